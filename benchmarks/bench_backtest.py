@@ -0,0 +1,52 @@
+"""
+Benchmark: VectorizedBacktester over a synthetic year of 1m klines, with
+close-based and intrabar (high/low path) exits.
+
+Usage (from the repository root):
+    python benchmarks/bench_backtest.py
+"""
+
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from backtest.intrabar_exit_resolver import IntrabarExitResolver  # noqa: E402
+from backtest.vectorized_backtester import VectorizedBacktester  # noqa: E402
+from binance_adapter.kline_parser import OHLCV  # noqa: E402
+
+BARS_PER_YEAR = 365 * 24 * 60
+
+
+def main() -> None:
+    rng = np.random.default_rng(42)
+    closes = 2000 + np.cumsum(rng.normal(0, 1, BARS_PER_YEAR))
+    previous = np.r_[closes[0], closes[:-1]]
+    ohlcv = OHLCV(
+        np.arange(BARS_PER_YEAR, dtype=np.int64) * 60_000,
+        previous,
+        np.maximum(closes, previous) + rng.exponential(0.5, BARS_PER_YEAR),
+        np.minimum(closes, previous) - rng.exponential(0.5, BARS_PER_YEAR),
+        closes,
+        closes,
+    )
+    backtester = VectorizedBacktester(tp_ratio=0.005, sl_ratio=0.005, coin_precision=2)
+    for label, resolver in (
+        ("closes", None),
+        ("intrabar", IntrabarExitResolver(ohlcv)),
+    ):
+        seconds = min(
+            timeit.repeat(lambda: backtester.run(ohlcv, resolver), number=1, repeat=5)
+        )
+        result = backtester.run(ohlcv, resolver)
+        print(
+            f"{label}: bars: {BARS_PER_YEAR} | trades: {len(result.trades)} | "
+            f"{seconds:.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: REST round trips of the bot's calls against the local fake exchange.
+
+Usage (from the repository root):
+    python benchmarks/bench_fake_exchange.py [--latency 0.02] [--tuned]
+
+No network access is needed; `--latency` adds a simulated exchange delay.
+`--tuned` sends through the TunedHTTPAdapter and prints the per-phase
+timings it recorded.
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from binance.client import Client  # noqa: E402
+from binance_adapter.request_timings import RequestTimings  # noqa: E402
+from binance_adapter.tuned_http_adapter import TunedHTTPAdapter  # noqa: E402
+from fake_exchange.fake_binance_server import FakeBinanceServer  # noqa: E402
+
+ROUNDS = 200
+
+
+def measure(label: str, call: Callable[[], object]) -> None:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        call()
+    elapsed = (time.perf_counter() - started) / ROUNDS
+    print(f"{label:<22} {elapsed * 1000:8.3f} ms/call")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--tuned", action="store_true")
+    args = parser.parse_args()
+    # The weight limit is lifted: the benchmark measures transport, not throttling.
+    server = FakeBinanceServer.synthetic(latency=args.latency, weight_limit=10**9)
+    with server:
+        client = server.configure_client(Client("key", "secret", ping=False))
+        timings = RequestTimings()
+        if args.tuned:
+            TunedHTTPAdapter.install(client.session, timings=timings)
+        measure("server time", client.get_server_time)
+        measure("mark price", lambda: client.futures_mark_price(symbol="ETHUSDT"))
+        measure("balance", client.futures_account_balance)
+        measure(
+            "klines (limit=500)",
+            lambda: client.get_klines(symbol="ETHUSDT", interval="15m", limit=500),
+        )
+        measure(
+            "market order",
+            lambda: client.futures_create_order(
+                symbol="ETHUSDT",
+                type="MARKET",
+                side="BUY",
+                positionSide="LONG",
+                quantity="0.01",
+            ),
+        )
+        print(f"requests served: {len(server.requests)}")
+        if args.tuned:
+            print(timings.format_summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark: pandas DataFrame path vs KlineParser for extracting close prices.
+
+Usage (from the repository root):
+    python benchmarks/bench_kline_parsing.py
+
+pandas is optional; without it only the KlineParser timings are reported.
+"""
+
+import os
+import sys
+import timeit
+from typing import Callable, List, Optional
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from binance_adapter.kline_cache import Kline  # noqa: E402
+from binance_adapter.kline_parser import KlineParser  # noqa: E402
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - optional dependency
+    pd = None
+
+SIZES = [1_000, 10_000, 50_000]
+COLUMNS = [
+    "timestamp",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "close_time",
+    "quote_asset_volume",
+    "number_of_trades",
+    "taker_buy_base_asset_volume",
+    "taker_buy_quote_asset_volume",
+    "ignore",
+]
+
+
+def make_klines(size: int) -> List[Kline]:
+    rng = np.random.default_rng(42)
+    closes = 2000 + np.cumsum(rng.normal(0, 1, size))
+    return [
+        [
+            i * 60_000,
+            f"{c:.2f}",
+            f"{c + 1:.2f}",
+            f"{c - 1:.2f}",
+            f"{c:.2f}",
+            "12.345",
+            i * 60_000 + 59_999,
+            "24690.0",
+            100,
+            "6.1",
+            "12345.0",
+            "0",
+        ]
+        for i, c in enumerate(closes)
+    ]
+
+
+def pandas_closes(klines: List[Kline]) -> np.ndarray:
+    df = pd.DataFrame(klines, columns=COLUMNS)
+    return df["close"].astype(float).to_numpy()
+
+
+def best_of(function: Callable[[], object], number: int = 10) -> float:
+    return min(timeit.repeat(function, number=number, repeat=5)) / number * 1000
+
+
+def main() -> None:
+    print(
+        f"{'klines':>8} | {'pandas (ms)':>11} | {'closes (ms)':>11} | "
+        f"{'ohlcv (ms)':>10} | {'speedup':>7}"
+    )
+    for size in SIZES:
+        klines = make_klines(size)
+        closes_ms = best_of(lambda: KlineParser.parse_closes(klines))
+        ohlcv_ms = best_of(lambda: KlineParser.parse_ohlcv(klines))
+        pandas_ms: Optional[float] = None
+        if pd is not None:
+            assert np.array_equal(
+                pandas_closes(klines), KlineParser.parse_closes(klines)
+            )
+            pandas_ms = best_of(lambda: pandas_closes(klines))
+        pandas_text = f"{pandas_ms:11.2f}" if pandas_ms is not None else f"{'n/a':>11}"
+        speedup = f"{pandas_ms / closes_ms:6.1f}x" if pandas_ms is not None else "n/a"
+        print(
+            f"{size:>8} | {pandas_text} | {closes_ms:11.2f} | {ohlcv_ms:10.2f} | {speedup:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Benchmark: RemBot state machine throughput in a full-speed replay.
+
+Usage (from the repository root):
+    python benchmarks/bench_replay.py
+"""
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from backtest.replay_engine import ReplayEngine  # noqa: E402
+from bot.symbol_settings import SymbolSettings  # noqa: E402
+
+BARS = 30 * 24 * 60
+
+
+def main() -> None:
+    rng = np.random.default_rng(42)
+    closes = 2000 + np.cumsum(rng.normal(0, 1, BARS))
+    open_time = np.arange(BARS, dtype=np.int64) * 60_000
+    ticks = (open_time + 30_000, closes + rng.normal(0, 0.5, BARS))
+    settings = SymbolSettings("ETHUSDT", 2, 0.005, 0.005, 1, os.devnull)
+    for label, tick_data in (("bar closes", None), ("closes + ticks", ticks)):
+        report = ReplayEngine(settings).replay(closes, open_time, tick_data)
+        print(
+            f"{label}: {report.steps} steps | {len(report.result.trades)} trades | "
+            f"{report.steps_per_second:,.0f} steps/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+from typing import List, NamedTuple
+import numpy as np
+
+
+class Trade(NamedTuple):
+    """
+    A closed backtest trade.
+    """
+
+    position: str
+    entry_index: int
+    exit_index: int
+    entry_time: int
+    exit_time: int
+    entry_price: float
+    tp_price: float
+    sl_price: float
+    is_tp: bool
+
+    @property
+    def exit_price(self) -> float:
+        """
+        Price at which the position is closed (the triggered TP or SL level).
+
+        Returns:
+            float: The exit price.
+        """
+        return self.tp_price if self.is_tp else self.sl_price
+
+    @property
+    def result(self) -> str:
+        """
+        Result label as stored by the live bot (original side for TP,
+        reversed side for SL).
+
+        Returns:
+            str: "LONG" or "SHORT".
+        """
+        if self.is_tp:
+            return self.position
+        return "SHORT" if self.position == "LONG" else "LONG"
+
+    @property
+    def return_ratio(self) -> float:
+        """
+        Unlevered return of the trade relative to the entry price.
+
+        Returns:
+            float: Positive for profits, negative for losses.
+        """
+        change = (self.exit_price - self.entry_price) / self.entry_price
+        return change if self.position == "LONG" else -change
+
+
+class BacktestResult:
+    """
+    Closed trades of a backtest along with their summary statistics.
+
+    PnL and drawdown are expressed as unlevered return ratios, summed over
+    the trades (one position at a time, fixed stake).
+    """
+
+    def __init__(self, trades: List[Trade]) -> None:
+        """
+        Initialize the BacktestResult.
+
+        Args:
+            trades (List[Trade]): Closed trades ordered by entry.
+
+        Attributes:
+            returns (np.ndarray): Return ratio of every trade.
+        """
+        self.trades: List[Trade] = trades
+        self.returns: np.ndarray = np.array(
+            [trade.return_ratio for trade in trades], dtype=np.float64
+        )
+
+    @property
+    def win_count(self) -> int:
+        """
+        Number of trades closed by take-profit.
+
+        Returns:
+            int: The win count.
+        """
+        return sum(1 for trade in self.trades if trade.is_tp)
+
+    @property
+    def loss_count(self) -> int:
+        """
+        Number of trades closed by stop-loss.
+
+        Returns:
+            int: The loss count.
+        """
+        return len(self.trades) - self.win_count
+
+    @property
+    def win_rate(self) -> float:
+        """
+        Share of winning trades.
+
+        Returns:
+            float: Win rate between 0 and 1 (0.0 without trades).
+        """
+        if not self.trades:
+            return 0.0
+        return self.win_count / len(self.trades)
+
+    @property
+    def pnl(self) -> float:
+        """
+        Total return of all trades.
+
+        Returns:
+            float: Sum of the trade return ratios.
+        """
+        return float(self.returns.sum())
+
+    @property
+    def max_drawdown(self) -> float:
+        """
+        Largest peak-to-trough decline of the cumulative return.
+
+        Returns:
+            float: The maximum drawdown as a non-negative return ratio.
+        """
+        if not self.trades:
+            return 0.0
+        equity = np.concatenate(([0.0], np.cumsum(self.returns)))
+        return float((np.maximum.accumulate(equity) - equity).max())
@@ -0,0 +1,141 @@
+from typing import Optional, Tuple
+import numpy as np
+from binance_adapter.kline_parser import OHLCV
+
+
+class IntrabarExitResolver:
+    """
+    Resolves TP/SL exits from the high/low path of every bar.
+
+    A level counts as touched when the bar's high is strictly above the
+    upper level or its low strictly below the lower one (the comparisons of
+    the active position states). The first touching bar is located with the
+    same growing-chunk vectorized scans as the close-based backtest. When a
+    bar touches both levels, the bars of an optional lower timeframe inside
+    it are scanned to find which level was touched first; if that is still
+    ambiguous (or no lower timeframe is given) the bar is assumed to move
+    from its open to the nearer extreme first, or to hit the stop-loss first
+    when `assume_stop_loss` is set. Drill-downs only happen on such
+    ambiguous bars, so the resolution stays cheap enough for sweeps.
+    """
+
+    _EXIT_SCAN_CHUNK: int = 256
+
+    def __init__(
+        self,
+        ohlcv: OHLCV,
+        lower_timeframe: Optional[OHLCV] = None,
+        assume_stop_loss: bool = False,
+    ) -> None:
+        """
+        Initialize the IntrabarExitResolver.
+
+        Args:
+            ohlcv (OHLCV): Backtested klines.
+            lower_timeframe (Optional[OHLCV], optional): Klines of a lower
+                timeframe covering the same period (e.g. 1m inside 15m).
+                Defaults to None (no drill-down).
+            assume_stop_loss (bool, optional): Resolve bars that remain ambiguous
+                as stop-losses instead of following the open-nearest path.
+                Defaults to False.
+        """
+        self.open_time: np.ndarray = np.asarray(ohlcv.open_time, dtype=np.int64)
+        self.open: np.ndarray = np.ascontiguousarray(ohlcv.open, dtype=np.float64)
+        self.high: np.ndarray = np.ascontiguousarray(ohlcv.high, dtype=np.float64)
+        self.low: np.ndarray = np.ascontiguousarray(ohlcv.low, dtype=np.float64)
+        self.lower_timeframe: Optional[OHLCV] = lower_timeframe
+        self.assume_stop_loss: bool = assume_stop_loss
+        self.interval_ms: int = (
+            int(self.open_time[1] - self.open_time[0]) if len(self.open_time) > 1 else 0
+        )
+
+    @staticmethod
+    def _path_upper_first(open_price: float, high: float, low: float) -> bool:
+        """
+        Assume a bar reaches the extreme nearer to its open first.
+
+        Args:
+            open_price (float): Open of the bar.
+            high (float): High of the bar.
+            low (float): Low of the bar.
+
+        Returns:
+            bool: True if the high is assumed to come before the low.
+        """
+        return high - open_price < open_price - low
+
+    def _drill_down(self, index: int, upper: float, lower: float) -> Optional[bool]:
+        """
+        Decide which level a bar touched first from the lower timeframe.
+
+        Args:
+            index (int): Bar touching both levels.
+            upper (float): Upper exit level.
+            lower (float): Lower exit level.
+
+        Returns:
+            Optional[bool]: True if the upper level came first, False if the
+                lower one did, or None if the lower timeframe cannot tell.
+        """
+        sub = self.lower_timeframe
+        if sub is None:
+            return None
+        bar_open = self.open_time[index]
+        begin, end = np.searchsorted(
+            sub.open_time, [bar_open, bar_open + self.interval_ms]
+        )
+        up = sub.high[begin:end] > upper
+        down = sub.low[begin:end] < lower
+        hits = up | down
+        if not hits.any():
+            return None
+        first = int(hits.argmax())
+        if up[first] != down[first]:
+            return bool(up[first])
+        if self.assume_stop_loss:
+            return None
+        k = begin + first
+        return self._path_upper_first(sub.open[k], sub.high[k], sub.low[k])
+
+    def find_exit(
+        self, start: int, position: str, tp_price: float, sl_price: float
+    ) -> Optional[Tuple[int, bool]]:
+        """
+        Find the bar closing a position and whether it closed by take-profit.
+
+        Args:
+            start (int): First bar to check (the one after the entry).
+            position (str): "LONG" or "SHORT".
+            tp_price (float): Take-profit price.
+            sl_price (float): Stop-loss price.
+
+        Returns:
+            Optional[Tuple[int, bool]]: Exit bar index and TP flag, or None if
+                the position stays open.
+        """
+        is_long = position == "LONG"
+        upper, lower = (tp_price, sl_price) if is_long else (sl_price, tp_price)
+        chunk = self._EXIT_SCAN_CHUNK
+        while start < len(self.high):
+            up = self.high[start : start + chunk] > upper
+            down = self.low[start : start + chunk] < lower
+            hits = up | down
+            if hits.any():
+                offset = int(hits.argmax())
+                index = start + offset
+                if up[offset] != down[offset]:
+                    upper_first = bool(up[offset])
+                else:
+                    upper_first = self._drill_down(index, upper, lower)
+                    if upper_first is None:
+                        upper_first = (
+                            not is_long
+                            if self.assume_stop_loss
+                            else self._path_upper_first(
+                                self.open[index], self.high[index], self.low[index]
+                            )
+                        )
+                return index, upper_first == is_long
+            start += chunk
+            chunk *= 2
+        return None
@@ -0,0 +1,102 @@
+import csv
+from pathlib import Path
+from typing import Any, List, Union
+import numpy as np
+from binance_adapter.kline_cache import Kline
+from binance_adapter.kline_parser import OHLCV, KlineParser
+
+
+class KlineLoader:
+    """
+    Loads historical klines for backtesting.
+
+    Klines are downloaded page by page over REST or read from CSV files in
+    the Binance kline layout (as published by data.binance.vision, with or
+    without a header row), and parsed straight into NumPy column arrays.
+    """
+
+    PAGE_LIMIT: int = 1000
+
+    @staticmethod
+    def fetch_klines(
+        client: Any, symbol: str, interval: str, start_time: int, end_time: int
+    ) -> List[Kline]:
+        """
+        Download all klines opened within a time range.
+
+        Args:
+            client (Any): Binance client instance.
+            symbol (str): Trading symbol (e.g., "ETHUSDT").
+            interval (str): Kline interval (e.g., "1m").
+            start_time (int): Range start in milliseconds (inclusive).
+            end_time (int): Range end in milliseconds (inclusive).
+
+        Returns:
+            List[Kline]: Raw klines ordered by open time.
+        """
+        klines: List[Kline] = []
+        while start_time <= end_time:
+            page = client.get_klines(
+                symbol=symbol,
+                interval=interval,
+                startTime=start_time,
+                endTime=end_time,
+                limit=KlineLoader.PAGE_LIMIT,
+            )
+            klines.extend(page)
+            if len(page) < KlineLoader.PAGE_LIMIT:
+                break
+            start_time = int(page[-1][0]) + 1
+        return klines
+
+    @staticmethod
+    def write_csv(path: Union[str, Path], klines: List[Kline]) -> None:
+        """
+        Write raw klines to a CSV file in the Binance kline layout.
+
+        Args:
+            path (Union[str, Path]): Destination CSV file.
+            klines (List[Kline]): Raw klines ordered by open time.
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerows(klines)
+
+    @staticmethod
+    def read_csv(path: Union[str, Path]) -> OHLCV:
+        """
+        Read klines from a CSV file into column arrays.
+
+        Args:
+            path (Union[str, Path]): CSV file in the Binance kline layout.
+
+        Returns:
+            OHLCV: Open times as int64 and prices/volume as float64 arrays.
+        """
+        with open(path, encoding="utf-8") as f:
+            first_line = f.readline()
+        skip_rows = 0 if first_line[:1].isdigit() else 1
+        columns = (
+            KlineParser.OPEN_TIME,
+            KlineParser.OPEN,
+            KlineParser.HIGH,
+            KlineParser.LOW,
+            KlineParser.CLOSE,
+            KlineParser.VOLUME,
+        )
+        data = np.loadtxt(
+            path,
+            delimiter=",",
+            skiprows=skip_rows,
+            usecols=columns,
+            dtype=np.float64,
+            ndmin=2,
+        )
+        return OHLCV(
+            open_time=data[:, 0].astype(np.int64),
+            open=np.ascontiguousarray(data[:, 1]),
+            high=np.ascontiguousarray(data[:, 2]),
+            low=np.ascontiguousarray(data[:, 3]),
+            close=np.ascontiguousarray(data[:, 4]),
+            volume=np.ascontiguousarray(data[:, 5]),
+        )
@@ -0,0 +1,356 @@
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+from backtest.intrabar_exit_resolver import IntrabarExitResolver
+from backtest.vectorized_backtester import IndicatorSeries, VectorizedBacktester
+from binance_adapter.kline_parser import OHLCV
+
+ArrayLayout = Tuple[Tuple[str, str, int], ...]
+
+
+class SweepParams(NamedTuple):
+    """
+    One strategy parameter combination of a sweep.
+    """
+
+    tp_ratio: float
+    sl_ratio: float
+    ema_period: int = 100
+    macd_fast_period: int = 12
+    macd_slow_period: int = 26
+    macd_signal_period: int = 26
+    rsi_period: int = 6
+
+
+class SweepResult(NamedTuple):
+    """
+    Backtest statistics of one parameter combination.
+    """
+
+    params: SweepParams
+    trades: int
+    win_rate: float
+    pnl: float
+    max_drawdown: float
+
+
+class ParameterSweep:
+    """
+    Backtests grids of TP/SL ratios and indicator periods across CPU cores.
+
+    The close series (and, for intrabar exits, the kline columns) is copied
+    once into shared memory and attached by every worker process of a
+    ProcessPoolExecutor, so tasks only carry parameter tuples. Combinations
+    are sharded by indicator periods, letting each worker compute the
+    indicators once per shard and reuse them for all of its TP/SL pairs.
+    """
+
+    _worker_close: Optional[np.ndarray] = None
+    _worker_resolver: Optional[IntrabarExitResolver] = None
+    _worker_memory: Optional[SharedMemory] = None
+    _worker_coin_precision: int = 2
+
+    def __init__(
+        self,
+        close: np.ndarray,
+        coin_precision: int,
+        max_workers: Optional[int] = None,
+        ohlcv: Optional[OHLCV] = None,
+        lower_timeframe: Optional[OHLCV] = None,
+        assume_stop_loss: bool = False,
+    ) -> None:
+        """
+        Initialize the ParameterSweep.
+
+        Args:
+            close (np.ndarray): Close prices of the backtest series.
+            coin_precision (int): Decimals the TP/SL prices are rounded to.
+            max_workers (Optional[int], optional): Number of worker processes.
+                Defaults to None (one per CPU core).
+            ohlcv (Optional[OHLCV], optional): Klines of the series whose high/low
+                paths resolve the exits. Defaults to None (exits on closes).
+            lower_timeframe (Optional[OHLCV], optional): Lower timeframe klines
+                for the intrabar drill-down. Defaults to None.
+            assume_stop_loss (bool, optional): Resolve ambiguous bars as
+                stop-losses. Defaults to False.
+        """
+        self.close: np.ndarray = np.ascontiguousarray(close, dtype=np.float64)
+        self.coin_precision: int = coin_precision
+        self.max_workers: int = max_workers or os.cpu_count() or 1
+        self.ohlcv: Optional[OHLCV] = ohlcv
+        self.lower_timeframe: Optional[OHLCV] = lower_timeframe
+        self.assume_stop_loss: bool = assume_stop_loss
+
+    @staticmethod
+    def grid(
+        tp_ratios: Iterable[float],
+        sl_ratios: Iterable[float],
+        ema_periods: Iterable[int] = (100,),
+        macd_fast_periods: Iterable[int] = (12,),
+        macd_slow_periods: Iterable[int] = (26,),
+        macd_signal_periods: Iterable[int] = (26,),
+        rsi_periods: Iterable[int] = (6,),
+    ) -> List[SweepParams]:
+        """
+        Build the cartesian product of the given parameter values.
+
+        Combinations whose MACD fast period is not below the slow one are skipped.
+
+        Returns:
+            List[SweepParams]: All valid parameter combinations.
+        """
+        return [
+            SweepParams(tp, sl, ema, fast, slow, signal, rsi)
+            for ema, fast, slow, signal, rsi, tp, sl in itertools.product(
+                ema_periods,
+                macd_fast_periods,
+                macd_slow_periods,
+                macd_signal_periods,
+                rsi_periods,
+                tp_ratios,
+                sl_ratios,
+            )
+            if fast < slow
+        ]
+
+    def _shard(self, combinations: Sequence[SweepParams]) -> List[List[SweepParams]]:
+        """
+        Split combinations into tasks sharing the same indicator periods.
+
+        Each period group is further split so that there are roughly four
+        tasks per worker, keeping every core busy even with a single group.
+
+        Args:
+            combinations (Sequence[SweepParams]): Combinations to evaluate.
+
+        Returns:
+            List[List[SweepParams]]: Tasks of combinations.
+        """
+        groups: Dict[Tuple[int, ...], List[SweepParams]] = {}
+        for params in combinations:
+            groups.setdefault(tuple(params[2:]), []).append(params)
+        target_size = max(1, len(combinations) // (self.max_workers * 4))
+        return [
+            group[i : i + target_size]
+            for group in groups.values()
+            for i in range(0, len(group), target_size)
+        ]
+
+    def _shared_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Collect the arrays the workers need, keyed by name.
+
+        Returns:
+            Dict[str, np.ndarray]: The close series and, for intrabar exits,
+                the kline columns of both timeframes.
+        """
+        arrays: Dict[str, np.ndarray] = {"close": self.close}
+        for prefix, klines in (("", self.ohlcv), ("lower_", self.lower_timeframe)):
+            if klines is not None:
+                for name in ("open_time", "open", "high", "low"):
+                    arrays[prefix + name] = np.ascontiguousarray(getattr(klines, name))
+        return arrays
+
+    @staticmethod
+    def _attach_arrays(
+        buffer: memoryview, layout: ArrayLayout
+    ) -> Dict[str, np.ndarray]:
+        """
+        View the arrays packed one after another in a shared buffer.
+
+        Args:
+            buffer (memoryview): The shared memory buffer.
+            layout (ArrayLayout): Name, dtype and length of every packed array.
+
+        Returns:
+            Dict[str, np.ndarray]: Arrays backed by the buffer, keyed by name.
+        """
+        arrays: Dict[str, np.ndarray] = {}
+        offset = 0
+        for name, dtype, length in layout:
+            arrays[name] = np.ndarray(
+                (length,), dtype=dtype, buffer=buffer, offset=offset
+            )
+            offset += arrays[name].nbytes
+        return arrays
+
+    @staticmethod
+    def _init_worker(
+        memory_name: str,
+        layout: ArrayLayout,
+        coin_precision: int,
+        assume_stop_loss: bool = False,
+    ) -> None:
+        """
+        Attach the shared arrays in a worker process.
+
+        Args:
+            memory_name (str): Name of the shared memory block.
+            layout (ArrayLayout): Name, dtype and length of every packed array.
+            coin_precision (int): Decimals the TP/SL prices are rounded to.
+            assume_stop_loss (bool, optional): Resolve ambiguous bars as
+                stop-losses. Defaults to False.
+        """
+        memory = SharedMemory(name=memory_name)
+        arrays = ParameterSweep._attach_arrays(memory.buf, layout)
+        ParameterSweep._worker_memory = memory
+        ParameterSweep._worker_close = arrays["close"]
+        ParameterSweep._worker_coin_precision = coin_precision
+        ParameterSweep._worker_resolver = None
+        if "high" in arrays:
+            lower_timeframe = None
+            if "lower_high" in arrays:
+                lower_timeframe = ParameterSweep._as_ohlcv(arrays, "lower_")
+            ParameterSweep._worker_resolver = IntrabarExitResolver(
+                ParameterSweep._as_ohlcv(arrays, ""), lower_timeframe, assume_stop_loss
+            )
+
+    @staticmethod
+    def _as_ohlcv(arrays: Dict[str, np.ndarray], prefix: str) -> OHLCV:
+        """
+        Rebuild the kline columns an IntrabarExitResolver reads.
+
+        Args:
+            arrays (Dict[str, np.ndarray]): Shared arrays keyed by name.
+            prefix (str): Name prefix of the timeframe ("" or "lower_").
+
+        Returns:
+            OHLCV: Klines without close and volume columns (NaN placeholders).
+        """
+        missing = np.full(len(arrays[prefix + "open_time"]), np.nan)
+        return OHLCV(
+            open_time=arrays[prefix + "open_time"],
+            open=arrays[prefix + "open"],
+            high=arrays[prefix + "high"],
+            low=arrays[prefix + "low"],
+            close=missing,
+            volume=missing,
+        )
+
+    @staticmethod
+    def _run_shard(shard: List[SweepParams]) -> List[SweepResult]:
+        """
+        Backtest a task of combinations sharing the same indicator periods.
+
+        Args:
+            shard (List[SweepParams]): Combinations to evaluate.
+
+        Returns:
+            List[SweepResult]: Statistics of every combination.
+        """
+        close = ParameterSweep._worker_close
+        if close is None:
+            raise RuntimeError("ParameterSweep worker is not initialized")
+        indicators: Optional[IndicatorSeries] = None
+        results: List[SweepResult] = []
+        for params in shard:
+            backtester = VectorizedBacktester(
+                params.tp_ratio,
+                params.sl_ratio,
+                ParameterSweep._worker_coin_precision,
+                *params[2:],
+            )
+            if indicators is None:
+                indicators = backtester.compute_indicators(close)
+            result = backtester.run_series(
+                close,
+                indicators=indicators,
+                exit_resolver=ParameterSweep._worker_resolver,
+            )
+            results.append(
+                SweepResult(
+                    params=params,
+                    trades=len(result.trades),
+                    win_rate=result.win_rate,
+                    pnl=result.pnl,
+                    max_drawdown=result.max_drawdown,
+                )
+            )
+        return results
+
+    def run(self, combinations: Sequence[SweepParams]) -> List[SweepResult]:
+        """
+        Evaluate all combinations in parallel and rank them.
+
+        Args:
+            combinations (Sequence[SweepParams]): Combinations to evaluate.
+
+        Returns:
+            List[SweepResult]: Results sorted by PnL, then win rate, then
+                drawdown (best first).
+        """
+        arrays = self._shared_arrays()
+        layout: ArrayLayout = tuple(
+            (name, array.dtype.str, len(array)) for name, array in arrays.items()
+        )
+        size = sum(array.nbytes for array in arrays.values())
+        memory = SharedMemory(create=True, size=max(1, size))
+        try:
+            for name, shared in self._attach_arrays(memory.buf, layout).items():
+                shared[:] = arrays[name]
+            del shared
+            with ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=ParameterSweep._init_worker,
+                initargs=(
+                    memory.name,
+                    layout,
+                    self.coin_precision,
+                    self.assume_stop_loss,
+                ),
+            ) as executor:
+                shards = self._shard(combinations)
+                results = [
+                    result
+                    for shard_results in executor.map(ParameterSweep._run_shard, shards)
+                    for result in shard_results
+                ]
+        finally:
+            memory.close()
+            memory.unlink()
+        return self.rank(results)
+
+    @staticmethod
+    def rank(results: Iterable[SweepResult]) -> List[SweepResult]:
+        """
+        Sort results by PnL, then win rate, then lowest drawdown.
+
+        Args:
+            results (Iterable[SweepResult]): Results to rank.
+
+        Returns:
+            List[SweepResult]: Ranked results, best first.
+        """
+        return sorted(results, key=lambda r: (-r.pnl, -r.win_rate, r.max_drawdown))
+
+    @staticmethod
+    def format_table(results: Sequence[SweepResult], top: int = 20) -> str:
+        """
+        Render ranked results as a plain-text table.
+
+        Args:
+            results (Sequence[SweepResult]): Ranked results.
+            top (int, optional): Number of rows to render. Defaults to 20.
+
+        Returns:
+            str: The table.
+        """
+        header = (
+            f"{'#':>4} | {'TP':>7} | {'SL':>7} | {'EMA':>4} | {'MACD':>9} | "
+            f"{'RSI':>3} | {'trades':>6} | {'win-rate':>8} | {'PnL':>8} | "
+            f"{'drawdown':>8}"
+        )
+        lines = [header, "-" * len(header)]
+        for rank, r in enumerate(results[:top], start=1):
+            p = r.params
+            macd = f"{p.macd_fast_period}/{p.macd_slow_period}/{p.macd_signal_period}"
+            lines.append(
+                f"{rank:>4} | {p.tp_ratio:>7.4f} | {p.sl_ratio:>7.4f} | "
+                f"{p.ema_period:>4} | {macd:>9} | {p.rsi_period:>3} | "
+                f"{r.trades:>6} | {r.win_rate * 100:>7.2f}% | "
+                f"{r.pnl * 100:>7.2f}% | {r.max_drawdown * 100:>7.2f}%"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,93 @@
+from typing import Optional, Tuple, Union
+from backtest.replay_clock import ReplayClock
+from backtest.replay_indicator_manager import ReplayIndicatorManager
+from binance_adapter.account_manager import AccountManager, ExitFill
+from bot.bot_settings import BotSettings
+from bot.symbol_settings import SymbolSettings
+
+
+class ReplayBinanceAdapter:
+    """
+    BinanceAdapter stand-in for replays: no client, no orders.
+
+    Market data comes from a ReplayIndicatorManager and entries only
+    compute their TP/SL prices with the live AccountManager rounding.
+    """
+
+    def __init__(
+        self,
+        indicator_manager: ReplayIndicatorManager,
+        clock: ReplayClock,
+        symbol_settings: Union[SymbolSettings, BotSettings],
+    ) -> None:
+        """
+        Initialize the ReplayBinanceAdapter.
+
+        Args:
+            indicator_manager (ReplayIndicatorManager): Source of replayed market data.
+            clock (ReplayClock): Replay clock serving the server time.
+            symbol_settings (Union[SymbolSettings, BotSettings]): Settings of the
+                replayed symbol.
+        """
+        self.indicator_manager: ReplayIndicatorManager = indicator_manager
+        self.clock: ReplayClock = clock
+        self.symbol_settings: Union[SymbolSettings, BotSettings] = symbol_settings
+        self.account_manager: AccountManager = AccountManager(None, symbol_settings)
+        self.rate_limiter: None = None
+
+    def get_server_time(self) -> int:
+        """
+        Retrieve the replay time.
+
+        Returns:
+            int: Replay time in milliseconds.
+        """
+        return self.clock.get_timestamp_ms()
+
+    def exits_tracked(self) -> bool:
+        """
+        Replays have no orders, exits are always detected from prices.
+
+        Returns:
+            bool: Always False.
+        """
+        return False
+
+    def resolve_exit_fill(self) -> Optional[ExitFill]:
+        """
+        Replays have no orders, so no exit ever fills.
+
+        Returns:
+            Optional[ExitFill]: Always None.
+        """
+        return None
+
+    def enter_long(
+        self, coin_price: float, state_block: bool = False
+    ) -> Tuple[float, float]:
+        """
+        Enter a replayed LONG position.
+
+        Args:
+            coin_price (float): Entry price.
+            state_block (bool, optional): Unused. Defaults to False.
+
+        Returns:
+            Tuple[float, float]: Take-profit and stop-loss prices.
+        """
+        return self.account_manager.calculate_target_prices("LONG", coin_price)
+
+    def enter_short(
+        self, coin_price: float, state_block: bool = False
+    ) -> Tuple[float, float]:
+        """
+        Enter a replayed SHORT position.
+
+        Args:
+            coin_price (float): Entry price.
+            state_block (bool, optional): Unused. Defaults to False.
+
+        Returns:
+            Tuple[float, float]: Take-profit and stop-loss prices.
+        """
+        return self.account_manager.calculate_target_prices("SHORT", coin_price)
@@ -0,0 +1,73 @@
+import datetime
+from contextlib import contextmanager
+from typing import Iterator
+from utils.date_utils import DateUtils
+
+
+class ReplayClock:
+    """
+    Fake clock advanced by the replayed events instead of wall time.
+
+    While installed, `DateUtils` reads its time, so snapshot dates, log
+    lines and scheduler computations all follow the replayed market data
+    and no code ever has to sleep.
+    """
+
+    def __init__(self, start_ms: int = 0) -> None:
+        """
+        Initialize the ReplayClock.
+
+        Args:
+            start_ms (int, optional): Initial Unix time in milliseconds. Defaults to 0.
+
+        Attributes:
+            now_ms (int): Current replay time in milliseconds.
+        """
+        self.now_ms: int = int(start_ms)
+
+    def advance_to(self, timestamp_ms: int) -> None:
+        """
+        Move the clock forward to a timestamp (never backwards).
+
+        Args:
+            timestamp_ms (int): Unix time in milliseconds.
+        """
+        self.now_ms = max(self.now_ms, int(timestamp_ms))
+
+    def get_timestamp_ms(self) -> int:
+        """
+        Get the replay time in milliseconds.
+
+        Returns:
+            int: Milliseconds elapsed since the Unix epoch.
+        """
+        return self.now_ms
+
+    def get_date(self) -> str:
+        """
+        Get the replay time as a formatted (UTC) string.
+
+        Returns:
+            str: Replay timestamp in the format "[YYYY-MM-DD HH:MM:SS]".
+        """
+        moment = datetime.datetime.fromtimestamp(
+            self.now_ms / 1000, tz=datetime.timezone.utc
+        )
+        return moment.strftime("[%Y-%m-%d %H:%M:%S]")
+
+    @contextmanager
+    def installed(self) -> Iterator["ReplayClock"]:
+        """
+        Route `DateUtils` time lookups to this clock for the duration of the block.
+
+        Yields:
+            ReplayClock: This clock.
+        """
+        get_date, get_timestamp_ms = DateUtils.get_date, DateUtils.get_timestamp_ms
+        DateUtils.get_date = self.get_date
+        DateUtils.get_timestamp_ms = self.get_timestamp_ms
+        try:
+            yield self
+        finally:
+            DateUtils.get_date = staticmethod(get_date)
+            DateUtils.get_timestamp_ms = staticmethod(get_timestamp_ms)
@@ -0,0 +1,298 @@
+import contextlib
+import os
+import time
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+import numpy as np
+from backtest.backtest_result import BacktestResult, Trade
+from backtest.replay_binance_adapter import ReplayBinanceAdapter
+from backtest.replay_clock import ReplayClock
+from backtest.replay_indicator_manager import ReplayIndicatorManager
+from base_dir import BASE_DIR
+from binance_adapter.kline_parser import OHLCV
+from bot.bot_settings import SETTINGS, BotSettings
+from bot.rem_bot import RemBot
+from bot.states.active.active_position_state import ActivePositionState
+from bot.states.active.long_position_state import LongPositionState
+from bot.symbol_settings import SymbolSettings
+from utils.date_utils import DateUtils
+from utils.file_utils import FileUtils
+from utils.logger import Logger
+
+
+class ReplayReport(NamedTuple):
+    """
+    Outcome and throughput of a replay.
+
+    `errors` counts the exceptions the state machine logged (and recovered
+    from) during the replay; `first_error` is the message of the first one.
+    """
+
+    steps: int
+    seconds: float
+    result: BacktestResult
+    errors: int = 0
+    first_error: Optional[str] = None
+
+    @property
+    def steps_per_second(self) -> float:
+        """
+        State machine throughput.
+
+        Returns:
+            float: Replayed steps per second of wall time.
+        """
+        return self.steps / self.seconds if self.seconds > 0 else float("inf")
+
+
+class ReplayEngine:
+    """
+    Drives the real RemBot state machine over recorded market data.
+
+    A RemBot is built on a ReplayBinanceAdapter and its live Flat, Long and
+    Short states are stepped once per recorded event: every bar close is a
+    full refresh at the bar's last price, and optional recorded price ticks
+    in between are price-only steps. A ReplayClock replaces wall time, so
+    nothing sleeps and the replay runs as fast as the CPU allows. Trades
+    are read back from the state transitions, which makes the result
+    directly comparable with the VectorizedBacktester; the results files
+    and trade journal are only written to on request. Exceptions the states
+    log are counted in the report, even when the bot's output is discarded.
+    """
+
+    def __init__(
+        self,
+        symbol_settings: Optional[Union[SymbolSettings, BotSettings]] = None,
+        quiet: bool = True,
+        save_results: bool = False,
+    ) -> None:
+        """
+        Initialize the ReplayEngine.
+
+        Args:
+            symbol_settings (Optional[Union[SymbolSettings, BotSettings]], optional):
+                Settings of the replayed symbol. Defaults to None (the `[POSITION]`
+                settings, with results saved to `replay_results.csv`).
+            quiet (bool, optional): Discard the bot's console output. Defaults to True.
+            save_results (bool, optional): Save the replayed trades like the
+                live bot does (results CSV and trade journal). Defaults to False.
+        """
+        self.symbol_settings: Union[SymbolSettings, BotSettings] = (
+            SymbolSettings(
+                SETTINGS.SYMBOL,
+                SETTINGS.COIN_PRECISION,
+                SETTINGS.TP_RATIO,
+                SETTINGS.SL_RATIO,
+                SETTINGS.LEVERAGE,
+                BASE_DIR / "replay_results.csv",
+            )
+            if symbol_settings is None
+            else symbol_settings
+        )
+        self.quiet: bool = quiet
+        self.save_results: bool = save_results
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _counting_errors(errors: Dict[str, int]) -> Iterator[Dict[str, int]]:
+        """
+        Count the messages logged by `Logger.log_exception` in the block.
+
+        The messages are still logged as well.
+
+        Args:
+            errors (Dict[str, int]): Occurrences of every message, in the
+                order they were first logged.
+
+        Yields:
+            Dict[str, int]: The counts.
+        """
+        log_exception = Logger.__dict__["log_exception"]
+
+        def collect(message: str) -> None:
+            errors[message] = errors.get(message, 0) + 1
+            log_exception.__func__(Logger, message)
+
+        Logger.log_exception = staticmethod(collect)
+        try:
+            yield errors
+        finally:
+            Logger.log_exception = log_exception
+
+    @staticmethod
+    def _events(
+        open_time: np.ndarray,
+        interval_ms: int,
+        ticks: Optional[Tuple[np.ndarray, np.ndarray]],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Merge bar closes and recorded price ticks into one time-ordered stream.
+
+        Args:
+            open_time (np.ndarray): Bar open times in milliseconds.
+            interval_ms (int): Bar length in milliseconds.
+            ticks (Optional[Tuple[np.ndarray, np.ndarray]]): Tick times and prices.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]: Per event, its
+                time, bar index, tick index (-1 for bar closes) and whether it
+                is a bar close.
+        """
+        close_time = open_time + interval_ms - 1
+        bar_index = np.arange(len(open_time))
+        if ticks is None:
+            return close_time, bar_index, np.full(len(open_time), -1), (bar_index >= 0)
+        tick_time = np.asarray(ticks[0], dtype=np.int64)
+        tick_bar = np.searchsorted(open_time, tick_time, side="right") - 1
+        keep = tick_bar >= 0
+        tick_index = np.flatnonzero(keep)
+        times = np.concatenate([tick_time[keep], close_time])
+        order = np.argsort(times, kind="stable")
+        return (
+            times[order],
+            np.concatenate([tick_bar[keep], bar_index])[order],
+            np.concatenate([tick_index, np.full(len(open_time), -1)])[order],
+            np.concatenate([np.zeros(len(tick_index), bool), bar_index >= 0])[order],
+        )
+
+    @staticmethod
+    def _warm_up(indicator_manager: ReplayIndicatorManager, close: np.ndarray) -> int:
+        """
+        Commit bars until the indicators are warmed up.
+
+        Args:
+            indicator_manager (ReplayIndicatorManager): Manager to warm up.
+            close (np.ndarray): Close prices ordered by open time.
+
+        Returns:
+            int: Index of the first warm bar (`len(close)` if none is).
+        """
+        for index in range(len(close)):
+            indicator_manager.advance(index, close[index])
+            if indicator_manager.is_warm():
+                return index
+        return len(close)
+
+    def replay(
+        self,
+        close: np.ndarray,
+        open_time: Optional[np.ndarray] = None,
+        ticks: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        interval_ms: Optional[int] = None,
+    ) -> ReplayReport:
+        """
+        Replay recorded closes (and optionally ticks) through the state machine.
+
+        The bot starts on the first bar whose indicators are warmed up, where
+        its initial entry block is decided, like the live bot at start-up.
+
+        Args:
+            close (np.ndarray): Close prices ordered by open time.
+            open_time (Optional[np.ndarray], optional): Bar open times in
+                milliseconds. Defaults to None (one interval apart from 0).
+            ticks (Optional[Tuple[np.ndarray, np.ndarray]], optional): Recorded
+                tick times (milliseconds) and prices. Defaults to None.
+            interval_ms (Optional[int], optional): Bar length in milliseconds.
+                Defaults to None (inferred from `open_time`, else INTERVAL).
+
+        Returns:
+            ReplayReport: Replayed trades and state machine throughput.
+        """
+        close = np.asarray(close, dtype=np.float64)
+        if interval_ms is None:
+            interval_ms = (
+                int(open_time[1] - open_time[0])
+                if open_time is not None and len(open_time) > 1
+                else DateUtils.interval_to_milliseconds(SETTINGS.INTERVAL)
+            )
+        if open_time is None:
+            open_time = np.arange(len(close), dtype=np.int64) * interval_ms
+        open_time = np.asarray(open_time, dtype=np.int64)
+        times, bars, tick_indexes, is_close = self._events(
+            open_time, interval_ms, ticks
+        )
+        tick_prices = None if ticks is None else np.asarray(ticks[1], np.float64)
+
+        indicator_manager = ReplayIndicatorManager(close)
+        clock = ReplayClock()
+        adapter = ReplayBinanceAdapter(indicator_manager, clock, self.symbol_settings)
+        trades: List[Trade] = []
+        errors: Dict[str, int] = {}
+        steps = 0
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(clock.installed())
+            stack.enter_context(self._counting_errors(errors))
+            if not self.save_results:
+                stack.enter_context(FileUtils.discarding_results())
+            if self.quiet:
+                devnull = stack.enter_context(open(os.devnull, "w"))
+                stack.enter_context(contextlib.redirect_stdout(devnull))
+            start = time.perf_counter()
+            first = self._warm_up(indicator_manager, close)
+            if first == len(close):
+                return ReplayReport(
+                    0,
+                    time.perf_counter() - start,
+                    BacktestResult([]),
+                    sum(errors.values()),
+                    next(iter(errors), None),
+                )
+            clock.advance_to(open_time[first] + interval_ms - 1)
+            bot = RemBot(binance_adapter=adapter)
+            begin = int(np.searchsorted(times, open_time[first] + interval_ms))
+            entry: Tuple[int, int] = (first, int(clock.now_ms))
+            for event in range(begin, len(times)):
+                bar, now = int(bars[event]), int(times[event])
+                clock.advance_to(now)
+                indicator_manager.advance(
+                    bar,
+                    close[bar] if is_close[event] else tick_prices[tick_indexes[event]],
+                )
+                state, wins = bot.state, bot.performance_tracker.win_count
+                state.step(full_refresh=bool(is_close[event]))
+                steps += 1
+                if bot.state is state:
+                    continue
+                if isinstance(bot.state, ActivePositionState):
+                    entry = (bar, now)
+                else:
+                    trades.append(
+                        Trade(
+                            position=(
+                                "LONG"
+                                if isinstance(state, LongPositionState)
+                                else "SHORT"
+                            ),
+                            entry_index=entry[0],
+                            exit_index=bar,
+                            entry_time=entry[1],
+                            exit_time=now,
+                            entry_price=bot.data_manager.position_snapshot.price,
+                            tp_price=state.tp_price,
+                            sl_price=state.sl_price,
+                            is_tp=bot.performance_tracker.win_count > wins,
+                        )
+                    )
+            seconds = time.perf_counter() - start
+        return ReplayReport(
+            steps,
+            seconds,
+            BacktestResult(trades),
+            sum(errors.values()),
+            next(iter(errors), None),
+        )
+
+    def run(
+        self, ohlcv: OHLCV, ticks: Optional[Tuple[np.ndarray, np.ndarray]] = None
+    ) -> ReplayReport:
+        """
+        Replay parsed klines (and optionally ticks) through the state machine.
+
+        Args:
+            ohlcv (OHLCV): Recorded klines as column arrays.
+            ticks (Optional[Tuple[np.ndarray, np.ndarray]], optional): Recorded
+                tick times (milliseconds) and prices. Defaults to None.
+
+        Returns:
+            ReplayReport: Replayed trades and state machine throughput.
+        """
+        return self.replay(ohlcv.close, ohlcv.open_time, ticks)
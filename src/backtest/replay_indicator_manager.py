@@ -0,0 +1,101 @@
+import math
+from typing import Optional
+import numpy as np
+from data.market_snapshot import MarketSnapshot
+from indicators.streaming_indicator_engine import StreamingIndicatorEngine
+from utils.date_utils import DateUtils
+
+
+class ReplayIndicatorManager:
+    """
+    Serves recorded klines and prices with the IndicatorManager interface.
+
+    The replay positions the manager on a forming bar and a price with
+    `advance`; earlier closes are committed once to the same
+    StreamingIndicatorEngine the live IndicatorManager uses, and every
+    snapshot evaluates the forming bar at the current price, exactly as a
+    live refresh would.
+    """
+
+    def __init__(self, close: np.ndarray) -> None:
+        """
+        Initialize the ReplayIndicatorManager.
+
+        Args:
+            close (np.ndarray): Recorded close prices ordered by open time.
+
+        Attributes:
+            indicator_engine (StreamingIndicatorEngine): Indicators of the committed bars.
+            bar_index (int): Index of the forming bar.
+            price (float): Current price of the forming bar.
+            market_stream (None): Replays never stream.
+        """
+        self.close: np.ndarray = close
+        self.indicator_engine: StreamingIndicatorEngine = StreamingIndicatorEngine()
+        self.bar_index: int = 0
+        self.price: float = math.nan
+        self.market_stream: Optional[object] = None
+
+    def advance(self, bar_index: int, price: float) -> None:
+        """
+        Move to a forming bar and price, committing the bars closed before it.
+
+        Args:
+            bar_index (int): Index of the bar the price belongs to.
+            price (float): Current price.
+        """
+        for index in range(self.bar_index, bar_index):
+            self.indicator_engine.update(float(self.close[index]))
+        self.bar_index = max(self.bar_index, bar_index)
+        self.price = float(price)
+
+    def is_warm(self) -> bool:
+        """
+        Whether every indicator has a value at the current bar and price.
+
+        Returns:
+            bool: True once the indicators are warmed up.
+        """
+        return not any(math.isnan(v) for v in self.indicator_engine.peek(self.price))
+
+    def fetch_indicators(self) -> MarketSnapshot:
+        """
+        Evaluate the indicators of the forming bar at the current price.
+
+        Returns:
+            MarketSnapshot: Snapshot containing the current price and indicators.
+        """
+        values = self.indicator_engine.peek(self.price)
+        return MarketSnapshot(
+            date=DateUtils.get_date(),
+            price=self.price,
+            macd_12=values.macd_12,
+            macd_26=values.macd_26,
+            ema_100=values.ema_100,
+            rsi_6=values.rsi_6,
+        )
+
+    def fetch_price_snapshot(self) -> MarketSnapshot:
+        """
+        Build a snapshot from the current price (same as `fetch_indicators`).
+
+        Returns:
+            MarketSnapshot: Snapshot containing the current price and indicators.
+        """
+        return self.fetch_indicators()
+
+    def fetch_price_only_snapshot(
+        self, previous: MarketSnapshot, mark_price: bool = False
+    ) -> MarketSnapshot:
+        """
+        Refresh only the price of a snapshot.
+
+        Args:
+            previous (MarketSnapshot): Snapshot whose indicator values are kept.
+            mark_price (bool, optional): Ignored; recordings carry a single price.
+                Defaults to False.
+
+        Returns:
+            MarketSnapshot: Copy of `previous` with the current price and date.
+        """
+        return previous.with_price(date=DateUtils.get_date(), price=self.price)
@@ -0,0 +1,285 @@
+from typing import List, NamedTuple, Optional, Tuple
+import numpy as np
+import talib
+from backtest.backtest_result import BacktestResult, Trade
+from backtest.intrabar_exit_resolver import IntrabarExitResolver
+from binance_adapter.kline_parser import OHLCV
+
+
+class IndicatorSeries(NamedTuple):
+    """
+    REM indicator values for every bar of a series (NaN during warm-up).
+    """
+
+    macd_12: np.ndarray
+    macd_26: np.ndarray
+    ema_100: np.ndarray
+    rsi_6: np.ndarray
+
+
+class VectorizedBacktester:
+    """
+    Backtests the REM strategy over historical klines with array operations.
+
+    Every bar close is treated as one bot step with the close as the price.
+    The indicators are computed once for the whole series, the
+    FlatPositionState entry conditions become boolean masks, and the
+    DataManager blocking rules (an entry blocks its own side and unblocks
+    the other, starting from the EMA-based initial block) reduce the
+    simulation to alternating between the LONG and SHORT entry masks. TP/SL
+    exits use the same strict comparisons as the active position states and
+    are located with vectorized scans, so only the trades themselves are
+    iterated in Python. With an IntrabarExitResolver, exits are decided on
+    the bar high/low paths instead of the closes.
+    """
+
+    _EXIT_SCAN_CHUNK: int = 256
+
+    def __init__(
+        self,
+        tp_ratio: float,
+        sl_ratio: float,
+        coin_precision: int,
+        ema_period: int = 100,
+        macd_fast_period: int = 12,
+        macd_slow_period: int = 26,
+        macd_signal_period: int = 26,
+        rsi_period: int = 6,
+    ) -> None:
+        """
+        Initialize the VectorizedBacktester.
+
+        Args:
+            tp_ratio (float): Take-profit distance relative to the entry price.
+            sl_ratio (float): Stop-loss distance relative to the entry price.
+            coin_precision (int): Decimals the TP/SL prices are rounded to.
+            ema_period (int, optional): EMA period. Defaults to 100.
+            macd_fast_period (int, optional): MACD fast EMA period. Defaults to 12.
+            macd_slow_period (int, optional): MACD slow EMA period. Defaults to 26.
+            macd_signal_period (int, optional): MACD signal period. Defaults to 26.
+            rsi_period (int, optional): RSI period. Defaults to 6.
+        """
+        self.tp_ratio: float = tp_ratio
+        self.sl_ratio: float = sl_ratio
+        self.coin_precision: int = coin_precision
+        self.ema_period: int = ema_period
+        self.macd_fast_period: int = macd_fast_period
+        self.macd_slow_period: int = macd_slow_period
+        self.macd_signal_period: int = macd_signal_period
+        self.rsi_period: int = rsi_period
+
+    def compute_indicators(self, close: np.ndarray) -> IndicatorSeries:
+        """
+        Compute the REM indicators over the whole close series at once.
+
+        Args:
+            close (np.ndarray): Close prices as float64.
+
+        Returns:
+            IndicatorSeries: Indicator arrays aligned with `close`.
+        """
+        macd, signal, _ = talib.MACD(
+            close,
+            fastperiod=self.macd_fast_period,
+            slowperiod=self.macd_slow_period,
+            signalperiod=self.macd_signal_period,
+        )
+        return IndicatorSeries(
+            macd_12=macd,
+            macd_26=signal,
+            ema_100=talib.EMA(close, timeperiod=self.ema_period),
+            rsi_6=talib.RSI(close, timeperiod=self.rsi_period),
+        )
+
+    @staticmethod
+    def entry_masks(
+        close: np.ndarray, indicators: IndicatorSeries
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate the FlatPositionState entry conditions for every bar.
+
+        Args:
+            close (np.ndarray): Close prices.
+            indicators (IndicatorSeries): Indicator arrays aligned with `close`.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: LONG and SHORT entry masks (ignoring blocks).
+        """
+        macd, signal = indicators.macd_12, indicators.macd_26
+        ema, rsi = indicators.ema_100, indicators.rsi_6
+        long_mask = (macd > signal) & (macd < 0) & (rsi > 50) & (close < ema)
+        short_mask = (macd < signal) & (macd > 0) & (rsi < 50) & (close > ema)
+        return long_mask, short_mask
+
+    def target_prices(self, position: str, price: float) -> Tuple[float, float]:
+        """
+        Calculate the TP and SL prices exactly like the live account manager.
+
+        Args:
+            position (str): "LONG" or "SHORT".
+            price (float): Entry price.
+
+        Returns:
+            Tuple[float, float]: A tuple containing (take_profit_price, stop_loss_price).
+        """
+        direction = 1 if position == "LONG" else -1
+        tp_price = float(
+            round(price * (1 + direction * self.tp_ratio), self.coin_precision)
+        )
+        sl_price = float(
+            round(price * (1 - direction * self.sl_ratio), self.coin_precision)
+        )
+        return tp_price, sl_price
+
+    def _find_exit(
+        self, close: np.ndarray, start: int, upper: float, lower: float
+    ) -> Optional[int]:
+        """
+        Find the first bar at or after `start` whose close leaves (lower, upper).
+
+        The series is scanned in geometrically growing chunks, so short
+        trades only touch a few bars while long ones stay vectorized.
+
+        Args:
+            close (np.ndarray): Close prices.
+            start (int): First bar to check.
+            upper (float): Exit when the close is strictly above this level.
+            lower (float): Exit when the close is strictly below this level.
+
+        Returns:
+            Optional[int]: Index of the exit bar, or None if the position stays open.
+        """
+        chunk = self._EXIT_SCAN_CHUNK
+        while start < len(close):
+            window = close[start : start + chunk]
+            hits = (window > upper) | (window < lower)
+            if hits.any():
+                return start + int(hits.argmax())
+            start += chunk
+            chunk *= 2
+        return None
+
+    def _find_close_exit(
+        self,
+        close: np.ndarray,
+        start: int,
+        position: str,
+        tp_price: float,
+        sl_price: float,
+    ) -> Optional[Tuple[int, bool]]:
+        """
+        Find the close exiting a position and whether it hit the take-profit.
+
+        Args:
+            close (np.ndarray): Close prices.
+            start (int): First bar to check.
+            position (str): "LONG" or "SHORT".
+            tp_price (float): Take-profit price.
+            sl_price (float): Stop-loss price.
+
+        Returns:
+            Optional[Tuple[int, bool]]: Exit bar index and TP flag, or None if
+                the position stays open.
+        """
+        is_long = position == "LONG"
+        upper, lower = (tp_price, sl_price) if is_long else (sl_price, tp_price)
+        exit_index = self._find_exit(close, start, upper, lower)
+        if exit_index is None:
+            return None
+        exit_price = close[exit_index]
+        return exit_index, bool(
+            exit_price > tp_price if is_long else exit_price < tp_price
+        )
+
+    def run_series(
+        self,
+        close: np.ndarray,
+        open_time: Optional[np.ndarray] = None,
+        indicators: Optional[IndicatorSeries] = None,
+        exit_resolver: Optional[IntrabarExitResolver] = None,
+    ) -> BacktestResult:
+        """
+        Backtest the strategy over a close series.
+
+        Args:
+            close (np.ndarray): Close prices as float64.
+            open_time (Optional[np.ndarray], optional): Bar open times in
+                milliseconds. Defaults to None (bar indices are used).
+            indicators (Optional[IndicatorSeries], optional): Precomputed
+                indicators, e.g. shared by runs that only differ in TP/SL.
+                Defaults to None (computed from `close`).
+            exit_resolver (Optional[IntrabarExitResolver], optional): Resolver of
+                TP/SL exits from the bars' high/low paths. Defaults to None
+                (exits on closes, like the polled live price).
+
+        Returns:
+            BacktestResult: Closed trades and their statistics.
+        """
+        close = np.ascontiguousarray(close, dtype=np.float64)
+        times = np.arange(len(close)) if open_time is None else open_time
+        if indicators is None:
+            indicators = self.compute_indicators(close)
+        warm = ~np.isnan(np.column_stack(indicators)).any(axis=1)
+        trades: List[Trade] = []
+        if not warm.any():
+            return BacktestResult(trades)
+
+        long_mask, short_mask = self.entry_masks(close, indicators)
+        entries = {
+            "LONG": np.flatnonzero(long_mask & warm),
+            "SHORT": np.flatnonzero(short_mask & warm),
+        }
+        first = int(warm.argmax())
+        position = "SHORT" if close[first] < indicators.ema_100[first] else "LONG"
+        step = first + 1
+        while True:
+            candidates = entries[position]
+            k = int(np.searchsorted(candidates, step))
+            if k == len(candidates):
+                break
+            entry = int(candidates[k])
+            price = float(close[entry])
+            tp_price, sl_price = self.target_prices(position, price)
+            found = (
+                self._find_close_exit(close, entry + 1, position, tp_price, sl_price)
+                if exit_resolver is None
+                else exit_resolver.find_exit(entry + 1, position, tp_price, sl_price)
+            )
+            if found is None:
+                break
+            exit_index, is_tp = found
+            trades.append(
+                Trade(
+                    position=position,
+                    entry_index=entry,
+                    exit_index=exit_index,
+                    entry_time=int(times[entry]),
+                    exit_time=int(times[exit_index]),
+                    entry_price=price,
+                    tp_price=tp_price,
+                    sl_price=sl_price,
+                    is_tp=bool(is_tp),
+                )
+            )
+            position = "SHORT" if position == "LONG" else "LONG"
+            step = exit_index + 1
+        return BacktestResult(trades)
+
+    def run(
+        self, ohlcv: OHLCV, exit_resolver: Optional[IntrabarExitResolver] = None
+    ) -> BacktestResult:
+        """
+        Backtest the strategy over parsed klines.
+
+        Args:
+            ohlcv (OHLCV): Historical klines as column arrays.
+            exit_resolver (Optional[IntrabarExitResolver], optional): Resolver of
+                TP/SL exits from the bars' high/low paths. Defaults to None
+                (exits on closes).
+
+        Returns:
+            BacktestResult: Closed trades and their statistics.
+        """
+        return self.run_series(
+            ohlcv.close, ohlcv.open_time, exit_resolver=exit_resolver
+        )
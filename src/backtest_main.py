@@ -0,0 +1,96 @@
+import argparse
+from typing import List, Optional
+from backtest.intrabar_exit_resolver import IntrabarExitResolver
+from backtest.kline_loader import KlineLoader
+from backtest.vectorized_backtester import VectorizedBacktester
+from bot.bot_settings import SETTINGS
+from utils.date_utils import DateUtils
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the backtest command line.
+
+    Args:
+        argv (Optional[List[str]], optional): Arguments to parse. Defaults to None (sys.argv).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Backtest the REM strategy over historical klines."
+    )
+    parser.add_argument("csv", help="Kline CSV file (Binance kline layout).")
+    parser.add_argument(
+        "--download-days",
+        type=float,
+        default=None,
+        help="Download this many days of SYMBOL/INTERVAL klines into the CSV first.",
+    )
+    parser.add_argument("--tp-ratio", type=float, default=SETTINGS.TP_RATIO)
+    parser.add_argument("--sl-ratio", type=float, default=SETTINGS.SL_RATIO)
+    parser.add_argument("--coin-precision", type=int, default=SETTINGS.COIN_PRECISION)
+    parser.add_argument(
+        "--intrabar",
+        action="store_true",
+        help="Resolve TP/SL exits from the bar high/low paths instead of closes.",
+    )
+    parser.add_argument(
+        "--lower-csv",
+        default=None,
+        help="Lower timeframe kline CSV for the intrabar drill-down (implies --intrabar).",
+    )
+    parser.add_argument(
+        "--assume-stop-loss",
+        action="store_true",
+        help="Count bars touching both levels as stop-losses when undecidable.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Entry point of the backtest command.
+
+    Optionally downloads klines, runs the vectorized backtest (with
+    intrabar exits if requested) and prints the trade statistics.
+
+    Args:
+        argv (Optional[List[str]], optional): Arguments to parse. Defaults to None (sys.argv).
+    """
+    args = parse_args(argv)
+    if args.download_days is not None:
+        from binance.client import Client
+
+        end_time = DateUtils.get_timestamp_ms()
+        start_time = end_time - int(args.download_days * 86_400_000)
+        client = Client(SETTINGS.API_PUBLIC_KEY, SETTINGS.API_SECRET_KEY)
+        KlineLoader.write_csv(
+            args.csv,
+            KlineLoader.fetch_klines(
+                client, SETTINGS.SYMBOL, SETTINGS.INTERVAL, start_time, end_time
+            ),
+        )
+
+    ohlcv = KlineLoader.read_csv(args.csv)
+    exit_resolver = None
+    if args.intrabar or args.lower_csv is not None:
+        exit_resolver = IntrabarExitResolver(
+            ohlcv,
+            None if args.lower_csv is None else KlineLoader.read_csv(args.lower_csv),
+            args.assume_stop_loss,
+        )
+    result = VectorizedBacktester(
+        args.tp_ratio, args.sl_ratio, args.coin_precision
+    ).run(ohlcv, exit_resolver)
+    print(f"Bars: {len(ohlcv.close)}")
+    print(
+        f"Trades: {len(result.trades)} (TP: {result.win_count} SL: {result.loss_count})"
+    )
+    print(f"Win-Rate: {result.win_rate * 100:.2f}%")
+    print(f"PnL: {result.pnl * 100:.2f}%")
+    print(f"Max drawdown: {result.max_drawdown * 100:.2f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,23 @@
-from bot.bot_settings import SETTINGS
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from bot.bot_settings import SETTINGS, BotSettings
+from bot.symbol_settings import SymbolSettings
+from binance_adapter.account_stream import AccountStream
+from binance_adapter.exchange_filter_cache import ExchangeFilterCache, SymbolFilters
 from binance.client import Client
+from utils.logger import Logger
+
+
+class ExitFill(NamedTuple):
+    """
+    Fill of the exit order that closed a position.
+
+    Attributes:
+        is_tp (bool): True if the take-profit order filled, False for the stop-loss.
+        price (float): Average fill price.
+    """
+
+    is_tp: bool
+    price: float
 
 
 class AccountManager:
@@ -7,16 +25,63 @@ class AccountManager:
     Manages account operations such as retrieving balances,
     calculating order quantities, and placing futures orders
     (market, take-profit, and stop-loss) on Binance.
+
+    The order parameters are built by separate helpers so that the
+    asynchronous account manager submits exactly the same orders. The entry
+    and its TP/SL orders can also be sent as one batch order (a bracket),
+    whose per-leg results are checked and rolled back on partial failure.
+    When an AccountStream is attached, balances and positions are served
+    from its cache while it is fresh, and over REST otherwise. With exchange
+    filters, prices and quantities follow the symbol's tick and lot sizes
+    instead of `COIN_PRECISION`. The ids of the placed TP/SL orders are kept,
+    so that their fills can be picked up from the account stream.
     """
 
-    def __init__(self, client: Client) -> None:
+    BRACKET_LEGS: Tuple[str, ...] = ("entry", "take-profit", "stop-loss")
+
+    def __init__(
+        self, client: Client, symbol_settings: Optional[SymbolSettings] = None
+    ) -> None:
         """
         Initialize the AccountManager.
 
         Args:
             client (Client): Binance Futures client instance used for API communication.
+            symbol_settings (Optional[SymbolSettings], optional): Settings of the
+                traded symbol. Defaults to None (the `[POSITION]` settings).
+
+        Attributes:
+            account_stream (Optional[AccountStream]): User data stream cache
+                serving balances and positions. Defaults to None (REST only).
+            exchange_filters (Optional[SymbolFilters]): Exchange filters of the
+                symbol. Defaults to None (`COIN_PRECISION` rounding).
+            exit_order_ids (Dict[str, int]): Order ids of the open position's
+                "take-profit" and "stop-loss" orders.
         """
         self.client: Client = client
+        self.symbol_settings: Union[SymbolSettings, BotSettings] = (
+            SETTINGS if symbol_settings is None else symbol_settings
+        )
+        self.account_stream: Optional[AccountStream] = None
+        self.exchange_filters: Optional[SymbolFilters] = None
+        self.exit_order_ids: Dict[str, int] = {}
+        self._exit_stream_connections: Optional[int] = None
+
+    def use_exchange_filters(self, cache: ExchangeFilterCache) -> None:
+        """
+        Take the exchange filters of the traded symbol from a cache.
+
+        Symbols missing from the cache keep the `COIN_PRECISION` rounding.
+
+        Args:
+            cache (ExchangeFilterCache): Loaded exchange filter cache.
+        """
+        symbol = self.symbol_settings.SYMBOL
+        self.exchange_filters = cache.get(symbol)
+        if self.exchange_filters is None:
+            Logger.log_info(
+                f"No exchange filters for {symbol}, rounding with COIN_PRECISION"
+            )
 
     def get_coin_amount(self, balance: float, price: float) -> float:
         """
@@ -29,38 +94,472 @@ class AccountManager:
         Returns:
             float: Calculated coin amount.
         """
-        notional: float = balance * float(SETTINGS.LEVERAGE)
+        notional: float = balance * float(self.symbol_settings.LEVERAGE)
         return notional / price
 
-    def get_account_balance(self) -> float:
+    def order_quantity(self, quantity: float, price: float) -> float:
         """
-        Retrieve the USDT balance from the futures account.
+        Round an order quantity down to the lot step and check the minimums.
+
+        Without exchange filters the quantity is returned unchanged.
+
+        Args:
+            quantity (float): Unrounded quantity.
+            price (float): Expected fill price.
+
+        Returns:
+            float: Quantity accepted by the exchange filters.
+
+        Raises:
+            ValueError: If the rounded order is below the minimum quantity or notional.
+        """
+        filters = self.exchange_filters
+        if filters is None:
+            return quantity
+        rounded = filters.round_quantity(quantity)
+        if not filters.meets_minimums(rounded, price):
+            raise ValueError(
+                f"{self.symbol_settings.SYMBOL} order of {rounded} at {price} "
+                f"is below the exchange minimums"
+            )
+        return rounded
+
+    def calculate_target_prices(
+        self, order_type: str, coin_price: float
+    ) -> Tuple[float, float]:
+        """
+        Calculate the take-profit and stop-loss prices of a new position.
+
+        Prices are rounded to the tick size with exchange filters, or to
+        `COIN_PRECISION` decimals otherwise.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            coin_price (float): Entry price of the coin.
+
+        Returns:
+            Tuple[float, float]: A tuple containing (take_profit_price, stop_loss_price).
+        """
+        settings = self.symbol_settings
+        direction = 1 if order_type == "LONG" else -1
+        filters = self.exchange_filters
+        if filters is not None:
+            return (
+                filters.round_price(coin_price * (1 + direction * settings.TP_RATIO)),
+                filters.round_price(coin_price * (1 - direction * settings.SL_RATIO)),
+            )
+        tp_price: float = float(
+            round(
+                coin_price * (1 + direction * settings.TP_RATIO),
+                settings.COIN_PRECISION,
+            )
+        )
+        sl_price: float = float(
+            round(
+                coin_price * (1 - direction * settings.SL_RATIO),
+                settings.COIN_PRECISION,
+            )
+        )
+        return tp_price, sl_price
+
+    @staticmethod
+    def parse_usdt_balance(account_info: List[Dict[str, Any]]) -> float:
+        """
+        Extract the USDT balance from a futures account balance response.
+
+        Args:
+            account_info (List[Dict[str, Any]]): Per-asset balances.
 
         Returns:
             float: Available USDT balance. Returns 0.0 if not found.
         """
-        account_info = self.client.futures_account_balance()
         for item in account_info:
             if item["asset"] == "USDT":
                 return float(item["balance"])
         return 0.0
 
-    def enter_position(self, order_type: str, quantity: float) -> None:
+    def entry_order_params(self, order_type: str, quantity: float) -> Dict[str, Any]:
         """
-        Enter a futures position (LONG or SHORT) using a market order.
+        Build the market order parameters that open a position.
 
         Args:
             order_type (str): Type of position ("LONG" or "SHORT").
             quantity (float): Quantity of the asset to trade.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for `futures_create_order`.
         """
         side, position = ("BUY", "LONG") if order_type == "LONG" else ("SELL", "SHORT")
+        return {
+            "symbol": self.symbol_settings.SYMBOL,
+            "quantity": quantity,
+            "type": "MARKET",
+            "side": side,
+            "positionSide": position,
+        }
+
+    def _exit_order_params(
+        self, order_type: str, quantity: float, exit_type: str, stop_price: float
+    ) -> Dict[str, Any]:
+        """
+        Build the conditional market order parameters that close a position.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            quantity (float): Quantity of the asset.
+            exit_type (str): Binance order type ("TAKE_PROFIT_MARKET" or "STOP_MARKET").
+            stop_price (float): Price at which to trigger the order.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for `futures_create_order`.
+        """
+        side, position = ("SELL", "LONG") if order_type == "LONG" else ("BUY", "SHORT")
+        return {
+            "symbol": self.symbol_settings.SYMBOL,
+            "quantity": quantity,
+            "type": exit_type,
+            "positionSide": position,
+            "firstTrigger": "PLACE_ORDER",
+            "timeInForce": "GTE_GTC",
+            "stopPrice": stop_price,
+            "side": side,
+            "secondTrigger": "CANCEL_ORDER",
+            "workingType": "MARK_PRICE",
+            "priceProtect": "true",
+        }
+
+    def tp_order_params(
+        self, order_type: str, quantity: float, tp_price: float
+    ) -> Dict[str, Any]:
+        """
+        Build the Take-Profit (TP) order parameters for an open position.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            quantity (float): Quantity of the asset.
+            tp_price (float): Price at which to trigger the TP order.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for `futures_create_order`.
+        """
+        return self._exit_order_params(
+            order_type, quantity, "TAKE_PROFIT_MARKET", tp_price
+        )
+
+    def sl_order_params(
+        self, order_type: str, quantity: float, sl_price: float
+    ) -> Dict[str, Any]:
+        """
+        Build the Stop-Loss (SL) order parameters for an open position.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            quantity (float): Quantity of the asset.
+            sl_price (float): Price at which to trigger the SL order.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for `futures_create_order`.
+        """
+        return self._exit_order_params(order_type, quantity, "STOP_MARKET", sl_price)
+
+    def close_order_params(self, order_type: str, quantity: float) -> Dict[str, Any]:
+        """
+        Build the market order parameters that close a position.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            quantity (float): Quantity of the asset to close.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for `futures_create_order`.
+        """
+        side = "SELL" if order_type == "LONG" else "BUY"
+        return {
+            "symbol": self.symbol_settings.SYMBOL,
+            "quantity": quantity,
+            "type": "MARKET",
+            "side": side,
+            "positionSide": order_type,
+        }
 
+    def bracket_order_params(
+        self, order_type: str, quantity: float, tp_price: float, sl_price: float
+    ) -> List[Dict[str, str]]:
+        """
+        Build the batch order legs of an entry with its TP and SL orders.
+
+        Batch orders are sent as JSON, so every parameter is a string.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            quantity (float): Quantity of the asset to trade.
+            tp_price (float): Price at which to trigger the TP order.
+            sl_price (float): Price at which to trigger the SL order.
+
+        Returns:
+            List[Dict[str, str]]: The entry, TP and SL legs, in `BRACKET_LEGS` order.
+        """
+        legs = (
+            self.entry_order_params(order_type, quantity),
+            self.tp_order_params(order_type, quantity, tp_price),
+            self.sl_order_params(order_type, quantity, sl_price),
+        )
+        return [{key: str(value) for key, value in leg.items()} for leg in legs]
+
+    @classmethod
+    def rejected_legs(cls, results: List[Dict[str, Any]]) -> List[str]:
+        """
+        Describe the legs of a bracket batch order that were rejected.
+
+        Accepted legs are returned as orders (with an `orderId`); rejected
+        ones as an error object with `code` and `msg`.
+
+        Args:
+            results (List[Dict[str, Any]]): Per-leg results, in `BRACKET_LEGS` order.
+
+        Returns:
+            List[str]: One description per rejected leg (empty if all were accepted).
+        """
+        rejected = []
+        for index, name in enumerate(cls.BRACKET_LEGS):
+            leg = results[index] if index < len(results) else {}
+            if "orderId" not in leg:
+                rejected.append(f"{name}: {leg.get('code')} {leg.get('msg')}")
+        return rejected
+
+    def _bracket_error(self, rejected: List[str]) -> RuntimeError:
+        """
+        Build the error raised once a partially failed bracket is rolled back.
+
+        Args:
+            rejected (List[str]): Descriptions of the rejected legs.
+
+        Returns:
+            RuntimeError: The error to raise.
+        """
+        return RuntimeError(
+            f"{self.symbol_settings.SYMBOL} bracket order rolled back, "
+            f"rejected {'; '.join(rejected)}"
+        )
+
+    @staticmethod
+    def parse_position_amount(
+        positions: List[Dict[str, Any]], order_type: str
+    ) -> float:
+        """
+        Extract a position amount from a futures position information response.
+
+        Args:
+            positions (List[Dict[str, Any]]): Positions of the symbol.
+            order_type (str): Position side ("LONG" or "SHORT").
+
+        Returns:
+            float: Signed position amount. Returns 0.0 if not found.
+        """
+        for item in positions:
+            if item.get("positionSide") == order_type:
+                return float(item["positionAmt"])
+        return 0.0
+
+    def cached_balance(self) -> Optional[float]:
+        """
+        Return the USDT balance from the account stream cache.
+
+        Returns:
+            Optional[float]: The cached balance, or None if no stream is
+                attached or its cache is stale.
+        """
+        if self.account_stream is None:
+            return None
+        return self.account_stream.get_balance("USDT")
+
+    def cached_position_amount(self, order_type: str) -> Optional[float]:
+        """
+        Return a position amount of the traded symbol from the account stream cache.
+
+        Args:
+            order_type (str): Position side ("LONG" or "SHORT").
+
+        Returns:
+            Optional[float]: The cached amount, or None if no stream is
+                attached or its cache is stale.
+        """
+        if self.account_stream is None:
+            return None
+        position = self.account_stream.get_position(
+            self.symbol_settings.SYMBOL, order_type
+        )
+        return None if position is None else position.amount
+
+    def _reset_exit_orders(self) -> None:
+        """
+        Forget the exit orders of the previous position.
+
+        The current account stream connection is remembered, since fills
+        can only be relied on while that connection lasts.
+        """
+        self._forget_exit_orders()
+        stream = self.account_stream
+        self._exit_stream_connections = None if stream is None else stream.connections
+
+    def _forget_exit_orders(self) -> None:
+        """
+        Forget the exit orders and stop tracking them on the account stream.
+        """
+        if self.account_stream is not None:
+            for order_id in self.exit_order_ids.values():
+                self.account_stream.untrack_order(order_id)
+        self.exit_order_ids = {}
+
+    def _track_exit_order(self, leg: str, order: Dict[str, Any]) -> None:
+        """
+        Remember the order id of a placed exit order.
+
+        The account stream keeps the updates of the order until it is
+        forgotten, so that its fill is never dropped from the stream cache
+        by the updates of other orders.
+
+        Args:
+            leg (str): "take-profit" or "stop-loss".
+            order (Dict[str, Any]): The order placement response.
+        """
+        order_id = int(order["orderId"])
+        self.exit_order_ids[leg] = order_id
+        if self.account_stream is not None:
+            self.account_stream.track_order(order_id)
+
+    def exits_tracked(self) -> bool:
+        """
+        Whether the exit of the open position will be reported as a fill.
+
+        Returns:
+            bool: True if both exit orders are known and the account stream is
+                fresh and has not reconnected (and possibly missed events)
+                since they were placed.
+        """
+        stream = self.account_stream
+        return (
+            stream is not None
+            and len(self.exit_order_ids) == 2
+            and stream.connections == self._exit_stream_connections
+            and stream.is_fresh()
+        )
+
+    def find_exit_fill(self) -> Optional[ExitFill]:
+        """
+        Look up a fill of the open position's exit orders in the account stream.
+
+        Returns:
+            Optional[ExitFill]: The fill, or None if neither exit order filled
+                (or no account stream is attached).
+        """
+        stream = self.account_stream
+        if stream is None:
+            return None
+        for leg, order_id in self.exit_order_ids.items():
+            update = stream.get_order_update(order_id)
+            if update is not None and update.get("X") == "FILLED":
+                return ExitFill(leg == "take-profit", float(update["ap"]))
+        return None
+
+    def fetch_exit_fill(self) -> Optional[ExitFill]:
+        """
+        Look up a fill of the open position's exit orders over REST.
+
+        Used when no account stream saw the fill, e.g. after a restart.
+
+        Returns:
+            Optional[ExitFill]: The fill, or None if neither exit order filled.
+        """
+        for leg, order_id in self.exit_order_ids.items():
+            order = self.client.futures_get_order(
+                symbol=self.symbol_settings.SYMBOL, orderId=order_id
+            )
+            if order.get("status") == "FILLED":
+                return ExitFill(leg == "take-profit", float(order["avgPrice"]))
+        return None
+
+    def _remaining_exit_order(self, fill: ExitFill) -> Optional[int]:
+        """
+        Pop the id of the exit order left open by a fill and forget both orders.
+
+        Args:
+            fill (ExitFill): Fill of the other exit order.
+
+        Returns:
+            Optional[int]: Id of the order to cancel, if known.
+        """
+        remaining = self.exit_order_ids.get(
+            "stop-loss" if fill.is_tp else "take-profit"
+        )
+        self._forget_exit_orders()
+        return remaining
+
+    def cancel_remaining_exit(self, fill: ExitFill) -> None:
+        """
+        Cancel the exit order that did not fill.
+
+        Failures (e.g. the exchange already expired the order with the
+        position) are logged.
+
+        Args:
+            fill (ExitFill): Fill of the other exit order.
+        """
+        order_id = self._remaining_exit_order(fill)
+        if order_id is None:
+            return
+        try:
+            self.client.futures_cancel_order(
+                symbol=self.symbol_settings.SYMBOL, orderId=order_id
+            )
+        except Exception as e:
+            Logger.log_exception(f"Exit order {order_id} cancel failed: {e}")
+
+    def get_account_balance(self) -> float:
+        """
+        Retrieve the USDT balance from the futures account.
+
+        The account stream cache is used when fresh, REST otherwise.
+
+        Returns:
+            float: Available USDT balance. Returns 0.0 if not found.
+        """
+        cached = self.cached_balance()
+        if cached is not None:
+            return cached
+        return self.parse_usdt_balance(self.client.futures_account_balance())
+
+    def get_position_amount(self, order_type: str) -> float:
+        """
+        Retrieve the position amount of the traded symbol.
+
+        The account stream cache is used when fresh, REST otherwise.
+
+        Args:
+            order_type (str): Position side ("LONG" or "SHORT").
+
+        Returns:
+            float: Signed position amount. Returns 0.0 if not found.
+        """
+        cached = self.cached_position_amount(order_type)
+        if cached is not None:
+            return cached
+        positions = self.client.futures_position_information(
+            symbol=self.symbol_settings.SYMBOL
+        )
+        return self.parse_position_amount(positions, order_type)
+
+    def enter_position(self, order_type: str, quantity: float) -> None:
+        """
+        Enter a futures position (LONG or SHORT) using a market order.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            quantity (float): Quantity of the asset to trade.
+        """
+        self._reset_exit_orders()
         self.client.futures_create_order(
-            symbol=SETTINGS.SYMBOL,
-            quantity=quantity,
-            type="MARKET",
-            side=side,
-            positionSide=position,
+            **self.entry_order_params(order_type, quantity)
         )
 
     def place_tp_order(self, order_type: str, quantity: float, tp_price: float) -> None:
@@ -72,21 +571,10 @@ class AccountManager:
             quantity (float): Quantity of the asset.
             tp_price (float): Price at which to trigger the TP order.
         """
-        side, position = ("SELL", "LONG") if order_type == "LONG" else ("BUY", "SHORT")
-
-        self.client.futures_create_order(
-            symbol=SETTINGS.SYMBOL,
-            quantity=quantity,
-            type="TAKE_PROFIT_MARKET",
-            positionSide=position,
-            firstTrigger="PLACE_ORDER",
-            timeInForce="GTE_GTC",
-            stopPrice=tp_price,
-            side=side,
-            secondTrigger="CANCEL_ORDER",
-            workingType="MARK_PRICE",
-            priceProtect="true",
+        order = self.client.futures_create_order(
+            **self.tp_order_params(order_type, quantity, tp_price)
         )
+        self._track_exit_order("take-profit", order)
 
     def place_sl_order(self, order_type: str, quantity: float, sl_price: float) -> None:
         """
@@ -97,18 +585,49 @@ class AccountManager:
             quantity (float): Quantity of the asset.
             sl_price (float): Price at which to trigger the SL order.
         """
-        side, position = ("SELL", "LONG") if order_type == "LONG" else ("BUY", "SHORT")
+        order = self.client.futures_create_order(
+            **self.sl_order_params(order_type, quantity, sl_price)
+        )
+        self._track_exit_order("stop-loss", order)
 
-        self.client.futures_create_order(
-            symbol=SETTINGS.SYMBOL,
-            quantity=quantity,
-            type="STOP_MARKET",
-            positionSide=position,
-            firstTrigger="PLACE_ORDER",
-            timeInForce="GTE_GTC",
-            stopPrice=sl_price,
-            side=side,
-            secondTrigger="CANCEL_ORDER",
-            workingType="MARK_PRICE",
-            priceProtect="true",
+    def place_bracket_orders(
+        self, order_type: str, quantity: float, tp_price: float, sl_price: float
+    ) -> None:
+        """
+        Enter a position with its TP and SL orders in a single batch request.
+
+        If any leg is rejected the bracket is rolled back: an opened position
+        is closed at market and the accepted TP/SL orders are cancelled.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            quantity (float): Quantity of the asset to trade.
+            tp_price (float): Price at which to trigger the TP order.
+            sl_price (float): Price at which to trigger the SL order.
+
+        Raises:
+            RuntimeError: If any leg was rejected (after rolling back).
+        """
+        self._reset_exit_orders()
+        results = self.client.futures_place_batch_order(
+            batchOrders=self.bracket_order_params(
+                order_type, quantity, tp_price, sl_price
+            )
         )
+        rejected = self.rejected_legs(results)
+        if not rejected:
+            self._track_exit_order("take-profit", results[1])
+            self._track_exit_order("stop-loss", results[2])
+            return
+        exit_order_ids = [leg["orderId"] for leg in results[1:] if "orderId" in leg]
+        try:
+            if results and "orderId" in results[0]:
+                self.client.futures_create_order(
+                    **self.close_order_params(order_type, quantity)
+                )
+        finally:
+            if exit_order_ids:
+                self.client.futures_cancel_orders(
+                    symbol=self.symbol_settings.SYMBOL, orderidlist=exit_order_ids
+                )
+        raise self._bracket_error(rejected)
@@ -0,0 +1,309 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple
+from binance.client import Client
+from binance_adapter.websocket_stream import WebSocketStream
+from utils.date_utils import DateUtils
+from utils.logger import Logger
+
+
+class PositionInfo(NamedTuple):
+    """
+    Cached state of one futures position.
+
+    Attributes:
+        amount (float): Signed position amount (0.0 when flat).
+        entry_price (float): Average entry price.
+    """
+
+    amount: float
+    entry_price: float
+
+
+PositionKey = Tuple[str, str]
+
+
+class AccountStream(WebSocketStream):
+    """
+    Caches the futures account state from the user data stream.
+
+    The stream connects with a listen key, which a background thread keeps
+    alive. After every (re)connection the balances and positions are seeded
+    over REST; from then on `ACCOUNT_UPDATE` events keep them current and
+    the latest `ORDER_TRADE_UPDATE` of every order is kept (the oldest are
+    dropped past `MAX_ORDER_UPDATES`, except for tracked orders). Readers should
+    only trust the cache while `is_fresh` holds (connected, seeded and with
+    a listen key that has not lapsed) and fall back to REST otherwise.
+    """
+
+    DEFAULT_BASE_URL: str = "wss://fstream.binance.com"
+    KEEPALIVE_INTERVAL: float = 1_800.0
+    LISTEN_KEY_TTL_MS: int = 3_600_000
+    MAX_ORDER_UPDATES: int = 256
+
+    def __init__(self, client: Client, base_url: str = DEFAULT_BASE_URL) -> None:
+        """
+        Initialize the AccountStream.
+
+        Args:
+            client (Client): Binance client used for the listen key and REST seeding.
+            base_url (str, optional): WebSocket base URL. Defaults to Binance Futures.
+
+        Attributes:
+            listen_key (Optional[str]): Listen key of the current connection.
+            balances (Dict[str, float]): Wallet balance per asset.
+            positions (Dict[PositionKey, PositionInfo]): Positions per
+                (symbol, position side).
+            order_updates (OrderedDict[int, Dict[str, Any]]): Latest order
+                update payload per order id, oldest first.
+            tracked_orders (Set[int]): Ids of the orders whose updates are
+                never dropped from `order_updates`.
+            connections (int): Number of (re)connections so far; events may
+                have been missed whenever it changes.
+        """
+        super().__init__()
+        self.client: Client = client
+        self.base_url: str = base_url.rstrip("/")
+        self.listen_key: Optional[str] = None
+        self.balances: Dict[str, float] = {}
+        self.positions: Dict[PositionKey, PositionInfo] = {}
+        self.order_updates: OrderedDict[int, Dict[str, Any]] = OrderedDict()
+        self.tracked_orders: Set[int] = set()
+        self.connections: int = 0
+        self._listen_key_ms: Optional[int] = None
+        self._seeded: bool = False
+        self._lock: threading.Lock = threading.Lock()
+        self._keepalive_thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def create(cls, api_key: str, api_secret: str) -> AccountStream:
+        """
+        Build a stream with its own synchronous client.
+
+        Asynchronous runtimes use this, since the stream callbacks run in
+        worker threads.
+
+        Args:
+            api_key (str): Binance API public key.
+            api_secret (str): Binance API secret key.
+
+        Returns:
+            AccountStream: The (not yet started) stream.
+        """
+        return cls(Client(api_key, api_secret))
+
+    def _get_url(self) -> str:
+        """
+        Obtain (or extend) the listen key and build the stream URL.
+
+        Returns:
+            str: The stream URL.
+        """
+        self.listen_key = self.client.futures_stream_get_listen_key()
+        self._listen_key_ms = DateUtils.get_timestamp_ms()
+        return f"{self.base_url}/ws/{self.listen_key}"
+
+    def _on_connect(self) -> None:
+        """
+        Seed balances and positions over REST after each (re)connection.
+        """
+        balances = self.client.futures_account_balance()
+        positions = self.client.futures_position_information()
+        with self._lock:
+            self.balances = {item["asset"]: float(item["balance"]) for item in balances}
+            self.positions = {
+                (item["symbol"], item.get("positionSide", "BOTH")): PositionInfo(
+                    float(item["positionAmt"]), float(item["entryPrice"])
+                )
+                for item in positions
+            }
+            self._seeded = True
+            self.connections += 1
+
+    def _apply_account_update(self, update: Dict[str, Any]) -> None:
+        """
+        Apply the balances and positions of an `ACCOUNT_UPDATE` event.
+
+        Args:
+            update (Dict[str, Any]): The `a` object of the event.
+        """
+        balances: List[Dict[str, Any]] = update.get("B", [])
+        positions: List[Dict[str, Any]] = update.get("P", [])
+        with self._lock:
+            for balance in balances:
+                self.balances[balance["a"]] = float(balance["wb"])
+            for position in positions:
+                self.positions[(position["s"], position["ps"])] = PositionInfo(
+                    float(position["pa"]), float(position["ep"])
+                )
+
+    def _apply_order_update(self, order: Dict[str, Any]) -> None:
+        """
+        Keep the latest `ORDER_TRADE_UPDATE` payload of an order.
+
+        Past `MAX_ORDER_UPDATES`, the oldest updates of untracked orders are
+        dropped; the cache only grows beyond it while tracked orders fill it.
+
+        Args:
+            order (Dict[str, Any]): The `o` object of the event.
+        """
+        order_id = int(order["i"])
+        with self._lock:
+            self.order_updates.pop(order_id, None)
+            self.order_updates[order_id] = order
+            excess = len(self.order_updates) - self.MAX_ORDER_UPDATES
+            for stale_id in list(self.order_updates):
+                if excess <= 0:
+                    break
+                if stale_id != order_id and stale_id not in self.tracked_orders:
+                    del self.order_updates[stale_id]
+                    excess -= 1
+
+    def track_order(self, order_id: int) -> None:
+        """
+        Keep the updates of an order until it is untracked.
+
+        Args:
+            order_id (int): Exchange order id.
+        """
+        with self._lock:
+            self.tracked_orders.add(int(order_id))
+
+    def untrack_order(self, order_id: int) -> None:
+        """
+        Let the updates of an order be dropped like any other.
+
+        Args:
+            order_id (int): Exchange order id.
+        """
+        with self._lock:
+            self.tracked_orders.discard(int(order_id))
+
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        """
+        Apply a user data stream event to the cache.
+
+        An expired listen key closes the connection, so that the stream
+        reconnects (and reseeds) with a new one.
+
+        Args:
+            message (Dict[str, Any]): The user data stream event.
+        """
+        event_type = message.get("e")
+        if event_type == "ACCOUNT_UPDATE":
+            self._apply_account_update(message["a"])
+        elif event_type == "ORDER_TRADE_UPDATE":
+            self._apply_order_update(message["o"])
+        elif event_type == "listenKeyExpired":
+            self._listen_key_ms = None
+            if self._websocket is not None and self._loop is not None:
+                asyncio.run_coroutine_threadsafe(self._websocket.close(), self._loop)
+
+    def _keepalive_forever(self) -> None:
+        """
+        Extend the listen key periodically until the stream is stopped.
+
+        A failed keepalive is logged; the cache turns stale once the listen
+        key has lapsed.
+        """
+        while not self._stopped.wait(self.KEEPALIVE_INTERVAL):
+            if self.listen_key is None:
+                continue
+            try:
+                self.client.futures_stream_keepalive(listenKey=self.listen_key)
+                self._listen_key_ms = DateUtils.get_timestamp_ms()
+            except Exception as e:
+                Logger.log_exception(f"Listen key keepalive failed: {e}")
+
+    def start(self) -> None:
+        """
+        Start consuming the stream and keeping its listen key alive.
+        """
+        super().start()
+        if self._keepalive_thread is not None and self._keepalive_thread.is_alive():
+            return
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive_forever, name="AccountStreamKeepalive", daemon=True
+        )
+        self._keepalive_thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the stream and the keepalive thread, and close the listen key.
+
+        Args:
+            timeout (float, optional): Seconds to wait for each thread. Defaults to 5.0.
+        """
+        super().stop(timeout)
+        if self._keepalive_thread is not None:
+            self._keepalive_thread.join(timeout)
+        if self.listen_key is not None:
+            try:
+                self.client.futures_stream_close(listenKey=self.listen_key)
+            except Exception as e:
+                Logger.log_exception(f"Listen key close failed: {e}")
+            self.listen_key = None
+        self._seeded = False
+
+    def is_fresh(self) -> bool:
+        """
+        Whether the cached account state can be trusted.
+
+        Returns:
+            bool: True if the stream is connected, seeded and its listen key
+                was obtained or extended within its validity.
+        """
+        listen_key_ms = self._listen_key_ms
+        return (
+            self.is_connected
+            and self._seeded
+            and listen_key_ms is not None
+            and DateUtils.get_timestamp_ms() - listen_key_ms < self.LISTEN_KEY_TTL_MS
+        )
+
+    def get_balance(self, asset: str = "USDT") -> Optional[float]:
+        """
+        Return the cached wallet balance of an asset, if fresh.
+
+        Args:
+            asset (str, optional): Asset name. Defaults to "USDT".
+
+        Returns:
+            Optional[float]: The balance (0.0 if the asset is not held), or
+                None if the cache is stale.
+        """
+        if not self.is_fresh():
+            return None
+        return self.balances.get(asset, 0.0)
+
+    def get_position(self, symbol: str, position_side: str) -> Optional[PositionInfo]:
+        """
+        Return the cached position of a symbol and side, if fresh.
+
+        Args:
+            symbol (str): Trading symbol (e.g., "ETHUSDT").
+            position_side (str): "LONG", "SHORT" or "BOTH".
+
+        Returns:
+            Optional[PositionInfo]: The position (flat if unknown), or None if
+                the cache is stale.
+        """
+        if not self.is_fresh():
+            return None
+        return self.positions.get((symbol, position_side), PositionInfo(0.0, 0.0))
+
+    def get_order_update(self, order_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Return the latest `ORDER_TRADE_UPDATE` payload of an order.
+
+        Args:
+            order_id (int): Exchange order id.
+
+        Returns:
+            Optional[Dict[str, Any]]: The `o` object of the latest event, or
+                None if no event was received for the order.
+        """
+        return self.order_updates.get(int(order_id))
@@ -0,0 +1,185 @@
+import asyncio
+from typing import Optional
+from binance import AsyncClient
+from binance_adapter.account_manager import AccountManager, ExitFill
+from bot.symbol_settings import SymbolSettings
+from utils.logger import Logger
+
+
+class AsyncAccountManager(AccountManager):
+    """
+    Asynchronous counterpart of AccountManager built on an AsyncClient.
+
+    Quantity, target price and order parameter calculations are inherited
+    unchanged; balances are read and orders are submitted with awaitable
+    requests. The synchronous request methods are not usable with an
+    AsyncClient, use the `async_` prefixed ones instead.
+    """
+
+    def __init__(
+        self, client: AsyncClient, symbol_settings: Optional[SymbolSettings] = None
+    ) -> None:
+        """
+        Initialize the AsyncAccountManager.
+
+        Args:
+            client (AsyncClient): Asynchronous Binance client used for API communication.
+            symbol_settings (Optional[SymbolSettings], optional): Settings of the
+                traded symbol. Defaults to None (the `[POSITION]` settings).
+        """
+        super().__init__(client, symbol_settings)  # type: ignore[arg-type]
+        self.client: AsyncClient = client  # type: ignore[assignment]
+
+    async def async_get_account_balance(self) -> float:
+        """
+        Retrieve the USDT balance from the futures account.
+
+        The account stream cache is used when fresh, REST otherwise.
+
+        Returns:
+            float: Available USDT balance. Returns 0.0 if not found.
+        """
+        cached = self.cached_balance()
+        if cached is not None:
+            return cached
+        account_info = await self.client.futures_account_balance()
+        return self.parse_usdt_balance(account_info)
+
+    async def async_get_position_amount(self, order_type: str) -> float:
+        """
+        Retrieve the position amount of the traded symbol.
+
+        The account stream cache is used when fresh, REST otherwise.
+
+        Args:
+            order_type (str): Position side ("LONG" or "SHORT").
+
+        Returns:
+            float: Signed position amount. Returns 0.0 if not found.
+        """
+        cached = self.cached_position_amount(order_type)
+        if cached is not None:
+            return cached
+        positions = await self.client.futures_position_information(
+            symbol=self.symbol_settings.SYMBOL
+        )
+        return self.parse_position_amount(positions, order_type)
+
+    async def async_enter_position(self, order_type: str, quantity: float) -> None:
+        """
+        Enter a futures position (LONG or SHORT) using a market order.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            quantity (float): Quantity of the asset to trade.
+        """
+        self._reset_exit_orders()
+        await self.client.futures_create_order(
+            **self.entry_order_params(order_type, quantity)
+        )
+
+    async def async_place_exit_orders(
+        self, order_type: str, quantity: float, tp_price: float, sl_price: float
+    ) -> None:
+        """
+        Place the Take-Profit and Stop-Loss orders of an open position concurrently.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            quantity (float): Quantity of the asset.
+            tp_price (float): Price at which to trigger the TP order.
+            sl_price (float): Price at which to trigger the SL order.
+        """
+        tp_order, sl_order = await asyncio.gather(
+            self.client.futures_create_order(
+                **self.tp_order_params(order_type, quantity, tp_price)
+            ),
+            self.client.futures_create_order(
+                **self.sl_order_params(order_type, quantity, sl_price)
+            ),
+        )
+        self._track_exit_order("take-profit", tp_order)
+        self._track_exit_order("stop-loss", sl_order)
+
+    async def async_place_bracket_orders(
+        self, order_type: str, quantity: float, tp_price: float, sl_price: float
+    ) -> None:
+        """
+        Enter a position with its TP and SL orders in a single batch request.
+
+        If any leg is rejected the bracket is rolled back: an opened position
+        is closed at market while the accepted TP/SL orders are cancelled.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            quantity (float): Quantity of the asset to trade.
+            tp_price (float): Price at which to trigger the TP order.
+            sl_price (float): Price at which to trigger the SL order.
+
+        Raises:
+            RuntimeError: If any leg was rejected (after rolling back).
+        """
+        self._reset_exit_orders()
+        results = await self.client.futures_place_batch_order(
+            batchOrders=self.bracket_order_params(
+                order_type, quantity, tp_price, sl_price
+            )
+        )
+        rejected = self.rejected_legs(results)
+        if not rejected:
+            self._track_exit_order("take-profit", results[1])
+            self._track_exit_order("stop-loss", results[2])
+            return
+        rollback = []
+        if results and "orderId" in results[0]:
+            rollback.append(
+                self.client.futures_create_order(
+                    **self.close_order_params(order_type, quantity)
+                )
+            )
+        exit_order_ids = [leg["orderId"] for leg in results[1:] if "orderId" in leg]
+        if exit_order_ids:
+            rollback.append(
+                self.client.futures_cancel_orders(
+                    symbol=self.symbol_settings.SYMBOL, orderidlist=exit_order_ids
+                )
+            )
+        await asyncio.gather(*rollback)
+        raise self._bracket_error(rejected)
+
+    async def async_fetch_exit_fill(self) -> Optional[ExitFill]:
+        """
+        Look up a fill of the open position's exit orders over REST.
+
+        Used when no account stream saw the fill, e.g. after a restart.
+
+        Returns:
+            Optional[ExitFill]: The fill, or None if neither exit order filled.
+        """
+        for leg, order_id in self.exit_order_ids.items():
+            order = await self.client.futures_get_order(
+                symbol=self.symbol_settings.SYMBOL, orderId=order_id
+            )
+            if order.get("status") == "FILLED":
+                return ExitFill(leg == "take-profit", float(order["avgPrice"]))
+        return None
+
+    async def async_cancel_remaining_exit(self, fill: ExitFill) -> None:
+        """
+        Cancel the exit order that did not fill.
+
+        Failures (e.g. the exchange already expired the order with the
+        position) are logged.
+
+        Args:
+            fill (ExitFill): Fill of the other exit order.
+        """
+        order_id = self._remaining_exit_order(fill)
+        if order_id is None:
+            return
+        try:
+            await self.client.futures_cancel_order(
+                symbol=self.symbol_settings.SYMBOL, orderId=order_id
+            )
+        except Exception as e:
+            Logger.log_exception(f"Exit order {order_id} cancel failed: {e}")
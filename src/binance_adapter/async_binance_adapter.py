@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Coroutine, Dict, Optional, Tuple, TypeVar, Union
+import aiohttp
+from binance import AsyncClient
+from bot.bot_settings import SETTINGS, BotSettings
+from bot.symbol_settings import SymbolSettings
+from binance_adapter.account_manager import ExitFill
+from binance_adapter.account_stream import AccountStream
+from binance_adapter.async_account_manager import AsyncAccountManager
+from binance_adapter.exchange_filter_cache import ExchangeFilterCache
+from binance_adapter.async_indicator_manager import AsyncIndicatorManager
+from binance_adapter.rate_limiter import RateLimiter
+from binance_adapter.request_timings import RequestTimings
+
+T = TypeVar("T")
+
+
+class AsyncBinanceAdapter:
+    """
+    Asynchronous counterpart of BinanceAdapter built on an AsyncClient.
+
+    Market data and orders are awaitable. The blocking `enter_long` and
+    `enter_short` facade keeps the position states unchanged: when their
+    `apply` runs in a worker thread, the calls are submitted to the event loop
+    the adapter was created on and waited for.
+    """
+
+    KEEPALIVE_TIMEOUT: float = 30.0
+    DNS_CACHE_SECONDS: int = 300
+
+    def __init__(
+        self,
+        client: AsyncClient,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        symbol_settings: Optional[SymbolSettings] = None,
+    ) -> None:
+        """
+        Initialize the AsyncBinanceAdapter. Use `create` to also open the client.
+
+        Several adapters may share one client (and its connection pool).
+
+        Args:
+            client (AsyncClient): Asynchronous Binance client used for API communication.
+            loop (Optional[asyncio.AbstractEventLoop], optional): Event loop the
+                client runs on. Defaults to None (no blocking facade).
+            symbol_settings (Optional[SymbolSettings], optional): Settings of the
+                traded symbol. Defaults to None (the `[POSITION]` settings).
+
+        Attributes:
+            rate_limiter (Optional[RateLimiter]): Limiter traced on the client
+                session, if any.
+            request_timings (Optional[RequestTimings]): Phase timings traced on
+                the client session, if any.
+        """
+        self.client: AsyncClient = client
+        self.loop: Optional[asyncio.AbstractEventLoop] = loop
+        self.symbol_settings: Union[SymbolSettings, BotSettings] = (
+            SETTINGS if symbol_settings is None else symbol_settings
+        )
+        self.account_manager: AsyncAccountManager = AsyncAccountManager(
+            client, symbol_settings
+        )
+        self.indicator_manager: AsyncIndicatorManager = AsyncIndicatorManager(
+            client, symbol_settings
+        )
+        self.rate_limiter: Optional[RateLimiter] = None
+        self.request_timings: Optional[RequestTimings] = None
+
+    @classmethod
+    async def create(
+        cls, symbol_settings: Optional[SymbolSettings] = None
+    ) -> AsyncBinanceAdapter:
+        """
+        Open an AsyncClient with the configured API keys and build the adapter.
+
+        With `ACCOUNT_STREAM` an account stream is also started and attached,
+        with `EXCHANGE_FILTERS` the symbol filters are loaded, with
+        `RATE_LIMIT` the client session is traced by a RateLimiter, and with
+        `HTTP_TUNING` it uses a tuned connection pool and records RequestTimings.
+
+        Args:
+            symbol_settings (Optional[SymbolSettings], optional): Settings of the
+                traded symbol. Defaults to None (the `[POSITION]` settings).
+
+        Returns:
+            AsyncBinanceAdapter: Adapter bound to the running event loop.
+        """
+        rate_limiter = RateLimiter() if SETTINGS.RATE_LIMIT else None
+        request_timings = RequestTimings() if SETTINGS.HTTP_TUNING else None
+        client = await cls.create_client(rate_limiter, request_timings)
+        adapter = cls(client, asyncio.get_running_loop(), symbol_settings)
+        adapter.rate_limiter = rate_limiter
+        adapter.request_timings = request_timings
+        if SETTINGS.ACCOUNT_STREAM:
+            adapter.account_manager.account_stream = await cls.start_account_stream()
+        if SETTINGS.EXCHANGE_FILTERS:
+            adapter.account_manager.use_exchange_filters(
+                await cls.load_exchange_filters(client)
+            )
+        await adapter.configure_leverage()
+        return adapter
+
+    @classmethod
+    async def create_client(
+        cls,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_timings: Optional[RequestTimings] = None,
+    ) -> AsyncClient:
+        """
+        Open an AsyncClient with the configured API keys.
+
+        With `HTTP_TUNING` its session keeps `HTTP_POOL_SIZE` keep-alive
+        connections per host (aiohttp disables Nagle's algorithm and accepts
+        gzip by default), caches DNS lookups and applies the configured
+        connect and read timeouts.
+
+        Args:
+            rate_limiter (Optional[RateLimiter], optional): Limiter traced on
+                the client session. Defaults to None.
+            request_timings (Optional[RequestTimings], optional): Phase timings
+                traced on the client session. Defaults to None.
+
+        Returns:
+            AsyncClient: The opened client.
+        """
+        options: Dict[str, Any] = {}
+        session_params: Dict[str, Any] = {}
+        if SETTINGS.HTTP_TUNING:
+            session_params["connector"] = aiohttp.TCPConnector(
+                limit=2 * SETTINGS.HTTP_POOL_SIZE,
+                limit_per_host=SETTINGS.HTTP_POOL_SIZE,
+                keepalive_timeout=cls.KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=cls.DNS_CACHE_SECONDS,
+            )
+            options["requests_params"] = {
+                "timeout": aiohttp.ClientTimeout(
+                    sock_connect=SETTINGS.HTTP_CONNECT_TIMEOUT,
+                    sock_read=SETTINGS.HTTP_READ_TIMEOUT,
+                )
+            }
+        if request_timings is not None:
+            session_params = request_timings.session_params(session_params)
+        if rate_limiter is not None:
+            session_params = rate_limiter.session_params(session_params)
+        if session_params:
+            options["session_params"] = session_params
+        return await AsyncClient.create(
+            SETTINGS.API_PUBLIC_KEY, SETTINGS.API_SECRET_KEY, **options
+        )
+
+    @staticmethod
+    async def start_account_stream() -> AccountStream:
+        """
+        Build and start an account stream with the configured API keys.
+
+        The stream uses its own synchronous client, built in a worker thread.
+
+        Returns:
+            AccountStream: The started stream.
+        """
+        account_stream = await asyncio.to_thread(
+            AccountStream.create, SETTINGS.API_PUBLIC_KEY, SETTINGS.API_SECRET_KEY
+        )
+        account_stream.start()
+        return account_stream
+
+    @staticmethod
+    async def load_exchange_filters(client: AsyncClient) -> ExchangeFilterCache:
+        """
+        Read the persisted exchange filters, or download them if stale.
+
+        Args:
+            client (AsyncClient): Client used to download `exchangeInfo`.
+
+        Returns:
+            ExchangeFilterCache: The loaded cache.
+        """
+        cache = ExchangeFilterCache()
+        if not await asyncio.to_thread(cache.read):
+            cache.update(await client.futures_exchange_info())
+        return cache
+
+    async def configure_leverage(self) -> None:
+        """
+        Configure the symbol leverage, unless in test mode.
+        """
+        if not SETTINGS.TEST_MODE:
+            await self.client.futures_change_leverage(
+                symbol=self.symbol_settings.SYMBOL,
+                leverage=self.symbol_settings.LEVERAGE,
+            )
+
+    async def close(self) -> None:
+        """
+        Stop the attached account stream, if any, and close the HTTP session.
+        """
+        account_stream = self.account_manager.account_stream
+        if account_stream is not None:
+            await asyncio.to_thread(account_stream.stop)
+        await self.client.close_connection()
+
+    async def get_server_time(self) -> int:
+        """
+        Retrieve the exchange server time.
+
+        Returns:
+            int: Server time in milliseconds.
+        """
+        return int((await self.client.get_server_time())["serverTime"])
+
+    async def async_enter_position(
+        self, order_type: str, coin_price: float, state_block: bool = False
+    ) -> Tuple[float, float]:
+        """
+        Enter a futures position. Calculates take-profit and stop-loss prices and,
+        if not in test mode and not blocked, places the market order followed by
+        the concurrently submitted TP and SL orders, or all three as a single
+        batch request with `BATCH_ORDERS`.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            coin_price (float): Current market price of the coin.
+            state_block (bool, optional): Whether to block order placement. Defaults to False.
+
+        Returns:
+            Tuple[float, float]: A tuple containing (take_profit_price, stop_loss_price).
+        """
+        account_manager = self.account_manager
+        account_balance: float = await account_manager.async_get_account_balance()
+        coin_amount: float = account_manager.get_coin_amount(
+            account_balance * 0.95, coin_price
+        )
+        tp_price, sl_price = account_manager.calculate_target_prices(
+            order_type, coin_price
+        )
+
+        if not SETTINGS.TEST_MODE and not state_block:
+            quantity = account_manager.order_quantity(coin_amount, coin_price)
+            if SETTINGS.BATCH_ORDERS:
+                await account_manager.async_place_bracket_orders(
+                    order_type, quantity, tp_price, sl_price
+                )
+            else:
+                await account_manager.async_enter_position(order_type, quantity)
+                await account_manager.async_place_exit_orders(
+                    order_type, quantity, tp_price, sl_price
+                )
+
+        return tp_price, sl_price
+
+    def _run_blocking(self, coroutine: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a coroutine on the adapter's event loop from a worker thread.
+
+        Args:
+            coroutine (Coroutine[Any, Any, T]): The coroutine to run.
+
+        Returns:
+            T: The coroutine result.
+
+        Raises:
+            RuntimeError: If the adapter is not bound to an event loop.
+        """
+        if self.loop is None:
+            coroutine.close()
+            raise RuntimeError("AsyncBinanceAdapter is not bound to an event loop")
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def exits_tracked(self) -> bool:
+        """
+        Whether the exit of the open position will be reported as an order fill.
+
+        Returns:
+            bool: True if price polling can be skipped.
+        """
+        return self.account_manager.exits_tracked()
+
+    def resolve_exit_fill(self) -> Optional[ExitFill]:
+        """
+        Return the fill that closed the position from a worker thread,
+        cancelling the other exit order on the adapter's event loop.
+
+        Returns:
+            Optional[ExitFill]: The fill, or None if no exit order has filled.
+        """
+        fill = self.account_manager.find_exit_fill()
+        if fill is not None:
+            self._run_blocking(self.account_manager.async_cancel_remaining_exit(fill))
+        return fill
+
+    def enter_long(
+        self, coin_price: float, state_block: bool = False
+    ) -> Tuple[float, float]:
+        """
+        Enter a LONG futures position from a worker thread.
+
+        Args:
+            coin_price (float): Current market price of the coin.
+            state_block (bool, optional): Whether to block order placement. Defaults to False.
+
+        Returns:
+            Tuple[float, float]: A tuple containing (take_profit_price, stop_loss_price).
+        """
+        return self._run_blocking(
+            self.async_enter_position("LONG", coin_price, state_block)
+        )
+
+    def enter_short(
+        self, coin_price: float, state_block: bool = False
+    ) -> Tuple[float, float]:
+        """
+        Enter a SHORT futures position from a worker thread.
+
+        Args:
+            coin_price (float): Current market price of the coin.
+            state_block (bool, optional): Whether to block order placement. Defaults to False.
+
+        Returns:
+            Tuple[float, float]: A tuple containing (take_profit_price, stop_loss_price).
+        """
+        return self._run_blocking(
+            self.async_enter_position("SHORT", coin_price, state_block)
+        )
@@ -0,0 +1,188 @@
+import asyncio
+from typing import List, Optional
+from binance import AsyncClient
+from bot.bot_settings import SETTINGS
+from binance_adapter.indicator_manager import IndicatorManager
+from binance_adapter.kline_cache import Kline
+from bot.symbol_settings import SymbolSettings
+from data.market_snapshot import MarketSnapshot
+from utils.date_utils import DateUtils
+
+
+class AsyncIndicatorManager(IndicatorManager):
+    """
+    Asynchronous counterpart of IndicatorManager built on an AsyncClient.
+
+    The kline cache, lookback planning and streaming indicator evaluation are
+    inherited unchanged; only the REST requests are awaitable, which lets the
+    kline refresh and the price request of a snapshot run concurrently.
+    The synchronous fetch methods are not usable with an AsyncClient, use the
+    `async_` prefixed ones instead.
+    """
+
+    def __init__(
+        self, client: AsyncClient, symbol_settings: Optional[SymbolSettings] = None
+    ) -> None:
+        """
+        Initialize the AsyncIndicatorManager.
+
+        Args:
+            client (AsyncClient): Asynchronous Binance client used for API communication.
+            symbol_settings (Optional[SymbolSettings], optional): Settings of the
+                traded symbol. Defaults to None (the `[POSITION]` settings).
+        """
+        super().__init__(client, symbol_settings)  # type: ignore[arg-type]
+        self.client: AsyncClient = client  # type: ignore[assignment]
+
+    async def _async_fetch_klines_since(self, start_time: int) -> List[Kline]:
+        """
+        Retrieve all klines opened at or after the given time, page by page.
+
+        Args:
+            start_time (int): Open time in milliseconds of the first kline to fetch.
+
+        Returns:
+            List[Kline]: Raw klines ordered by open time.
+        """
+        klines: List[Kline] = []
+        while True:
+            page = await self.client.get_klines(
+                symbol=self.symbol_settings.SYMBOL,
+                interval=SETTINGS.INTERVAL,
+                startTime=start_time,
+                limit=self._KLINES_PAGE_LIMIT,
+            )
+            klines.extend(page)
+            if len(page) < self._KLINES_PAGE_LIMIT:
+                return klines
+            start_time = int(page[-1][0]) + 1
+
+    async def _async_fetch_latest_klines(self, count: int) -> List[Kline]:
+        """
+        Retrieve exactly the latest `count` klines (including the forming one).
+
+        Args:
+            count (int): Number of klines to retrieve.
+
+        Returns:
+            List[Kline]: Raw klines ordered by open time.
+        """
+        if count <= self._KLINES_PAGE_LIMIT:
+            return await self.client.get_klines(
+                symbol=self.symbol_settings.SYMBOL,
+                interval=SETTINGS.INTERVAL,
+                limit=count,
+            )
+        interval_ms = DateUtils.interval_to_milliseconds(SETTINGS.INTERVAL)
+        start_time = DateUtils.get_timestamp_ms() - count * interval_ms
+        return (await self._async_fetch_klines_since(start_time))[-count:]
+
+    async def async_sync_klines(self) -> List[Kline]:
+        """
+        Bring the kline cache up to date over REST and return its content.
+
+        Returns:
+            List[Kline]: Cached klines ordered by open time.
+        """
+        symbol, interval = self.symbol_settings.SYMBOL, SETTINGS.INTERVAL
+        last_open_time = self.kline_cache.last_open_time(symbol, interval)
+        if last_open_time is None:
+            klines = await self._async_fetch_latest_klines(self.lookback_bars)
+            self.kline_cache.replace(symbol, interval, klines)
+        else:
+            self.kline_cache.merge(
+                symbol, interval, await self._async_fetch_klines_since(last_open_time)
+            )
+        return self.kline_cache.get(symbol, interval)
+
+    async def _async_fetch_price(self) -> float:
+        """
+        Retrieve the current market price for the configured trading symbol.
+
+        Returns:
+            float: The latest price of the symbol. Returns 0.0 if unavailable.
+        """
+        ticker = await self.client.get_symbol_ticker(symbol=self.symbol_settings.SYMBOL)
+        if ticker:
+            return float(ticker["price"])
+        return 0.0
+
+    async def _async_fetch_mark_price(self) -> float:
+        """
+        Retrieve the current mark price for the configured trading symbol.
+
+        Returns:
+            float: The latest mark price of the symbol.
+        """
+        mark_price = await self.client.futures_mark_price(
+            symbol=self.symbol_settings.SYMBOL
+        )
+        return float(mark_price["markPrice"])
+
+    async def async_fetch_indicators(self) -> MarketSnapshot:
+        """
+        Fetch and calculate all configured indicators for the trading symbol.
+
+        The kline refresh and the price request are issued concurrently.
+
+        Returns:
+            MarketSnapshot: Snapshot containing the latest price and indicators.
+        """
+        klines, price = await asyncio.gather(
+            self.async_sync_klines(), self._async_fetch_price()
+        )
+        values = self._evaluate_klines(klines)
+
+        return MarketSnapshot(
+            date=DateUtils.get_date(),
+            price=price,
+            macd_12=values.macd_12,
+            macd_26=values.macd_26,
+            ema_100=values.ema_100,
+            rsi_6=values.rsi_6,
+        )
+
+    async def async_fetch_price_snapshot(self) -> MarketSnapshot:
+        """
+        Build a snapshot from a fresh price only, without downloading klines.
+
+        Falls back to `async_fetch_indicators` when nothing is cached yet or
+        when the forming bar has closed since the last kline refresh.
+
+        Returns:
+            MarketSnapshot: Snapshot containing the latest price and indicators.
+        """
+        klines = self.kline_cache.get(self.symbol_settings.SYMBOL, SETTINGS.INTERVAL)
+        if not klines or int(klines[-1][6]) < DateUtils.get_timestamp_ms():
+            return await self.async_fetch_indicators()
+        price = await self._async_fetch_price()
+        values = self.indicator_engine.peek(price)
+
+        return MarketSnapshot(
+            date=DateUtils.get_date(),
+            price=price,
+            macd_12=values.macd_12,
+            macd_26=values.macd_26,
+            ema_100=values.ema_100,
+            rsi_6=values.rsi_6,
+        )
+
+    async def async_fetch_price_only_snapshot(
+        self, previous: MarketSnapshot, mark_price: bool = False
+    ) -> MarketSnapshot:
+        """
+        Refresh only the price of a snapshot, skipping klines and indicators.
+
+        Args:
+            previous (MarketSnapshot): Snapshot whose indicator values are kept.
+            mark_price (bool, optional): Use the mark price instead of the last
+                traded price. Defaults to False.
+
+        Returns:
+            MarketSnapshot: Copy of `previous` with the fresh price and date.
+        """
+        if mark_price:
+            price = await self._async_fetch_mark_price()
+        else:
+            price = await self._async_fetch_price()
+        return previous.with_price(date=DateUtils.get_date(), price=price)
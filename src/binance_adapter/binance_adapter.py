@@ -1,8 +1,17 @@
-from binance_adapter.account_manager import AccountManager
-from bot.bot_settings import SETTINGS
+from binance_adapter.account_manager import AccountManager, ExitFill
+from binance_adapter.account_stream import AccountStream
+from binance_adapter.exchange_filter_cache import ExchangeFilterCache
+from bot.bot_settings import SETTINGS, BotSettings
 from binance_adapter.indicator_manager import IndicatorManager
+from binance_adapter.market_stream import MarketStream
+from binance_adapter.rate_limited_http_adapter import RateLimitedHTTPAdapter
+from binance_adapter.rate_limiter import RateLimiter
+from binance_adapter.request_timings import RequestTimings
+from binance_adapter.tuned_http_adapter import TunedHTTPAdapter
+from bot.symbol_settings import SymbolSettings
 from binance.client import Client
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple, Union
+import requests
 
 
 class BinanceAdapter:
@@ -12,24 +21,163 @@ class BinanceAdapter:
     technical indicator fetching (via IndicatorManager).
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        symbol_settings: Optional[SymbolSettings] = None,
+        client: Optional[Client] = None,
+    ) -> None:
         """
         Initialize the BinanceAdapter.
 
-        Creates a Binance Futures client using API keys from settings and
-        initializes account and indicator managers. If not in test mode,
-        the client leverage is also configured.
+        Creates a Binance Futures client using API keys from settings (unless
+        a shared client is given) and initializes account and indicator
+        managers for the traded symbol. In stream mode a MarketStream is
+        attached to the indicator manager and with `ACCOUNT_STREAM` an
+        AccountStream to the account manager (both are started by the bot).
+        With `EXCHANGE_FILTERS` the symbol filters are loaded from the
+        exchange filter cache. With `HTTP_TUNING` the client session uses a
+        tuned, timed transport and with `RATE_LIMIT` it passes through a
+        RateLimiter. If not in test mode, the symbol leverage is also
+        configured.
+
+        Args:
+            symbol_settings (Optional[SymbolSettings], optional): Settings of the
+                traded symbol. Defaults to None (the `[POSITION]` settings).
+            client (Optional[Client], optional): Client shared with other adapters.
+                Defaults to None (a new client).
+
+        Attributes:
+            http_adapter (Optional[TunedHTTPAdapter]): Transport of the client
+                session, if any.
+            rate_limiter (Optional[RateLimiter]): Limiter of the client session, if any.
         """
-        self.client: Client = Client(SETTINGS.API_PUBLIC_KEY, SETTINGS.API_SECRET_KEY)
-        self.account_manager: AccountManager = AccountManager(self.client)
-        self.indicator_manager: IndicatorManager = IndicatorManager(self.client)
+        self.client: Client = (
+            Client(SETTINGS.API_PUBLIC_KEY, SETTINGS.API_SECRET_KEY)
+            if client is None
+            else client
+        )
+        self.http_adapter: Optional[TunedHTTPAdapter] = self.install_http_adapter(
+            self.client.session
+        )
+        self.rate_limiter: Optional[RateLimiter] = (
+            self.http_adapter.rate_limiter
+            if isinstance(self.http_adapter, RateLimitedHTTPAdapter)
+            else None
+        )
+        self.account_manager: AccountManager = AccountManager(
+            self.client, symbol_settings
+        )
+        self.indicator_manager: IndicatorManager = IndicatorManager(
+            self.client, symbol_settings
+        )
+        self.symbol_settings: Union[SymbolSettings, BotSettings] = (
+            SETTINGS if symbol_settings is None else symbol_settings
+        )
+
+        if SETTINGS.STREAM_MODE:
+            self.indicator_manager.market_stream = MarketStream(
+                symbol=self.symbol_settings.SYMBOL,
+                interval=SETTINGS.INTERVAL,
+                kline_cache=self.indicator_manager.kline_cache,
+                on_connect=self.indicator_manager.sync_klines,
+            )
+
+        if SETTINGS.ACCOUNT_STREAM:
+            self.account_manager.account_stream = AccountStream(self.client)
+
+        if SETTINGS.EXCHANGE_FILTERS:
+            self.account_manager.use_exchange_filters(
+                ExchangeFilterCache().load(self.client.futures_exchange_info)
+            )
 
         if not SETTINGS.TEST_MODE:
             self.client.futures_change_leverage(
-                symbol=SETTINGS.SYMBOL,
-                leverage=SETTINGS.LEVERAGE,
+                symbol=self.symbol_settings.SYMBOL,
+                leverage=self.symbol_settings.LEVERAGE,
             )
 
+    @staticmethod
+    def install_http_adapter(session: requests.Session) -> Optional[TunedHTTPAdapter]:
+        """
+        Mount the transport selected by `HTTP_TUNING` and `RATE_LIMIT` on a session.
+
+        A session that already has one (a shared client) keeps it.
+
+        Args:
+            session (requests.Session): Session of the client.
+
+        Returns:
+            Optional[TunedHTTPAdapter]: The mounted adapter, or None if neither
+                setting is enabled.
+        """
+        options: Dict[str, Any] = {}
+        if SETTINGS.HTTP_TUNING:
+            options = dict(
+                pool_size=SETTINGS.HTTP_POOL_SIZE,
+                timeout=(SETTINGS.HTTP_CONNECT_TIMEOUT, SETTINGS.HTTP_READ_TIMEOUT),
+                timings=RequestTimings(),
+            )
+        if SETTINGS.RATE_LIMIT:
+            return RateLimitedHTTPAdapter.install(session, **options)
+        if SETTINGS.HTTP_TUNING:
+            return TunedHTTPAdapter.install(session, **options)
+        return None
+
+    def get_server_time(self) -> int:
+        """
+        Retrieve the exchange server time.
+
+        Returns:
+            int: Server time in milliseconds.
+        """
+        return int(self.client.get_server_time()["serverTime"])
+
+    def exits_tracked(self) -> bool:
+        """
+        Whether the exit of the open position will be reported as an order fill.
+
+        Returns:
+            bool: True if price polling can be skipped.
+        """
+        return self.account_manager.exits_tracked()
+
+    def resolve_exit_fill(self) -> Optional[ExitFill]:
+        """
+        Return the fill that closed the position, cancelling the other exit order.
+
+        Returns:
+            Optional[ExitFill]: The fill, or None if no exit order has filled.
+        """
+        fill = self.account_manager.find_exit_fill()
+        if fill is not None:
+            self.account_manager.cancel_remaining_exit(fill)
+        return fill
+
+    def _place_orders(
+        self, order_type: str, quantity: float, tp_price: float, sl_price: float
+    ) -> None:
+        """
+        Place the entry order and its TP and SL orders.
+
+        With `BATCH_ORDERS` the three orders go out as one batch request, so
+        the position is never left without protection for extra round trips;
+        otherwise they are placed one after another.
+
+        Args:
+            order_type (str): Type of position ("LONG" or "SHORT").
+            quantity (float): Quantity of the asset to trade.
+            tp_price (float): Price at which to trigger the TP order.
+            sl_price (float): Price at which to trigger the SL order.
+        """
+        if SETTINGS.BATCH_ORDERS:
+            self.account_manager.place_bracket_orders(
+                order_type, quantity, tp_price, sl_price
+            )
+            return
+        self.account_manager.enter_position(order_type, quantity)
+        self.account_manager.place_tp_order(order_type, quantity, tp_price)
+        self.account_manager.place_sl_order(order_type, quantity, sl_price)
+
     def enter_long(
         self, coin_price: float, state_block: bool = False
     ) -> Tuple[float, float]:
@@ -49,17 +197,13 @@ class BinanceAdapter:
             account_balance * 0.95, coin_price
         )
 
-        tp_price: float = float(
-            round(coin_price * (1 + SETTINGS.TP_RATIO), SETTINGS.COIN_PRECISION)
-        )
-        sl_price: float = float(
-            round(coin_price * (1 - SETTINGS.SL_RATIO), SETTINGS.COIN_PRECISION)
+        tp_price, sl_price = self.account_manager.calculate_target_prices(
+            "LONG", coin_price
         )
 
         if not SETTINGS.TEST_MODE and not state_block:
-            self.account_manager.enter_position("LONG", coin_amount)
-            self.account_manager.place_tp_order("LONG", coin_amount, tp_price)
-            self.account_manager.place_sl_order("LONG", coin_amount, sl_price)
+            quantity = self.account_manager.order_quantity(coin_amount, coin_price)
+            self._place_orders("LONG", quantity, tp_price, sl_price)
 
         return tp_price, sl_price
 
@@ -82,16 +226,12 @@ class BinanceAdapter:
             account_balance * 0.95, coin_price
         )
 
-        tp_price: float = float(
-            round(coin_price * (1 - SETTINGS.TP_RATIO), SETTINGS.COIN_PRECISION)
-        )
-        sl_price: float = float(
-            round(coin_price * (1 + SETTINGS.SL_RATIO), SETTINGS.COIN_PRECISION)
+        tp_price, sl_price = self.account_manager.calculate_target_prices(
+            "SHORT", coin_price
         )
 
         if not SETTINGS.TEST_MODE and not state_block:
-            self.account_manager.enter_position("SHORT", coin_amount)
-            self.account_manager.place_tp_order("SHORT", coin_amount, tp_price)
-            self.account_manager.place_sl_order("SHORT", coin_amount, sl_price)
+            quantity = self.account_manager.order_quantity(coin_amount, coin_price)
+            self._place_orders("SHORT", quantity, tp_price, sl_price)
 
         return tp_price, sl_price
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import json
+import os
+from decimal import ROUND_FLOOR, ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional, Union
+from base_dir import BASE_DIR
+from utils.date_utils import DateUtils
+from utils.logger import Logger
+
+
+class SymbolFilters(NamedTuple):
+    """
+    Trading filters of one futures symbol.
+
+    Attributes:
+        tick_size (Decimal): Price increment (`PRICE_FILTER`).
+        step_size (Decimal): Quantity increment (`LOT_SIZE`).
+        min_qty (Decimal): Minimum quantity (`LOT_SIZE`).
+        min_notional (Decimal): Minimum order value (`MIN_NOTIONAL`).
+    """
+
+    tick_size: Decimal
+    step_size: Decimal
+    min_qty: Decimal
+    min_notional: Decimal
+
+    def round_price(self, price: float) -> float:
+        """
+        Round a price to the nearest tick.
+
+        Args:
+            price (float): Price to round.
+
+        Returns:
+            float: Price on the tick grid.
+        """
+        ticks = (Decimal(str(price)) / self.tick_size).to_integral_value(ROUND_HALF_UP)
+        return float(ticks * self.tick_size)
+
+    def round_quantity(self, quantity: float) -> float:
+        """
+        Round a quantity down to the lot step, so it never exceeds the budget.
+
+        Args:
+            quantity (float): Quantity to round.
+
+        Returns:
+            float: Quantity on the step grid.
+        """
+        steps = (Decimal(str(quantity)) / self.step_size).to_integral_value(ROUND_FLOOR)
+        return float(steps * self.step_size)
+
+    def meets_minimums(self, quantity: float, price: float) -> bool:
+        """
+        Check a (rounded) order against the minimum quantity and notional.
+
+        Args:
+            quantity (float): Order quantity.
+            price (float): Order price.
+
+        Returns:
+            bool: True if the exchange would accept the order size.
+        """
+        amount = Decimal(str(quantity))
+        return (
+            amount >= self.min_qty and amount * Decimal(str(price)) >= self.min_notional
+        )
+
+
+class ExchangeFilterCache:
+    """
+    Per-symbol exchange filters from `exchangeInfo`, persisted to disk.
+
+    The filters are downloaded once and saved as a small JSON index next to
+    the settings; while that file is younger than the TTL it is read instead
+    of downloading `exchangeInfo` again, so restarts and portfolios of many
+    symbols cost a single request per TTL. Lookups are a dictionary access
+    and rounding is done locally with exact decimal arithmetic.
+    """
+
+    DEFAULT_PATH: Path = BASE_DIR / "exchange_filters.json"
+    DEFAULT_TTL_SECONDS: float = 86_400.0
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize an empty ExchangeFilterCache.
+
+        Args:
+            path (Optional[Union[str, Path]], optional): JSON file the filters
+                are persisted to. Defaults to None (`DEFAULT_PATH`).
+            ttl_seconds (float, optional): Maximum age of the persisted
+                filters. Defaults to one day.
+
+        Attributes:
+            filters (Dict[str, SymbolFilters]): Filters per symbol.
+        """
+        self.path: Path = self.DEFAULT_PATH if path is None else Path(path)
+        self.ttl_ms: int = int(ttl_seconds * 1000)
+        self.filters: Dict[str, SymbolFilters] = {}
+
+    @staticmethod
+    def _index_symbol(symbol_info: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Extract the filters used for rounding from one `exchangeInfo` symbol.
+
+        Args:
+            symbol_info (Dict[str, Any]): Entry of the `symbols` list.
+
+        Returns:
+            Dict[str, str]: Tick size, step size, minimum quantity and
+                minimum notional (missing filters default to no constraint).
+        """
+        filters = {item["filterType"]: item for item in symbol_info["filters"]}
+        price_filter = filters.get("PRICE_FILTER", {})
+        lot_size = filters.get("LOT_SIZE", {})
+        min_notional = filters.get("MIN_NOTIONAL", {})
+        return {
+            "tickSize": price_filter.get("tickSize", "0"),
+            "stepSize": lot_size.get("stepSize", "0"),
+            "minQty": lot_size.get("minQty", "0"),
+            "minNotional": min_notional.get(
+                "notional", min_notional.get("minNotional", "0")
+            ),
+        }
+
+    @staticmethod
+    def _to_filters(indexed: Dict[str, str]) -> Optional[SymbolFilters]:
+        """
+        Build the filters of a symbol from its persisted index entry.
+
+        Args:
+            indexed (Dict[str, str]): Entry produced by `_index_symbol`.
+
+        Returns:
+            Optional[SymbolFilters]: The filters, or None if the symbol has
+                no usable tick or step size.
+        """
+        tick_size = Decimal(indexed["tickSize"])
+        step_size = Decimal(indexed["stepSize"])
+        if tick_size <= 0 or step_size <= 0:
+            return None
+        return SymbolFilters(
+            tick_size,
+            step_size,
+            Decimal(indexed["minQty"]),
+            Decimal(indexed["minNotional"]),
+        )
+
+    def _set_index(self, symbols: Dict[str, Dict[str, str]]) -> None:
+        """
+        Replace the in-memory filters with a symbol index.
+
+        Args:
+            symbols (Dict[str, Dict[str, str]]): Index entries per symbol.
+        """
+        filters = {}
+        for symbol, indexed in symbols.items():
+            symbol_filters = self._to_filters(indexed)
+            if symbol_filters is not None:
+                filters[symbol] = symbol_filters
+        self.filters = filters
+
+    def read(self) -> bool:
+        """
+        Load the persisted filters if they are younger than the TTL.
+
+        Unreadable files are logged and treated as missing.
+
+        Returns:
+            bool: True if the filters were loaded.
+        """
+        if not self.path.is_file():
+            return False
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                data = json.load(f)
+            if DateUtils.get_timestamp_ms() - int(data["updated_ms"]) >= self.ttl_ms:
+                return False
+            self._set_index(data["symbols"])
+        except Exception as e:
+            Logger.log_exception(f"Exchange filter cache unreadable: {e}")
+            return False
+        return True
+
+    def update(self, exchange_info: Dict[str, Any]) -> None:
+        """
+        Index a fresh `exchangeInfo` response and persist it.
+
+        The file is written to a temporary path first and then renamed, so a
+        crash never leaves a truncated cache behind.
+
+        Args:
+            exchange_info (Dict[str, Any]): The `exchangeInfo` response.
+        """
+        symbols = {
+            info["symbol"]: self._index_symbol(info)
+            for info in exchange_info.get("symbols", [])
+        }
+        self._set_index(symbols)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(self.path.name + ".tmp")
+        with temporary.open("w", encoding="utf-8") as f:
+            json.dump(
+                {"updated_ms": DateUtils.get_timestamp_ms(), "symbols": symbols}, f
+            )
+        os.replace(temporary, self.path)
+
+    def load(self, fetch: Callable[[], Dict[str, Any]]) -> ExchangeFilterCache:
+        """
+        Read the persisted filters, or download and persist them if stale.
+
+        Args:
+            fetch (Callable[[], Dict[str, Any]]): Returns the `exchangeInfo` response.
+
+        Returns:
+            ExchangeFilterCache: This cache, for chaining.
+        """
+        if not self.read():
+            self.update(fetch())
+        return self
+
+    def get(self, symbol: str) -> Optional[SymbolFilters]:
+        """
+        Return the filters of a symbol.
+
+        Args:
+            symbol (str): Trading symbol (e.g., "ETHUSDT").
+
+        Returns:
+            Optional[SymbolFilters]: The filters, or None if the symbol is unknown.
+        """
+        return self.filters.get(symbol)
@@ -1,11 +1,15 @@
-from datetime import datetime, timedelta
-from typing import Optional, List, Tuple
-import numpy as np
-import talib
-import pandas as pd
+from typing import Any, Dict, Optional, List, Union
 from binance.client import Client
-from bot.bot_settings import SETTINGS
+from bot.bot_settings import SETTINGS, BotSettings
+from bot.symbol_settings import SymbolSettings
+from binance_adapter.kline_cache import KlineCache, Kline
+from binance_adapter.market_stream import MarketStream
 from data.market_snapshot import MarketSnapshot
+from indicators.lookback_planner import LookbackPlanner
+from indicators.streaming_indicator_engine import (
+    IndicatorValues,
+    StreamingIndicatorEngine,
+)
 from utils.date_utils import DateUtils
 
 
@@ -13,47 +17,175 @@ class IndicatorManager:
     """
     Handles fetching historical market data from Binance
     and calculating technical indicators such as EMA, MACD, and RSI.
+
+    Klines are kept in a KlineCache: the lookback planned by a LookbackPlanner
+    (just enough bars for the indicators to converge) is downloaded once and
+    every following call only fetches the klines opened since the latest
+    cached (still-forming) bar. Closed bars are committed once to a
+    StreamingIndicatorEngine, so each snapshot only costs a provisional
+    update for the forming bar. When a connected MarketStream is attached,
+    klines and prices are served from the stream instead of REST.
     """
 
-    def __init__(self, client: Client) -> None:
+    _KLINES_PAGE_LIMIT: int = 1000
+
+    def __init__(
+        self, client: Client, symbol_settings: Optional[SymbolSettings] = None
+    ) -> None:
         """
         Initialize the IndicatorManager.
 
         Args:
             client (Client): Binance Futures client instance used for API communication.
+            symbol_settings (Optional[SymbolSettings], optional): Settings of the
+                traded symbol. Defaults to None (the `[POSITION]` settings).
         """
         self.client: Client = client
+        self.symbol_settings: Union[SymbolSettings, BotSettings] = (
+            SETTINGS if symbol_settings is None else symbol_settings
+        )
+        self.kline_cache: KlineCache = KlineCache()
+        self.indicator_engine: StreamingIndicatorEngine = StreamingIndicatorEngine()
+        self._committed_open_time: Optional[int] = None
+        self.market_stream: Optional[MarketStream] = None
+        self.lookback_bars: int = LookbackPlanner().required_bars(
+            SETTINGS.LOOKBACK_TOLERANCE
+        )
 
-    def _get_close_prices(self) -> np.ndarray:
+    @property
+    def committed_open_time(self) -> Optional[int]:
         """
-        Retrieve closing prices for the last month from Binance.
+        Open time of the latest closed kline committed to the indicator engine.
 
         Returns:
-            np.ndarray: An array of closing prices.
+            Optional[int]: Open time in milliseconds, or None before the first refresh.
         """
-        klines = self.client.get_historical_klines(
-            symbol=SETTINGS.SYMBOL,
-            interval=SETTINGS.INTERVAL,
-            start_str="1 month ago UTC",
-        )
-        df = pd.DataFrame(
-            klines,
-            columns=[
-                "timestamp",
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume",
-                "close_time",
-                "quote_asset_volume",
-                "number_of_trades",
-                "taker_buy_base_asset_volume",
-                "taker_buy_quote_asset_volume",
-                "ignore",
-            ],
+        return self._committed_open_time
+
+    def export_state(self) -> Dict[str, Any]:
+        """
+        Export the committed indicator state, e.g. for a checkpoint.
+
+        Only the latest cached kline is kept alongside the engine state: after
+        a restore, `sync_klines` fetches the klines opened since that one and
+        commits them, so no history is downloaded again.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable state.
+        """
+        klines = self.kline_cache.get(self.symbol_settings.SYMBOL, SETTINGS.INTERVAL)
+        return {
+            "engine": self.indicator_engine.state(),
+            "committed_open_time": self._committed_open_time,
+            "last_kline": klines[-1] if klines else None,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """
+        Replace the indicator state with one exported by `export_state`.
+
+        Args:
+            state (Dict[str, Any]): The exported state.
+
+        Raises:
+            ValueError: If the state has no committed kline to resume from.
+        """
+        if state["committed_open_time"] is None or state["last_kline"] is None:
+            raise ValueError("Indicator state has no committed kline")
+        self.indicator_engine.restore(state["engine"])
+        self._committed_open_time = int(state["committed_open_time"])
+        self.kline_cache.replace(
+            self.symbol_settings.SYMBOL, SETTINGS.INTERVAL, [state["last_kline"]]
         )
-        return df["close"].astype(float).to_numpy()
+
+    def _fetch_klines_since(self, start_time: int) -> List[Kline]:
+        """
+        Retrieve all klines opened at or after the given time, page by page.
+
+        Args:
+            start_time (int): Open time in milliseconds of the first kline to fetch.
+
+        Returns:
+            List[Kline]: Raw klines ordered by open time.
+        """
+        klines: List[Kline] = []
+        while True:
+            page = self.client.get_klines(
+                symbol=self.symbol_settings.SYMBOL,
+                interval=SETTINGS.INTERVAL,
+                startTime=start_time,
+                limit=self._KLINES_PAGE_LIMIT,
+            )
+            klines.extend(page)
+            if len(page) < self._KLINES_PAGE_LIMIT:
+                return klines
+            start_time = int(page[-1][0]) + 1
+
+    def _fetch_latest_klines(self, count: int) -> List[Kline]:
+        """
+        Retrieve exactly the latest `count` klines (including the forming one).
+
+        A single `limit` request is used when it fits in one page; otherwise
+        the pages are requested from a millisecond `startTime`.
+
+        Args:
+            count (int): Number of klines to retrieve.
+
+        Returns:
+            List[Kline]: Raw klines ordered by open time.
+        """
+        if count <= self._KLINES_PAGE_LIMIT:
+            return self.client.get_klines(
+                symbol=self.symbol_settings.SYMBOL,
+                interval=SETTINGS.INTERVAL,
+                limit=count,
+            )
+        interval_ms = DateUtils.interval_to_milliseconds(SETTINGS.INTERVAL)
+        start_time = DateUtils.get_timestamp_ms() - count * interval_ms
+        return self._fetch_klines_since(start_time)[-count:]
+
+    def _is_streaming(self) -> bool:
+        """
+        Check whether market data is currently served by a connected stream.
+
+        Returns:
+            bool: True if a MarketStream is attached and connected.
+        """
+        return self.market_stream is not None and self.market_stream.is_connected
+
+    def _refresh_klines(self) -> List[Kline]:
+        """
+        Return up-to-date klines, refreshing the cache over REST unless streaming.
+
+        Returns:
+            List[Kline]: Cached klines ordered by open time.
+        """
+        if self._is_streaming():
+            return self.kline_cache.get(self.symbol_settings.SYMBOL, SETTINGS.INTERVAL)
+        return self.sync_klines()
+
+    def sync_klines(self) -> List[Kline]:
+        """
+        Bring the kline cache up to date over REST and return its content.
+
+        On the first call the planned lookback is backfilled. Afterwards
+        only the klines since the latest cached open time are requested, which
+        refreshes the still-forming bar and appends any newly opened ones
+        (including any gap left by a stream disconnection).
+
+        Returns:
+            List[Kline]: Cached klines ordered by open time.
+        """
+        symbol, interval = self.symbol_settings.SYMBOL, SETTINGS.INTERVAL
+        last_open_time = self.kline_cache.last_open_time(symbol, interval)
+        if last_open_time is None:
+            klines = self._fetch_latest_klines(self.lookback_bars)
+            self.kline_cache.replace(symbol, interval, klines)
+        else:
+            self.kline_cache.merge(
+                symbol, interval, self._fetch_klines_since(last_open_time)
+            )
+        return self.kline_cache.get(symbol, interval)
 
     def _fetch_price(self) -> float:
         """
@@ -62,97 +194,117 @@ class IndicatorManager:
         Returns:
             float: The latest price of the symbol. Returns 0.0 if unavailable.
         """
-        ticker = self.client.get_symbol_ticker(symbol=SETTINGS.SYMBOL)
+        market_stream = self.market_stream
+        if self._is_streaming() and market_stream.last_price is not None:
+            return market_stream.last_price
+        ticker = self.client.get_symbol_ticker(symbol=self.symbol_settings.SYMBOL)
         if ticker:
             return float(ticker["price"])
         return 0.0
 
-    def _calculate_EMA(
-        self, period: int, close_prices: Optional[np.ndarray] = None
-    ) -> float:
+    def _fetch_mark_price(self) -> float:
         """
-        Calculate the Exponential Moving Average (EMA).
-
-        Args:
-            period (int): The lookback period for EMA.
-            close_prices (Optional[np.ndarray], optional): Array of closing prices.
-                If None, fresh data will be fetched. Defaults to None.
+        Retrieve the current mark price for the configured trading symbol.
 
         Returns:
-            float: The latest EMA value.
+            float: The latest mark price of the symbol.
         """
-        close_prices = (
-            self._get_close_prices() if close_prices is None else close_prices
+        market_stream = self.market_stream
+        if self._is_streaming() and market_stream.mark_price is not None:
+            return market_stream.mark_price
+        return float(
+            self.client.futures_mark_price(symbol=self.symbol_settings.SYMBOL)[
+                "markPrice"
+            ]
         )
-        ema = talib.EMA(close_prices, timeperiod=period)
-        return float(ema[-1])
 
-    def _calculate_MACD(
-        self,
-        macd_period: int,
-        signal_period: int,
-        close_prices: Optional[np.ndarray] = None,
-    ) -> Tuple[float, float]:
+    def _evaluate_klines(self, klines: List[Kline]) -> IndicatorValues:
         """
-        Calculate the Moving Average Convergence Divergence (MACD) indicator.
+        Commit newly closed klines to the indicator engine and evaluate the forming one.
+
+        The last kline is treated as the still-forming bar; every earlier kline
+        opened after the last committed one is committed exactly once.
 
         Args:
-            macd_period (int): Fast EMA period.
-            signal_period (int): Slow EMA and signal line period.
-            close_prices (Optional[np.ndarray], optional): Array of closing prices.
-                If None, fresh data will be fetched. Defaults to None.
+            klines (List[Kline]): Klines ordered by open time.
 
         Returns:
-            Tuple[float, float]: Latest MACD and signal line values.
-        """
-        close_prices = (
-            self._get_close_prices() if close_prices is None else close_prices
-        )
-        macd, signal, _ = talib.MACD(
-            close_prices,
-            fastperiod=macd_period,
-            slowperiod=signal_period,
-            signalperiod=signal_period,
-        )
-        return float(macd[-1]), float(signal[-1])
+            IndicatorValues: Indicator values including the forming bar.
 
-    def _calculate_RSI(
-        self, period: int, close_prices: Optional[np.ndarray] = None
-    ) -> float:
+        Raises:
+            ValueError: If no klines are available.
         """
-        Calculate the Relative Strength Index (RSI).
+        if not klines:
+            raise ValueError(f"No klines available for {self.symbol_settings.SYMBOL}")
+        committed = self._committed_open_time
+        start = len(klines) - 1
+        while start > 0 and (
+            committed is None or int(klines[start - 1][0]) > committed
+        ):
+            start -= 1
+        for kline in klines[start:-1]:
+            self.indicator_engine.update(float(kline[4]))
+            self._committed_open_time = int(kline[0])
+        return self.indicator_engine.peek(float(klines[-1][4]))
 
-        Args:
-            period (int): The lookback period for RSI.
-            close_prices (Optional[np.ndarray], optional): Array of closing prices.
-                If None, fresh data will be fetched. Defaults to None.
+    def fetch_indicators(self) -> MarketSnapshot:
+        """
+        Fetch and calculate all configured indicators for the trading symbol.
 
         Returns:
-            float: The latest RSI value.
+            MarketSnapshot: Snapshot containing the latest price and indicators.
         """
-        close_prices = (
-            self._get_close_prices() if close_prices is None else close_prices
+        values = self._evaluate_klines(self._refresh_klines())
+
+        return MarketSnapshot(
+            date=DateUtils.get_date(),
+            price=self._fetch_price(),
+            macd_12=values.macd_12,
+            macd_26=values.macd_26,
+            ema_100=values.ema_100,
+            rsi_6=values.rsi_6,
         )
-        rsi = talib.RSI(close_prices, timeperiod=period)
-        return float(rsi[-1])
 
-    def fetch_indicators(self) -> MarketSnapshot:
+    def fetch_price_snapshot(self) -> MarketSnapshot:
         """
-        Fetch and calculate all configured indicators for the trading symbol.
+        Build a snapshot from a fresh price only, without downloading klines.
+
+        The price is used as the provisional close of the forming bar, so the
+        indicators are updated in O(1). A full `fetch_indicators` is done
+        instead when nothing is cached yet or when the forming bar has closed
+        since the last kline refresh.
 
         Returns:
             MarketSnapshot: Snapshot containing the latest price and indicators.
         """
-        close_prices = self._get_close_prices()
-        temp_macd_12, temp_macd_26 = self._calculate_MACD(
-            macd_period=12, signal_period=26, close_prices=close_prices
-        )
+        klines = self.kline_cache.get(self.symbol_settings.SYMBOL, SETTINGS.INTERVAL)
+        if not klines or int(klines[-1][6]) < DateUtils.get_timestamp_ms():
+            return self.fetch_indicators()
+        price = self._fetch_price()
+        values = self.indicator_engine.peek(price)
 
         return MarketSnapshot(
             date=DateUtils.get_date(),
-            price=self._fetch_price(),
-            macd_12=temp_macd_12,
-            macd_26=temp_macd_26,
-            ema_100=self._calculate_EMA(period=100, close_prices=close_prices),
-            rsi_6=self._calculate_RSI(period=6, close_prices=close_prices),
+            price=price,
+            macd_12=values.macd_12,
+            macd_26=values.macd_26,
+            ema_100=values.ema_100,
+            rsi_6=values.rsi_6,
         )
+
+    def fetch_price_only_snapshot(
+        self, previous: MarketSnapshot, mark_price: bool = False
+    ) -> MarketSnapshot:
+        """
+        Refresh only the price of a snapshot, skipping klines and indicators.
+
+        Args:
+            previous (MarketSnapshot): Snapshot whose indicator values are kept.
+            mark_price (bool, optional): Use the mark price instead of the last
+                traded price. Defaults to False.
+
+        Returns:
+            MarketSnapshot: Copy of `previous` with the fresh price and date.
+        """
+        price = self._fetch_mark_price() if mark_price else self._fetch_price()
+        return previous.with_price(date=DateUtils.get_date(), price=price)
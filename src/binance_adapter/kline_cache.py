@@ -0,0 +1,103 @@
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+Kline = List[Any]
+CacheKey = Tuple[str, str]
+
+
+class KlineCache:
+    """
+    In-memory store of raw Binance klines keyed by symbol and interval.
+
+    The cache is backfilled once with a full history window and then kept
+    up to date by merging only the most recent klines, where the still-forming
+    last bar is replaced by its refreshed version. The window size established
+    by the backfill is preserved so the cached history keeps sliding forward.
+    Writes are serialized, so REST refreshes and stream updates may come from
+    different threads.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty KlineCache.
+
+        Attributes:
+            _klines (Dict[CacheKey, List[Kline]]): Cached klines per (symbol, interval).
+            _max_sizes (Dict[CacheKey, int]): Window size per (symbol, interval).
+        """
+        self._klines: Dict[CacheKey, List[Kline]] = {}
+        self._max_sizes: Dict[CacheKey, int] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, symbol: str, interval: str) -> List[Kline]:
+        """
+        Return the cached klines for a symbol and interval.
+
+        Args:
+            symbol (str): Trading symbol (e.g., "ETHUSDT").
+            interval (str): Kline interval (e.g., "15m").
+
+        Returns:
+            List[Kline]: Cached klines ordered by open time (empty if none).
+        """
+        return self._klines.get((symbol, interval), [])
+
+    def last_open_time(self, symbol: str, interval: str) -> Optional[int]:
+        """
+        Return the open time of the latest cached kline.
+
+        Args:
+            symbol (str): Trading symbol.
+            interval (str): Kline interval.
+
+        Returns:
+            Optional[int]: Open time in milliseconds, or None if nothing is cached.
+        """
+        klines = self.get(symbol, interval)
+        if not klines:
+            return None
+        return int(klines[-1][0])
+
+    def replace(self, symbol: str, interval: str, klines: List[Kline]) -> None:
+        """
+        Replace the cached klines with a full backfill.
+
+        The number of backfilled klines becomes the window size kept by
+        subsequent merges.
+
+        Args:
+            symbol (str): Trading symbol.
+            interval (str): Kline interval.
+            klines (List[Kline]): Klines ordered by open time.
+        """
+        key = (symbol, interval)
+        with self._lock:
+            self._klines[key] = list(klines)
+            self._max_sizes[key] = len(klines)
+
+    def merge(self, symbol: str, interval: str, klines: List[Kline]) -> None:
+        """
+        Merge freshly fetched klines into the cache.
+
+        Cached klines whose open time is at or after the first new kline are
+        dropped (this replaces the still-forming bar), the new klines are
+        appended and the oldest klines are trimmed to keep the window size.
+
+        Args:
+            symbol (str): Trading symbol.
+            interval (str): Kline interval.
+            klines (List[Kline]): Klines ordered by open time.
+        """
+        if not klines:
+            return
+        key = (symbol, interval)
+        first_open_time = int(klines[0][0])
+        with self._lock:
+            cached = self._klines.get(key, [])
+            keep = len(cached)
+            while keep > 0 and int(cached[keep - 1][0]) >= first_open_time:
+                keep -= 1
+            merged = cached[:keep] + list(klines)
+            max_size = max(self._max_sizes.get(key, 0), len(klines))
+            self._klines[key] = merged[-max_size:]
+            self._max_sizes[key] = max_size
@@ -0,0 +1,86 @@
+from typing import List, NamedTuple
+import numpy as np
+from binance_adapter.kline_cache import Kline
+
+
+class OHLCV(NamedTuple):
+    """
+    Column arrays parsed from raw klines.
+    """
+
+    open_time: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+
+class KlineParser:
+    """
+    Parses raw Binance klines directly into NumPy arrays.
+
+    Each requested column is written into a preallocated float64 (or int64
+    for open times) array, avoiding the intermediate DataFrame of strings
+    that used to be built on every step.
+    """
+
+    OPEN_TIME: int = 0
+    OPEN: int = 1
+    HIGH: int = 2
+    LOW: int = 3
+    CLOSE: int = 4
+    VOLUME: int = 5
+
+    @staticmethod
+    def parse_column(
+        klines: List[Kline], column: int, dtype: type = np.float64
+    ) -> np.ndarray:
+        """
+        Parse one kline column into a preallocated array.
+
+        Args:
+            klines (List[Kline]): Raw klines as returned by the API.
+            column (int): Index of the column to parse (e.g., KlineParser.CLOSE).
+            dtype (type, optional): Output dtype. Defaults to np.float64.
+
+        Returns:
+            np.ndarray: One value per kline.
+        """
+        values = np.empty(len(klines), dtype=dtype)
+        values[:] = [kline[column] for kline in klines]
+        return values
+
+    @staticmethod
+    def parse_closes(klines: List[Kline]) -> np.ndarray:
+        """
+        Parse the close prices of the given klines.
+
+        Args:
+            klines (List[Kline]): Raw klines as returned by the API.
+
+        Returns:
+            np.ndarray: Close prices as float64.
+        """
+        return KlineParser.parse_column(klines, KlineParser.CLOSE)
+
+    @staticmethod
+    def parse_ohlcv(klines: List[Kline]) -> OHLCV:
+        """
+        Parse open time and OHLCV columns of the given klines.
+
+        Args:
+            klines (List[Kline]): Raw klines as returned by the API.
+
+        Returns:
+            OHLCV: Open times as int64 and prices/volume as float64 arrays.
+        """
+        parse = KlineParser.parse_column
+        return OHLCV(
+            open_time=parse(klines, KlineParser.OPEN_TIME, np.int64),
+            open=parse(klines, KlineParser.OPEN),
+            high=parse(klines, KlineParser.HIGH),
+            low=parse(klines, KlineParser.LOW),
+            close=parse(klines, KlineParser.CLOSE),
+            volume=parse(klines, KlineParser.VOLUME),
+        )
@@ -0,0 +1,143 @@
+import threading
+from typing import Any, Callable, Dict, Optional
+from binance_adapter.kline_cache import Kline, KlineCache
+from binance_adapter.websocket_stream import WebSocketStream
+
+
+class MarketStream(WebSocketStream):
+    """
+    Streams futures klines and mark prices for a single symbol.
+
+    Subscribes to the combined `<symbol>@kline_<interval>` and
+    `<symbol>@markPrice@1s` streams. Kline events are merged into the shared
+    KlineCache (replacing the forming bar), mark price events update
+    `mark_price`, and every event wakes up threads blocked in
+    `wait_for_update`. After every (re)connection the `on_connect` callback
+    is used to backfill the gap over REST.
+    """
+
+    DEFAULT_BASE_URL: str = "wss://fstream.binance.com"
+
+    def __init__(
+        self,
+        symbol: str,
+        interval: str,
+        kline_cache: KlineCache,
+        on_connect: Optional[Callable[[], Any]] = None,
+        base_url: str = DEFAULT_BASE_URL,
+    ) -> None:
+        """
+        Initialize the MarketStream.
+
+        Args:
+            symbol (str): Trading symbol (e.g., "ETHUSDT").
+            interval (str): Kline interval (e.g., "15m").
+            kline_cache (KlineCache): Cache updated with streamed klines.
+            on_connect (Optional[Callable[[], Any]], optional): Callback run after
+                each (re)connection, typically a REST backfill. Defaults to None.
+            base_url (str, optional): WebSocket base URL. Defaults to Binance Futures.
+
+        Attributes:
+            last_price (Optional[float]): Close of the latest streamed kline.
+            mark_price (Optional[float]): Latest streamed mark price.
+        """
+        super().__init__()
+        self.symbol: str = symbol
+        self.interval: str = interval
+        self.kline_cache: KlineCache = kline_cache
+        self.base_url: str = base_url.rstrip("/")
+        self.last_price: Optional[float] = None
+        self.mark_price: Optional[float] = None
+        self._on_connect_callback: Optional[Callable[[], Any]] = on_connect
+        self._updates: int = 0
+        self._seen_updates: int = 0
+        self._updated: threading.Condition = threading.Condition()
+
+    def _get_url(self) -> str:
+        """
+        Build the combined stream URL for the kline and mark price streams.
+
+        Returns:
+            str: The stream URL.
+        """
+        symbol = self.symbol.lower()
+        return (
+            f"{self.base_url}/stream?streams="
+            f"{symbol}@kline_{self.interval}/{symbol}@markPrice@1s"
+        )
+
+    def _on_connect(self) -> None:
+        """
+        Backfill the gap left by the previous disconnection, if a callback is set.
+        """
+        if self._on_connect_callback is not None:
+            self._on_connect_callback()
+
+    @staticmethod
+    def _to_kline(event_kline: Dict[str, Any]) -> Kline:
+        """
+        Convert a streamed kline payload into the REST kline layout.
+
+        Args:
+            event_kline (Dict[str, Any]): The `k` object of a kline event.
+
+        Returns:
+            Kline: Kline in the same 12-column layout returned by the REST API.
+        """
+        return [
+            int(event_kline["t"]),
+            event_kline["o"],
+            event_kline["h"],
+            event_kline["l"],
+            event_kline["c"],
+            event_kline["v"],
+            int(event_kline["T"]),
+            event_kline["q"],
+            int(event_kline["n"]),
+            event_kline["V"],
+            event_kline["Q"],
+            "0",
+        ]
+
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        """
+        Apply a combined stream message to the cache or the mark price.
+
+        Args:
+            message (Dict[str, Any]): Combined stream message with a `data` payload.
+        """
+        data = message.get("data", message)
+        event_type = data.get("e")
+        if event_type == "kline":
+            kline = self._to_kline(data["k"])
+            self.kline_cache.merge(self.symbol, self.interval, [kline])
+            self.last_price = float(kline[4])
+        elif event_type == "markPriceUpdate":
+            self.mark_price = float(data["p"])
+        else:
+            return
+        with self._updated:
+            self._updates += 1
+            self._updated.notify_all()
+
+    def wait_for_update(self, timeout: float) -> bool:
+        """
+        Block until a stream event arrives that the previous call did not
+        report, or the timeout expires.
+
+        Events are counted rather than flagged, so an event that arrives
+        while the caller is busy (even right as a previous wait returns) is
+        reported by the next call instead of being lost.
+
+        Args:
+            timeout (float): Maximum number of seconds to wait.
+
+        Returns:
+            bool: True if an event arrived; False on timeout.
+        """
+        with self._updated:
+            updated = self._updated.wait_for(
+                lambda: self._updates != self._seen_updates, timeout
+            )
+            self._seen_updates = self._updates
+        return updated
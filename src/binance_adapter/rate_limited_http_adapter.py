@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Any, Optional
+import requests
+from binance_adapter.rate_limiter import RateLimiter
+from binance_adapter.tuned_http_adapter import TunedHTTPAdapter
+
+
+class RateLimitedHTTPAdapter(TunedHTTPAdapter):
+    """
+    requests transport adapter passing every request through a RateLimiter.
+
+    Mounted on the session of a synchronous python-binance Client, it waits
+    for the request's weight (and order count) before sending, and feeds the
+    rate limit headers of every response back to the limiter. It keeps the
+    pooling, timeouts and timings of the TunedHTTPAdapter; the time spent
+    waiting for the limiter is not part of the recorded phases.
+    """
+
+    def __init__(
+        self, rate_limiter: Optional[RateLimiter] = None, **kwargs: Any
+    ) -> None:
+        """
+        Initialize the RateLimitedHTTPAdapter.
+
+        Args:
+            rate_limiter (Optional[RateLimiter], optional): Limiter shared by
+                the mounted sessions. Defaults to None (a new limiter).
+            **kwargs (Any): Further `TunedHTTPAdapter` arguments.
+        """
+        super().__init__(**kwargs)
+        self.rate_limiter: RateLimiter = (
+            RateLimiter() if rate_limiter is None else rate_limiter
+        )
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send a request once the limiter grants it and record its usage.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+            *args (Any): Further `HTTPAdapter.send` arguments.
+            **kwargs (Any): Further `HTTPAdapter.send` keyword arguments.
+
+        Returns:
+            requests.Response: The response.
+        """
+        url = str(request.url)
+        self.rate_limiter.acquire(
+            self.rate_limiter.request_cost(str(request.method), url)
+        )
+        response = super().send(request, *args, **kwargs)
+        self.rate_limiter.update(url, response.status_code, response.headers)
+        return response
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Dict, List, Mapping, NamedTuple, Optional
+from urllib.parse import parse_qs, urlsplit
+import aiohttp
+from binance_adapter.token_bucket import TokenBucket
+from utils.logger import Logger
+
+
+class RequestCost(NamedTuple):
+    """
+    Rate limit cost of one REST request.
+
+    Attributes:
+        family (str): API family sharing a weight limit ("api" or "fapi").
+        weight (int): Request weight.
+        orders (int): Orders counted against the order rate limits.
+        is_trading (bool): Whether the request trades (and has priority).
+    """
+
+    family: str
+    weight: int
+    orders: int
+    is_trading: bool
+
+
+class RateLimiter:
+    """
+    Central request-weight and order-count limiter for the Binance REST APIs.
+
+    Every request first takes its weight from the token bucket of its API
+    family (spot `api` and futures `fapi` have separate per-minute limits)
+    and, for new orders, from the 10-second and 1-minute order buckets.
+    Market data may only use `MARKET_DATA_SHARE` of the weight; the rest is
+    reserved for trading requests, which therefore never queue behind
+    polling. The `X-MBX-USED-WEIGHT-1M` and `X-MBX-ORDER-COUNT-*` headers of
+    every response resynchronize the buckets, and a 429 or 418 response
+    blocks the family for its `Retry-After`.
+
+    `poll_interval` turns the remaining budget into a polling interval, so
+    polling runs as fast as the budget allows and slows down as it drains.
+    """
+
+    WEIGHT_LIMITS: Dict[str, int] = {"api": 6_000, "fapi": 2_400}
+    ORDER_LIMIT_10S: int = 300
+    ORDER_LIMIT_1M: int = 1_200
+    MARKET_DATA_SHARE: float = 0.8
+    MIN_HEADROOM: float = 0.05
+    DEFAULT_RETRY_AFTER: float = 60.0
+    WEIGHTS: Dict[str, int] = {
+        "ticker/price": 2,
+        "depth": 5,
+        "balance": 5,
+        "account": 5,
+        "positionRisk": 5,
+        "batchOrders": 5,
+        "openOrders": 1,
+    }
+    TRADING_ENDPOINTS: frozenset = frozenset(
+        {"order", "batchOrders", "leverage", "listenKey"}
+    )
+
+    def __init__(self) -> None:
+        """
+        Initialize the RateLimiter with full buckets.
+
+        Attributes:
+            weight_buckets (Dict[str, TokenBucket]): Weight per API family.
+            order_buckets (List[TokenBucket]): 10-second and 1-minute order counts.
+            waited (float): Total seconds requests were held back.
+        """
+        self.weight_buckets: Dict[str, TokenBucket] = {
+            family: TokenBucket(limit, 60.0)
+            for family, limit in self.WEIGHT_LIMITS.items()
+        }
+        self.order_buckets: List[TokenBucket] = [
+            TokenBucket(self.ORDER_LIMIT_10S, 10.0),
+            TokenBucket(self.ORDER_LIMIT_1M, 60.0),
+        ]
+        self.waited: float = 0.0
+        self._polled: Dict[str, int] = {family: 0 for family in self.WEIGHT_LIMITS}
+        self._lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def request_cost(cls, method: str, url: str) -> RequestCost:
+        """
+        Estimate the rate limit cost of a request from its method and URL.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Full request URL, including the query string.
+
+        Returns:
+            RequestCost: The cost of the request.
+        """
+        parts = urlsplit(url)
+        segments = parts.path.strip("/").split("/")
+        family = "fapi" if "fapi" in segments else "api"
+        endpoint = "/".join(segments[2:]) if len(segments) > 2 else segments[-1]
+        query = parse_qs(parts.query)
+        if endpoint == "klines":
+            limit = int(query.get("limit", ["500"])[0])
+            weight = (
+                1 if limit < 100 else 2 if limit < 500 else 5 if limit <= 1000 else 10
+            )
+        else:
+            weight = cls.WEIGHTS.get(endpoint, 1)
+        orders = 0
+        if method.upper() == "POST" and endpoint == "order":
+            orders = 1
+        elif method.upper() == "POST" and endpoint == "batchOrders":
+            try:
+                orders = len(json.loads(query["batchOrders"][0]))
+            except (KeyError, ValueError):
+                orders = 1
+        return RequestCost(family, weight, orders, endpoint in cls.TRADING_ENDPOINTS)
+
+    def _weight_bucket(self, family: str) -> TokenBucket:
+        return self.weight_buckets.get(family, self.weight_buckets["api"])
+
+    def try_acquire(self, cost: RequestCost) -> float:
+        """
+        Take the cost of a request if the budget allows it.
+
+        Args:
+            cost (RequestCost): Cost of the request.
+
+        Returns:
+            float: 0.0 if the cost was taken, else the seconds to wait before
+                trying again.
+        """
+        bucket = self._weight_bucket(cost.family)
+        floor = (
+            0.0 if cost.is_trading else bucket.capacity * (1 - self.MARKET_DATA_SHARE)
+        )
+        with self._lock:
+            wait = bucket.wait_time(cost.weight, floor)
+            if cost.orders:
+                for order_bucket in self.order_buckets:
+                    wait = max(wait, order_bucket.wait_time(cost.orders))
+            if wait > 0:
+                return wait
+            bucket.take(cost.weight)
+            for order_bucket in self.order_buckets:
+                order_bucket.take(cost.orders)
+            if not cost.is_trading:
+                self._polled[cost.family] = (
+                    self._polled.get(cost.family, 0) + cost.weight
+                )
+            return 0.0
+
+    def acquire(self, cost: RequestCost) -> float:
+        """
+        Wait (blocking) until the cost of a request can be taken, then take it.
+
+        Args:
+            cost (RequestCost): Cost of the request.
+
+        Returns:
+            float: Seconds waited.
+        """
+        waited = 0.0
+        while (wait := self.try_acquire(cost)) > 0:
+            time.sleep(wait)
+            waited += wait
+        self.waited += waited
+        return waited
+
+    async def async_acquire(self, cost: RequestCost) -> float:
+        """
+        Wait (without blocking the event loop) until the cost can be taken.
+
+        Args:
+            cost (RequestCost): Cost of the request.
+
+        Returns:
+            float: Seconds waited.
+        """
+        waited = 0.0
+        while (wait := self.try_acquire(cost)) > 0:
+            await asyncio.sleep(wait)
+            waited += wait
+        self.waited += waited
+        return waited
+
+    def update(self, url: str, status: int, headers: Mapping[str, str]) -> None:
+        """
+        Resynchronize the buckets with the rate limit headers of a response.
+
+        A 429 (too many requests) or 418 (IP ban) response blocks the API
+        family for the `Retry-After` seconds.
+
+        Args:
+            url (str): URL of the request.
+            status (int): HTTP status of the response.
+            headers (Mapping[str, str]): Response headers.
+        """
+        family = self.request_cost("GET", url).family
+        bucket = self._weight_bucket(family)
+        used_weight = headers.get("X-MBX-USED-WEIGHT-1M")
+        orders_10s = headers.get("X-MBX-ORDER-COUNT-10S")
+        orders_1m = headers.get("X-MBX-ORDER-COUNT-1M")
+        with self._lock:
+            if used_weight is not None:
+                bucket.sync_used(float(used_weight))
+            for order_bucket, used in zip(self.order_buckets, (orders_10s, orders_1m)):
+                if used is not None:
+                    order_bucket.sync_used(float(used))
+            if status in (418, 429):
+                retry_after = float(
+                    headers.get("Retry-After", self.DEFAULT_RETRY_AFTER)
+                )
+                bucket.block(retry_after)
+        if status in (418, 429):
+            Logger.log_exception(
+                f"Rate limited (HTTP {status}), pausing {family} requests "
+                f"for {retry_after:.0f} s"
+            )
+
+    def poll_interval(self, base_seconds: float) -> float:
+        """
+        Spacing of the next poll that the remaining budget can sustain.
+
+        The market-data weight spent since the previous call is taken as the
+        cost of one poll. Polls are never spaced closer than `base_seconds`;
+        as a family's headroom above the order reserve drains, its sustainable
+        rate shrinks proportionally and the interval grows, and a blocked
+        family holds polling until it is released.
+
+        Args:
+            base_seconds (float): Minimum spacing of polls.
+
+        Returns:
+            float: Seconds until the next poll.
+        """
+        interval = base_seconds
+        with self._lock:
+            polled, self._polled = self._polled, dict.fromkeys(self._polled, 0)
+            for family, bucket in self.weight_buckets.items():
+                floor = bucket.capacity * (1 - self.MARKET_DATA_SHARE)
+                headroom = max(bucket.headroom(floor), self.MIN_HEADROOM)
+                sustainable = bucket.rate * self.MARKET_DATA_SHARE * headroom
+                interval = max(interval, polled.get(family, 0) / sustainable)
+                interval = max(interval, bucket.blocked_until - time.monotonic())
+        return interval
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Build an aiohttp trace config applying this limiter to a session.
+
+        Pass it as `session_params={"trace_configs": [...]}` to the AsyncClient.
+
+        Returns:
+            aiohttp.TraceConfig: Hooks acquiring before and updating after
+                every request.
+        """
+
+        async def on_request_start(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceRequestStartParams,
+        ) -> None:
+            await self.async_acquire(self.request_cost(params.method, str(params.url)))
+
+        async def on_request_end(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceRequestEndParams,
+        ) -> None:
+            self.update(
+                str(params.url), params.response.status, params.response.headers
+            )
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        return trace_config
+
+    def session_params(self, session_params: Optional[Dict] = None) -> Dict:
+        """
+        Add this limiter's trace config to AsyncClient session parameters.
+
+        Args:
+            session_params (Optional[Dict], optional): Parameters to extend.
+                Defaults to None.
+
+        Returns:
+            Dict: The parameters with the trace config appended.
+        """
+        params = dict(session_params or {})
+        params["trace_configs"] = [
+            *params.get("trace_configs", []),
+            self.trace_config(),
+        ]
+        return params
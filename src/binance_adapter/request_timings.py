@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from types import SimpleNamespace
+from typing import Deque, Dict, Mapping, NamedTuple, Optional
+import aiohttp
+from utils.logger import Logger
+
+
+class PhaseStats(NamedTuple):
+    """
+    Summary of the recent samples of one request phase.
+
+    Attributes:
+        count (int): Number of samples.
+        p50 (float): Median, in milliseconds.
+        p99 (float): 99th percentile, in milliseconds.
+        max (float): Slowest sample, in milliseconds.
+    """
+
+    count: int
+    p50: float
+    p99: float
+    max: float
+
+
+class RequestTimings:
+    """
+    Per-phase timings of the REST requests of a client.
+
+    Every request reports the phases it went through: `dns` (name
+    resolution), `connect` (TCP handshake), `tls` (TLS handshake) and `ttfb`
+    (request sent to response headers). A request served on a pooled
+    keep-alive connection only reports `ttfb`, so the phase counts also show
+    how often connections are reused. The latest samples of every phase are
+    kept, and a summary is logged every `LOG_EVERY` requests.
+    """
+
+    PHASES: tuple = ("dns", "connect", "tls", "ttfb")
+    MAX_SAMPLES: int = 1_000
+    LOG_EVERY: int = 1_000
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty RequestTimings.
+
+        Attributes:
+            samples (Dict[str, Deque[float]]): Latest durations per phase, in seconds.
+            requests (int): Requests recorded so far.
+        """
+        self.samples: Dict[str, Deque[float]] = {
+            phase: deque(maxlen=self.MAX_SAMPLES) for phase in self.PHASES
+        }
+        self.requests: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, phases: Mapping[str, float]) -> None:
+        """
+        Record the phases of one request.
+
+        Args:
+            phases (Mapping[str, float]): Duration of each phase, in seconds.
+        """
+        with self._lock:
+            self.requests += 1
+            for phase, seconds in phases.items():
+                self.samples[phase].append(seconds)
+            is_due = self.requests % self.LOG_EVERY == 0
+        if is_due:
+            Logger.log_info(self.format_summary())
+
+    def summary(self) -> Dict[str, PhaseStats]:
+        """
+        Summarize the recent samples of every phase that has any.
+
+        Returns:
+            Dict[str, PhaseStats]: Statistics per phase, in milliseconds.
+        """
+        with self._lock:
+            samples = {phase: sorted(values) for phase, values in self.samples.items()}
+        stats: Dict[str, PhaseStats] = {}
+        for phase, ordered in samples.items():
+            if not ordered:
+                continue
+            count = len(ordered)
+            stats[phase] = PhaseStats(
+                count,
+                ordered[min(count - 1, int(count * 0.5))] * 1000,
+                ordered[min(count - 1, int(count * 0.99))] * 1000,
+                ordered[-1] * 1000,
+            )
+        return stats
+
+    def format_summary(self) -> str:
+        """
+        Describe the recent timings in one line.
+
+        Returns:
+            str: e.g. "HTTP timings over 1000 requests: ttfb n=1000 p50 21.3 ms ...".
+        """
+        phases = ", ".join(
+            f"{phase} n={stats.count} p50 {stats.p50:.1f} ms "
+            f"p99 {stats.p99:.1f} ms max {stats.max:.1f} ms"
+            for phase, stats in self.summary().items()
+        )
+        return f"HTTP timings over {self.requests} requests: {phases or 'none'}"
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """
+        Build an aiohttp trace config recording the phases of every request.
+
+        aiohttp does not report the TLS handshake on its own, so for the
+        AsyncClient the `connect` phase includes it and `tls` stays empty.
+
+        Returns:
+            aiohttp.TraceConfig: Hooks timing DNS, connection and first byte.
+        """
+
+        async def on_request_start(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceRequestStartParams,
+        ) -> None:
+            context.phases = {}
+            context.dns_started = context.connect_started = None
+            context.headers_sent = None
+
+        async def on_dns_resolvehost_start(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceDnsResolveHostStartParams,
+        ) -> None:
+            context.dns_started = time.perf_counter()
+
+        async def on_dns_resolvehost_end(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceDnsResolveHostEndParams,
+        ) -> None:
+            context.phases["dns"] = time.perf_counter() - context.dns_started
+
+        async def on_connection_create_start(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceConnectionCreateStartParams,
+        ) -> None:
+            context.connect_started = time.perf_counter()
+
+        async def on_connection_create_end(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceConnectionCreateEndParams,
+        ) -> None:
+            elapsed = time.perf_counter() - context.connect_started
+            context.phases["connect"] = elapsed - context.phases.get("dns", 0.0)
+
+        async def on_request_headers_sent(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceRequestHeadersSentParams,
+        ) -> None:
+            context.headers_sent = time.perf_counter()
+
+        async def on_request_end(
+            session: aiohttp.ClientSession,
+            context: SimpleNamespace,
+            params: aiohttp.TraceRequestEndParams,
+        ) -> None:
+            headers_sent: Optional[float] = context.headers_sent
+            if headers_sent is not None:
+                context.phases["ttfb"] = time.perf_counter() - headers_sent
+            self.record(context.phases)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_request_headers_sent.append(on_request_headers_sent)
+        trace_config.on_request_end.append(on_request_end)
+        return trace_config
+
+    def session_params(self, session_params: Optional[Dict] = None) -> Dict:
+        """
+        Add this recorder's trace config to AsyncClient session parameters.
+
+        Args:
+            session_params (Optional[Dict], optional): Parameters to extend.
+                Defaults to None.
+
+        Returns:
+            Dict: The parameters with the trace config appended.
+        """
+        params = dict(session_params or {})
+        params["trace_configs"] = [
+            *params.get("trace_configs", []),
+            self.trace_config(),
+        ]
+        return params
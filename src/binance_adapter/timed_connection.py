@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import socket
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.response import BaseHTTPResponse
+from urllib3.util.connection import allowed_gai_family
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """
+    urllib3 connection reporting the DNS, connect and first-byte phases.
+
+    The phases are written to the dict held by `PHASES` in the current
+    context (set by the sending adapter around each request), so one
+    connection class serves every pool without knowing its recorder. The
+    host is resolved once, timed, and the resolved addresses are connected
+    in turn, like urllib3 does itself.
+    """
+
+    PHASES: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+        "http_phases", default=None
+    )
+
+    @classmethod
+    def _report(cls, phase: str, seconds: float) -> None:
+        """
+        Report a phase of the current request, if one is being timed.
+
+        Args:
+            phase (str): Phase name.
+            seconds (float): Duration of the phase.
+        """
+        phases = cls.PHASES.get()
+        if phases is not None:
+            phases[phase] = seconds
+
+    def _new_conn(self) -> socket.socket:
+        """
+        Resolve the host and open a TCP connection, timing both steps.
+
+        Returns:
+            socket.socket: The connected socket.
+        """
+        started = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(
+                self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM
+            )
+        except OSError:
+            return super()._new_conn()  # raises urllib3's NameResolutionError
+        resolved = time.perf_counter()
+        self._report("dns", resolved - started)
+        hosts: List[str] = list(dict.fromkeys(str(info[4][0]) for info in addresses))
+        dns_host = self._dns_host
+        try:
+            for host in hosts[:-1]:
+                self._dns_host = host
+                try:
+                    return self._timed_connect(resolved)
+                except NewConnectionError:
+                    resolved = time.perf_counter()
+            self._dns_host = hosts[-1]
+            return self._timed_connect(resolved)
+        finally:
+            self._dns_host = dns_host
+
+    def _timed_connect(self, started: float) -> socket.socket:
+        """
+        Open the TCP connection to the current address and report its duration.
+
+        Args:
+            started (float): `perf_counter` value the handshake is timed from.
+
+        Returns:
+            socket.socket: The connected socket.
+        """
+        sock = super()._new_conn()
+        self._report("connect", time.perf_counter() - started)
+        return sock
+
+    def getresponse(self) -> BaseHTTPResponse:
+        """
+        Wait for the response headers, reporting the time to first byte.
+
+        Returns:
+            BaseHTTPResponse: The response.
+        """
+        started = time.perf_counter()
+        response = super().getresponse()
+        self._report("ttfb", time.perf_counter() - started)
+        return response
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):
+    """
+    TimedHTTPConnection that also reports the TLS handshake.
+    """
+
+    def connect(self) -> None:
+        """
+        Connect and wrap the socket in TLS; the time not spent resolving
+        or connecting is reported as the `tls` phase.
+        """
+        started = time.perf_counter()
+        super().connect()
+        phases = self.PHASES.get()
+        if phases is not None:
+            elapsed = time.perf_counter() - started
+            handshakes = phases.get("dns", 0.0) + phases.get("connect", 0.0)
+            phases["tls"] = max(0.0, elapsed - handshakes)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    """HTTP connection pool opening TimedHTTPConnections."""
+
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS connection pool opening TimedHTTPSConnections."""
+
+    ConnectionCls = TimedHTTPSConnection
@@ -0,0 +1,109 @@
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously up to its capacity.
+
+    The bucket is not synchronized; callers serialize access. A floor can
+    be kept out of reach of low-priority consumers, and the bucket can be
+    blocked for a while (e.g. after a rate limit response) or resynchronized
+    with the usage reported by the server.
+    """
+
+    EPSILON: float = 1e-9
+
+    def __init__(self, capacity: float, period: float) -> None:
+        """
+        Initialize a full TokenBucket.
+
+        Args:
+            capacity (float): Maximum number of tokens.
+            period (float): Seconds needed to refill an empty bucket.
+
+        Attributes:
+            tokens (float): Tokens available at the last refill.
+            rate (float): Tokens refilled per second.
+            blocked_until (float): Monotonic time before which nothing is granted.
+        """
+        self.capacity: float = capacity
+        self.rate: float = capacity / period
+        self.tokens: float = capacity
+        self.blocked_until: float = 0.0
+        self._updated: float = time.monotonic()
+
+    def _refill(self) -> float:
+        """
+        Add the tokens refilled since the last update.
+
+        Returns:
+            float: The current monotonic time.
+        """
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        return now
+
+    def wait_time(self, amount: float, floor: float = 0.0) -> float:
+        """
+        Seconds until `amount` tokens can be taken without going below `floor`.
+
+        Args:
+            amount (float): Tokens needed.
+            floor (float, optional): Tokens that must remain. Defaults to 0.0.
+
+        Returns:
+            float: 0.0 if the tokens are available now.
+        """
+        now = self._refill()
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        missing = amount + floor - self.tokens
+        return 0.0 if missing <= self.EPSILON else missing / self.rate
+
+    def take(self, amount: float) -> None:
+        """
+        Take tokens (the balance may go negative when overcommitted).
+
+        Args:
+            amount (float): Tokens taken.
+        """
+        self._refill()
+        self.tokens -= amount
+
+    def sync_used(self, used: float) -> None:
+        """
+        Align the bucket with the usage reported by the server.
+
+        Args:
+            used (float): Tokens the server counts as used in its window.
+        """
+        self._refill()
+        self.tokens = self.capacity - used
+
+    def block(self, seconds: float) -> None:
+        """
+        Grant nothing for a while.
+
+        Args:
+            seconds (float): Seconds to block.
+        """
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def headroom(self, floor: float = 0.0) -> float:
+        """
+        Fraction of the tokens above `floor` that is currently available.
+
+        Args:
+            floor (float, optional): Tokens kept out of reach. Defaults to 0.0.
+
+        Returns:
+            float: Between 0.0 (empty or blocked) and 1.0 (full).
+        """
+        now = self._refill()
+        if now < self.blocked_until:
+            return 0.0
+        usable = self.capacity - floor
+        return min(1.0, max(0.0, (self.tokens - floor) / usable))
@@ -0,0 +1,133 @@
+import asyncio
+import json
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+from websockets.asyncio.client import connect, ClientConnection
+from utils.logger import Logger
+
+
+class WebSocketStream(ABC):
+    """
+    Base class for Binance WebSocket streams consumed in a background thread.
+
+    The stream runs its own asyncio event loop in a daemon thread, decodes
+    every JSON message and hands it to `_handle_message`. Dropped connections
+    are re-established with exponential backoff, and `_on_connect` is invoked
+    after every (re)connection before any message is processed, so subclasses
+    can backfill whatever was missed while disconnected.
+    """
+
+    _INITIAL_RECONNECT_DELAY: float = 1.0
+    _MAX_RECONNECT_DELAY: float = 30.0
+
+    def __init__(self) -> None:
+        """
+        Initialize the WebSocketStream.
+
+        Attributes:
+            is_connected (bool): Whether the stream is connected and backfilled.
+        """
+        self.is_connected: bool = False
+        self._stopped: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._websocket: Optional[ClientConnection] = None
+
+    @abstractmethod
+    def _get_url(self) -> str:
+        """
+        Build the WebSocket URL to connect to.
+
+        Returns:
+            str: The stream URL.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        """
+        Process a decoded stream message.
+
+        Args:
+            message (Dict[str, Any]): The JSON-decoded message.
+        """
+        raise NotImplementedError
+
+    def _on_connect(self) -> None:
+        """
+        Hook invoked (in a worker thread) after each successful connection.
+        """
+        return None
+
+    def start(self) -> None:
+        """
+        Start consuming the stream in a background daemon thread.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=lambda: asyncio.run(self._run_forever()),
+            name=type(self).__name__,
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the stream and wait for the background thread to finish.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread. Defaults to 5.0.
+        """
+        self._stopped.set()
+        loop, websocket = self._loop, self._websocket
+        if loop is not None and websocket is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(websocket.close(), loop)
+            except RuntimeError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    async def _run_forever(self) -> None:
+        """
+        Connect, consume and reconnect until the stream is stopped.
+        """
+        self._loop = asyncio.get_running_loop()
+        delay = self._INITIAL_RECONNECT_DELAY
+        while not self._stopped.is_set():
+            try:
+                async with connect(self._get_url()) as websocket:
+                    self._websocket = websocket
+                    await asyncio.to_thread(self._on_connect)
+                    self.is_connected = True
+                    delay = self._INITIAL_RECONNECT_DELAY
+                    async for raw_message in websocket:
+                        self._dispatch(raw_message)
+            except Exception as e:
+                if not self._stopped.is_set():
+                    Logger.log_exception(f"{type(self).__name__}: {e}")
+            finally:
+                self.is_connected = False
+                self._websocket = None
+            if self._stopped.is_set():
+                break
+            await asyncio.to_thread(self._stopped.wait, delay)
+            delay = min(delay * 2, self._MAX_RECONNECT_DELAY)
+
+    def _dispatch(self, raw_message: Any) -> None:
+        """
+        Decode a raw message and pass it to `_handle_message`.
+
+        Malformed or unexpected messages are logged and skipped so that a
+        single bad frame never tears down the connection.
+
+        Args:
+            raw_message (Any): The raw text frame received from the server.
+        """
+        try:
+            self._handle_message(json.loads(raw_message))
+        except Exception as e:
+            Logger.log_exception(f"{type(self).__name__} message error: {e}")
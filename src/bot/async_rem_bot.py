@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Optional, Union
+from bot.performance_tracker import PerformanceTracker
+from bot.data_manager import DataManager
+from bot.candle_scheduler import CandleScheduler
+from bot.bot_checkpoint import BotCheckpoint
+from bot.states.active.active_position_state import ActivePositionState
+from bot.states.flat.flat_position_state import FlatPositionState
+from bot.states.position_state import PositionState
+from bot.bot_settings import SETTINGS, BotSettings
+from bot.symbol_settings import SymbolSettings
+from binance_adapter.async_binance_adapter import AsyncBinanceAdapter
+from data.tick_recorder import TickRecorder
+from utils.date_utils import DateUtils
+from utils.logger import Logger
+
+
+class AsyncRemBot:
+    """
+    Trading bot running the RemBot state machine on an asyncio event loop.
+
+    Market data and orders go through an AsyncBinanceAdapter, so slow REST
+    calls are awaited instead of stalling the loop, and the kline and price
+    requests of each step are overlapped. The position states are shared with
+    RemBot and are driven through their `async_step`.
+    """
+
+    def __init__(self, binance_adapter: Optional[AsyncBinanceAdapter] = None) -> None:
+        """
+        Initialize the AsyncRemBot instance.
+
+        Args:
+            binance_adapter (Optional[AsyncBinanceAdapter], optional): Adapter of
+                the traded symbol, e.g. sharing its client with other bots.
+                Defaults to None (an adapter is opened by `run`).
+
+        Attributes:
+            performance_tracker (PerformanceTracker): Tracks wins and losses.
+            data_manager (DataManager): Manages market indicators and position snapshots.
+            binance_adapter (AsyncBinanceAdapter): Interface for Binance API operations.
+            symbol_settings (Union[SymbolSettings, BotSettings]): Settings of the traded symbol.
+            state (PositionState): Current trading state of the bot, entered
+                by `start`.
+            scheduler (CandleScheduler): Aligns steps to candle closes.
+            tick_recorder (Optional[TickRecorder]): Journal of the snapshot of
+                every step, with `TICK_JOURNAL` (opened by `run`).
+            checkpoint (Optional[BotCheckpoint]): Crash-safe checkpoint of the
+                bot, with `CHECKPOINT` (opened by `run`).
+        """
+        self.performance_tracker: PerformanceTracker = PerformanceTracker()
+        self.data_manager: DataManager = DataManager()
+        self.binance_adapter: AsyncBinanceAdapter
+        self.symbol_settings: Union[SymbolSettings, BotSettings]
+        if binance_adapter is not None:
+            self.binance_adapter = binance_adapter
+            self.symbol_settings = binance_adapter.symbol_settings
+        self._owns_adapter: bool = binance_adapter is None
+        self._state: PositionState
+        self.scheduler: CandleScheduler = CandleScheduler(
+            interval=SETTINGS.INTERVAL, tick_seconds=SETTINGS.SLEEP_DURATION
+        )
+        self.tick_recorder: Optional[TickRecorder] = None
+        self.checkpoint: Optional[BotCheckpoint] = None
+
+    @property
+    def state(self) -> PositionState:
+        """
+        Current trading state of the bot.
+
+        Returns:
+            PositionState: The state.
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state: PositionState) -> None:
+        """
+        Transition to a state, writing the checkpoint if there is one.
+
+        Args:
+            state (PositionState): The new state.
+        """
+        self._state = state
+        if self.checkpoint is not None:
+            self.checkpoint.save(self)
+
+    async def _reconcile(self) -> None:
+        """
+        Reconcile a restored state with the exchange.
+
+        Actions:
+            - Keeps a restored position that is still open on the exchange.
+            - Closes one whose exit order filled while the bot was stopped,
+              with that fill's result, cancelling the other exit order.
+            - Otherwise (closed by hand) returns to the flat state.
+            - Warns about an exchange position the flat state does not know.
+        """
+        state = self.state
+        account_manager = self.binance_adapter.account_manager
+        if not isinstance(state, ActivePositionState):
+            for side in ("LONG", "SHORT"):
+                if await account_manager.async_get_position_amount(side) != 0:
+                    Logger.log_info(f"Untracked {side} position is open.")
+            return
+        if await account_manager.async_get_position_amount(state.SIDE) != 0:
+            return
+        fill = await account_manager.async_fetch_exit_fill()
+        if fill is not None:
+            await account_manager.async_cancel_remaining_exit(fill)
+            state.close_from_fill(fill)
+            return
+        Logger.log_info(f"Restored {state.SIDE} position is no longer open.")
+        self.state = FlatPositionState(parent=self)
+
+    async def _sync_server_time(self) -> None:
+        """
+        Re-synchronize the scheduler with the exchange server clock.
+
+        Failures are logged and the previous offset is kept.
+        """
+        try:
+            server_time = await self.binance_adapter.get_server_time()
+            self.scheduler.offset_ms = server_time - DateUtils.get_timestamp_ms()
+        except Exception as e:
+            Logger.log_exception(f"Server time sync failed: {e}")
+
+    async def _initial_block(self) -> None:
+        """
+        Perform the initial blocking logic based on the latest indicator snapshot.
+
+        Actions:
+            - Fetches the first market snapshot from the AsyncBinanceAdapter.
+            - Blocks LONG entries if the current price is below the EMA-100.
+            - Otherwise, blocks SHORT entries.
+        """
+        self.data_manager.market_snapshot = (
+            await self.binance_adapter.indicator_manager.async_fetch_indicators()
+        )
+        temp_snapshot_alias = self.data_manager.market_snapshot
+        if SETTINGS.DEBUG_MODE:
+            Logger.log_info("debug: " + str(temp_snapshot_alias))
+        if temp_snapshot_alias.price < temp_snapshot_alias.ema_100:
+            self.data_manager.block_long()
+        else:
+            self.data_manager.block_short()
+
+    async def start(self) -> None:
+        """
+        Restore the checkpoint, if there is one, and reconcile it with the
+        exchange; otherwise apply the initial block and enter the flat state.
+        """
+        if self.checkpoint is not None and self.checkpoint.restore(self):
+            Logger.log_info("RemBot state is restored from the checkpoint.")
+            if not SETTINGS.TEST_MODE:
+                await self._reconcile()
+            return
+        await self._initial_block()
+        self.state = FlatPositionState(parent=self)
+
+    async def run(self) -> None:
+        """
+        Connect to the exchange and run the trading loop until cancelled.
+
+        Each iteration waits until the next scheduled tick and awaits the
+        current state's `async_step`, with a full indicator refresh (and a
+        server clock re-synchronization) on candle closes. Price ticks are
+        paced by the adapter's rate limiter, if it has one. With `TICK_JOURNAL`
+        the snapshot of every step is recorded, and with `CHECKPOINT` the
+        bot starts from its checkpoint and writes it once a new candle was
+        committed. A client session opened by the bot and the tick journal
+        are closed when the loop ends.
+        """
+        if self._owns_adapter:
+            self.binance_adapter = await AsyncBinanceAdapter.create()
+            self.symbol_settings = self.binance_adapter.symbol_settings
+        rate_limiter = self.binance_adapter.rate_limiter
+        if rate_limiter is not None:
+            self.scheduler.pace_fn = rate_limiter.poll_interval
+        if SETTINGS.TICK_JOURNAL:
+            self.tick_recorder = TickRecorder.for_symbol(
+                self.symbol_settings.SYMBOL, SETTINGS.TICK_SEGMENT_MB * 1024 * 1024
+            )
+        if SETTINGS.CHECKPOINT:
+            self.checkpoint = BotCheckpoint.for_symbol(self.symbol_settings.SYMBOL)
+        try:
+            Logger.log_start("RemBot is running...")
+            await self.start()
+            await self._sync_server_time()
+            while True:
+                delay, is_candle_close = self.scheduler.next_tick()
+                await asyncio.sleep(delay)
+                await self.state.async_step(full_refresh=is_candle_close)
+                if self.tick_recorder is not None:
+                    self.tick_recorder.record(self.data_manager.market_snapshot)
+                if self.checkpoint is not None:
+                    self.checkpoint.save_on_candle_close(self)
+                if is_candle_close:
+                    await self._sync_server_time()
+        finally:
+            if self.tick_recorder is not None:
+                self.tick_recorder.close()
+            if self._owns_adapter:
+                await self.binance_adapter.close()
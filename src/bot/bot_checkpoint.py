@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+from base_dir import BASE_DIR
+from bot.bot_settings import SETTINGS
+from bot.states.active.active_position_state import ActivePositionState
+from bot.states.active.long_position_state import LongPositionState
+from bot.states.active.short_position_state import ShortPositionState
+from bot.states.flat.flat_position_state import FlatPositionState
+from data.market_snapshot import MarketSnapshot
+from utils.date_utils import DateUtils
+from utils.logger import Logger
+
+
+class BotCheckpoint:
+    """
+    Crash-safe checkpoint of a RemBot, for warm restarts.
+
+    The checkpoint is a small JSON document holding everything a restart
+    would otherwise lose: the state (and TP/SL of an open position with its
+    exit order ids), the position and market snapshots, the block flags, the
+    win/loss counts and the committed indicator state. It is written to a
+    temporary file, flushed to disk and renamed over the previous one, so a
+    crash at any point leaves either the old or the new checkpoint behind.
+    Restoring it only reads that file; the klines missed while stopped are
+    fetched by the next indicator refresh.
+    """
+
+    VERSION: int = 1
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Initialize the BotCheckpoint.
+
+        Args:
+            path (Union[str, Path]): JSON file the checkpoint is written to.
+
+        Attributes:
+            saved_open_time (Optional[int]): Committed kline open time of the
+                latest checkpoint written or restored.
+        """
+        self.path: Path = Path(path)
+        self.saved_open_time: Optional[int] = None
+
+    @classmethod
+    def for_symbol(cls, symbol: str) -> BotCheckpoint:
+        """
+        Build the checkpoint of a symbol, next to the settings.
+
+        Args:
+            symbol (str): Trading symbol (e.g., "ETHUSDT").
+
+        Returns:
+            BotCheckpoint: Checkpoint stored in `checkpoint_<symbol>.json`.
+        """
+        return cls(BASE_DIR / f"checkpoint_{symbol}.json")
+
+    @staticmethod
+    def capture(bot: Any) -> Dict[str, Any]:
+        """
+        Collect the state of a bot into a JSON-serializable checkpoint.
+
+        Args:
+            bot (Any): The RemBot to capture.
+
+        Returns:
+            Dict[str, Any]: The checkpoint document.
+        """
+        state = bot.state
+        data_manager = bot.data_manager
+        is_active = isinstance(state, ActivePositionState)
+        return {
+            "version": BotCheckpoint.VERSION,
+            "saved_ms": DateUtils.get_timestamp_ms(),
+            "symbol": bot.symbol_settings.SYMBOL,
+            "interval": SETTINGS.INTERVAL,
+            "state": state.SIDE if is_active else "FLAT",
+            "tp_price": state.tp_price if is_active else None,
+            "sl_price": state.sl_price if is_active else None,
+            "exit_order_ids": (
+                bot.binance_adapter.account_manager.exit_order_ids if is_active else {}
+            ),
+            "is_long_blocked": data_manager.is_long_blocked,
+            "is_short_blocked": data_manager.is_short_blocked,
+            "win_count": bot.performance_tracker.win_count,
+            "loss_count": bot.performance_tracker.loss_count,
+            "market_snapshot": data_manager.market_snapshot.as_dict(),
+            "position_snapshot": (
+                data_manager.position_snapshot.as_dict() if is_active else None
+            ),
+            "indicators": bot.binance_adapter.indicator_manager.export_state(),
+        }
+
+    def save(self, bot: Any) -> None:
+        """
+        Write the checkpoint of a bot atomically.
+
+        Failures are logged; trading goes on without the checkpoint.
+
+        Args:
+            bot (Any): The RemBot to checkpoint.
+        """
+        try:
+            checkpoint = self.capture(bot)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(self.path.name + ".tmp")
+            with temporary.open("w", encoding="utf-8") as f:
+                json.dump(checkpoint, f, separators=(",", ":"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporary, self.path)
+            self.saved_open_time = checkpoint["indicators"]["committed_open_time"]
+        except Exception as e:
+            Logger.log_exception(f"Checkpoint save failed: {e}")
+
+    def save_on_candle_close(self, bot: Any) -> None:
+        """
+        Write the checkpoint if a candle was committed since the last one.
+
+        Args:
+            bot (Any): The RemBot to checkpoint.
+        """
+        committed = bot.binance_adapter.indicator_manager.committed_open_time
+        if committed != self.saved_open_time:
+            self.save(bot)
+
+    def read(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Read the checkpoint if it matches the symbol and interval traded now.
+
+        Unreadable files are logged and treated as missing.
+
+        Args:
+            symbol (str): Traded symbol.
+
+        Returns:
+            Optional[Dict[str, Any]]: The checkpoint document, or None.
+        """
+        if not self.path.is_file():
+            return None
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except Exception as e:
+            Logger.log_exception(f"Checkpoint unreadable: {e}")
+            return None
+        if (
+            checkpoint.get("version") != self.VERSION
+            or checkpoint.get("symbol") != symbol
+            or checkpoint.get("interval") != SETTINGS.INTERVAL
+        ):
+            return None
+        return checkpoint
+
+    def restore(self, bot: Any) -> bool:
+        """
+        Restore a bot from its checkpoint, without any exchange request.
+
+        Args:
+            bot (Any): The RemBot to restore.
+
+        Returns:
+            bool: True if a matching checkpoint was restored.
+        """
+        checkpoint = self.read(bot.symbol_settings.SYMBOL)
+        if checkpoint is None:
+            return False
+        try:
+            indicators = checkpoint["indicators"]
+            bot.binance_adapter.indicator_manager.restore_state(indicators)
+            data_manager = bot.data_manager
+            data_manager.is_long_blocked = bool(checkpoint["is_long_blocked"])
+            data_manager.is_short_blocked = bool(checkpoint["is_short_blocked"])
+            data_manager.market_snapshot = MarketSnapshot.from_dict(
+                checkpoint["market_snapshot"]
+            )
+            bot.performance_tracker.win_count = int(checkpoint["win_count"])
+            bot.performance_tracker.loss_count = int(checkpoint["loss_count"])
+            state = checkpoint["state"]
+            if state == "FLAT":
+                bot.state = FlatPositionState(parent=bot)
+            else:
+                data_manager.position_snapshot = MarketSnapshot.from_dict(
+                    checkpoint["position_snapshot"]
+                )
+                bot.binance_adapter.account_manager.exit_order_ids = {
+                    leg: int(order_id)
+                    for leg, order_id in checkpoint["exit_order_ids"].items()
+                }
+                state_class = (
+                    LongPositionState if state == "LONG" else ShortPositionState
+                )
+                bot.state = state_class(
+                    parent=bot,
+                    target_prices=[checkpoint["tp_price"], checkpoint["sl_price"]],
+                )
+        except Exception as e:
+            Logger.log_exception(f"Checkpoint restore failed: {e}")
+            return False
+        self.saved_open_time = indicators["committed_open_time"]
+        return True
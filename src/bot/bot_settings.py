@@ -1,8 +1,9 @@
 from dataclasses import dataclass
 from utils.file_utils import FileUtils
 from base_dir import BASE_DIR
+from bot.symbol_settings import SymbolSettings
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, List, Tuple, Union
 
 
 @dataclass(frozen=True)
@@ -19,6 +20,53 @@ class BotSettings:
     INTERVAL: str
     SLEEP_DURATION: float
     OUTPUT_CSV_PATH: Union[str, Path]
+    STREAM_MODE: bool = False
+    LOOKBACK_TOLERANCE: float = 1e-6
+    ASYNC_MODE: bool = False
+    PORTFOLIO: Tuple[SymbolSettings, ...] = ()
+    BATCH_ORDERS: bool = False
+    ACCOUNT_STREAM: bool = False
+    EXCHANGE_FILTERS: bool = False
+    RATE_LIMIT: bool = False
+    HTTP_TUNING: bool = False
+    HTTP_POOL_SIZE: int = 10
+    HTTP_CONNECT_TIMEOUT: float = 3.0
+    HTTP_READ_TIMEOUT: float = 10.0
+    CHECKPOINT: bool = False
+    BUFFERED_RESULTS: bool = False
+    RESULTS_FSYNC: str = "batch"
+    TRADE_JOURNAL: bool = False
+    TICK_JOURNAL: bool = False
+    TICK_SEGMENT_MB: int = 64
+
+
+def _read_portfolio(
+    position: Dict[str, Any], symbols: List[Dict[str, Any]]
+) -> Tuple[SymbolSettings, ...]:
+    """
+    Build the per-symbol settings of the `[[PORTFOLIO.SYMBOLS]]` tables.
+
+    Keys missing from a symbol table fall back to the `[POSITION]` values,
+    and every symbol writes its results to its own CSV file.
+
+    Args:
+        position (Dict[str, Any]): The `[POSITION]` section.
+        symbols (List[Dict[str, Any]]): The `[[PORTFOLIO.SYMBOLS]]` tables.
+
+    Returns:
+        Tuple[SymbolSettings, ...]: Settings of every portfolio symbol.
+    """
+    return tuple(
+        SymbolSettings(
+            entry["SYMBOL"],
+            entry.get("COIN_PRECISION", position["COIN_PRECISION"]),
+            entry.get("TP_RATIO", position["TP_RATIO"]),
+            entry.get("SL_RATIO", position["SL_RATIO"]),
+            entry.get("LEVERAGE", position["LEVERAGE"]),
+            BASE_DIR / f"results_{entry['SYMBOL']}.csv",
+        )
+        for entry in symbols
+    )
 
 
 SETTINGS_PATH = BASE_DIR / "settings.toml"
@@ -37,4 +85,24 @@ SETTINGS = BotSettings(
     _settings["RUNTIME"]["INTERVAL"],
     _settings["RUNTIME"]["SLEEP_DURATION"],
     OUTPUT_CSV_PATH,
+    _settings["RUNTIME"].get("STREAM_MODE", False),
+    _settings["RUNTIME"].get("LOOKBACK_TOLERANCE", 1e-6),
+    _settings["RUNTIME"].get("ASYNC_MODE", False),
+    _read_portfolio(
+        _settings["POSITION"], _settings.get("PORTFOLIO", {}).get("SYMBOLS", [])
+    ),
+    _settings["RUNTIME"].get("BATCH_ORDERS", False),
+    _settings["RUNTIME"].get("ACCOUNT_STREAM", False),
+    _settings["RUNTIME"].get("EXCHANGE_FILTERS", False),
+    _settings["RUNTIME"].get("RATE_LIMIT", False),
+    _settings["RUNTIME"].get("HTTP_TUNING", False),
+    _settings["RUNTIME"].get("HTTP_POOL_SIZE", 10),
+    _settings["RUNTIME"].get("HTTP_CONNECT_TIMEOUT", 3.0),
+    _settings["RUNTIME"].get("HTTP_READ_TIMEOUT", 10.0),
+    _settings["RUNTIME"].get("CHECKPOINT", False),
+    _settings["RUNTIME"].get("BUFFERED_RESULTS", False),
+    _settings["RUNTIME"].get("RESULTS_FSYNC", "batch"),
+    _settings["RUNTIME"].get("TRADE_JOURNAL", False),
+    _settings["RUNTIME"].get("TICK_JOURNAL", False),
+    _settings["RUNTIME"].get("TICK_SEGMENT_MB", 64),
 )
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Callable, Optional, Tuple
+from utils.date_utils import DateUtils
+from utils.logger import Logger
+
+
+class CandleScheduler:
+    """
+    Schedules bot steps on a grid aligned to exchange candle boundaries.
+
+    Every candle close (per exchange server time) yields a full indicator
+    refresh; in between, cheap price-only ticks are scheduled every
+    `tick_seconds`. Deadlines are computed from absolute boundaries rather
+    than by sleeping fixed durations, so the time spent in each step never
+    accumulates into drift, and the server clock offset is re-synchronized
+    periodically. An optional pacing function can push price-only ticks
+    further apart (never candle closes), e.g. when the request budget runs low.
+    """
+
+    CLOSE_GRACE_MS: int = 250
+    SYNC_INTERVAL_MS: int = 3_600_000
+
+    def __init__(
+        self,
+        interval: str,
+        tick_seconds: float,
+        server_time_fn: Optional[Callable[[], int]] = None,
+        pace_fn: Optional[Callable[[float], float]] = None,
+    ) -> None:
+        """
+        Initialize the CandleScheduler.
+
+        Args:
+            interval (str): Kline interval defining the candle boundaries (e.g., "15m").
+            tick_seconds (float): Spacing of price-only ticks between candle closes.
+            server_time_fn (Optional[Callable[[], int]], optional): Returns the
+                exchange server time in milliseconds. Defaults to None (local clock).
+            pace_fn (Optional[Callable[[float], float]], optional): Maps the
+                tick spacing to the spacing the request budget allows, e.g.
+                `RateLimiter.poll_interval`. Defaults to None (fixed spacing).
+        """
+        self.interval_ms: int = DateUtils.interval_to_milliseconds(interval)
+        self.tick_ms: int = max(1, int(tick_seconds * 1000))
+        self.server_time_fn: Optional[Callable[[], int]] = server_time_fn
+        self.pace_fn: Optional[Callable[[float], float]] = pace_fn
+        self.offset_ms: int = 0
+        self._last_sync_ms: Optional[int] = None
+
+    def _sync_offset(self, local_ms: int) -> None:
+        """
+        Re-synchronize the server clock offset when it is due.
+
+        Failures are logged and the previous offset is kept.
+
+        Args:
+            local_ms (int): Current local time in milliseconds.
+        """
+        if self.server_time_fn is None:
+            return
+        if (
+            self._last_sync_ms is not None
+            and local_ms - self._last_sync_ms < self.SYNC_INTERVAL_MS
+        ):
+            return
+        try:
+            self.offset_ms = int(self.server_time_fn()) - local_ms
+        except Exception as e:
+            Logger.log_exception(f"Server time sync failed: {e}")
+        self._last_sync_ms = local_ms
+
+    def now_ms(self) -> int:
+        """
+        Current exchange time in milliseconds.
+
+        Returns:
+            int: Local time corrected by the server clock offset.
+        """
+        local_ms = DateUtils.get_timestamp_ms()
+        self._sync_offset(local_ms)
+        return local_ms + self.offset_ms
+
+    def next_tick(self) -> Tuple[float, bool]:
+        """
+        Compute the delay until the next scheduled step.
+
+        Returns:
+            Tuple[float, bool]: Seconds to wait and whether that step is a
+                candle close (full refresh) rather than a price-only tick.
+        """
+        now = self.now_ms()
+        candle_open = now - now % self.interval_ms
+        next_close = candle_open + self.interval_ms
+        elapsed = now - candle_open
+        next_price_tick = candle_open + (elapsed // self.tick_ms + 1) * self.tick_ms
+        if self.pace_fn is not None:
+            paced_ms = int(self.pace_fn(self.tick_ms / 1000) * 1000)
+            next_price_tick = max(next_price_tick, now + paced_ms)
+        if next_price_tick < next_close:
+            return (next_price_tick - now) / 1000, False
+        return (next_close + self.CLOSE_GRACE_MS - now) / 1000, True
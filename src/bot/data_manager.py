@@ -1,4 +1,5 @@
 from data.market_snapshot import MarketSnapshot
+from data.snapshot_history import SnapshotHistory
 from utils.logger import Logger
 
 
@@ -8,9 +9,12 @@ class DataManager:
 
     This class tracks whether LONG or SHORT positions are currently blocked,
     stores the latest market indicator snapshot, and keeps the snapshot
-    taken at the time a position is opened.
+    taken at the time a position is opened. Every new market snapshot is also
+    appended to a fixed-size history of recent snapshots.
     """
 
+    HISTORY_SIZE: int = 1024
+
     def __init__(self) -> None:
         """
         Initialize the DataManager.
@@ -19,13 +23,43 @@ class DataManager:
             is_long_blocked (bool): Flag indicating whether LONG entries are blocked.
             is_short_blocked (bool): Flag indicating whether SHORT entries are blocked.
             market_snapshot (MarketSnapshot): Latest fetched market indicators.
+            history (SnapshotHistory): The most recent market snapshots.
             position_snapshot (MarketSnapshot): Snapshot of the market
                 at the moment a position is opened.
         """
         self.is_long_blocked: bool = False
         self.is_short_blocked: bool = False
-        self.market_snapshot: MarketSnapshot
+        self._market_snapshot: MarketSnapshot
         self.position_snapshot: MarketSnapshot
+        self.history: SnapshotHistory = SnapshotHistory(self.HISTORY_SIZE)
+
+    @property
+    def market_snapshot(self) -> MarketSnapshot:
+        """
+        Latest fetched market indicators.
+
+        Returns:
+            MarketSnapshot: The snapshot.
+
+        Raises:
+            AttributeError: If no snapshot was set yet.
+        """
+        return self._market_snapshot
+
+    @market_snapshot.setter
+    def market_snapshot(self, snapshot: MarketSnapshot) -> None:
+        """
+        Set the latest market indicators and append them to the history.
+
+        A snapshot that is already the latest one is not appended again.
+
+        Args:
+            snapshot (MarketSnapshot): The snapshot.
+        """
+        if snapshot is getattr(self, "_market_snapshot", None):
+            return
+        self._market_snapshot = snapshot
+        self.history.append(snapshot)
 
     def block_short(self) -> None:
         """
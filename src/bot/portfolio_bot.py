@@ -0,0 +1,150 @@
+import asyncio
+from typing import List, Optional, Sequence
+from binance import AsyncClient
+from bot.async_rem_bot import AsyncRemBot
+from bot.bot_checkpoint import BotCheckpoint
+from bot.candle_scheduler import CandleScheduler
+from bot.bot_settings import SETTINGS
+from bot.symbol_settings import SymbolSettings
+from binance_adapter.account_stream import AccountStream
+from binance_adapter.async_binance_adapter import AsyncBinanceAdapter
+from binance_adapter.rate_limiter import RateLimiter
+from binance_adapter.request_timings import RequestTimings
+from data.tick_recorder import TickRecorder
+from utils.date_utils import DateUtils
+from utils.logger import Logger
+
+
+class PortfolioBot:
+    """
+    Runs one RemBot state machine per symbol in a single process.
+
+    All symbols share one AsyncClient (and its HTTP connection pool) and one
+    candle scheduler; every tick the per-symbol AsyncRemBot states are stepped
+    concurrently on the same event loop. Each symbol keeps its own data
+    manager, performance tracker, indicator cache and position settings.
+    """
+
+    def __init__(self, symbol_settings: Sequence[SymbolSettings]) -> None:
+        """
+        Initialize the PortfolioBot.
+
+        Args:
+            symbol_settings (Sequence[SymbolSettings]): Settings of every traded symbol.
+
+        Attributes:
+            bots (List[AsyncRemBot]): Per-symbol bots, created by `run`.
+            scheduler (CandleScheduler): Aligns steps to candle closes.
+        """
+        self.symbol_settings: List[SymbolSettings] = list(symbol_settings)
+        self.bots: List[AsyncRemBot] = []
+        self.scheduler: CandleScheduler = CandleScheduler(
+            interval=SETTINGS.INTERVAL, tick_seconds=SETTINGS.SLEEP_DURATION
+        )
+
+    async def _sync_server_time(self, client: AsyncClient) -> None:
+        """
+        Re-synchronize the scheduler with the exchange server clock.
+
+        Failures are logged and the previous offset is kept.
+
+        Args:
+            client (AsyncClient): The shared client.
+        """
+        try:
+            server_time = int((await client.get_server_time())["serverTime"])
+            self.scheduler.offset_ms = server_time - DateUtils.get_timestamp_ms()
+        except Exception as e:
+            Logger.log_exception(f"Server time sync failed: {e}")
+
+    async def _step(self, full_refresh: bool) -> None:
+        """
+        Step every symbol concurrently, then record the snapshots of the
+        symbols that have a tick journal and write the checkpoints of the
+        symbols that committed a new candle.
+
+        Args:
+            full_refresh (bool): Whether klines and indicators are due for a refresh.
+        """
+        await asyncio.gather(
+            *(bot.state.async_step(full_refresh=full_refresh) for bot in self.bots)
+        )
+        for bot in self.bots:
+            if bot.tick_recorder is not None:
+                bot.tick_recorder.record(bot.data_manager.market_snapshot)
+            if bot.checkpoint is not None:
+                bot.checkpoint.save_on_candle_close(bot)
+
+    async def run(self) -> None:
+        """
+        Connect to the exchange and run the portfolio loop until cancelled.
+
+        The shared client is opened once, the leverage of every symbol is
+        configured and each bot applies its initial block; then every tick
+        steps all symbols concurrently, with a full indicator refresh on
+        candle closes. With `ACCOUNT_STREAM` one account stream serves the
+        balances of every symbol, and with `EXCHANGE_FILTERS` the filters of
+        every symbol come from a single exchange filter cache. With
+        `RATE_LIMIT` one limiter paces the requests of every symbol and the
+        price ticks; with `HTTP_TUNING` every symbol shares the tuned
+        connection pool and one RequestTimings. With `TICK_JOURNAL` the
+        snapshot of every step is recorded in the tick journal of its symbol,
+        and with `CHECKPOINT` every symbol starts from (and keeps writing) its
+        own checkpoint.
+        The client session (and stream) and the tick journals are closed when
+        the loop ends.
+        """
+        rate_limiter = RateLimiter() if SETTINGS.RATE_LIMIT else None
+        request_timings = RequestTimings() if SETTINGS.HTTP_TUNING else None
+        client = await AsyncBinanceAdapter.create_client(rate_limiter, request_timings)
+        loop = asyncio.get_running_loop()
+        account_stream: Optional[AccountStream] = None
+        try:
+            if SETTINGS.ACCOUNT_STREAM:
+                account_stream = await AsyncBinanceAdapter.start_account_stream()
+            self.bots = [
+                AsyncRemBot(AsyncBinanceAdapter(client, loop, settings))
+                for settings in self.symbol_settings
+            ]
+            for bot in self.bots:
+                bot.binance_adapter.account_manager.account_stream = account_stream
+                bot.binance_adapter.rate_limiter = rate_limiter
+                bot.binance_adapter.request_timings = request_timings
+            if SETTINGS.TICK_JOURNAL:
+                for bot in self.bots:
+                    bot.tick_recorder = TickRecorder.for_symbol(
+                        bot.symbol_settings.SYMBOL,
+                        SETTINGS.TICK_SEGMENT_MB * 1024 * 1024,
+                    )
+            if SETTINGS.CHECKPOINT:
+                for bot in self.bots:
+                    bot.checkpoint = BotCheckpoint.for_symbol(
+                        bot.symbol_settings.SYMBOL
+                    )
+            if rate_limiter is not None:
+                self.scheduler.pace_fn = rate_limiter.poll_interval
+            if SETTINGS.EXCHANGE_FILTERS:
+                cache = await AsyncBinanceAdapter.load_exchange_filters(client)
+                for bot in self.bots:
+                    bot.binance_adapter.account_manager.use_exchange_filters(cache)
+            Logger.log_start(
+                f"RemBot portfolio is running with {len(self.bots)} symbols..."
+            )
+            await asyncio.gather(
+                *(bot.binance_adapter.configure_leverage() for bot in self.bots)
+            )
+            await self._sync_server_time(client)
+            await asyncio.gather(*(bot.start() for bot in self.bots))
+            while True:
+                delay, is_candle_close = self.scheduler.next_tick()
+                await asyncio.sleep(delay)
+                await self._step(full_refresh=is_candle_close)
+                if is_candle_close:
+                    await self._sync_server_time(client)
+        finally:
+            for bot in self.bots:
+                if bot.tick_recorder is not None:
+                    bot.tick_recorder.close()
+            if account_stream is not None:
+                await asyncio.to_thread(account_stream.stop)
+            await client.close_connection()
@@ -2,10 +2,16 @@ from __future__ import annotations
 
 from bot.performance_tracker import PerformanceTracker
 from bot.data_manager import DataManager
+from bot.candle_scheduler import CandleScheduler
+from bot.bot_checkpoint import BotCheckpoint
+from bot.states.active.active_position_state import ActivePositionState
+from data.tick_recorder import TickRecorder
 from bot.states.flat.flat_position_state import FlatPositionState
 from bot.states.position_state import PositionState
-from bot.bot_settings import SETTINGS
+from bot.bot_settings import SETTINGS, BotSettings
+from bot.symbol_settings import SymbolSettings
 from binance_adapter.binance_adapter import BinanceAdapter
+from typing import Optional, Union
 from utils.logger import Logger
 from time import sleep
 
@@ -20,22 +26,115 @@ class RemBot:
     by a dedicated class.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, binance_adapter: Optional[BinanceAdapter] = None) -> None:
         """
         Initialize the RemBot instance.
 
+        Args:
+            binance_adapter (Optional[BinanceAdapter], optional): Adapter of the
+                traded symbol, e.g. a replay adapter. Defaults to None (a new
+                BinanceAdapter for the `[POSITION]` settings).
+
         Attributes:
             performance_tracker (PerformanceTracker): Tracks wins and losses.
             data_manager (DataManager): Manages market indicators and position snapshots.
             binance_adapter (BinanceAdapter): Interface for Binance API operations.
-            state (PositionState): Current trading state of the bot.
+            symbol_settings (Union[SymbolSettings, BotSettings]): Settings of the traded symbol.
+            checkpoint (Optional[BotCheckpoint]): Crash-safe checkpoint of the
+                bot, with `CHECKPOINT` (live trading only).
+            tick_recorder (Optional[TickRecorder]): Journal of the snapshot of
+                every step, with `TICK_JOURNAL` (live trading only).
+            state (PositionState): Current trading state of the bot, restored
+                from the checkpoint if there is one.
+            scheduler (CandleScheduler): Aligns steps to candle closes, paced
+                by the adapter's rate limiter if it has one.
         """
         self.performance_tracker: PerformanceTracker = PerformanceTracker()
         self.data_manager: DataManager = DataManager()
-        self.binance_adapter: BinanceAdapter = BinanceAdapter()
+        self.binance_adapter: BinanceAdapter = (
+            BinanceAdapter() if binance_adapter is None else binance_adapter
+        )
+        self.symbol_settings: Union[SymbolSettings, BotSettings] = (
+            SETTINGS if binance_adapter is None else binance_adapter.symbol_settings
+        )
+        self.checkpoint: Optional[BotCheckpoint] = (
+            BotCheckpoint.for_symbol(self.symbol_settings.SYMBOL)
+            if SETTINGS.CHECKPOINT and binance_adapter is None
+            else None
+        )
+        self.tick_recorder: Optional[TickRecorder] = (
+            TickRecorder.for_symbol(
+                self.symbol_settings.SYMBOL, SETTINGS.TICK_SEGMENT_MB * 1024 * 1024
+            )
+            if SETTINGS.TICK_JOURNAL and binance_adapter is None
+            else None
+        )
         Logger.log_start("RemBot is running...")
-        self._initial_block()
-        self.state: PositionState = FlatPositionState(parent=self)
+        if self.checkpoint is not None and self.checkpoint.restore(self):
+            Logger.log_info("RemBot state is restored from the checkpoint.")
+            if not SETTINGS.TEST_MODE:
+                self._reconcile()
+        else:
+            self._initial_block()
+            self.state = FlatPositionState(parent=self)
+        self.scheduler: CandleScheduler = CandleScheduler(
+            interval=SETTINGS.INTERVAL,
+            tick_seconds=SETTINGS.SLEEP_DURATION,
+            server_time_fn=self.binance_adapter.get_server_time,
+        )
+        rate_limiter = self.binance_adapter.rate_limiter
+        if rate_limiter is not None:
+            self.scheduler.pace_fn = rate_limiter.poll_interval
+
+    @property
+    def state(self) -> PositionState:
+        """
+        Current trading state of the bot.
+
+        Returns:
+            PositionState: The state.
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state: PositionState) -> None:
+        """
+        Transition to a state, writing the checkpoint if there is one.
+
+        Args:
+            state (PositionState): The new state.
+        """
+        self._state = state
+        if self.checkpoint is not None:
+            self.checkpoint.save(self)
+
+    def _reconcile(self) -> None:
+        """
+        Reconcile a restored state with the exchange.
+
+        Actions:
+            - Keeps a restored position that is still open on the exchange.
+            - Closes one whose exit order filled while the bot was stopped,
+              with that fill's result, cancelling the other exit order.
+            - Otherwise (closed by hand) returns to the flat state.
+            - Warns about an exchange position the flat state does not know.
+        """
+        state = self.state
+        account_manager = self.binance_adapter.account_manager
+        if not isinstance(state, ActivePositionState):
+            for side in ("LONG", "SHORT"):
+                if account_manager.get_position_amount(side) != 0:
+                    Logger.log_info(f"Untracked {side} position is open.")
+            return
+        if account_manager.get_position_amount(state.SIDE) != 0:
+            return
+        fill = account_manager.fetch_exit_fill()
+        if fill is not None:
+            account_manager.cancel_remaining_exit(fill)
+            state.close_from_fill(fill)
+            return
+        Logger.log_info(f"Restored {state.SIDE} position is no longer open.")
+        self.state = FlatPositionState(parent=self)
 
     def _initial_block(self) -> None:
         """
@@ -61,10 +160,36 @@ class RemBot:
         """
         Start the trading loop.
 
-        The loop executes indefinitely, with each iteration:
-            - Sleeping for the configured duration.
-            - Executing the current state's `step` method.
+        The account and market streams, if any, are started first. The loop
+        executes indefinitely, with each iteration:
+            - Sleeping until the next scheduled tick (a candle close or a
+              price-only tick every configured duration), or in stream mode
+              waiting for the next stream event (at most the configured duration).
+            - Executing the current state's `step` method, with a full
+              indicator refresh on candle closes and in stream mode.
+            - Recording the step's market snapshot in the tick journal, if any.
+            - Writing the checkpoint, if any, once a new candle was committed.
+        The tick journal is closed when the loop ends.
         """
-        while True:
-            sleep(SETTINGS.SLEEP_DURATION)
-            self.state.step()
+        account_stream = self.binance_adapter.account_manager.account_stream
+        if account_stream is not None:
+            account_stream.start()
+        market_stream = self.binance_adapter.indicator_manager.market_stream
+        if market_stream is not None:
+            market_stream.start()
+        try:
+            while True:
+                if market_stream is not None:
+                    market_stream.wait_for_update(SETTINGS.SLEEP_DURATION)
+                    self.state.step()
+                else:
+                    delay, is_candle_close = self.scheduler.next_tick()
+                    sleep(delay)
+                    self.state.step(full_refresh=is_candle_close)
+                if self.tick_recorder is not None:
+                    self.tick_recorder.record(self.data_manager.market_snapshot)
+                if self.checkpoint is not None:
+                    self.checkpoint.save_on_candle_close(self)
+        finally:
+            if self.tick_recorder is not None:
+                self.tick_recorder.close()
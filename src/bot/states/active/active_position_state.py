@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import Callable, Sequence, Literal, Any
+from typing import Callable, Optional, Sequence, Literal, Any
 from bot.states.position_state import PositionState
 from utils.logger import Logger
 from utils.file_utils import FileUtils
-from bot.bot_settings import SETTINGS
 from data.market_snapshot import MarketSnapshot
+from data.data_requirement import DataRequirement
 from bot.performance_tracker import PerformanceTracker
+from binance_adapter.account_manager import ExitFill
 
 
 class ActivePositionState(PositionState):
@@ -15,9 +16,17 @@ class ActivePositionState(PositionState):
     Base class for states that manage an active trading position.
 
     Subclasses (e.g., LongPositionState, ShortPositionState) must implement
-    the price-condition checks for take-profit and stop-loss.
+    the price-condition checks for take-profit and stop-loss. Since only the
+    price is compared against the TP/SL levels, active states refresh the
+    mark price alone (the price the TP/SL orders trigger on) and skip the
+    kline and indicator pipeline. When the exchange reports the TP/SL fills
+    over the account stream, the position is closed from the fill instead
+    and no price is polled at all.
     """
 
+    DATA_REQUIREMENT: DataRequirement = DataRequirement.MARK_PRICE
+    SIDE: Literal["LONG", "SHORT"]
+
     def __init__(self, parent: Any, target_prices: Sequence[float]) -> None:
         """
         Initialize the open position state.
@@ -30,13 +39,72 @@ class ActivePositionState(PositionState):
         super().__init__(parent)
         self.tp_price: float = float(target_prices[0])
         self.sl_price: float = float(target_prices[1])
+        self.fill_price: Optional[float] = None
+
+    def data_requirement(self) -> DataRequirement:
+        """
+        Skip the price refresh while exits are reported as order fills.
+
+        Returns:
+            DataRequirement: `DataRequirement.NONE` if the exit orders are
+                tracked on the account stream; `DATA_REQUIREMENT` otherwise.
+        """
+        if self.parent.binance_adapter.exits_tracked():
+            return DataRequirement.NONE
+        return self.DATA_REQUIREMENT
+
+    def _apply_exit(self, position: Literal["LONG", "SHORT"]) -> None:
+        """
+        Close the position from an exit order fill, or from the price.
+
+        A reported fill wins (its opposite exit order is cancelled by the
+        adapter); otherwise the price conditions of the subclass decide.
+
+        Args:
+            position (Literal["LONG", "SHORT"]): The side of the active position.
+        """
+        fill = self.parent.binance_adapter.resolve_exit_fill()
+        if fill is not None:
+            self._close_from_fill(position, fill)
+            return
+        price: float = self.parent.data_manager.market_snapshot.price
+        if self._is_tp_price():
+            self._close_position(position, self._handle_tp, price)
+        elif self._is_sl_price():
+            self._close_position(position, self._handle_sl, price)
+
+    def close_from_fill(self, fill: ExitFill) -> None:
+        """
+        Close the position from an exit order fill found outside `apply`,
+        e.g. while reconciling a restored position with the exchange.
+
+        Args:
+            fill (ExitFill): Fill of the exit order that closed the position.
+        """
+        self._close_from_fill(self.SIDE, fill)
+
+    def _close_from_fill(
+        self, position: Literal["LONG", "SHORT"], fill: ExitFill
+    ) -> None:
+        """
+        Close the position with the result of the exit order that filled.
+
+        Args:
+            position (Literal["LONG", "SHORT"]): The side of the active position.
+            fill (ExitFill): Fill of the exit order that closed the position.
+        """
+        handler = self._handle_tp if fill.is_tp else self._handle_sl
+        self.fill_price = fill.price
+        self._close_position(position, handler, fill.price)
 
     def _close_position(
         self,
         position: Literal["LONG", "SHORT"],
         result_function: Callable[
-            [Literal["LONG", "SHORT"], MarketSnapshot, PerformanceTracker], None
+            [Literal["LONG", "SHORT"], MarketSnapshot, PerformanceTracker, float],
+            None,
         ],
+        exit_price: float,
     ) -> None:
         """
         Close the current position and transition back to FlatPositionState.
@@ -45,6 +113,7 @@ class ActivePositionState(PositionState):
             position (Literal["LONG", "SHORT"]): The side of the active position.
             result_function (Callable): Callback to handle result persistence
                 and performance tracking (e.g., TP/SL handlers).
+            exit_price (float): Price the position was closed at.
 
         Actions performed:
             - Invokes the given result handler (TP or SL).
@@ -54,7 +123,7 @@ class ActivePositionState(PositionState):
         snapshot: MarketSnapshot = self.parent.data_manager.position_snapshot
         pf_tracker: PerformanceTracker = self.parent.performance_tracker
 
-        result_function(position, snapshot, pf_tracker)
+        result_function(position, snapshot, pf_tracker, exit_price)
 
         Logger.log_info(
             "TP: "
@@ -74,6 +143,7 @@ class ActivePositionState(PositionState):
         position: Literal["LONG", "SHORT"],
         snapshot: MarketSnapshot,
         performance_tracker: PerformanceTracker,
+        exit_price: float,
     ) -> None:
         """
         Handle a position closed by take-profit.
@@ -82,26 +152,31 @@ class ActivePositionState(PositionState):
             position (Literal["LONG", "SHORT"]): The side of the closed position.
             snapshot (MarketSnapshot): Snapshot at the time of entry.
             performance_tracker (PerformanceTracker): Tracker for wins/losses.
+            exit_price (float): Price the position was closed at.
 
         Actions performed:
             - Increments win count.
-            - Persists the TP result to CSV.
+            - Persists the TP result to CSV (and the trade journal, if any).
             - Logs the outcome.
         """
         Logger.log_success("Position is closed with TP")
         performance_tracker.increase_win()
+        result = self._get_position_result(position=position, is_tp=True)
         FileUtils.save_result(
-            file_path=SETTINGS.OUTPUT_CSV_PATH,
-            result=self._get_position_result(position=position, is_tp=True),
+            file_path=self.parent.symbol_settings.OUTPUT_CSV_PATH,
+            result=result,
             position=position,
             snapshot=snapshot,
+            exit_price=exit_price,
         )
+        self._record_trade(position, result, snapshot, exit_price)
 
     def _handle_sl(
         self,
         position: Literal["LONG", "SHORT"],
         snapshot: MarketSnapshot,
         performance_tracker: PerformanceTracker,
+        exit_price: float,
     ) -> None:
         """
         Handle a position closed by stop-loss.
@@ -110,19 +185,50 @@ class ActivePositionState(PositionState):
             position (Literal["LONG", "SHORT"]): The side of the closed position.
             snapshot (MarketSnapshot): Snapshot at the time of entry.
             performance_tracker (PerformanceTracker): Tracker for wins/losses.
+            exit_price (float): Price the position was closed at.
 
         Actions performed:
             - Increments loss count.
-            - Persists the SL result to CSV.
+            - Persists the SL result to CSV (and the trade journal, if any).
             - Logs the outcome.
         """
         Logger.log_failure("Position is closed with SL")
         performance_tracker.increase_loss()
+        result = self._get_position_result(position=position, is_tp=False)
         FileUtils.save_result(
-            file_path=SETTINGS.OUTPUT_CSV_PATH,
-            result=self._get_position_result(position=position, is_tp=False),
+            file_path=self.parent.symbol_settings.OUTPUT_CSV_PATH,
+            result=result,
+            position=position,
+            snapshot=snapshot,
+            exit_price=exit_price,
+        )
+        self._record_trade(position, result, snapshot, exit_price)
+
+    def _record_trade(
+        self,
+        position: Literal["LONG", "SHORT"],
+        result: str,
+        snapshot: MarketSnapshot,
+        exit_price: float,
+    ) -> None:
+        """
+        Record the closed position in the trade journal, if one is in use.
+
+        Args:
+            position (Literal["LONG", "SHORT"]): The side of the closed position.
+            result (str): The result label of the position.
+            snapshot (MarketSnapshot): Snapshot at the time of entry.
+            exit_price (float): Price the position was closed at.
+        """
+        FileUtils.record_trade(
+            symbol=self.parent.symbol_settings.SYMBOL,
+            result=result,
             position=position,
             snapshot=snapshot,
+            exit_price=exit_price,
+            tp_price=self.tp_price,
+            sl_price=self.sl_price,
+            fill_price=self.fill_price,
         )
 
     def _get_position_result(
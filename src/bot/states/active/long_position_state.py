@@ -1,4 +1,5 @@
 from __future__ import annotations
+from typing import Literal
 from bot.states.active.active_position_state import ActivePositionState
 
 
@@ -11,19 +12,18 @@ class LongPositionState(ActivePositionState):
     is satisfied, it closes the position and updates the bot's state accordingly.
     """
 
+    SIDE: Literal["LONG", "SHORT"] = "LONG"
+
     def apply(self) -> None:
         """
         Apply the logic for managing an active LONG position.
 
         Responsibilities:
+            - If an exit order filled, the position is closed at its fill price.
             - If TP price is reached, the position is closed with profit.
             - If SL price is reached, the position is closed with loss.
         """
-        if self._is_tp_price():
-            self._close_position("LONG", self._handle_tp)
-
-        elif self._is_sl_price():
-            self._close_position("LONG", self._handle_sl)
+        self._apply_exit("LONG")
 
     def _is_tp_price(self) -> bool:
         """
@@ -1,8 +1,10 @@
 from __future__ import annotations
+import asyncio
 from abc import ABC, abstractmethod
 from typing import final, Any
 from utils.logger import Logger
 from bot.bot_settings import SETTINGS
+from data.data_requirement import DataRequirement
 
 
 class PositionState(ABC):
@@ -11,9 +13,14 @@ class PositionState(ABC):
 
     This class defines the interface and core workflow for handling position states.
     Each concrete state (e.g., Long, Short, Flat) must implement the `apply` method
-    to define specific trading logic.
+    to define specific trading logic, and declares through `DATA_REQUIREMENT`
+    which market data must be refreshed before each step (`data_requirement`
+    may narrow it at runtime). States are driven
+    either by the blocking `step` or, on an asyncio runtime, by `async_step`.
     """
 
+    DATA_REQUIREMENT: DataRequirement = DataRequirement.INDICATORS
+
     def __init__(self, parent: Any) -> None:
         """
         Initialize a PositionState.
@@ -25,16 +32,20 @@ class PositionState(ABC):
         self.parent: Any = parent
 
     @final
-    def step(self) -> None:
+    def step(self, full_refresh: bool = True) -> None:
         """
         Execute one step of the position state.
 
         This method refreshes market indicators and applies the logic
         of the current position state. It also includes exception handling
         to prevent interruptions in the trading loop.
+
+        Args:
+            full_refresh (bool, optional): Whether to refresh klines and indicators
+                (candle close) or only the price (intermediate tick). Defaults to True.
         """
         try:
-            self._refresh_indicators()
+            self._refresh_market_data(full_refresh)
             if SETTINGS.DEBUG_MODE:
                 Logger.log_info(
                     "debug: " + str(self.parent.data_manager.market_snapshot)
@@ -43,6 +54,85 @@ class PositionState(ABC):
         except Exception as e:
             Logger.log_exception(str(e))
 
+    @final
+    async def async_step(self, full_refresh: bool = True) -> None:
+        """
+        Execute one step of the position state on an asyncio runtime.
+
+        Market data is refreshed through the awaitable indicator manager
+        methods, then `apply` runs in a worker thread so that its blocking
+        calls (order placement, result files) never stall the event loop.
+
+        Args:
+            full_refresh (bool, optional): Whether to refresh klines and indicators
+                (candle close) or only the price (intermediate tick). Defaults to True.
+        """
+        try:
+            await self._async_refresh_market_data(full_refresh)
+            if SETTINGS.DEBUG_MODE:
+                Logger.log_info(
+                    "debug: " + str(self.parent.data_manager.market_snapshot)
+                )
+            await asyncio.to_thread(self.apply)
+        except Exception as e:
+            Logger.log_exception(str(e))
+
+    def data_requirement(self) -> DataRequirement:
+        """
+        Market data to refresh before the next step.
+
+        Returns:
+            DataRequirement: `DATA_REQUIREMENT`, unless a state narrows it
+                at runtime.
+        """
+        return self.DATA_REQUIREMENT
+
+    def _refresh_market_data(self, full_refresh: bool) -> None:
+        """
+        Refresh the market data declared by `data_requirement`.
+
+        Args:
+            full_refresh (bool): Whether klines and indicators are due for a refresh.
+                Ignored by states that only need a price.
+        """
+        requirement = self.data_requirement()
+        if requirement is DataRequirement.NONE:
+            return
+        if requirement is DataRequirement.INDICATORS:
+            if full_refresh:
+                self._refresh_indicators()
+            else:
+                self._refresh_price()
+        else:
+            self._refresh_price_only(
+                mark_price=requirement is DataRequirement.MARK_PRICE
+            )
+
+    async def _async_refresh_market_data(self, full_refresh: bool) -> None:
+        """
+        Refresh the market data declared by `data_requirement` asynchronously.
+
+        Args:
+            full_refresh (bool): Whether klines and indicators are due for a refresh.
+                Ignored by states that only need a price.
+        """
+        requirement = self.data_requirement()
+        if requirement is DataRequirement.NONE:
+            return
+        data_manager = self.parent.data_manager
+        indicator_manager = self.parent.binance_adapter.indicator_manager
+        if requirement is DataRequirement.INDICATORS:
+            if full_refresh:
+                snapshot = await indicator_manager.async_fetch_indicators()
+            else:
+                snapshot = await indicator_manager.async_fetch_price_snapshot()
+        else:
+            snapshot = await indicator_manager.async_fetch_price_only_snapshot(
+                data_manager.market_snapshot,
+                mark_price=requirement is DataRequirement.MARK_PRICE,
+            )
+        data_manager.market_snapshot = snapshot
+
     @abstractmethod
     def apply(self) -> None:
         """
@@ -63,3 +153,29 @@ class PositionState(ABC):
         self.parent.data_manager.market_snapshot = (
             self.parent.binance_adapter.indicator_manager.fetch_indicators()
         )
+
+    def _refresh_price(self) -> None:
+        """
+        Refresh the latest price without downloading klines.
+
+        Updates the parent's DataManager with a snapshot whose indicators are
+        provisionally updated with the fresh price.
+        """
+        self.parent.data_manager.market_snapshot = (
+            self.parent.binance_adapter.indicator_manager.fetch_price_snapshot()
+        )
+
+    def _refresh_price_only(self, mark_price: bool = False) -> None:
+        """
+        Refresh only the (mark) price, skipping the kline and indicator pipeline.
+
+        Args:
+            mark_price (bool, optional): Refresh the mark price instead of the
+                last traded price. Defaults to False.
+        """
+        data_manager = self.parent.data_manager
+        data_manager.market_snapshot = (
+            self.parent.binance_adapter.indicator_manager.fetch_price_only_snapshot(
+                data_manager.market_snapshot, mark_price=mark_price
+            )
+        )
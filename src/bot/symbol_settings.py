@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Union
+
+
+@dataclass(frozen=True)
+class SymbolSettings:
+    """
+    Position settings of a single traded symbol.
+
+    The field names mirror the `[POSITION]` keys of BotSettings, so either
+    object can be handed to the exchange managers and position states.
+    """
+
+    SYMBOL: str
+    COIN_PRECISION: int
+    TP_RATIO: float
+    SL_RATIO: float
+    LEVERAGE: int
+    OUTPUT_CSV_PATH: Union[str, Path]
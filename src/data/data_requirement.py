@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class DataRequirement(Enum):
+    """
+    Market data a position state needs to be refreshed before each step.
+
+    Members:
+        INDICATORS: Price plus klines and all indicators.
+        PRICE: Latest traded price only.
+        MARK_PRICE: Latest mark price only (the price TP/SL orders trigger on).
+        NONE: Nothing, the exchange reports the exits as order fills.
+    """
+
+    INDICATORS = "INDICATORS"
+    PRICE = "PRICE"
+    MARK_PRICE = "MARK_PRICE"
+    NONE = "NONE"
@@ -1,5 +1,5 @@
-from typing import Tuple, Sequence, List, Optional
-import copy
+from typing import Any, Dict, Tuple, Sequence, List, Optional
+import numpy as np
 
 
 class MarketSnapshot:
@@ -8,8 +8,26 @@ class MarketSnapshot:
 
     This structure captures the timestamp, current price, and commonly-used
     indicators (MACD, EMA, RSI), along with a list of recent OHLC bars.
+
+    A snapshot is built on every step, so its fields are declared in
+    `__slots__`: instances carry no per-instance `__dict__`. `DTYPE` is the
+    layout of a snapshot stored as a NumPy record (`as_record`): the int64
+    timestamp in milliseconds and the five float64 values.
     """
 
+    __slots__ = ("date", "price", "macd_12", "macd_26", "ema_100", "rsi_6")
+
+    DTYPE: np.dtype = np.dtype(
+        [
+            ("timestamp_ms", "<i8"),
+            ("price", "<f8"),
+            ("macd_12", "<f8"),
+            ("macd_26", "<f8"),
+            ("ema_100", "<f8"),
+            ("rsi_6", "<f8"),
+        ]
+    )
+
     def __init__(
         self,
         date: str,
@@ -68,3 +86,76 @@ class MarketSnapshot:
             ema_100=self.ema_100,
             rsi_6=self.rsi_6,
         )
+
+    def with_price(self, date: str, price: float) -> "MarketSnapshot":
+        """
+        Create a copy of the snapshot with a new date and price.
+
+        Indicator values are carried over unchanged; this is used by states
+        that only need a fresh price.
+
+        Args:
+            date (str): Snapshot timestamp as a formatted string.
+            price (float): Latest market price.
+
+        Returns:
+            MarketSnapshot: A new snapshot instance with the given date and price.
+        """
+        return MarketSnapshot(
+            date=date,
+            price=price,
+            macd_12=self.macd_12,
+            macd_26=self.macd_26,
+            ema_100=self.ema_100,
+            rsi_6=self.rsi_6,
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Export the snapshot as a JSON-serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: The constructor arguments by name.
+        """
+        return {
+            "date": self.date,
+            "price": self.price,
+            "macd_12": self.macd_12,
+            "macd_26": self.macd_26,
+            "ema_100": self.ema_100,
+            "rsi_6": self.rsi_6,
+        }
+
+    def as_record(
+        self, timestamp_ms: int
+    ) -> Tuple[int, float, float, float, float, float]:
+        """
+        Export the snapshot as the values of a `DTYPE` record.
+
+        Args:
+            timestamp_ms (int): Time of the snapshot in milliseconds.
+
+        Returns:
+            Tuple[int, float, float, float, float, float]: The record values.
+        """
+        return (
+            timestamp_ms,
+            self.price,
+            self.macd_12,
+            self.macd_26,
+            self.ema_100,
+            self.rsi_6,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MarketSnapshot":
+        """
+        Rebuild a snapshot exported by `as_dict`.
+
+        Args:
+            data (Dict[str, Any]): The exported snapshot.
+
+        Returns:
+            MarketSnapshot: A new snapshot instance with the same values.
+        """
+        return cls(**data)
@@ -0,0 +1,87 @@
+from typing import Optional
+import numpy as np
+from data.market_snapshot import MarketSnapshot
+from utils.date_utils import DateUtils
+
+
+class SnapshotHistory:
+    """
+    Fixed-capacity ring buffer of the most recent market snapshots.
+
+    Snapshots are stored as rows of a NumPy structured array of
+    `MarketSnapshot.DTYPE`, the tick journal's record layout. Every row is
+    written twice, `capacity` rows apart, so the latest rows are always
+    contiguous: appending is O(1) and a window of them is a single slice of
+    the buffer, oldest row first, that never needs re-ordering.
+    """
+
+    DTYPE: np.dtype = MarketSnapshot.DTYPE
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the SnapshotHistory.
+
+        Args:
+            capacity (int): Number of snapshots kept.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(f"Invalid history capacity: {capacity}")
+        self.capacity: int = capacity
+        self._buffer: np.ndarray = np.zeros(2 * capacity, dtype=self.DTYPE)
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        """
+        Number of snapshots held.
+
+        Returns:
+            int: At most `capacity`.
+        """
+        return min(self._count, self.capacity)
+
+    def append(
+        self, snapshot: MarketSnapshot, timestamp_ms: Optional[int] = None
+    ) -> None:
+        """
+        Add a snapshot, replacing the oldest one when the buffer is full.
+
+        Args:
+            snapshot (MarketSnapshot): The snapshot.
+            timestamp_ms (Optional[int], optional): Its time in milliseconds.
+                Defaults to None (now).
+        """
+        row = snapshot.as_record(
+            DateUtils.get_timestamp_ms() if timestamp_ms is None else timestamp_ms
+        )
+        index = self._count % self.capacity
+        self._buffer[index] = row
+        self._buffer[index + self.capacity] = row
+        self._count += 1
+
+    def window(self, size: Optional[int] = None, copy: bool = True) -> np.ndarray:
+        """
+        The most recent snapshots, oldest first.
+
+        With `copy=False` the window is a view of the buffer instead of a
+        copy. Once the buffer is full, the next `append` overwrites the
+        oldest row of such a view, so a view must only be used before the
+        next snapshot is appended.
+
+        Args:
+            size (Optional[int], optional): Number of snapshots. Defaults to
+                None (all the snapshots held).
+            copy (bool, optional): Return a copy rather than a view of the
+                buffer. Defaults to True.
+
+        Returns:
+            np.ndarray: Structured array of at most `size` rows.
+        """
+        length = len(self) if size is None else min(max(size, 0), len(self))
+        end = self._count % self.capacity + (
+            self.capacity if self._count >= self.capacity else 0
+        )
+        window = self._buffer[end - length : end]
+        return window.copy() if copy else window
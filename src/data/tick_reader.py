@@ -0,0 +1,101 @@
+import datetime
+from pathlib import Path
+from typing import List, Optional, Union
+import numpy as np
+from data.tick_recorder import TickRecorder
+
+
+class TickReader:
+    """
+    Memory-mapped reader of the segments written by a TickRecorder.
+
+    Every segment is mapped read-only as a NumPy structured array of
+    `TickRecorder.DTYPE`, so the records are neither parsed nor copied: the
+    pages are read from the OS cache on first access. A record cut short
+    at the end of a segment (a crash while writing) is left out.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """
+        Initialize the TickReader.
+
+        Args:
+            directory (Union[str, Path]): Directory of the segment files.
+        """
+        self.directory: Path = Path(directory)
+
+    def segments(self) -> List[Path]:
+        """
+        List the segment files in recording order.
+
+        Returns:
+            List[Path]: The segments, sorted by day and index.
+        """
+        return sorted(self.directory.glob(f"*{TickRecorder.SUFFIX}"))
+
+    @staticmethod
+    def map_segment(path: Union[str, Path]) -> np.ndarray:
+        """
+        Map a segment file into memory.
+
+        Args:
+            path (Union[str, Path]): The segment.
+
+        Returns:
+            np.ndarray: Read-only structured array of its complete records.
+        """
+        count = Path(path).stat().st_size // TickRecorder.DTYPE.itemsize
+        if count == 0:
+            return np.empty(0, dtype=TickRecorder.DTYPE)
+        return np.memmap(path, dtype=TickRecorder.DTYPE, mode="r", shape=(count,))
+
+    @staticmethod
+    def _day_of(path: Path) -> int:
+        """
+        UTC day a segment was recorded on, from its name.
+
+        Args:
+            path (Path): The segment.
+
+        Returns:
+            int: Days since the Unix epoch.
+        """
+        day = datetime.datetime.strptime(path.name[:8], "%Y%m%d").replace(
+            tzinfo=datetime.timezone.utc
+        )
+        return int(day.timestamp() * 1000) // TickRecorder.DAY_MS
+
+    def read(
+        self, start_ms: Optional[int] = None, end_ms: Optional[int] = None
+    ) -> List[np.ndarray]:
+        """
+        Map the records of a time range, one array per segment.
+
+        Segments of other days are not opened, and the arrays are views of
+        the mapped files limited to the range.
+
+        Args:
+            start_ms (Optional[int], optional): First timestamp included.
+                Defaults to None (from the first record).
+            end_ms (Optional[int], optional): Timestamp the range stops before.
+                Defaults to None (to the last record).
+
+        Returns:
+            List[np.ndarray]: Non-empty structured arrays, in recording order.
+        """
+        arrays: List[np.ndarray] = []
+        for path in self.segments():
+            day = self._day_of(path)
+            if start_ms is not None and day < start_ms // TickRecorder.DAY_MS:
+                continue
+            if end_ms is not None and day > (end_ms - 1) // TickRecorder.DAY_MS:
+                continue
+            records = self.map_segment(path)
+            timestamps = records["timestamp_ms"]
+            first = 0 if start_ms is None else np.searchsorted(timestamps, start_ms)
+            last = (
+                len(records) if end_ms is None else np.searchsorted(timestamps, end_ms)
+            )
+            if first < last:
+                arrays.append(records[first:last])
+        return arrays
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import datetime
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, List, Optional, Tuple, Union
+import numpy as np
+from base_dir import BASE_DIR
+from data.market_snapshot import MarketSnapshot
+from utils.background_writer import BackgroundWriter
+from utils.date_utils import DateUtils
+
+
+class TickRecorder(BackgroundWriter):
+    """
+    Binary journal of the market snapshots of every step.
+
+    Each snapshot is appended as a fixed-width little-endian record (`RECORD`:
+    the int64 timestamp in milliseconds and the five float64 snapshot values,
+    48 bytes), so a segment file is a plain array of `MarketSnapshot.DTYPE`
+    that TickReader maps into memory without parsing. Segments are named
+    `<YYYYMMDD>-<index>.ticks` after the UTC day of their records; a new one
+    is started on each day and when a segment would exceed
+    `max_segment_bytes`. Records are written by the background thread.
+    """
+
+    RECORD: struct.Struct = struct.Struct("<q5d")
+    DTYPE: np.dtype = MarketSnapshot.DTYPE
+    SUFFIX: str = ".ticks"
+    DAY_MS: int = 86_400_000
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_segment_bytes: int = 64 * 1024 * 1024,
+        max_queue: int = 10_000,
+    ) -> None:
+        """
+        Initialize the TickRecorder and start its thread.
+
+        Args:
+            directory (Union[str, Path]): Directory of the segment files.
+            max_segment_bytes (int, optional): Size a segment is rotated at.
+                Defaults to 64 MiB.
+            max_queue (int, optional): Records queued before `record` blocks.
+                Defaults to 10000.
+        """
+        self.directory: Path = Path(directory)
+        self.max_segment_bytes: int = max(
+            self.RECORD.size, max_segment_bytes - max_segment_bytes % self.RECORD.size
+        )
+        super().__init__(f"tick-recorder-{self.directory.name}", max_queue)
+        self._file: Optional[BinaryIO] = None
+        self._day: Optional[int] = None
+        self._size: int = 0
+        self._last: Optional[MarketSnapshot] = None
+        self._start()
+
+    @classmethod
+    def for_symbol(cls, symbol: str, max_segment_bytes: int) -> TickRecorder:
+        """
+        Build the recorder of a symbol, in `ticks/<symbol>` next to the settings.
+
+        Args:
+            symbol (str): Trading symbol (e.g., "ETHUSDT").
+            max_segment_bytes (int): Size a segment is rotated at.
+
+        Returns:
+            TickRecorder: The recorder.
+        """
+        return cls(BASE_DIR / "ticks" / symbol, max_segment_bytes)
+
+    @classmethod
+    def day_name(cls, day: int) -> str:
+        """
+        Name prefix of the segments of a UTC day.
+
+        Args:
+            day (int): Days since the Unix epoch.
+
+        Returns:
+            str: The day as YYYYMMDD.
+        """
+        return datetime.datetime.fromtimestamp(
+            day * cls.DAY_MS / 1000, datetime.timezone.utc
+        ).strftime("%Y%m%d")
+
+    def record(
+        self, snapshot: MarketSnapshot, timestamp_ms: Optional[int] = None
+    ) -> None:
+        """
+        Queue a snapshot for recording, unless it was the last one recorded.
+
+        Args:
+            snapshot (MarketSnapshot): The snapshot.
+            timestamp_ms (Optional[int], optional): Its time in milliseconds.
+                Defaults to None (now).
+        """
+        if snapshot is self._last:
+            return
+        self._last = snapshot
+        self.write(
+            snapshot.as_record(
+                DateUtils.get_timestamp_ms() if timestamp_ms is None else timestamp_ms
+            )
+        )
+
+    def _open_segment(self, day: int) -> BinaryIO:
+        """
+        Open the segment records of a day are appended to.
+
+        The latest segment of the day is reused while it has room; a record
+        cut short by a crash at its end is dropped first.
+
+        Args:
+            day (int): Days since the Unix epoch.
+
+        Returns:
+            BinaryIO: The segment, open for appending.
+        """
+        if self._file is not None:
+            self._file.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        prefix = self.day_name(day)
+        existing: List[Path] = sorted(self.directory.glob(f"{prefix}-*{self.SUFFIX}"))
+        path = self.directory / f"{prefix}-{len(existing):04d}{self.SUFFIX}"
+        if existing:
+            size = existing[-1].stat().st_size
+            if size - size % self.RECORD.size < self.max_segment_bytes:
+                path = existing[-1]
+        segment = path.open("ab")
+        end = segment.tell()
+        self._size = end - end % self.RECORD.size
+        if self._size != end:
+            segment.truncate(self._size)
+        self._file = segment
+        self._day = day
+        return segment
+
+    def _write_batch(self, records: List[Any]) -> None:
+        """
+        Append records, rotating segments by day and size, and flush them.
+
+        Args:
+            records (List[Any]): Timestamp and snapshot value tuples.
+        """
+        segment = self._file
+        values: Tuple[Any, ...]
+        for values in records:
+            day = values[0] // self.DAY_MS
+            if (
+                segment is None
+                or day != self._day
+                or self._size + self.RECORD.size > self.max_segment_bytes
+            ):
+                segment = self._open_segment(day)
+            segment.write(self.RECORD.pack(*values))
+            self._size += self.RECORD.size
+        if segment is not None:
+            segment.flush()
+
+    def _close_target(self) -> None:
+        """
+        Close the current segment.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
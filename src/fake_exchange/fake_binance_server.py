@@ -0,0 +1,902 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Union
+from urllib.parse import unquote
+import numpy as np
+from aiohttp import WSMsgType, web
+from backtest.kline_loader import KlineLoader
+from binance_adapter.kline_cache import Kline
+from binance_adapter.kline_parser import OHLCV
+from utils.date_utils import DateUtils
+
+Handler = Callable[[web.Request, Dict[str, str]], Awaitable[Any]]
+
+
+class FakeBinanceServer:
+    """
+    Local stand-in for the Binance Futures endpoints used by the bot.
+
+    A single aiohttp server, run on its own event loop in a daemon thread,
+    answers the REST endpoints (klines, ticker and mark price, balance,
+    positions, single, batch and cancelled orders, leverage, exchangeInfo and
+    listen keys) and the kline/mark price and user data WebSocket streams.
+    Prices come from synthetic or recorded klines: `advance` closes the
+    current bar and `set_price` moves the forming one, and both push stream
+    events and trigger resting TP/SL orders, which are reported as order
+    fills on the user data stream.
+
+    Every REST response carries the `X-MBX-USED-WEIGHT-1M` header. Requests
+    beyond the weight limit are answered with HTTP 429, and latency, random
+    failures and scripted failures (`fail_next`) can be injected.
+    """
+
+    WEIGHT_LIMIT: int = 2400
+    WEIGHTS: Dict[str, int] = {
+        "klines": 5,
+        "balance": 5,
+        "positionRisk": 5,
+        "exchangeInfo": 1,
+        "batchOrders": 5,
+    }
+    TICK_SIZE: str = "0.01"
+    STEP_SIZE: str = "0.001"
+
+    def __init__(
+        self,
+        ohlcv: OHLCV,
+        symbol: str = "ETHUSDT",
+        interval: str = "15m",
+        start_index: Optional[int] = None,
+        balance: float = 10_000.0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        weight_limit: int = WEIGHT_LIMIT,
+        seed: Optional[int] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Initialize the FakeBinanceServer. Call `start` to serve.
+
+        Args:
+            ohlcv (OHLCV): Klines served for the symbol, ordered by open time.
+            symbol (str, optional): Served symbol. Defaults to "ETHUSDT".
+            interval (str, optional): Kline interval of `ohlcv`. Defaults to "15m".
+            start_index (Optional[int], optional): Index of the initially
+                forming bar. Defaults to None (the middle of the series).
+            balance (float, optional): Initial USDT wallet balance. Defaults to 10,000.
+            latency (float, optional): Seconds added to every REST response and
+                stream event. Defaults to 0.0.
+            jitter (float, optional): Maximum random extra latency in seconds.
+                Defaults to 0.0.
+            error_rate (float, optional): Probability of answering a REST
+                request with an internal error. Defaults to 0.0.
+            weight_limit (int, optional): Request weight allowed per minute.
+                Defaults to 2400.
+            seed (Optional[int], optional): Seed of the latency and error
+                draws. Defaults to None.
+            host (str, optional): Interface to bind. Defaults to "127.0.0.1".
+            port (int, optional): Port to bind. Defaults to 0 (any free port).
+
+        Attributes:
+            cursor (int): Index of the forming bar.
+            price (float): Current (last and mark) price.
+            balance (float): USDT wallet balance.
+            positions (Dict[str, List[float]]): Amount and entry price per
+                position side.
+            orders (Dict[int, Dict[str, Any]]): Every order placed, by id.
+            leverage (int): Leverage last set for the symbol.
+            requests (List[str]): Method and path of every REST request.
+        """
+        self.symbol: str = symbol
+        self.interval: str = interval
+        self.interval_ms: int = DateUtils.interval_to_milliseconds(interval)
+        self.open_time: List[int] = [int(t) for t in ohlcv.open_time]
+        self.open: List[float] = [float(v) for v in ohlcv.open]
+        self.high: List[float] = [float(v) for v in ohlcv.high]
+        self.low: List[float] = [float(v) for v in ohlcv.low]
+        self.close: List[float] = [float(v) for v in ohlcv.close]
+        self.volume: List[float] = [float(v) for v in ohlcv.volume]
+        self.cursor: int = len(self.close) // 2 if start_index is None else start_index
+        self.price: float = self.open[self.cursor]
+        self._forming_high: float = self.price
+        self._forming_low: float = self.price
+        self.balance: float = balance
+        self.positions: Dict[str, List[float]] = {
+            "LONG": [0.0, 0.0],
+            "SHORT": [0.0, 0.0],
+        }
+        self.orders: Dict[int, Dict[str, Any]] = {}
+        self.leverage: int = 1
+        self.requests: List[str] = []
+        self.latency: float = latency
+        self.jitter: float = jitter
+        self.error_rate: float = error_rate
+        self.weight_limit: int = weight_limit
+        self.host: str = host
+        self.port: int = port
+        self._random: random.Random = random.Random(seed)
+        self._failures: Deque[Dict[str, Any]] = deque()
+        self._weights: Deque[List[float]] = deque()
+        self._listen_keys: Set[str] = set()
+        self._market_sockets: Set[web.WebSocketResponse] = set()
+        self._user_sockets: Set[web.WebSocketResponse] = set()
+        self._bar_started: float = time.monotonic()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready: threading.Event = threading.Event()
+        self._routes: Dict[str, Handler] = {
+            "GET /api/v3/ping": self._empty,
+            "GET /api/v3/time": self._time,
+            "GET /api/v3/klines": self._klines,
+            "GET /api/v3/ticker/price": self._ticker_price,
+            "GET /fapi/v1/ping": self._empty,
+            "GET /fapi/v1/time": self._time,
+            "GET /fapi/v1/klines": self._klines,
+            "GET /fapi/v1/ticker/price": self._ticker_price,
+            "GET /fapi/v1/premiumIndex": self._premium_index,
+            "GET /fapi/v1/exchangeInfo": self._exchange_info,
+            "GET /fapi/v2/balance": self._balance,
+            "GET /fapi/v3/balance": self._balance,
+            "GET /fapi/v2/positionRisk": self._position_risk,
+            "GET /fapi/v3/positionRisk": self._position_risk,
+            "POST /fapi/v1/leverage": self._change_leverage,
+            "POST /fapi/v1/order": self._create_order,
+            "DELETE /fapi/v1/order": self._cancel_order,
+            "POST /fapi/v1/batchOrders": self._batch_orders,
+            "DELETE /fapi/v1/batchOrders": self._cancel_orders,
+            "POST /fapi/v1/listenKey": self._new_listen_key,
+            "PUT /fapi/v1/listenKey": self._keepalive_listen_key,
+            "DELETE /fapi/v1/listenKey": self._close_listen_key,
+        }
+
+    @classmethod
+    def synthetic(
+        cls,
+        bars: int = 2_000,
+        start_price: float = 2_000.0,
+        volatility: float = 0.002,
+        interval: str = "15m",
+        seed: int = 42,
+        **kwargs: Any,
+    ) -> FakeBinanceServer:
+        """
+        Build a server over a random walk whose forming bar is the current one.
+
+        Args:
+            bars (int, optional): Number of bars. Defaults to 2,000.
+            start_price (float, optional): First open price. Defaults to 2,000.
+            volatility (float, optional): Standard deviation of the per-bar
+                log return. Defaults to 0.002.
+            interval (str, optional): Kline interval. Defaults to "15m".
+            seed (int, optional): Random seed of the walk. Defaults to 42.
+            **kwargs (Any): Further `__init__` arguments.
+
+        Returns:
+            FakeBinanceServer: The (not yet started) server.
+        """
+        rng = np.random.default_rng(seed)
+        interval_ms = DateUtils.interval_to_milliseconds(interval)
+        close = start_price * np.exp(np.cumsum(rng.normal(0, volatility, bars)))
+        open_ = np.concatenate([[start_price], close[:-1]])
+        wick = np.abs(rng.normal(0, volatility / 2, (2, bars))) * close
+        start_index = kwargs.pop("start_index", bars // 2)
+        now = DateUtils.get_timestamp_ms()
+        first_open = now - now % interval_ms - start_index * interval_ms
+        ohlcv = OHLCV(
+            open_time=first_open + np.arange(bars, dtype=np.int64) * interval_ms,
+            open=open_,
+            high=np.maximum(open_, close) + wick[0],
+            low=np.minimum(open_, close) - wick[1],
+            close=close,
+            volume=rng.uniform(100, 1_000, bars),
+        )
+        return cls(
+            ohlcv, interval=interval, start_index=start_index, seed=seed, **kwargs
+        )
+
+    @classmethod
+    def from_csv(cls, path: Union[str, Path], **kwargs: Any) -> FakeBinanceServer:
+        """
+        Build a server replaying recorded klines.
+
+        Args:
+            path (Union[str, Path]): CSV file in the Binance kline layout.
+            **kwargs (Any): Further `__init__` arguments.
+
+        Returns:
+            FakeBinanceServer: The (not yet started) server.
+        """
+        return cls(KlineLoader.read_csv(path), **kwargs)
+
+    @property
+    def url(self) -> str:
+        """
+        Base HTTP URL of the server.
+
+        Returns:
+            str: The URL (e.g., "http://127.0.0.1:8765").
+        """
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def ws_url(self) -> str:
+        """
+        Base WebSocket URL, for `MarketStream` and `AccountStream`.
+
+        Returns:
+            str: The URL (e.g., "ws://127.0.0.1:8765").
+        """
+        return f"ws://{self.host}:{self.port}"
+
+    def configure_client(self, client: Any) -> Any:
+        """
+        Point a (sync or async) python-binance client at this server.
+
+        Clients should be built with `ping=False` (or `AsyncClient()` without
+        `create`), since their constructor pings the real exchange.
+
+        Args:
+            client (Any): Client or AsyncClient instance.
+
+        Returns:
+            Any: The same client, for chaining.
+        """
+        client.API_URL = f"{self.url}/api"
+        client.FUTURES_URL = f"{self.url}/fapi"
+        return client
+
+    def start(self) -> FakeBinanceServer:
+        """
+        Start serving in a background daemon thread.
+
+        Returns:
+            FakeBinanceServer: This server, for chaining.
+        """
+        self._thread = threading.Thread(
+            target=self._run, name="FakeBinanceServer", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait(10)
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Close all connections and stop the server thread.
+
+        Args:
+            timeout (float, optional): Seconds to wait for the thread. Defaults to 5.0.
+        """
+        if self._loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._loop = None
+
+    def __enter__(self) -> FakeBinanceServer:
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def fail_next(
+        self,
+        count: int = 1,
+        status: int = 503,
+        code: int = -1001,
+        message: str = "Internal error; unable to process your request.",
+    ) -> None:
+        """
+        Answer the next REST requests with an error.
+
+        Args:
+            count (int, optional): Number of requests to fail. Defaults to 1.
+            status (int, optional): HTTP status. Defaults to 503.
+            code (int, optional): Binance error code. Defaults to -1001.
+            message (str, optional): Error message.
+        """
+        for _ in range(count):
+            self._failures.append({"status": status, "code": code, "msg": message})
+
+    def advance(self, bars: int = 1) -> None:
+        """
+        Close the forming bar(s) and open the next one.
+
+        Args:
+            bars (int, optional): Number of bars to close. Defaults to 1.
+
+        Raises:
+            IndexError: If the recorded klines are exhausted.
+        """
+        self._call(self._advance, bars)
+
+    def set_price(self, price: float) -> None:
+        """
+        Move the price of the forming bar, triggering resting TP/SL orders.
+
+        Args:
+            price (float): New last and mark price.
+        """
+        self._call(self._set_price, price)
+
+    def server_time(self) -> int:
+        """
+        Current exchange time, running inside the forming bar.
+
+        Returns:
+            int: Server time in milliseconds.
+        """
+        elapsed = int((time.monotonic() - self._bar_started) * 1000)
+        return self.open_time[self.cursor] + min(elapsed, self.interval_ms - 1)
+
+    def _call(self, function: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a state change on the server loop (or directly if not started).
+
+        Args:
+            function (Callable[..., Any]): Coroutine function to run.
+            *args (Any): Its arguments.
+
+        Returns:
+            Any: Its result.
+        """
+        if self._loop is None:
+            return asyncio.run(function(*args))
+        return asyncio.run_coroutine_threadsafe(function(*args), self._loop).result()
+
+    def _run(self) -> None:
+        """
+        Serve on a fresh event loop until `stop`.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._serve())
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _serve(self) -> None:
+        """
+        Bind the aiohttp application.
+        """
+        app = web.Application()
+        app.router.add_get("/ws/{listen_key}", self._user_stream)
+        app.router.add_get("/stream", self._market_stream)
+        app.router.add_route("*", "/{tail:.*}", self._dispatch)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def _shutdown(self) -> None:
+        """
+        Close the WebSocket connections and the HTTP server.
+        """
+        for socket in list(self._market_sockets | self._user_sockets):
+            await socket.close()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    async def _delay(self) -> None:
+        """
+        Sleep for the configured latency and jitter.
+        """
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _used_weight(self, weight: int) -> int:
+        """
+        Add a request weight to the rolling one-minute window.
+
+        Args:
+            weight (int): Weight of the request.
+
+        Returns:
+            int: Weight used within the last minute, including this request.
+        """
+        now = time.monotonic()
+        while self._weights and now - self._weights[0][0] >= 60.0:
+            self._weights.popleft()
+        self._weights.append([now, weight])
+        return int(sum(item[1] for item in self._weights))
+
+    @staticmethod
+    def _error(status: int, code: int, message: str, used: int) -> web.Response:
+        """
+        Build a Binance-style error response.
+
+        Args:
+            status (int): HTTP status.
+            code (int): Binance error code.
+            message (str): Error message.
+            used (int): Used weight reported in the headers.
+
+        Returns:
+            web.Response: The response.
+        """
+        return web.json_response(
+            {"code": code, "msg": message},
+            status=status,
+            headers={"X-MBX-USED-WEIGHT-1M": str(used)},
+        )
+
+    async def _dispatch(self, request: web.Request) -> web.Response:
+        """
+        Route a REST request, applying latency, weights and error injection.
+
+        Args:
+            request (web.Request): The incoming request.
+
+        Returns:
+            web.Response: The endpoint response or an injected error.
+        """
+        route = f"{request.method} {request.path}"
+        self.requests.append(route)
+        await self._delay()
+        params: Dict[str, str] = dict(request.query)
+        if request.can_read_body:
+            params.update(await request.post())
+        endpoint = request.path.rsplit("/", 1)[-1]
+        used = self._used_weight(self.WEIGHTS.get(endpoint, 1))
+        handler = self._routes.get(route)
+        if handler is None:
+            return self._error(404, -5000, f"Path {request.path} not found", used)
+        if used > self.weight_limit:
+            response = self._error(
+                429, -1003, "Too many requests; current limit exceeded.", used
+            )
+            response.headers["Retry-After"] = "60"
+            return response
+        if self._failures:
+            failure = self._failures.popleft()
+            return self._error(failure["status"], failure["code"], failure["msg"], used)
+        if self._random.random() < self.error_rate:
+            return self._error(500, -1001, "Internal error (injected).", used)
+        try:
+            body = await handler(request, params)
+        except KeyError as e:
+            return self._error(400, -1102, f"Mandatory parameter {e} missing.", used)
+        if isinstance(body, dict) and "code" in body:
+            return self._error(400, body["code"], body["msg"], used)
+        return web.json_response(body, headers={"X-MBX-USED-WEIGHT-1M": str(used)})
+
+    def _kline(self, index: int) -> Kline:
+        """
+        Build the REST layout of a served bar.
+
+        Args:
+            index (int): Bar index.
+
+        Returns:
+            Kline: The raw kline.
+        """
+        if index == self.cursor:
+            close, high, low = self.price, self._forming_high, self._forming_low
+        else:
+            close, high, low = self.close[index], self.high[index], self.low[index]
+        volume = self.volume[index]
+        return [
+            self.open_time[index],
+            str(self.open[index]),
+            str(high),
+            str(low),
+            str(close),
+            str(volume),
+            self.open_time[index] + self.interval_ms - 1,
+            str(volume * close),
+            100,
+            str(volume / 2),
+            str(volume * close / 2),
+            "0",
+        ]
+
+    async def _empty(self, request: web.Request, params: Dict[str, str]) -> Any:
+        return {}
+
+    async def _time(self, request: web.Request, params: Dict[str, str]) -> Any:
+        return {"serverTime": self.server_time()}
+
+    async def _klines(self, request: web.Request, params: Dict[str, str]) -> Any:
+        """
+        Serve the bars opened up to the forming one, within the requested range.
+        """
+        limit = min(int(params.get("limit", 500)), 1500)
+        start_time = int(params.get("startTime", 0))
+        end_time = int(params.get("endTime", self.open_time[self.cursor]))
+        indexes = [
+            index
+            for index in range(self.cursor + 1)
+            if start_time <= self.open_time[index] <= end_time
+        ]
+        indexes = indexes[:limit] if "startTime" in params else indexes[-limit:]
+        return [self._kline(index) for index in indexes]
+
+    async def _ticker_price(self, request: web.Request, params: Dict[str, str]) -> Any:
+        return {"symbol": self.symbol, "price": str(self.price)}
+
+    async def _premium_index(self, request: web.Request, params: Dict[str, str]) -> Any:
+        return {
+            "symbol": self.symbol,
+            "markPrice": str(self.price),
+            "time": self.server_time(),
+        }
+
+    async def _exchange_info(self, request: web.Request, params: Dict[str, str]) -> Any:
+        return {
+            "serverTime": self.server_time(),
+            "symbols": [
+                {
+                    "symbol": self.symbol,
+                    "filters": [
+                        {"filterType": "PRICE_FILTER", "tickSize": self.TICK_SIZE},
+                        {
+                            "filterType": "LOT_SIZE",
+                            "stepSize": self.STEP_SIZE,
+                            "minQty": self.STEP_SIZE,
+                        },
+                        {"filterType": "MIN_NOTIONAL", "notional": "5"},
+                    ],
+                }
+            ],
+        }
+
+    async def _balance(self, request: web.Request, params: Dict[str, str]) -> Any:
+        return [{"asset": "USDT", "balance": str(self.balance)}]
+
+    def _position_list(self) -> List[Dict[str, Any]]:
+        """
+        Build the position information of both sides.
+
+        Returns:
+            List[Dict[str, Any]]: Positions in the `positionRisk` layout.
+        """
+        return [
+            {
+                "symbol": self.symbol,
+                "positionSide": side,
+                "positionAmt": str(amount),
+                "entryPrice": str(entry_price),
+            }
+            for side, (amount, entry_price) in self.positions.items()
+        ]
+
+    async def _position_risk(self, request: web.Request, params: Dict[str, str]) -> Any:
+        return self._position_list()
+
+    async def _change_leverage(
+        self, request: web.Request, params: Dict[str, str]
+    ) -> Any:
+        self.leverage = int(params["leverage"])
+        return {"symbol": params["symbol"], "leverage": self.leverage}
+
+    def _place(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Accept an order: market orders fill at the current price, TP/SL
+        orders rest until their stop price is crossed.
+
+        Args:
+            params (Dict[str, Any]): Order parameters.
+
+        Returns:
+            Dict[str, Any]: The order, or a Binance error object.
+        """
+        if params.get("symbol") != self.symbol:
+            return {"code": -1121, "msg": "Invalid symbol."}
+        order = {
+            "orderId": len(self.orders) + 1,
+            "symbol": self.symbol,
+            "status": "NEW",
+            "type": params["type"],
+            "side": params["side"],
+            "positionSide": params.get("positionSide", "BOTH"),
+            "origQty": str(params["quantity"]),
+            "stopPrice": str(params.get("stopPrice", "0")),
+            "avgPrice": "0",
+            "updateTime": self.server_time(),
+        }
+        self.orders[order["orderId"]] = order
+        if order["type"] == "MARKET":
+            self._fill(order)
+        return order
+
+    def _fill(self, order: Dict[str, Any]) -> None:
+        """
+        Fill an order at the current price and update the position and balance.
+
+        Args:
+            order (Dict[str, Any]): The order to fill.
+        """
+        side = order["positionSide"]
+        quantity = float(order["origQty"])
+        sign = 1.0 if side == "LONG" else -1.0
+        position = self.positions.setdefault(side, [0.0, 0.0])
+        opening = (order["side"] == "BUY") == (side == "LONG")
+        if opening:
+            amount = abs(position[0]) + quantity
+            position[1] = (
+                abs(position[0]) * position[1] + quantity * self.price
+            ) / amount
+            position[0] = sign * amount
+        else:
+            closed = min(quantity, abs(position[0]))
+            self.balance += sign * closed * (self.price - position[1])
+            position[0] = sign * (abs(position[0]) - closed)
+            if position[0] == 0.0:
+                position[1] = 0.0
+        order.update(
+            status="FILLED", avgPrice=str(self.price), updateTime=self.server_time()
+        )
+
+    async def _publish_fill(self, order: Dict[str, Any]) -> None:
+        """
+        Report a filled order and the new account state on the user streams.
+
+        Args:
+            order (Dict[str, Any]): The filled order.
+        """
+        event_time = self.server_time()
+        await self._broadcast(
+            self._user_sockets,
+            {
+                "e": "ORDER_TRADE_UPDATE",
+                "E": event_time,
+                "o": {
+                    "s": self.symbol,
+                    "i": order["orderId"],
+                    "o": order["type"],
+                    "S": order["side"],
+                    "ps": order["positionSide"],
+                    "X": order["status"],
+                    "ap": order["avgPrice"],
+                    "sp": order["stopPrice"],
+                    "q": order["origQty"],
+                },
+            },
+        )
+        amount, entry_price = self.positions[order["positionSide"]]
+        await self._broadcast(
+            self._user_sockets,
+            {
+                "e": "ACCOUNT_UPDATE",
+                "E": event_time,
+                "a": {
+                    "B": [{"a": "USDT", "wb": str(self.balance)}],
+                    "P": [
+                        {
+                            "s": self.symbol,
+                            "ps": order["positionSide"],
+                            "pa": str(amount),
+                            "ep": str(entry_price),
+                        }
+                    ],
+                },
+            },
+        )
+
+    async def _create_order(self, request: web.Request, params: Dict[str, str]) -> Any:
+        order = self._place(params)
+        if order.get("status") == "FILLED":
+            await self._publish_fill(order)
+        return order
+
+    async def _batch_orders(self, request: web.Request, params: Dict[str, str]) -> Any:
+        results = [self._place(leg) for leg in json.loads(params["batchOrders"])]
+        for order in results:
+            if order.get("status") == "FILLED":
+                await self._publish_fill(order)
+        return results
+
+    def _cancel(self, order_id: int) -> Dict[str, Any]:
+        """
+        Cancel a resting order.
+
+        Args:
+            order_id (int): Id of the order.
+
+        Returns:
+            Dict[str, Any]: The cancelled order, or a Binance error object.
+        """
+        order = self.orders.get(order_id)
+        if order is None or order["status"] != "NEW":
+            return {"code": -2011, "msg": "Unknown order sent."}
+        order.update(status="CANCELED", updateTime=self.server_time())
+        return order
+
+    async def _cancel_order(self, request: web.Request, params: Dict[str, str]) -> Any:
+        return self._cancel(int(params["orderId"]))
+
+    async def _cancel_orders(self, request: web.Request, params: Dict[str, str]) -> Any:
+        order_ids = json.loads(unquote(params["orderidlist"]))
+        return [self._cancel(int(order_id)) for order_id in order_ids]
+
+    async def _new_listen_key(
+        self, request: web.Request, params: Dict[str, str]
+    ) -> Any:
+        listen_key = f"fake-listen-key-{len(self._listen_keys) + 1}"
+        self._listen_keys.add(listen_key)
+        return {"listenKey": listen_key}
+
+    async def _keepalive_listen_key(
+        self, request: web.Request, params: Dict[str, str]
+    ) -> Any:
+        return {}
+
+    async def _close_listen_key(
+        self, request: web.Request, params: Dict[str, str]
+    ) -> Any:
+        self._listen_keys.discard(params.get("listenKey", ""))
+        return {}
+
+    async def _broadcast(
+        self, sockets: Set[web.WebSocketResponse], message: Dict[str, Any]
+    ) -> None:
+        """
+        Send an event to every connected socket of a stream.
+
+        Args:
+            sockets (Set[web.WebSocketResponse]): Connected sockets.
+            message (Dict[str, Any]): The event.
+        """
+        if not sockets:
+            return
+        await self._delay()
+        text = json.dumps(message)
+        for socket in list(sockets):
+            if socket.closed:
+                sockets.discard(socket)
+            else:
+                await socket.send_str(text)
+
+    async def _hold(
+        self, request: web.Request, sockets: Set[web.WebSocketResponse]
+    ) -> web.WebSocketResponse:
+        """
+        Accept a WebSocket connection and keep it registered until it closes.
+
+        Args:
+            request (web.Request): The upgrade request.
+            sockets (Set[web.WebSocketResponse]): Sockets of the stream.
+
+        Returns:
+            web.WebSocketResponse: The closed socket.
+        """
+        socket = web.WebSocketResponse(heartbeat=None)
+        await socket.prepare(request)
+        sockets.add(socket)
+        try:
+            async for message in socket:
+                if message.type == WSMsgType.ERROR:
+                    break
+        finally:
+            sockets.discard(socket)
+        return socket
+
+    async def _user_stream(self, request: web.Request) -> web.StreamResponse:
+        if request.match_info["listen_key"] not in self._listen_keys:
+            raise web.HTTPBadRequest(text="Invalid listen key")
+        return await self._hold(request, self._user_sockets)
+
+    async def _market_stream(self, request: web.Request) -> web.StreamResponse:
+        return await self._hold(request, self._market_sockets)
+
+    async def _publish_market(self, index: int, closed: bool) -> None:
+        """
+        Push a kline event and a mark price event to the market streams.
+
+        Args:
+            index (int): Index of the bar.
+            closed (bool): Whether the bar is closed.
+        """
+        kline = self._kline(index)
+        symbol = self.symbol.lower()
+        await self._broadcast(
+            self._market_sockets,
+            {
+                "stream": f"{symbol}@kline_{self.interval}",
+                "data": {
+                    "e": "kline",
+                    "E": self.server_time(),
+                    "s": self.symbol,
+                    "k": {
+                        "t": kline[0],
+                        "T": kline[6],
+                        "i": self.interval,
+                        "o": kline[1],
+                        "h": kline[2],
+                        "l": kline[3],
+                        "c": kline[4],
+                        "v": kline[5],
+                        "n": kline[8],
+                        "x": closed,
+                        "q": kline[7],
+                        "V": kline[9],
+                        "Q": kline[10],
+                    },
+                },
+            },
+        )
+        await self._broadcast(
+            self._market_sockets,
+            {
+                "stream": f"{symbol}@markPrice@1s",
+                "data": {
+                    "e": "markPriceUpdate",
+                    "E": self.server_time(),
+                    "s": self.symbol,
+                    "p": str(self.price),
+                },
+            },
+        )
+
+    def _is_triggered(self, order: Dict[str, Any]) -> bool:
+        """
+        Whether the current price crosses a resting TP/SL order.
+
+        Args:
+            order (Dict[str, Any]): A resting order.
+
+        Returns:
+            bool: True if the order should fill.
+        """
+        stop_price = float(order["stopPrice"])
+        rising = (order["type"] == "TAKE_PROFIT_MARKET") == (order["side"] == "SELL")
+        return self.price >= stop_price if rising else self.price <= stop_price
+
+    async def _trigger_orders(self) -> None:
+        """
+        Fill the resting TP/SL orders crossed by the current price.
+        """
+        for order in list(self.orders.values()):
+            if (
+                order["status"] == "NEW"
+                and order["type"] in ("TAKE_PROFIT_MARKET", "STOP_MARKET")
+                and self._is_triggered(order)
+            ):
+                self._fill(order)
+                await self._publish_fill(order)
+
+    async def _move_price(self, price: float) -> None:
+        """
+        Move the price within the forming bar and fill the crossed orders.
+
+        Args:
+            price (float): New price.
+        """
+        self.price = float(price)
+        self._forming_high = max(self._forming_high, self.price)
+        self._forming_low = min(self._forming_low, self.price)
+        await self._trigger_orders()
+
+    async def _set_price(self, price: float) -> None:
+        await self._move_price(price)
+        await self._publish_market(self.cursor, closed=False)
+
+    async def _advance(self, bars: int) -> None:
+        """
+        Walk each forming bar through its recorded high, low and close (in
+        that order), publish it as closed and open the next bar.
+        """
+        for _ in range(bars):
+            index = self.cursor
+            if index + 1 >= len(self.close):
+                raise IndexError("The served klines are exhausted")
+            for price in (self.high[index], self.low[index], self.close[index]):
+                await self._move_price(price)
+            self.high[index], self.low[index] = self._forming_high, self._forming_low
+            self.cursor = index + 1
+            await self._publish_market(index, closed=True)
+            self._bar_started = time.monotonic()
+            self.price = self.open[self.cursor]
+            self._forming_high = self._forming_low = self.price
+            await self._publish_market(self.cursor, closed=False)
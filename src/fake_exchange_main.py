@@ -0,0 +1,82 @@
+import argparse
+import time
+from typing import List, Optional
+from bot.bot_settings import SETTINGS
+from fake_exchange.fake_binance_server import FakeBinanceServer
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the fake exchange command line.
+
+    Args:
+        argv (Optional[List[str]], optional): Arguments to parse. Defaults to None (sys.argv).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Serve a local fake Binance Futures exchange."
+    )
+    parser.add_argument(
+        "--csv", help="Recorded klines (Binance kline layout); synthetic if omitted."
+    )
+    parser.add_argument("--bars", type=int, default=2_000)
+    parser.add_argument("--symbol", default=SETTINGS.SYMBOL)
+    parser.add_argument("--interval", default=SETTINGS.INTERVAL)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--bar-seconds",
+        type=float,
+        default=0.0,
+        help="Close a bar every N seconds (0 keeps the price still).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Entry point of the fake exchange command.
+
+    Serves until interrupted, closing a bar every `--bar-seconds`.
+
+    Args:
+        argv (Optional[List[str]], optional): Arguments to parse. Defaults to None (sys.argv).
+    """
+    args = parse_args(argv)
+    options = dict(
+        symbol=args.symbol,
+        interval=args.interval,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        host=args.host,
+        port=args.port,
+    )
+    server = (
+        FakeBinanceServer.from_csv(args.csv, **options)
+        if args.csv
+        else FakeBinanceServer.synthetic(bars=args.bars, **options)
+    )
+    server.start()
+    print(f"REST: {server.url} (set API_URL/FUTURES_URL with configure_client)")
+    print(f"WebSocket: {server.ws_url}")
+    try:
+        while True:
+            time.sleep(args.bar_seconds or 3_600.0)
+            if args.bar_seconds:
+                server.advance()
+    except (KeyboardInterrupt, IndexError):
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
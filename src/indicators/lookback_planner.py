@@ -0,0 +1,116 @@
+import math
+
+
+class LookbackPlanner:
+    """
+    Computes how many bars are needed for the REM indicators to converge.
+
+    Every indicator is an exponential smoother whose initial seed keeps a
+    residual weight of (1 - alpha)^n after n further bars. The planner picks,
+    for a given tolerance, the smallest history where that residual weight
+    drops below the tolerance for every configured indicator.
+    """
+
+    def __init__(
+        self,
+        ema_period: int = 100,
+        macd_fast_period: int = 12,
+        macd_slow_period: int = 26,
+        macd_signal_period: int = 26,
+        rsi_period: int = 6,
+    ) -> None:
+        """
+        Initialize the LookbackPlanner.
+
+        Args:
+            ema_period (int, optional): EMA period. Defaults to 100.
+            macd_fast_period (int, optional): MACD fast EMA period. Defaults to 12.
+            macd_slow_period (int, optional): MACD slow EMA period. Defaults to 26.
+            macd_signal_period (int, optional): MACD signal period. Defaults to 26.
+            rsi_period (int, optional): RSI period. Defaults to 6.
+        """
+        self.ema_period: int = ema_period
+        self.macd_fast_period: int = macd_fast_period
+        self.macd_slow_period: int = macd_slow_period
+        self.macd_signal_period: int = macd_signal_period
+        self.rsi_period: int = rsi_period
+
+    @staticmethod
+    def _decay_bars(alpha: float, tolerance: float) -> int:
+        """
+        Number of bars after which a seed with smoothing `alpha` weighs below `tolerance`.
+
+        Args:
+            alpha (float): Smoothing factor of the exponential smoother.
+            tolerance (float): Maximum residual weight of the seed.
+
+        Returns:
+            int: Number of bars to process after the seed.
+        """
+        if alpha >= 1.0:
+            return 0
+        return max(0, math.ceil(math.log(tolerance) / math.log(1.0 - alpha)))
+
+    def ema_bars(self, period: int, tolerance: float) -> int:
+        """
+        Bars needed for an EMA (seeded with a `period` SMA) to converge.
+
+        Args:
+            period (int): EMA period.
+            tolerance (float): Maximum residual weight of the seed.
+
+        Returns:
+            int: Required number of bars.
+        """
+        return period + self._decay_bars(2.0 / (period + 1), tolerance)
+
+    def macd_bars(self, tolerance: float) -> int:
+        """
+        Bars needed for the MACD line and its signal line to converge.
+
+        Args:
+            tolerance (float): Maximum residual weight of the seeds.
+
+        Returns:
+            int: Required number of bars.
+        """
+        slow = max(self.macd_fast_period, self.macd_slow_period)
+        return self.ema_bars(slow, tolerance) + self.ema_bars(
+            self.macd_signal_period, tolerance
+        )
+
+    def rsi_bars(self, tolerance: float) -> int:
+        """
+        Bars needed for Wilder's RSI to converge.
+
+        Args:
+            tolerance (float): Maximum residual weight of the seed.
+
+        Returns:
+            int: Required number of bars.
+        """
+        period = self.rsi_period
+        return period + 1 + self._decay_bars(1.0 / period, tolerance)
+
+    def required_bars(self, tolerance: float) -> int:
+        """
+        Bars to download so that every configured indicator converges.
+
+        One extra bar is added for the still-forming candle.
+
+        Args:
+            tolerance (float): Maximum residual weight of the seeds, in (0, 1).
+
+        Returns:
+            int: Required number of bars.
+
+        Raises:
+            ValueError: If the tolerance is not in (0, 1).
+        """
+        if not 0.0 < tolerance < 1.0:
+            raise ValueError("LOOKBACK_TOLERANCE must be between 0 and 1")
+        return 1 + max(
+            self.ema_bars(self.ema_period, tolerance),
+            self.macd_bars(tolerance),
+            self.rsi_bars(tolerance),
+        )
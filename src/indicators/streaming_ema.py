@@ -0,0 +1,80 @@
+from typing import Any, Dict, Optional
+
+
+class StreamingEMA:
+    """
+    Exponential Moving Average updated one value at a time.
+
+    The average is seeded with the simple mean of the first `period` values
+    and then smoothed with k = 2 / (period + 1), exactly like `talib.EMA`.
+    Each update costs O(1) regardless of how much history has been seen.
+    """
+
+    def __init__(self, period: int) -> None:
+        """
+        Initialize the StreamingEMA.
+
+        Args:
+            period (int): The lookback period of the EMA.
+
+        Attributes:
+            value (Optional[float]): Latest committed EMA value, None until warmed up.
+        """
+        self.period: int = period
+        self.value: Optional[float] = None
+        self._k: float = 2.0 / (period + 1)
+        self._count: int = 0
+        self._seed_sum: float = 0.0
+
+    def peek(self, x: float) -> Optional[float]:
+        """
+        Compute the EMA that would result from `x` without committing it.
+
+        Args:
+            x (float): Candidate input value (e.g., the forming bar's close).
+
+        Returns:
+            Optional[float]: The provisional EMA, or None if not yet warmed up.
+        """
+        if self.value is not None:
+            return ((x - self.value) * self._k) + self.value
+        if self._count + 1 == self.period:
+            return (self._seed_sum + x) / self.period
+        return None
+
+    def update(self, x: float) -> Optional[float]:
+        """
+        Commit a new input value.
+
+        Args:
+            x (float): Input value (e.g., a closed bar's close).
+
+        Returns:
+            Optional[float]: The updated EMA, or None if not yet warmed up.
+        """
+        new_value = self.peek(x)
+        if self.value is None:
+            self._seed_sum += x
+        self._count += 1
+        self.value = new_value
+        return new_value
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Export the committed state, e.g. for a checkpoint.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable state.
+        """
+        return {"value": self.value, "count": self._count, "seed_sum": self._seed_sum}
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """
+        Replace the committed state with an exported one.
+
+        Args:
+            state (Dict[str, Any]): State produced by `state`.
+        """
+        self.value = state["value"]
+        self._count = int(state["count"])
+        self._seed_sum = float(state["seed_sum"])
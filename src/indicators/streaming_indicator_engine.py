@@ -0,0 +1,127 @@
+import math
+from typing import Any, Dict, Iterable, NamedTuple, Optional
+from indicators.streaming_ema import StreamingEMA
+from indicators.streaming_macd import StreamingMACD
+from indicators.streaming_rsi import StreamingRSI
+
+
+class IndicatorValues(NamedTuple):
+    """
+    Latest values of the REM indicator set (NaN until warmed up).
+    """
+
+    macd_12: float
+    macd_26: float
+    ema_100: float
+    rsi_6: float
+
+
+class StreamingIndicatorEngine:
+    """
+    Stateful engine computing the REM indicators (EMA, MACD + signal, RSI).
+
+    Closed candles are committed with `update` in O(1); the still-forming
+    candle is evaluated with `peek`, a provisional "what-if" update that
+    leaves the committed state untouched. The values match TA-Lib run over
+    the committed closes followed by the forming close.
+    """
+
+    def __init__(
+        self,
+        ema_period: int = 100,
+        macd_fast_period: int = 12,
+        macd_slow_period: int = 26,
+        macd_signal_period: int = 26,
+        rsi_period: int = 6,
+    ) -> None:
+        """
+        Initialize the StreamingIndicatorEngine.
+
+        Args:
+            ema_period (int, optional): EMA period. Defaults to 100.
+            macd_fast_period (int, optional): MACD fast EMA period. Defaults to 12.
+            macd_slow_period (int, optional): MACD slow EMA period. Defaults to 26.
+            macd_signal_period (int, optional): MACD signal period. Defaults to 26.
+            rsi_period (int, optional): RSI period. Defaults to 6.
+        """
+        self.ema: StreamingEMA = StreamingEMA(ema_period)
+        self.macd: StreamingMACD = StreamingMACD(
+            macd_fast_period, macd_slow_period, macd_signal_period
+        )
+        self.rsi: StreamingRSI = StreamingRSI(rsi_period)
+
+    @staticmethod
+    def _or_nan(value: Optional[float]) -> float:
+        """
+        Convert a missing indicator value into NaN, as TA-Lib does.
+
+        Args:
+            value (Optional[float]): Indicator value or None.
+
+        Returns:
+            float: The value, or NaN if it is None.
+        """
+        return math.nan if value is None else value
+
+    def seed(self, closes: Iterable[float]) -> None:
+        """
+        Commit a sequence of closed candles.
+
+        Args:
+            closes (Iterable[float]): Close prices ordered from oldest to newest.
+        """
+        for close in closes:
+            self.update(float(close))
+
+    def update(self, close: float) -> None:
+        """
+        Commit a closed candle.
+
+        Args:
+            close (float): Close price of the candle.
+        """
+        self.ema.update(close)
+        self.macd.update(close)
+        self.rsi.update(close)
+
+    def peek(self, close: float) -> IndicatorValues:
+        """
+        Evaluate the indicators for a forming candle without committing it.
+
+        Args:
+            close (float): Current (provisional) close price.
+
+        Returns:
+            IndicatorValues: Indicator values including the forming candle.
+        """
+        macd = self.macd.peek(close)
+        return IndicatorValues(
+            macd_12=math.nan if macd is None else macd[0],
+            macd_26=math.nan if macd is None else macd[1],
+            ema_100=self._or_nan(self.ema.peek(close)),
+            rsi_6=self._or_nan(self.rsi.peek(close)),
+        )
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Export the committed state of every indicator, e.g. for a checkpoint.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable state.
+        """
+        return {
+            "ema": self.ema.state(),
+            "macd": self.macd.state(),
+            "rsi": self.rsi.state(),
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """
+        Replace the committed state of every indicator with an exported one.
+
+        Args:
+            state (Dict[str, Any]): State produced by `state`.
+        """
+        self.ema.restore(state["ema"])
+        self.macd.restore(state["macd"])
+        self.rsi.restore(state["rsi"])
@@ -0,0 +1,104 @@
+from typing import Any, Dict, Optional, Tuple
+from indicators.streaming_ema import StreamingEMA
+
+
+class StreamingMACD:
+    """
+    Moving Average Convergence Divergence updated one value at a time.
+
+    Mirrors `talib.MACD`: the fast EMA is seeded on the `fast_period` values
+    that end where the slow EMA is seeded, so both become valid on the same
+    bar, and the signal line is an EMA of the MACD line.
+    """
+
+    def __init__(self, fast_period: int, slow_period: int, signal_period: int) -> None:
+        """
+        Initialize the StreamingMACD.
+
+        Args:
+            fast_period (int): Fast EMA period.
+            slow_period (int): Slow EMA period.
+            signal_period (int): Signal line EMA period.
+        """
+        if slow_period < fast_period:
+            fast_period, slow_period = slow_period, fast_period
+        self._fast: StreamingEMA = StreamingEMA(fast_period)
+        self._slow: StreamingEMA = StreamingEMA(slow_period)
+        self._signal: StreamingEMA = StreamingEMA(signal_period)
+        self._fast_offset: int = slow_period - fast_period
+        self._count: int = 0
+
+    @property
+    def value(self) -> Optional[Tuple[float, float]]:
+        """
+        Latest committed (MACD, signal) pair.
+
+        Returns:
+            Optional[Tuple[float, float]]: The pair, or None if not yet warmed up.
+        """
+        if self._signal.value is None or self._fast.value is None:
+            return None
+        assert self._slow.value is not None
+        return self._fast.value - self._slow.value, self._signal.value
+
+    def peek(self, x: float) -> Optional[Tuple[float, float]]:
+        """
+        Compute the (MACD, signal) pair that would result from `x` without committing it.
+
+        Args:
+            x (float): Candidate input value.
+
+        Returns:
+            Optional[Tuple[float, float]]: The provisional pair, or None if not yet warmed up.
+        """
+        fast = self._fast.peek(x) if self._count >= self._fast_offset else None
+        slow = self._slow.peek(x)
+        if fast is None or slow is None:
+            return None
+        signal = self._signal.peek(fast - slow)
+        if signal is None:
+            return None
+        return fast - slow, signal
+
+    def update(self, x: float) -> Optional[Tuple[float, float]]:
+        """
+        Commit a new input value.
+
+        Args:
+            x (float): Input value.
+
+        Returns:
+            Optional[Tuple[float, float]]: The updated pair, or None if not yet warmed up.
+        """
+        fast = self._fast.update(x) if self._count >= self._fast_offset else None
+        slow = self._slow.update(x)
+        self._count += 1
+        if fast is not None and slow is not None:
+            self._signal.update(fast - slow)
+        return self.value
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Export the committed state, e.g. for a checkpoint.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable state.
+        """
+        return {
+            "fast": self._fast.state(),
+            "slow": self._slow.state(),
+            "signal": self._signal.state(),
+            "count": self._count,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """
+        Replace the committed state with an exported one.
+
+        Args:
+            state (Dict[str, Any]): State produced by `state`.
+        """
+        self._fast.restore(state["fast"])
+        self._slow.restore(state["slow"])
+        self._signal.restore(state["signal"])
+        self._count = int(state["count"])
@@ -0,0 +1,130 @@
+from typing import Any, Dict, Optional, Tuple
+
+
+class StreamingRSI:
+    """
+    Wilder's Relative Strength Index updated one value at a time.
+
+    Average gain and loss are seeded with the simple mean of the first
+    `period` price changes and then smoothed with Wilder's method, exactly
+    like `talib.RSI`.
+    """
+
+    def __init__(self, period: int) -> None:
+        """
+        Initialize the StreamingRSI.
+
+        Args:
+            period (int): The lookback period of the RSI.
+
+        Attributes:
+            value (Optional[float]): Latest committed RSI value, None until warmed up.
+        """
+        self.period: int = period
+        self.value: Optional[float] = None
+        self._prev: Optional[float] = None
+        self._count: int = 0
+        self._avg_gain: float = 0.0
+        self._avg_loss: float = 0.0
+
+    @staticmethod
+    def _to_rsi(avg_gain: float, avg_loss: float) -> float:
+        """
+        Convert average gain and loss into an RSI value.
+
+        Args:
+            avg_gain (float): Average gain.
+            avg_loss (float): Average loss.
+
+        Returns:
+            float: RSI in the range [0, 100] (0 when there was no movement).
+        """
+        total = avg_gain + avg_loss
+        if -1e-8 < total < 1e-8:
+            return 0.0
+        return 100.0 * (avg_gain / total)
+
+    def _next(self, x: float) -> Tuple[float, float, Optional[float]]:
+        """
+        Compute the state that would result from `x`.
+
+        Args:
+            x (float): Input value.
+
+        Returns:
+            Tuple[float, float, Optional[float]]: (avg_gain, avg_loss, rsi) where
+                rsi is None if not yet warmed up.
+        """
+        if self._prev is None:
+            return 0.0, 0.0, None
+        diff = x - self._prev
+        gain, loss = self._avg_gain, self._avg_loss
+        if self._count > self.period:
+            gain *= self.period - 1
+            loss *= self.period - 1
+        if diff < 0:
+            loss -= diff
+        else:
+            gain += diff
+        if self._count < self.period:
+            return gain, loss, None
+        gain /= self.period
+        loss /= self.period
+        return gain, loss, self._to_rsi(gain, loss)
+
+    def peek(self, x: float) -> Optional[float]:
+        """
+        Compute the RSI that would result from `x` without committing it.
+
+        Args:
+            x (float): Candidate input value.
+
+        Returns:
+            Optional[float]: The provisional RSI, or None if not yet warmed up.
+        """
+        return self._next(x)[2]
+
+    def update(self, x: float) -> Optional[float]:
+        """
+        Commit a new input value.
+
+        Args:
+            x (float): Input value.
+
+        Returns:
+            Optional[float]: The updated RSI, or None if not yet warmed up.
+        """
+        self._avg_gain, self._avg_loss, rsi = self._next(x)
+        self._prev = x
+        self._count += 1
+        if rsi is not None:
+            self.value = rsi
+        return rsi
+
+    def state(self) -> Dict[str, Any]:
+        """
+        Export the committed state, e.g. for a checkpoint.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable state.
+        """
+        return {
+            "value": self.value,
+            "prev": self._prev,
+            "count": self._count,
+            "avg_gain": self._avg_gain,
+            "avg_loss": self._avg_loss,
+        }
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """
+        Replace the committed state with an exported one.
+
+        Args:
+            state (Dict[str, Any]): State produced by `state`.
+        """
+        self.value = state["value"]
+        self._prev = state["prev"]
+        self._count = int(state["count"])
+        self._avg_gain = float(state["avg_gain"])
+        self._avg_loss = float(state["avg_loss"])
@@ -0,0 +1,73 @@
+import argparse
+import time
+from pathlib import Path
+from typing import List, Optional
+from bot.bot_settings import SETTINGS
+from utils.trade_journal import TradeJournal
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the trade journal command line.
+
+    Args:
+        argv (Optional[List[str]], optional): Arguments to parse. Defaults to None (sys.argv).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Import results CSVs into the trade journal and report win rates."
+    )
+    parser.add_argument(
+        "--import-csv",
+        type=Path,
+        nargs="*",
+        default=[],
+        help="Results CSVs to import (trades already in the journal are skipped).",
+    )
+    parser.add_argument("--symbol", default=SETTINGS.SYMBOL)
+    parser.add_argument("--position", choices=["LONG", "SHORT"], default=None)
+    parser.add_argument(
+        "--days", type=float, default=None, help="Only trades of the last days."
+    )
+    parser.add_argument("--journal", type=Path, default=TradeJournal.DEFAULT_PATH)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Entry point of the trade journal command.
+
+    Imports the given results CSVs for the symbol, then prints the win rate
+    of its journaled trades (optionally of one side and recent days only).
+
+    Args:
+        argv (Optional[List[str]], optional): Arguments to parse. Defaults to None (sys.argv).
+    """
+    args = parse_args(argv)
+    journal = TradeJournal(args.journal)
+    try:
+        for path in args.import_csv:
+            print(
+                f"Imported {journal.import_csv(path, args.symbol)} trades from {path}"
+            )
+        since_ms = (
+            None
+            if args.days is None
+            else int((time.time() - args.days * 86_400) * 1000)
+        )
+        started = time.perf_counter()
+        trades, wins = journal.win_rate(args.symbol, args.position, since_ms)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    finally:
+        journal.close()
+    rate = wins / trades * 100 if trades else 0.0
+    print(
+        f"{args.symbol} {args.position or 'ALL'}: {trades} trades, "
+        f"Win-Rate: {rate:.2f}% ({elapsed_ms:.2f} ms)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,37 @@
+import asyncio
+from bot.async_rem_bot import AsyncRemBot
+from bot.bot_settings import SETTINGS
+from bot.portfolio_bot import PortfolioBot
 from bot.rem_bot import RemBot
+from utils.file_utils import FileUtils
 
 
 def main() -> None:
     """
     Entry point of the trading bot.
 
-    Initializes the RemBot instance and starts its execution loop.
+    Initializes the RemBot instance and starts its execution loop. When a
+    portfolio is configured, all its symbols are traded by a PortfolioBot;
+    in async mode a single AsyncRemBot runs on an asyncio event loop. With
+    `BUFFERED_RESULTS` results are written by background writers and with
+    `TRADE_JOURNAL` trades are also recorded in the trade journal; both are
+    flushed when the bot stops.
     """
-    rembot: RemBot = RemBot()
-    rembot.run()
+    if SETTINGS.BUFFERED_RESULTS:
+        FileUtils.use_buffered_writers(SETTINGS.RESULTS_FSYNC)
+    if SETTINGS.TRADE_JOURNAL:
+        FileUtils.use_trade_journal()
+    try:
+        if SETTINGS.PORTFOLIO:
+            asyncio.run(PortfolioBot(SETTINGS.PORTFOLIO).run())
+            return
+        if SETTINGS.ASYNC_MODE:
+            asyncio.run(AsyncRemBot().run())
+            return
+        rembot: RemBot = RemBot()
+        rembot.run()
+    finally:
+        FileUtils.close_writers()
 
 
 if __name__ == "__main__":
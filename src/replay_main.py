@@ -0,0 +1,130 @@
+import argparse
+from pathlib import Path
+from typing import List, Optional
+from backtest.backtest_result import BacktestResult
+from backtest.kline_loader import KlineLoader
+from backtest.replay_engine import ReplayEngine
+from backtest.vectorized_backtester import VectorizedBacktester
+from bot.bot_settings import SETTINGS
+from bot.symbol_settings import SymbolSettings
+from base_dir import BASE_DIR
+
+
+def first_divergence(
+    replayed: BacktestResult, backtested: BacktestResult
+) -> Optional[int]:
+    """
+    Find the first trade on which a replay and a backtest disagree.
+
+    Trades are compared on side, entry and exit bars, prices and outcome.
+
+    Args:
+        replayed (BacktestResult): Trades of the state machine replay.
+        backtested (BacktestResult): Trades of the vectorized backtest.
+
+    Returns:
+        Optional[int]: Index of the first differing trade, or None if they agree.
+    """
+    for index in range(max(len(replayed.trades), len(backtested.trades))):
+        if index >= len(replayed.trades) or index >= len(backtested.trades):
+            return index
+        a, b = replayed.trades[index], backtested.trades[index]
+        if (a.position, a.entry_index, a.exit_index, a.is_tp) != (
+            b.position,
+            b.entry_index,
+            b.exit_index,
+            b.is_tp,
+        ) or (a.entry_price, a.tp_price, a.sl_price) != (
+            b.entry_price,
+            b.tp_price,
+            b.sl_price,
+        ):
+            return index
+    return None
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the replay command line.
+
+    Args:
+        argv (Optional[List[str]], optional): Arguments to parse. Defaults to None (sys.argv).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Replay historical klines through the live RemBot state machine."
+    )
+    parser.add_argument("csv", help="Kline CSV file (Binance kline layout).")
+    parser.add_argument("--tp-ratio", type=float, default=SETTINGS.TP_RATIO)
+    parser.add_argument("--sl-ratio", type=float, default=SETTINGS.SL_RATIO)
+    parser.add_argument("--coin-precision", type=int, default=SETTINGS.COIN_PRECISION)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=None,
+        help="CSV the replayed results are appended to (not saved by default).",
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="Show the bot's console output."
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Entry point of the replay command.
+
+    Replays the klines through the state machine, prints its throughput, the
+    exceptions its steps logged and its trade statistics, and checks the
+    trades against the vectorized backtest. Results are only saved to a CSV
+    given with `--output`.
+
+    Args:
+        argv (Optional[List[str]], optional): Arguments to parse. Defaults to None (sys.argv).
+    """
+    args = parse_args(argv)
+    ohlcv = KlineLoader.read_csv(args.csv)
+    symbol_settings = SymbolSettings(
+        SETTINGS.SYMBOL,
+        args.coin_precision,
+        args.tp_ratio,
+        args.sl_ratio,
+        SETTINGS.LEVERAGE,
+        BASE_DIR / "replay_results.csv" if args.output is None else args.output,
+    )
+    report = ReplayEngine(
+        symbol_settings, quiet=not args.verbose, save_results=args.output is not None
+    ).run(ohlcv)
+    result = report.result
+    print(f"Bars: {len(ohlcv.close)}")
+    print(
+        f"Steps: {report.steps} in {report.seconds:.3f} s "
+        f"({report.steps_per_second:,.0f} steps/s)"
+    )
+    if report.errors:
+        print(f"Step errors: {report.errors} (first: {report.first_error})")
+    print(
+        f"Trades: {len(result.trades)} (TP: {result.win_count} SL: {result.loss_count})"
+    )
+    print(f"Win-Rate: {result.win_rate * 100:.2f}%")
+    print(f"PnL: {result.pnl * 100:.2f}%")
+
+    backtested = VectorizedBacktester(
+        args.tp_ratio, args.sl_ratio, args.coin_precision
+    ).run(ohlcv)
+    index = first_divergence(result, backtested)
+    if index is None:
+        print(f"Backtest agreement: OK ({len(backtested.trades)} trades)")
+    else:
+        print(f"Backtest divergence at trade #{index + 1}")
+        for name, trades in (
+            ("replay", result.trades),
+            ("backtest", backtested.trades),
+        ):
+            print(f"  {name}: {trades[index] if index < len(trades) else None}")
+
+
+if __name__ == "__main__":
+    main()
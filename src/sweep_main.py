@@ -0,0 +1,112 @@
+import argparse
+from typing import Any, Callable, List, Optional, TypeVar
+import numpy as np
+from backtest.kline_loader import KlineLoader
+from backtest.parameter_sweep import ParameterSweep
+from bot.bot_settings import SETTINGS
+
+T = TypeVar("T", int, float)
+
+
+def parse_grid(text: str, cast: Callable[[Any], T]) -> List[T]:
+    """
+    Parse a grid of values given as a comma list or an inclusive range.
+
+    Args:
+        text (str): Either "a,b,c" or "start:stop:step" (stop included).
+        cast (Callable[[Any], T]): Converter of a single value (int or float).
+
+    Returns:
+        List[T]: The grid values.
+
+    Raises:
+        ValueError: If the range step is not positive.
+    """
+    if ":" not in text:
+        return [cast(value) for value in text.split(",") if value.strip()]
+    start, stop, step = (float(part) for part in text.split(":"))
+    if step <= 0:
+        raise ValueError(f"Invalid grid step: {text}")
+    count = int(np.floor((stop - start) / step + 1e-9)) + 1
+    return [cast(round(start + i * step, 10)) for i in range(count)]
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse the sweep command line.
+
+    Args:
+        argv (Optional[List[str]], optional): Arguments to parse. Defaults to None (sys.argv).
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Sweep TP/SL ratios and indicator periods over historical klines."
+    )
+    parser.add_argument("csv", help="Kline CSV file (Binance kline layout).")
+    parser.add_argument("--tp-ratios", default=str(SETTINGS.TP_RATIO))
+    parser.add_argument("--sl-ratios", default=str(SETTINGS.SL_RATIO))
+    parser.add_argument("--ema-periods", default="100")
+    parser.add_argument("--macd-fast-periods", default="12")
+    parser.add_argument("--macd-slow-periods", default="26")
+    parser.add_argument("--macd-signal-periods", default="26")
+    parser.add_argument("--rsi-periods", default="6")
+    parser.add_argument("--coin-precision", type=int, default=SETTINGS.COIN_PRECISION)
+    parser.add_argument(
+        "--intrabar",
+        action="store_true",
+        help="Resolve TP/SL exits from the bar high/low paths instead of closes.",
+    )
+    parser.add_argument(
+        "--lower-csv",
+        default=None,
+        help="Lower timeframe kline CSV for the intrabar drill-down (implies --intrabar).",
+    )
+    parser.add_argument(
+        "--assume-stop-loss",
+        action="store_true",
+        help="Count bars touching both levels as stop-losses when undecidable.",
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=20)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Entry point of the sweep command.
+
+    Runs every grid combination in parallel and prints the ranked table.
+
+    Args:
+        argv (Optional[List[str]], optional): Arguments to parse. Defaults to None (sys.argv).
+    """
+    args = parse_args(argv)
+    ohlcv = KlineLoader.read_csv(args.csv)
+    intrabar = args.intrabar or args.lower_csv is not None
+    sweep = ParameterSweep(
+        ohlcv.close,
+        args.coin_precision,
+        args.workers,
+        ohlcv=ohlcv if intrabar else None,
+        lower_timeframe=(
+            None if args.lower_csv is None else KlineLoader.read_csv(args.lower_csv)
+        ),
+        assume_stop_loss=args.assume_stop_loss,
+    )
+    combinations = sweep.grid(
+        parse_grid(args.tp_ratios, float),
+        parse_grid(args.sl_ratios, float),
+        parse_grid(args.ema_periods, int),
+        parse_grid(args.macd_fast_periods, int),
+        parse_grid(args.macd_slow_periods, int),
+        parse_grid(args.macd_signal_periods, int),
+        parse_grid(args.rsi_periods, int),
+    )
+    print(f"Combinations: {len(combinations)} on {sweep.max_workers} workers")
+    print(ParameterSweep.format_table(sweep.run(combinations), args.top))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, List
+from utils.logger import Logger
+
+
+class BackgroundWriter(ABC):
+    """
+    Base class of sinks that write records from a background thread.
+
+    Records are handed over through a bounded queue and written by a daemon
+    thread in batches (everything queued at the time), so the caller only
+    pays for a queue put. A full queue blocks the caller until the thread
+    catches up, which bounds the memory held by a stalled disk. Subclasses
+    open their target before calling `_start` and implement how a batch is
+    written and how the target is closed.
+    """
+
+    _STOP = object()
+
+    def __init__(self, name: str, max_queue: int = 10_000) -> None:
+        """
+        Initialize the BackgroundWriter (its thread is started by `_start`).
+
+        Args:
+            name (str): Name of the writer, used for its thread and in errors.
+            max_queue (int, optional): Records queued before `write` blocks.
+                Defaults to 10000.
+        """
+        self.name: str = name
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._closed: bool = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._drain, name=name, daemon=True)
+
+    def _start(self) -> None:
+        """
+        Start the writing thread, once the target is open.
+        """
+        self._thread.start()
+
+    @abstractmethod
+    def _write_batch(self, records: List[Any]) -> None:
+        """
+        Write a batch of records to the target.
+
+        Args:
+            records (List[Any]): The records, in queue order.
+        """
+
+    @abstractmethod
+    def _close_target(self) -> None:
+        """
+        Close the target, after every queued record was written.
+        """
+
+    def write(self, record: Any) -> None:
+        """
+        Queue a record for writing.
+
+        The record is queued under the lock `close` takes, so it is never
+        queued behind the stop marker; a `close` racing a blocked `write`
+        waits for it.
+
+        Args:
+            record (Any): The record.
+
+        Raises:
+            RuntimeError: If the writer is closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.name} is closed")
+            self._queue.put(record)
+
+    def flush(self) -> None:
+        """
+        Wait until every queued record is written.
+        """
+        self._queue.join()
+
+    def close(self) -> None:
+        """
+        Write the queued records, stop the thread and close the target.
+
+        Closing twice is a no-op.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join()
+        self._close_target()
+
+    def _drain(self) -> None:
+        """
+        Write queued records batch by batch until the writer is closed.
+
+        Write failures are logged; the records of that batch are lost.
+        """
+        stopped = False
+        while not stopped:
+            items = [self._queue.get()]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = [item for item in items if item is not self._STOP]
+            stopped = len(records) < len(items)
+            try:
+                if records:
+                    self._write_batch(records)
+            except Exception as e:
+                Logger.log_exception(f"{self.name} write failed: {e}")
+            for _ in items:
+                self._queue.task_done()
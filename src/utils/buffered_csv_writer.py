@@ -0,0 +1,99 @@
+import csv
+import os
+from pathlib import Path
+from typing import Any, Iterable, List, TextIO, Union
+from utils.background_writer import BackgroundWriter
+
+
+class BufferedCsvWriter(BackgroundWriter):
+    """
+    Append-only CSV writer that keeps its file open and writes in the background.
+
+    The file is opened once, with the header written if it is empty, and
+    rows are written in batches by the writer thread. Each batch is flushed
+    to the OS; `fsync` decides when the data is also forced to disk:
+        - "batch": after every batch.
+        - "close": once, when the writer is closed.
+        - "never": left to the OS.
+    """
+
+    FSYNC_POLICIES = ("batch", "close", "never")
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        header: Iterable[str],
+        fsync: str = "batch",
+        max_queue: int = 10_000,
+    ) -> None:
+        """
+        Initialize the BufferedCsvWriter and start its thread.
+
+        Args:
+            path (Union[str, Path]): CSV file to append to.
+            header (Iterable[str]): Header row written to an empty file.
+            fsync (str, optional): When to force writes to disk ("batch",
+                "close" or "never"). Defaults to "batch".
+            max_queue (int, optional): Rows queued before `write` blocks.
+                Defaults to 10000.
+
+        Raises:
+            ValueError: If the fsync policy is unknown.
+        """
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.path: Path = Path(path)
+        self.fsync: str = fsync
+        super().__init__(f"csv-writer-{self.path.name}", max_queue)
+        self._file: TextIO = self._open(list(header))
+        self._writer = csv.writer(self._file)
+        self._start()
+
+    def _open(self, header: List[str]) -> TextIO:
+        """
+        Open the file for appending, writing the header if it is empty.
+
+        Args:
+            header (List[str]): Header row.
+
+        Returns:
+            TextIO: The open file.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        f = self.path.open("a", newline="", encoding="utf-8")
+        if f.tell() == 0:
+            csv.writer(f).writerow(header)
+            f.flush()
+        return f
+
+    def write(self, record: Iterable[Any]) -> None:
+        """
+        Queue a row for writing.
+
+        Args:
+            record (Iterable[Any]): Row values.
+
+        Raises:
+            RuntimeError: If the writer is closed.
+        """
+        super().write(list(record))
+
+    def _write_batch(self, records: List[Any]) -> None:
+        """
+        Append rows to the file and flush them, fsyncing with the "batch" policy.
+
+        Args:
+            records (List[Any]): The rows.
+        """
+        self._writer.writerows(records)
+        self._file.flush()
+        if self.fsync == "batch":
+            os.fsync(self._file.fileno())
+
+    def _close_target(self) -> None:
+        """
+        Close the file, fsyncing it unless the policy is "never".
+        """
+        if self.fsync != "never":
+            os.fsync(self._file.fileno())
+        self._file.close()
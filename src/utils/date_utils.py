@@ -1,4 +1,5 @@
 import datetime
+import time
 
 
 class DateUtils:
@@ -9,6 +10,14 @@ class DateUtils:
     the current date and time in standardized formats.
     """
 
+    _INTERVAL_UNIT_MS = {
+        "s": 1_000,
+        "m": 60_000,
+        "h": 3_600_000,
+        "d": 86_400_000,
+        "w": 604_800_000,
+    }
+
     @staticmethod
     def get_date() -> str:
         """
@@ -18,3 +27,32 @@ class DateUtils:
             str: Current timestamp in the format "[YYYY-MM-DD HH:MM:SS]".
         """
         return datetime.datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
+
+    @staticmethod
+    def get_timestamp_ms() -> int:
+        """
+        Get the current Unix time in milliseconds.
+
+        Returns:
+            int: Milliseconds elapsed since the Unix epoch.
+        """
+        return int(time.time() * 1000)
+
+    @staticmethod
+    def interval_to_milliseconds(interval: str) -> int:
+        """
+        Convert a Binance kline interval (e.g., "15m", "4h") into milliseconds.
+
+        Args:
+            interval (str): Interval made of an amount and a unit (s, m, h, d, w).
+
+        Returns:
+            int: Interval length in milliseconds.
+
+        Raises:
+            ValueError: If the interval is not in a supported fixed-length format.
+        """
+        amount, unit = interval[:-1], interval[-1:]
+        if not amount.isdigit() or unit not in DateUtils._INTERVAL_UNIT_MS:
+            raise ValueError(f"Invalid INTERVAL: {interval!r}")
+        return int(amount) * DateUtils._INTERVAL_UNIT_MS[unit]
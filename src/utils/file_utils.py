@@ -1,7 +1,14 @@
+import atexit
 import csv
+import os
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Union, Iterable, Any, Dict
+from typing import Union, Iterable, Iterator, Any, Dict, List, Optional, Set
 from data.market_snapshot import MarketSnapshot
+from utils.background_writer import BackgroundWriter
+from utils.buffered_csv_writer import BufferedCsvWriter
+from utils.date_utils import DateUtils
+from utils.trade_journal import TradeJournal, TradeRecord
 import tomllib
 
 
@@ -9,7 +16,8 @@ class FileUtils:
     """
     Utility class for file operations including:
         - Ensuring directory paths
-        - Writing results to CSV
+        - Writing results to CSV, directly or through background writers
+        - Recording trades in the SQLite trade journal
         - Reading configuration from TOML files
     """
 
@@ -22,7 +30,91 @@ class FileUtils:
         "macd_26",
         "ema_100",
         "rsi_6",
+        "exit_price",
     ]
+    _LEGACY_HEADER = _HEADER[:-1]
+    _checked_headers: Set[Path] = set()
+    _buffered_fsync: Optional[str] = None
+    _writers: Dict[Path, BufferedCsvWriter] = {}
+    _journal: Optional[TradeJournal] = None
+    _close_registered: bool = False
+    _discard_results: bool = False
+
+    @staticmethod
+    def _close_at_exit() -> None:
+        """
+        Make sure `close_writers` runs at interpreter exit.
+        """
+        if not FileUtils._close_registered:
+            atexit.register(FileUtils.close_writers)
+            FileUtils._close_registered = True
+
+    @staticmethod
+    def use_buffered_writers(fsync: str = "batch") -> None:
+        """
+        Write result rows through one BufferedCsvWriter per file from now on.
+
+        The writers are closed (and their rows written) by `close_writers`,
+        which also runs at interpreter exit.
+
+        Args:
+            fsync (str, optional): fsync policy of the writers. Defaults to "batch".
+
+        Raises:
+            ValueError: If the fsync policy is unknown.
+        """
+        if fsync not in BufferedCsvWriter.FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        FileUtils._close_at_exit()
+        FileUtils._buffered_fsync = fsync
+
+    @staticmethod
+    def use_trade_journal(path: Union[str, Path] = TradeJournal.DEFAULT_PATH) -> None:
+        """
+        Record every trade saved from now on in a TradeJournal as well.
+
+        The journal is closed by `close_writers`, which also runs at
+        interpreter exit.
+
+        Args:
+            path (Union[str, Path], optional): SQLite database of the journal.
+                Defaults to the journal's default path.
+        """
+        FileUtils._close_at_exit()
+        FileUtils._journal = TradeJournal(path)
+
+    @staticmethod
+    @contextmanager
+    def discarding_results() -> Iterator[None]:
+        """
+        Discard the results and trades saved for the duration of the block.
+
+        Used by replays, whose trades are read back from the state machine,
+        so that they neither touch the disk nor add to the live results.
+
+        Yields:
+            None
+        """
+        discard = FileUtils._discard_results
+        FileUtils._discard_results = True
+        try:
+            yield
+        finally:
+            FileUtils._discard_results = discard
+
+    @staticmethod
+    def close_writers() -> None:
+        """
+        Close the background writers and the trade journal, writing every
+        queued row.
+        """
+        writers: List[BackgroundWriter] = list(FileUtils._writers.values())
+        FileUtils._writers.clear()
+        if FileUtils._journal is not None:
+            writers.append(FileUtils._journal)
+            FileUtils._journal = None
+        for writer in writers:
+            writer.close()
 
     @staticmethod
     def _ensure_parent(path: Union[str, Path]) -> None:
@@ -48,16 +140,57 @@ class FileUtils:
         p = Path(path)
         return (not p.exists()) or (p.stat().st_size == 0)
 
+    @staticmethod
+    def _upgrade_header(path: Union[str, Path]) -> None:
+        """
+        Upgrade a results CSV written before the `exit_price` column existed.
+
+        The file is rewritten once, with the current header and an empty
+        `exit_price` on its rows, so that the rows appended next line up with
+        the header. Each path is only checked on its first write.
+
+        Args:
+            path (Union[str, Path]): Path to the CSV file.
+        """
+        p = Path(path)
+        if p in FileUtils._checked_headers:
+            return
+        FileUtils._checked_headers.add(p)
+        if FileUtils._is_empty_file(p):
+            return
+        with p.open("r", newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        if rows[0] != FileUtils._LEGACY_HEADER:
+            return
+        tmp = p.with_name(p.name + ".tmp")
+        with tmp.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(FileUtils._HEADER)
+            writer.writerows(row + [""] for row in rows[1:])
+        os.replace(tmp, p)
+
     @staticmethod
     def _append_csv(path: Union[str, Path], row: Iterable[Union[str, float]]) -> None:
         """
         Append a row of data to a CSV file. If the file is new or empty,
-        a header row is written first.
+        a header row is written first, and a file with the header of older
+        versions is upgraded first. With buffered writers enabled the row is
+        queued to the writer of the file instead.
 
         Args:
             path (Union[str, Path]): Path to the CSV file.
             row (Iterable[Union[str, float]]): Row data to append.
         """
+        FileUtils._upgrade_header(path)
+        if FileUtils._buffered_fsync is not None:
+            writer = FileUtils._writers.get(Path(path))
+            if writer is None:
+                writer = BufferedCsvWriter(
+                    path, FileUtils._HEADER, fsync=FileUtils._buffered_fsync
+                )
+                FileUtils._writers[Path(path)] = writer
+            writer.write(row)
+            return
         FileUtils._ensure_parent(path)
         write_header = FileUtils._is_empty_file(path)
         with open(path, "a", newline="", encoding="utf-8") as f:
@@ -72,16 +205,21 @@ class FileUtils:
         result: str,
         position: str,
         snapshot: MarketSnapshot,
+        exit_price: Optional[float] = None,
     ) -> None:
         """
-        Save a trading result into a CSV file.
+        Save a trading result into a CSV file (unless results are discarded).
 
         Args:
             file_path (Union[str, Path]): Path to the results CSV file.
             result (str): Outcome of the trade ("WIN"/"LOSS" or similar).
             position (str): Position side ("LONG"/"SHORT").
             snapshot (MarketSnapshot): Market snapshot at the time of entry/exit.
+            exit_price (Optional[float], optional): Price the position was closed
+                at. Defaults to None (left empty).
         """
+        if FileUtils._discard_results:
+            return
         row = [
             snapshot.date,
             result,
@@ -91,9 +229,59 @@ class FileUtils:
             float(snapshot.macd_26),
             float(snapshot.ema_100),
             float(snapshot.rsi_6),
+            "" if exit_price is None else float(exit_price),
         ]
         FileUtils._append_csv(file_path, row)
 
+    @staticmethod
+    def record_trade(
+        symbol: str,
+        result: str,
+        position: str,
+        snapshot: MarketSnapshot,
+        exit_price: float,
+        tp_price: float,
+        sl_price: float,
+        fill_price: Optional[float] = None,
+    ) -> None:
+        """
+        Record a closed trade in the trade journal, if one is in use and
+        results are not discarded.
+
+        Args:
+            symbol (str): Traded symbol.
+            result (str): Outcome of the trade, as in the results CSV.
+            position (str): Position side ("LONG"/"SHORT").
+            snapshot (MarketSnapshot): Market snapshot at the time of entry.
+            exit_price (float): Price the position was closed at.
+            tp_price (float): Take-profit price of the position.
+            sl_price (float): Stop-loss price of the position.
+            fill_price (Optional[float], optional): Average price of the exit
+                order fill that closed the position. Defaults to None (closed
+                from the polled price).
+        """
+        if FileUtils._journal is None or FileUtils._discard_results:
+            return
+        FileUtils._journal.write(
+            TradeRecord(
+                symbol=symbol,
+                date=snapshot.date,
+                result=result,
+                position=position,
+                price=float(snapshot.price),
+                macd_12=float(snapshot.macd_12),
+                macd_26=float(snapshot.macd_26),
+                ema_100=float(snapshot.ema_100),
+                rsi_6=float(snapshot.rsi_6),
+                exit_price=float(exit_price),
+                tp_price=float(tp_price),
+                sl_price=float(sl_price),
+                fill_price=fill_price,
+                entry_ms=TradeJournal.timestamp_of(snapshot.date),
+                exit_ms=DateUtils.get_timestamp_ms(),
+            )
+        )
+
     @staticmethod
     def read_toml_file(path: Union[str, Path]) -> Dict[str, Any]:
         """
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import csv
+import datetime
+import sqlite3
+from pathlib import Path
+from typing import Any, List, NamedTuple, Optional, Tuple, Union
+from base_dir import BASE_DIR
+from utils.background_writer import BackgroundWriter
+
+
+class TradeRecord(NamedTuple):
+    """
+    A closed trade, as stored in the trade journal.
+
+    The first fields are the columns of the results CSV. `fill_price` is the
+    average price of the exit order when the position was closed by its fill
+    (None when it was closed from the polled price), and the timestamps are
+    Unix milliseconds.
+    """
+
+    symbol: str
+    date: str
+    result: str
+    position: str
+    price: float
+    macd_12: float
+    macd_26: float
+    ema_100: float
+    rsi_6: float
+    exit_price: Optional[float] = None
+    tp_price: Optional[float] = None
+    sl_price: Optional[float] = None
+    fill_price: Optional[float] = None
+    entry_ms: Optional[int] = None
+    exit_ms: Optional[int] = None
+
+
+class TradeJournal(BackgroundWriter):
+    """
+    Indexed SQLite journal of closed trades.
+
+    The database runs in WAL mode, so queries read it while trades are
+    written, and every batch of queued trades is inserted in one transaction
+    by the writer thread. A trade is unique by (symbol, date, position,
+    price), so recording it again (e.g. re-importing a results CSV) is a
+    no-op; that index and the one on result let per-symbol and per-period
+    statistics read only the matching rows.
+    """
+
+    DEFAULT_PATH: Path = BASE_DIR / "trades.sqlite3"
+    DATE_FORMAT: str = "[%Y-%m-%d %H:%M:%S]"
+    _SCHEMA: Tuple[str, ...] = (
+        """
+        CREATE TABLE IF NOT EXISTS trades (
+            id INTEGER PRIMARY KEY,
+            symbol TEXT NOT NULL,
+            date TEXT NOT NULL,
+            result TEXT NOT NULL,
+            position TEXT NOT NULL,
+            price REAL NOT NULL,
+            macd_12 REAL,
+            macd_26 REAL,
+            ema_100 REAL,
+            rsi_6 REAL,
+            exit_price REAL,
+            tp_price REAL,
+            sl_price REAL,
+            fill_price REAL,
+            entry_ms INTEGER,
+            exit_ms INTEGER
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS trades_result ON trades (result)",
+        "DROP INDEX IF EXISTS trades_symbol_date",
+        """
+        DELETE FROM trades WHERE id NOT IN (
+            SELECT MIN(id) FROM trades GROUP BY symbol, date, position, price
+        )
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS trades_trade"
+        " ON trades (symbol, date, position, price)",
+    )
+    _INSERT: str = (
+        f"INSERT OR IGNORE INTO trades ({', '.join(TradeRecord._fields)}) "
+        f"VALUES ({', '.join('?' * len(TradeRecord._fields))})"
+    )
+
+    def __init__(
+        self, path: Union[str, Path] = DEFAULT_PATH, max_queue: int = 10_000
+    ) -> None:
+        """
+        Initialize the TradeJournal, creating its schema, and start its thread.
+
+        Args:
+            path (Union[str, Path], optional): SQLite database file.
+                Defaults to `trades.sqlite3` next to the settings.
+            max_queue (int, optional): Trades queued before `write` blocks.
+                Defaults to 10000.
+        """
+        self.path: Path = Path(path)
+        super().__init__(f"trade-journal-{self.path.name}", max_queue)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            for statement in self._SCHEMA:
+                self._connection.execute(statement)
+        self._start()
+
+    @classmethod
+    def date_of(cls, timestamp_ms: int) -> str:
+        """
+        Format a timestamp like the `date` column (local time).
+
+        Args:
+            timestamp_ms (int): Unix time in milliseconds.
+
+        Returns:
+            str: The formatted date.
+        """
+        return datetime.datetime.fromtimestamp(timestamp_ms / 1000).strftime(
+            cls.DATE_FORMAT
+        )
+
+    @classmethod
+    def timestamp_of(cls, date: str) -> Optional[int]:
+        """
+        Parse a `date` column value into a timestamp.
+
+        Args:
+            date (str): The date (local time).
+
+        Returns:
+            Optional[int]: Unix time in milliseconds, or None if the date
+                is not in the bot's format.
+        """
+        try:
+            parsed = datetime.datetime.strptime(date, cls.DATE_FORMAT)
+        except ValueError:
+            return None
+        return int(parsed.timestamp() * 1000)
+
+    def _write_batch(self, records: List[Any]) -> None:
+        """
+        Insert a batch of trades in one transaction, skipping the trades
+        already in the journal.
+
+        Args:
+            records (List[Any]): The TradeRecords.
+        """
+        with self._connection:
+            self._connection.executemany(self._INSERT, records)
+
+    def _close_target(self) -> None:
+        """
+        Close the database connection.
+        """
+        self._connection.close()
+
+    def _query(self, sql: str, parameters: Tuple[Any, ...]) -> List[Tuple[Any, ...]]:
+        """
+        Run a read query on its own connection, beside the writer thread.
+
+        Args:
+            sql (str): The query.
+            parameters (Tuple[Any, ...]): Its parameters.
+
+        Returns:
+            List[Tuple[Any, ...]]: The rows.
+        """
+        connection = sqlite3.connect(self.path)
+        try:
+            return connection.execute(sql, parameters).fetchall()
+        finally:
+            connection.close()
+
+    def win_rate(
+        self,
+        symbol: str,
+        position: Optional[str] = None,
+        since_ms: Optional[int] = None,
+    ) -> Tuple[int, int]:
+        """
+        Count the trades of a symbol and how many of them won.
+
+        A trade won if its result is its own side (the TP was hit).
+
+        Args:
+            symbol (str): Traded symbol.
+            position (Optional[str], optional): Only trades of this side
+                ("LONG" or "SHORT"). Defaults to None (both).
+            since_ms (Optional[int], optional): Only trades entered at or after
+                this Unix time in milliseconds. Defaults to None (all).
+
+        Returns:
+            Tuple[int, int]: Number of trades and number of wins.
+        """
+        sql = "SELECT COUNT(*), COALESCE(SUM(result = position), 0) FROM trades"
+        sql += " WHERE symbol = ?"
+        parameters: Tuple[Any, ...] = (symbol,)
+        if since_ms is not None:
+            sql += " AND date >= ?"
+            parameters += (self.date_of(since_ms),)
+        if position is not None:
+            sql += " AND position = ?"
+            parameters += (position,)
+        trades, wins = self._query(sql, parameters)[0]
+        return int(trades), int(wins)
+
+    def import_csv(self, path: Union[str, Path], symbol: str) -> int:
+        """
+        Import a results CSV written by `FileUtils.save_result`.
+
+        Trades already in the journal are skipped, so a file can be imported
+        again, e.g. after more trades were appended to it.
+
+        Args:
+            path (Union[str, Path]): The results CSV.
+            symbol (str): Symbol the results were traded on.
+
+        Returns:
+            int: Number of imported trades (not counting the skipped ones).
+        """
+        (before,) = self._query("SELECT COUNT(*) FROM trades", ())[0]
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                exit_price = row.get("exit_price") or None
+                self.write(
+                    TradeRecord(
+                        symbol=symbol,
+                        date=row["date"],
+                        result=row["result"],
+                        position=row["position"],
+                        price=float(row["price"]),
+                        macd_12=float(row["macd_12"]),
+                        macd_26=float(row["macd_26"]),
+                        ema_100=float(row["ema_100"]),
+                        rsi_6=float(row["rsi_6"]),
+                        exit_price=None if exit_price is None else float(exit_price),
+                        entry_ms=self.timestamp_of(row["date"]),
+                    )
+                )
+        self.flush()
+        (after,) = self._query("SELECT COUNT(*) FROM trades", ())[0]
+        return int(after - before)
@@ -0,0 +1,40 @@
+import pytest
+from backtest.backtest_result import BacktestResult, Trade
+
+
+def make_trade(position: str, is_tp: bool) -> Trade:
+    tp, sl = (110.0, 95.0) if position == "LONG" else (90.0, 105.0)
+    return Trade(position, 0, 1, 0, 60_000, 100.0, tp, sl, is_tp)
+
+
+def test_trade_exit_price_result_and_return():
+    long_sl = make_trade("LONG", False)
+    short_tp = make_trade("SHORT", True)
+
+    assert long_sl.exit_price == 95.0 and long_sl.result == "SHORT"
+    assert long_sl.return_ratio == pytest.approx(-0.05)
+    assert short_tp.exit_price == 90.0 and short_tp.result == "SHORT"
+    assert short_tp.return_ratio == pytest.approx(0.1)
+
+
+def test_statistics_over_trades():
+    result = BacktestResult(
+        [
+            make_trade("LONG", True),
+            make_trade("SHORT", False),
+            make_trade("LONG", False),
+            make_trade("SHORT", True),
+        ]
+    )
+
+    assert (result.win_count, result.loss_count) == (2, 2)
+    assert result.win_rate == 0.5
+    assert result.pnl == pytest.approx(0.1)
+    assert result.max_drawdown == pytest.approx(0.1)
+
+
+def test_empty_result():
+    result = BacktestResult([])
+    assert result.win_rate == 0.0
+    assert result.pnl == 0.0
+    assert result.max_drawdown == 0.0
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from backtest.intrabar_exit_resolver import IntrabarExitResolver
+from backtest.vectorized_backtester import VectorizedBacktester
+from binance_adapter.kline_parser import OHLCV
+
+
+def make_ohlcv(bars, interval_ms: int = 900_000) -> OHLCV:
+    open_, high, low, close = (np.array(column, dtype=float) for column in zip(*bars))
+    open_time = np.arange(len(bars), dtype=np.int64) * interval_ms
+    return OHLCV(open_time, open_, high, low, close, close)
+
+
+FLAT = (100.0, 100.5, 99.5, 100.0)
+
+
+@pytest.mark.parametrize(
+    "position, bar, expected",
+    [
+        ("LONG", (100, 102.5, 99.5, 101), True),
+        ("LONG", (100, 100.5, 97.5, 99), False),
+        ("SHORT", (100, 100.5, 97.5, 99), True),
+        ("SHORT", (100, 102.5, 99.5, 101), False),
+    ],
+)
+def test_single_level_touches(position, bar, expected):
+    resolver = IntrabarExitResolver(make_ohlcv([FLAT, FLAT, bar]))
+    tp, sl = (102.0, 98.0) if position == "LONG" else (98.0, 102.0)
+    assert resolver.find_exit(1, position, tp, sl) == (2, expected)
+
+
+def test_levels_are_compared_strictly():
+    resolver = IntrabarExitResolver(make_ohlcv([FLAT, (100, 102, 98, 100)]))
+    assert resolver.find_exit(1, "LONG", 102.0, 98.0) is None
+
+
+def test_ambiguous_bar_follows_the_extreme_nearest_to_the_open():
+    near_high = make_ohlcv([FLAT, (101.5, 102.5, 97.5, 100)])
+    near_low = make_ohlcv([FLAT, (98.5, 102.5, 97.5, 100)])
+    assert IntrabarExitResolver(near_high).find_exit(1, "LONG", 102, 98) == (1, True)
+    assert IntrabarExitResolver(near_low).find_exit(1, "LONG", 102, 98) == (1, False)
+    assert IntrabarExitResolver(near_low).find_exit(1, "SHORT", 98, 102) == (1, True)
+
+
+def test_ambiguous_bar_can_be_assumed_a_stop_loss():
+    ohlcv = make_ohlcv([FLAT, (101.5, 102.5, 97.5, 100)])
+    resolver = IntrabarExitResolver(ohlcv, assume_stop_loss=True)
+    assert resolver.find_exit(1, "LONG", 102, 98) == (1, False)
+    assert resolver.find_exit(1, "SHORT", 98, 102) == (1, False)
+
+
+def test_drill_down_uses_the_first_touching_lower_bar():
+    ohlcv = make_ohlcv([FLAT, (101.5, 102.5, 97.5, 100)], interval_ms=180_000)
+    lower = make_ohlcv(
+        [FLAT, FLAT, FLAT, (100, 100.5, 97.5, 98), (98, 102.5, 98, 101), FLAT],
+        interval_ms=60_000,
+    )
+    resolver = IntrabarExitResolver(ohlcv, lower)
+    assert resolver.find_exit(1, "LONG", 102, 98) == (1, False)
+
+
+def test_ambiguous_lower_bar_falls_back_to_its_own_path_or_stop_loss():
+    ohlcv = make_ohlcv([FLAT, (98.5, 102.5, 97.5, 100)], interval_ms=120_000)
+    lower = make_ohlcv(
+        [FLAT, FLAT, (101.5, 102.5, 97.5, 100), FLAT], interval_ms=60_000
+    )
+    assert IntrabarExitResolver(ohlcv, lower).find_exit(1, "LONG", 102, 98) == (
+        1,
+        True,
+    )
+    assert IntrabarExitResolver(ohlcv, lower, True).find_exit(1, "LONG", 102, 98) == (
+        1,
+        False,
+    )
+
+
+def test_drill_down_without_matching_lower_bars_uses_the_bar_path():
+    ohlcv = make_ohlcv([FLAT, (101.5, 102.5, 97.5, 100)], interval_ms=120_000)
+    lower = make_ohlcv([FLAT, FLAT, FLAT, FLAT], interval_ms=60_000)
+    assert IntrabarExitResolver(ohlcv, lower).find_exit(1, "LONG", 102, 98) == (
+        1,
+        True,
+    )
+
+
+def test_scan_crosses_growing_chunks():
+    bars = [FLAT] * 5_000
+    bars[3_000] = (100, 102.5, 99.5, 101)
+    resolver = IntrabarExitResolver(make_ohlcv(bars))
+    assert resolver.find_exit(1, "LONG", 102, 98) == (3_000, True)
+    assert resolver.find_exit(3_001, "LONG", 102, 98) is None
+
+
+def test_backtest_with_close_only_bars_matches_close_exits():
+    rng = np.random.default_rng(7)
+    close = 2000 + np.cumsum(rng.normal(0, 2, 6_000))
+    ohlcv = OHLCV(np.arange(len(close)), close, close, close, close, close)
+    backtester = VectorizedBacktester(0.004, 0.003, 2)
+
+    intrabar = backtester.run(ohlcv, IntrabarExitResolver(ohlcv))
+
+    assert intrabar.trades == backtester.run(ohlcv).trades
+
+
+def test_backtest_with_wicks_exits_no_later_than_closes():
+    rng = np.random.default_rng(9)
+    close = 2000 + np.cumsum(rng.normal(0, 2, 6_000))
+    ohlcv = OHLCV(np.arange(len(close)), close, close + 3, close - 3, close, close)
+    backtester = VectorizedBacktester(0.004, 0.003, 2)
+
+    first_close = backtester.run(ohlcv).trades[0]
+    first_intrabar = backtester.run(ohlcv, IntrabarExitResolver(ohlcv)).trades[0]
+
+    assert first_intrabar.entry_index == first_close.entry_index
+    assert first_intrabar.exit_index <= first_close.exit_index
@@ -0,0 +1,44 @@
+from unittest.mock import MagicMock
+import numpy as np
+from backtest.kline_loader import KlineLoader
+
+
+def make_klines(count: int, start: int = 0):
+    return [
+        [start + i * 60_000, "1.0", "2.0", "0.5", f"{1.5 + i}", "10", 0, "0", 1]
+        + ["0", "0", "0"]
+        for i in range(count)
+    ]
+
+
+def test_fetch_klines_pages_until_a_short_page():
+    client = MagicMock()
+    client.get_klines.side_effect = [make_klines(1000), make_klines(3, 60_000_000)]
+
+    klines = KlineLoader.fetch_klines(client, "ETHUSDT", "1m", 0, 10**12)
+
+    assert len(klines) == 1003
+    assert client.get_klines.call_args_list[1].kwargs["startTime"] == (999 * 60_000 + 1)
+
+
+def test_write_and_read_csv_round_trip(tmp_path):
+    path = tmp_path / "data" / "klines.csv"
+    KlineLoader.write_csv(path, make_klines(3))
+
+    ohlcv = KlineLoader.read_csv(path)
+
+    assert ohlcv.open_time.dtype == np.int64
+    assert ohlcv.open_time.tolist() == [0, 60_000, 120_000]
+    assert ohlcv.close.tolist() == [1.5, 2.5, 3.5]
+    assert ohlcv.high.tolist() == [2.0] * 3
+
+
+def test_read_csv_skips_header_row(tmp_path):
+    path = tmp_path / "klines.csv"
+    path.write_text(
+        "open_time,open,high,low,close,volume,close_time\n"
+        "60000,1,2,0.5,1.5,10,119999\n"
+    )
+    ohlcv = KlineLoader.read_csv(path)
+    assert ohlcv.open_time.tolist() == [60_000]
+    assert ohlcv.volume.tolist() == [10.0]
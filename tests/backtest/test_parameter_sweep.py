@@ -0,0 +1,178 @@
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+import pytest
+from backtest.parameter_sweep import ParameterSweep, SweepParams, SweepResult
+from backtest.intrabar_exit_resolver import IntrabarExitResolver
+from backtest.vectorized_backtester import VectorizedBacktester
+from binance_adapter.kline_parser import OHLCV
+
+
+def random_walk(size: int, seed: int = 11) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 2000 + np.cumsum(rng.normal(0, 2, size))
+
+
+def random_ohlcv(size: int, seed: int = 11, interval_ms: int = 60_000) -> OHLCV:
+    close = random_walk(size, seed)
+    previous = np.r_[close[0], close[:-1]]
+    return OHLCV(
+        np.arange(size, dtype=np.int64) * interval_ms,
+        previous,
+        np.maximum(close, previous) + 1.0,
+        np.minimum(close, previous) - 1.0,
+        close,
+        close,
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_worker_state(monkeypatch):
+    monkeypatch.setattr(ParameterSweep, "_worker_close", None)
+    monkeypatch.setattr(ParameterSweep, "_worker_resolver", None)
+    monkeypatch.setattr(ParameterSweep, "_worker_memory", None)
+    monkeypatch.setattr(ParameterSweep, "_worker_coin_precision", 2)
+
+
+def test_grid_builds_product_and_skips_invalid_macd_periods():
+    combinations = ParameterSweep.grid(
+        [0.004, 0.006], [0.003], macd_fast_periods=[12, 30], macd_slow_periods=[26]
+    )
+
+    assert combinations == [
+        SweepParams(0.004, 0.003, 100, 12, 26, 26, 6),
+        SweepParams(0.006, 0.003, 100, 12, 26, 26, 6),
+    ]
+
+
+def test_shard_groups_by_indicator_periods():
+    sweep = ParameterSweep(np.zeros(10), 2, max_workers=1)
+    combinations = ParameterSweep.grid(
+        [0.001, 0.002, 0.003, 0.004], [0.001, 0.002], rsi_periods=[6, 14]
+    )
+
+    shards = sweep._shard(combinations)
+
+    assert len(shards) == 4
+    assert sum(len(shard) for shard in shards) == len(combinations)
+    for shard in shards:
+        assert len({params[2:] for params in shard}) == 1
+
+
+def test_run_shard_requires_an_initialized_worker():
+    with pytest.raises(RuntimeError):
+        ParameterSweep._run_shard([SweepParams(0.004, 0.003)])
+
+
+def attach_in_process(sweep):
+    arrays = sweep._shared_arrays()
+    layout = tuple((name, a.dtype.str, len(a)) for name, a in arrays.items())
+    memory = SharedMemory(create=True, size=sum(a.nbytes for a in arrays.values()))
+    for name, shared in ParameterSweep._attach_arrays(memory.buf, layout).items():
+        shared[:] = arrays[name]
+    del shared
+    ParameterSweep._init_worker(memory.name, layout, 2, sweep.assume_stop_loss)
+    return memory
+
+
+def release(memory):
+    ParameterSweep._worker_close = None
+    ParameterSweep._worker_resolver = None
+    ParameterSweep._worker_memory.close()
+    memory.close()
+    memory.unlink()
+
+
+def test_run_shard_matches_single_backtests():
+    close = random_walk(4_000)
+    memory = attach_in_process(ParameterSweep(close, 2))
+    try:
+        assert ParameterSweep._worker_resolver is None
+        shard = ParameterSweep.grid([0.002, 0.004], [0.002, 0.003])
+
+        results = ParameterSweep._run_shard(shard)
+
+        for params, result in zip(shard, results):
+            expected = VectorizedBacktester(
+                params.tp_ratio, params.sl_ratio, 2
+            ).run_series(close)
+            assert result.params == params
+            assert result.trades == len(expected.trades)
+            assert result.pnl == pytest.approx(expected.pnl)
+            assert result.win_rate == pytest.approx(expected.win_rate)
+            assert result.max_drawdown == pytest.approx(expected.max_drawdown)
+    finally:
+        release(memory)
+
+
+def test_run_shard_resolves_exits_intrabar_when_klines_are_shared():
+    ohlcv = random_ohlcv(4_000)
+    lower = random_ohlcv(8_000, seed=5, interval_ms=30_000)
+    sweep = ParameterSweep(
+        ohlcv.close, 2, ohlcv=ohlcv, lower_timeframe=lower, assume_stop_loss=True
+    )
+    memory = attach_in_process(sweep)
+    try:
+        resolver = ParameterSweep._worker_resolver
+        assert resolver.assume_stop_loss is True
+        assert np.array_equal(resolver.lower_timeframe.high, lower.high)
+        params = SweepParams(0.004, 0.003)
+
+        (result,) = ParameterSweep._run_shard([params])
+
+        expected = VectorizedBacktester(0.004, 0.003, 2).run(
+            ohlcv, IntrabarExitResolver(ohlcv, lower, assume_stop_loss=True)
+        )
+        assert result.trades == len(expected.trades)
+        assert result.pnl == pytest.approx(expected.pnl)
+    finally:
+        release(memory)
+
+
+def test_run_evaluates_combinations_in_worker_processes():
+    close = random_walk(3_000)
+    combinations = ParameterSweep.grid([0.002, 0.004], [0.002, 0.003], [50, 100])
+
+    results = ParameterSweep(close, 2, max_workers=2).run(combinations)
+
+    assert sorted(r.params for r in results) == sorted(combinations)
+    assert results == ParameterSweep.rank(results)
+
+
+def test_run_shares_klines_with_workers_for_intrabar_exits():
+    ohlcv = random_ohlcv(3_000)
+    combinations = ParameterSweep.grid([0.004], [0.003])
+
+    (result,) = ParameterSweep(ohlcv.close, 2, 2, ohlcv=ohlcv).run(combinations)
+
+    expected = VectorizedBacktester(0.004, 0.003, 2).run(
+        ohlcv, IntrabarExitResolver(ohlcv)
+    )
+    assert result.trades == len(expected.trades)
+    assert result.pnl == pytest.approx(expected.pnl)
+
+
+def test_rank_orders_by_pnl_then_win_rate_then_drawdown():
+    params = SweepParams(0.004, 0.003)
+    worst = SweepResult(params, 5, 0.9, 0.01, 0.0)
+    tied_low_drawdown = SweepResult(params, 5, 0.5, 0.02, 0.01)
+    tied_high_drawdown = SweepResult(params, 5, 0.5, 0.02, 0.03)
+    best_win_rate = SweepResult(params, 5, 0.6, 0.02, 0.05)
+
+    ranked = ParameterSweep.rank(
+        [worst, tied_high_drawdown, best_win_rate, tied_low_drawdown]
+    )
+
+    assert ranked == [best_win_rate, tied_low_drawdown, tied_high_drawdown, worst]
+
+
+def test_format_table_renders_top_rows():
+    results = [
+        SweepResult(SweepParams(0.004, 0.003), 10, 0.6, 0.012, 0.004),
+        SweepResult(SweepParams(0.006, 0.002, rsi_period=14), 8, 0.5, 0.002, 0.01),
+    ]
+
+    table = ParameterSweep.format_table(results, top=1).splitlines()
+
+    assert len(table) == 3
+    assert "12/26/26" in table[2]
+    assert "60.00%" in table[2] and "1.20%" in table[2]
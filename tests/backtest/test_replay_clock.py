@@ -0,0 +1,27 @@
+from backtest.replay_clock import ReplayClock
+from utils.date_utils import DateUtils
+
+
+def test_clock_only_moves_forward():
+    clock = ReplayClock(start_ms=1_000)
+    clock.advance_to(5_000)
+    clock.advance_to(2_000)
+    assert clock.get_timestamp_ms() == 5_000
+
+
+def test_get_date_formats_replay_time_in_utc():
+    assert ReplayClock(86_400_000 + 61_000).get_date() == "[1970-01-02 00:01:01]"
+
+
+def test_installed_routes_date_utils_and_restores_it():
+    real_get_date = DateUtils.get_date
+    clock = ReplayClock(0)
+
+    with clock.installed() as installed:
+        clock.advance_to(120_000)
+        assert installed is clock
+        assert DateUtils.get_timestamp_ms() == 120_000
+        assert DateUtils.get_date() == "[1970-01-01 00:02:00]"
+
+    assert DateUtils.get_date is real_get_date
+    assert DateUtils.get_timestamp_ms() > 120_000
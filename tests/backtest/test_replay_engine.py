@@ -0,0 +1,137 @@
+import numpy as np
+import pytest
+from backtest.replay_binance_adapter import ReplayBinanceAdapter
+from backtest.replay_clock import ReplayClock
+from backtest.replay_engine import ReplayEngine, ReplayReport
+from backtest.replay_indicator_manager import ReplayIndicatorManager
+from backtest.backtest_result import BacktestResult
+from backtest.vectorized_backtester import VectorizedBacktester
+from binance_adapter.kline_parser import OHLCV
+from bot.states.flat.flat_position_state import FlatPositionState
+from bot.symbol_settings import SymbolSettings
+import backtest.replay_engine as replay_engine_module
+from utils.logger import Logger
+
+
+def random_walk(size: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 2000 + np.cumsum(rng.normal(0, 2, size))
+
+
+def trade_keys(result):
+    return [
+        (t.position, t.entry_index, t.exit_index, t.is_tp, t.tp_price, t.sl_price)
+        for t in result.trades
+    ]
+
+
+@pytest.fixture
+def symbol_settings(tmp_path):
+    return SymbolSettings("ETHUSDT", 2, 0.004, 0.003, 1, tmp_path / "replay.csv")
+
+
+def test_replay_of_bar_closes_matches_the_vectorized_backtest(symbol_settings):
+    close = random_walk(6_000)
+
+    report = ReplayEngine(symbol_settings).replay(close)
+    backtested = VectorizedBacktester(0.004, 0.003, 2).run_series(close)
+
+    assert len(backtested.trades) > 20
+    assert trade_keys(report.result) == trade_keys(backtested)
+    assert report.steps > 5_000
+    assert report.steps_per_second > 0
+    assert report.errors == 0 and report.first_error is None
+    assert not symbol_settings.OUTPUT_CSV_PATH.exists()
+
+
+def test_results_are_saved_on_request(symbol_settings, monkeypatch):
+    journaled = []
+    monkeypatch.setattr(
+        replay_engine_module.FileUtils,
+        "record_trade",
+        staticmethod(lambda **kwargs: journaled.append(kwargs)),
+    )
+    close = random_walk(3_000)
+
+    report = ReplayEngine(symbol_settings, save_results=True).replay(close)
+
+    assert report.result.trades
+    assert (
+        symbol_settings.OUTPUT_CSV_PATH.read_text().count("\n")
+        == len(report.result.trades) + 1
+    )
+    assert len(journaled) == len(report.result.trades)
+
+
+def test_step_exceptions_are_counted_in_the_report(symbol_settings, monkeypatch):
+    def fail(self):
+        raise RuntimeError("apply failed")
+
+    monkeypatch.setattr(FlatPositionState, "apply", fail)
+    log_exception = Logger.__dict__["log_exception"]
+
+    report = ReplayEngine(symbol_settings).replay(random_walk(400), interval_ms=1)
+
+    assert report.steps > 0
+    assert report.errors == report.steps
+    assert report.first_error == "apply failed"
+    assert report.result.trades == []
+    assert Logger.__dict__["log_exception"] is log_exception
+
+
+def test_ticks_are_replayed_as_price_steps_within_their_bar(symbol_settings):
+    close = random_walk(3_000, 3)
+    open_time = np.arange(len(close), dtype=np.int64) * 60_000 + 10**12
+    tick_time = open_time + 30_000
+    tick_price = close + 50.0
+
+    report = ReplayEngine(symbol_settings).run(
+        OHLCV(open_time, close, close, close, close, close), (tick_time, tick_price)
+    )
+
+    trades = report.result.trades
+    assert report.steps > 2 * 2_800
+    assert trades
+    assert all(open_time[0] <= t.entry_time <= t.exit_time for t in trades)
+    assert any((t.exit_time - open_time[0]) % 60_000 == 30_000 for t in trades)
+
+
+def test_events_put_ticks_before_the_close_of_their_bar():
+    open_time = np.array([0, 60_000, 120_000], dtype=np.int64)
+    ticks = (np.array([-5, 30_000, 59_999]), np.array([1.0, 2.0, 3.0]))
+
+    times, bars, tick_indexes, is_close = ReplayEngine._events(open_time, 60_000, ticks)
+
+    assert times.tolist() == [30_000, 59_999, 59_999, 119_999, 179_999]
+    assert bars.tolist() == [0, 0, 0, 1, 2]
+    assert tick_indexes.tolist() == [1, 2, -1, -1, -1]
+    assert is_close.tolist() == [False, False, True, True, True]
+
+
+def test_too_short_series_replays_nothing(symbol_settings):
+    report = ReplayEngine(symbol_settings).replay(np.linspace(1, 2, 50))
+    assert report.steps == 0 and report.result.trades == []
+
+
+def test_verbose_replay_prints_the_bot_output(symbol_settings, capsys):
+    ReplayEngine(symbol_settings, quiet=False).replay(random_walk(400), interval_ms=1)
+    assert "RemBot is running..." in capsys.readouterr().out
+
+
+def test_default_settings_write_to_replay_results():
+    assert ReplayEngine().symbol_settings.OUTPUT_CSV_PATH.name == "replay_results.csv"
+
+
+def test_steps_per_second_handles_zero_duration():
+    assert ReplayReport(10, 0.0, BacktestResult([])).steps_per_second == float("inf")
+    assert ReplayReport(10, 2.0, BacktestResult([])).steps_per_second == 5.0
+
+
+def test_adapter_computes_targets_and_serves_replay_time(symbol_settings):
+    clock = ReplayClock(42)
+    adapter = ReplayBinanceAdapter(
+        ReplayIndicatorManager(np.ones(1)), clock, symbol_settings
+    )
+    assert adapter.get_server_time() == 42
+    assert adapter.enter_long(100.0) == (100.4, 99.7)
+    assert adapter.enter_short(100.0, state_block=True) == (99.6, 100.3)
@@ -0,0 +1,51 @@
+import math
+import numpy as np
+import talib
+from backtest.replay_indicator_manager import ReplayIndicatorManager
+from data.market_snapshot import MarketSnapshot
+
+
+def test_snapshots_match_talib_over_committed_bars_and_current_price():
+    rng = np.random.default_rng(1)
+    close = 2000 + np.cumsum(rng.normal(0, 2, 400))
+    manager = ReplayIndicatorManager(close)
+
+    manager.advance(300, 1990.0)
+    snapshot = manager.fetch_indicators()
+
+    series = np.append(close[:300], 1990.0)
+    assert snapshot.price == 1990.0
+    assert math.isclose(
+        snapshot.ema_100, talib.EMA(series, timeperiod=100)[-1], rel_tol=1e-9
+    )
+    assert math.isclose(snapshot.rsi_6, talib.RSI(series, timeperiod=6)[-1])
+    assert manager.fetch_price_snapshot().ema_100 == snapshot.ema_100
+
+
+def test_advance_commits_each_bar_once_and_never_rewinds():
+    manager = ReplayIndicatorManager(np.arange(1.0, 11.0))
+    manager.advance(5, 6.5)
+    manager.advance(3, 4.0)
+    assert manager.bar_index == 5
+    assert manager.indicator_engine.ema._count == 5
+    assert manager.price == 4.0
+
+
+def test_is_warm_once_every_indicator_has_a_value():
+    close = np.linspace(100, 200, 200)
+    manager = ReplayIndicatorManager(close)
+    manager.advance(50, close[50])
+    assert not manager.is_warm()
+    manager.advance(150, close[150])
+    assert manager.is_warm()
+
+
+def test_price_only_snapshot_keeps_previous_indicators():
+    manager = ReplayIndicatorManager(np.ones(3))
+    manager.advance(1, 5.0)
+    previous = MarketSnapshot("d", 1.0, 2.0, 3.0, 4.0, 50.0)
+
+    snapshot = manager.fetch_price_only_snapshot(previous, mark_price=True)
+
+    assert snapshot.price == 5.0
+    assert (snapshot.macd_12, snapshot.ema_100) == (2.0, 4.0)
@@ -0,0 +1,154 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+from backtest.vectorized_backtester import VectorizedBacktester
+from binance_adapter.kline_parser import OHLCV
+from bot.data_manager import DataManager
+from bot.performance_tracker import PerformanceTracker
+from bot.states.flat.flat_position_state import FlatPositionState
+import bot.states.active.active_position_state as active_state_module
+from data.market_snapshot import MarketSnapshot
+from utils.logger import Logger
+
+
+def random_walk(size: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 2000 + np.cumsum(rng.normal(0, 2, size))
+
+
+class ReplayAdapter:
+    def __init__(self, backtester: VectorizedBacktester) -> None:
+        self.backtester = backtester
+        self.entries = []
+
+    def resolve_exit_fill(self):
+        return None
+
+    def exits_tracked(self):
+        return False
+
+    def enter_long(self, price, state_block=False):
+        self.entries.append("LONG")
+        return self.backtester.target_prices("LONG", price)
+
+    def enter_short(self, price, state_block=False):
+        self.entries.append("SHORT")
+        return self.backtester.target_prices("SHORT", price)
+
+
+def replay_live_states(monkeypatch, backtester, close):
+    for name in ("log_info", "log_success", "log_failure"):
+        monkeypatch.setattr(Logger, name, staticmethod(lambda _message: None))
+    saved = []
+    monkeypatch.setattr(
+        active_state_module.FileUtils,
+        "save_result",
+        lambda **kwargs: saved.append(kwargs),
+    )
+    parent = SimpleNamespace(
+        data_manager=DataManager(),
+        performance_tracker=PerformanceTracker(),
+        binance_adapter=ReplayAdapter(backtester),
+        symbol_settings=SimpleNamespace(SYMBOL="BTCUSDT", OUTPUT_CSV_PATH="unused.csv"),
+    )
+    indicators = backtester.compute_indicators(close)
+    warm = ~np.isnan(np.column_stack(indicators)).any(axis=1)
+    first = int(warm.argmax())
+
+    def snapshot(i):
+        return MarketSnapshot(
+            str(i),
+            float(close[i]),
+            float(indicators.macd_12[i]),
+            float(indicators.macd_26[i]),
+            float(indicators.ema_100[i]),
+            float(indicators.rsi_6[i]),
+        )
+
+    parent.data_manager.market_snapshot = snapshot(first)
+    if close[first] < indicators.ema_100[first]:
+        parent.data_manager.block_long()
+    else:
+        parent.data_manager.block_short()
+    parent.state = FlatPositionState(parent=parent)
+    for i in range(first + 1, len(close)):
+        parent.data_manager.market_snapshot = snapshot(i)
+        parent.state.apply()
+    return [
+        (int(s["snapshot"].date), s["position"], s["result"]) for s in saved
+    ], parent
+
+
+def test_trades_match_the_live_state_machine(monkeypatch):
+    close = random_walk(6_000)
+    backtester = VectorizedBacktester(tp_ratio=0.004, sl_ratio=0.003, coin_precision=2)
+
+    result = backtester.run_series(close)
+    live_trades, parent = replay_live_states(monkeypatch, backtester, close)
+
+    assert len(result.trades) > 20
+    assert [(t.entry_index, t.position, t.result) for t in result.trades] == (
+        live_trades
+    )
+    assert result.win_count == parent.performance_tracker.win_count
+    assert result.loss_count == parent.performance_tracker.loss_count
+
+
+def test_entries_alternate_sides_and_follow_blocking_rules():
+    result = VectorizedBacktester(0.004, 0.003, 2).run_series(random_walk(6_000, 3))
+    positions = [trade.position for trade in result.trades]
+    assert all(a != b for a, b in zip(positions, positions[1:]))
+    assert all(
+        prev.exit_index < trade.entry_index
+        for prev, trade in zip(result.trades, result.trades[1:])
+    )
+
+
+def test_target_prices_are_rounded_like_the_account_manager():
+    backtester = VectorizedBacktester(tp_ratio=0.1, sl_ratio=0.05, coin_precision=1)
+    assert backtester.target_prices("LONG", 100.04) == (110.0, 95.0)
+    assert backtester.target_prices("SHORT", 100.0) == (90.0, 105.0)
+
+
+def test_run_uses_open_times_and_exit_prices():
+    close = random_walk(3_000, 11)
+    open_time = np.arange(len(close), dtype=np.int64) * 60_000
+    ohlcv = OHLCV(open_time, close, close, close, close, close)
+
+    trade = VectorizedBacktester(0.004, 0.003, 2).run(ohlcv).trades[0]
+
+    assert trade.entry_time == trade.entry_index * 60_000
+    assert trade.exit_time == trade.exit_index * 60_000
+    assert trade.exit_price == (trade.tp_price if trade.is_tp else trade.sl_price)
+
+
+def test_open_position_at_the_end_is_not_reported():
+    close = random_walk(3_000, 5)
+    backtester = VectorizedBacktester(tp_ratio=10.0, sl_ratio=10.0, coin_precision=2)
+    long_mask, short_mask = backtester.entry_masks(
+        close, backtester.compute_indicators(close)
+    )
+    assert long_mask.any() and short_mask.any()
+    assert backtester.run_series(close).trades == []
+
+
+def test_too_short_series_has_no_trades():
+    result = VectorizedBacktester(0.01, 0.01, 2).run_series(np.linspace(1, 2, 50))
+    assert result.trades == [] and result.win_rate == 0.0
+
+
+def test_find_exit_scans_across_growing_chunks():
+    backtester = VectorizedBacktester(0.01, 0.01, 2)
+    close = np.ones(5_000)
+    close[3_000] = 2.0
+    assert backtester._find_exit(close, 1, upper=1.5, lower=0.5) == 3_000
+    assert backtester._find_exit(close, 3_001, upper=1.5, lower=0.5) is None
+
+
+@pytest.mark.parametrize("position", ["LONG", "SHORT"])
+def test_short_and_long_exits_use_strict_comparisons(position):
+    backtester = VectorizedBacktester(0.01, 0.01, 2)
+    tp_price, sl_price = backtester.target_prices(position, 100.0)
+    upper, lower = max(tp_price, sl_price), min(tp_price, sl_price)
+    close = np.array([100.0, upper, lower, upper + 0.01])
+    assert backtester._find_exit(close, 1, upper, lower) == 3
@@ -0,0 +1,90 @@
+import asyncio
+import json
+import threading
+from typing import Any, Dict, List
+import pytest
+from websockets.asyncio.server import serve, ServerConnection
+
+
+class FakeWebSocketServer:
+    """Local WebSocket server sending scripted messages to each connection."""
+
+    def __init__(self) -> None:
+        self.scripts: List[List[Any]] = []
+        self.paths: List[str] = []
+        self.port: int = 0
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._stop: asyncio.Future
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"ws://127.0.0.1:{self.port}"
+
+    async def _handler(self, connection: ServerConnection) -> None:
+        assert connection.request is not None
+        self.paths.append(connection.request.path)
+        script = self.scripts.pop(0) if self.scripts else []
+        for message in script:
+            text = message if isinstance(message, str) else json.dumps(message)
+            await connection.send(text)
+        if self.scripts:
+            return  # close so the client reconnects for the next script
+        await asyncio.Future()
+
+    async def _serve(self) -> None:
+        self._stop = self._loop.create_future()
+        async with serve(self._handler, "127.0.0.1", 0) as server:
+            self.port = server.sockets[0].getsockname()[1]
+            self._ready.set()
+            await self._stop
+
+    def _run(self) -> None:
+        self._loop.run_until_complete(self._serve())
+
+    def start(self) -> None:
+        self._thread.start()
+        self._ready.wait(5)
+
+    def stop(self) -> None:
+        self._loop.call_soon_threadsafe(self._stop.set_result, None)
+        self._thread.join(5)
+
+
+@pytest.fixture
+def fake_ws_server():
+    server = FakeWebSocketServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+def make_kline_event(
+    open_time: int, close: str, closed: bool = False
+) -> Dict[str, Any]:
+    return {
+        "stream": "btcusdt@kline_1m",
+        "data": {
+            "e": "kline",
+            "k": {
+                "t": open_time,
+                "T": open_time + 59_999,
+                "o": "1",
+                "h": "2",
+                "l": "0.5",
+                "c": close,
+                "v": "10",
+                "n": 3,
+                "x": closed,
+                "q": "20",
+                "V": "4",
+                "Q": "8",
+            },
+        },
+    }
+
+
+@pytest.fixture
+def kline_event():
+    return make_kline_event
@@ -1,8 +1,11 @@
+from decimal import Decimal
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 import pytest
 from binance_adapter.account_manager import AccountManager
 import binance_adapter.account_manager as account_manager_module
+from bot.symbol_settings import SymbolSettings
+from binance_adapter.exchange_filter_cache import SymbolFilters
 
 
 @pytest.fixture(autouse=True)
@@ -148,3 +151,272 @@ def test_place_sl_order_short_builds_correct_payload(client):
     assert order_kwargs["workingType"] == "MARK_PRICE"
     assert order_kwargs["timeInForce"] == "GTE_GTC"
     assert order_kwargs["priceProtect"] == "true"
+
+
+def test_symbol_settings_override_position_settings(client):
+    symbol_settings = SymbolSettings("ETHUSDT", 1, 0.1, 0.05, 2, "eth.csv")
+    account_manager = AccountManager(client, symbol_settings)
+
+    account_manager.place_sl_order(order_type="LONG", quantity=1.0, sl_price=95.0)
+
+    assert client.futures_create_order.call_args.kwargs["symbol"] == "ETHUSDT"
+    assert account_manager.get_coin_amount(100.0, 50.0) == pytest.approx(4.0)
+    assert account_manager.calculate_target_prices("LONG", 100.0) == (110.0, 95.0)
+    assert account_manager.calculate_target_prices("SHORT", 100.0) == (90.0, 105.0)
+
+
+def accepted(order_id: int) -> dict:
+    return {"orderId": order_id, "status": "NEW"}
+
+
+REJECTED = {"code": -2021, "msg": "Order would immediately trigger."}
+
+
+def test_bracket_order_params_are_string_legs(client):
+    legs = AccountManager(client).bracket_order_params("LONG", 1.5, 110.0, 95.0)
+
+    assert [(leg["type"], leg["side"]) for leg in legs] == [
+        ("MARKET", "BUY"),
+        ("TAKE_PROFIT_MARKET", "SELL"),
+        ("STOP_MARKET", "SELL"),
+    ]
+    assert legs[1]["stopPrice"] == "110.0" and legs[2]["stopPrice"] == "95.0"
+    assert all(isinstance(v, str) for leg in legs for v in leg.values())
+
+
+def test_place_bracket_orders_sends_one_batch_request(client):
+    client.futures_place_batch_order.return_value = [
+        accepted(1),
+        accepted(2),
+        accepted(3),
+    ]
+
+    AccountManager(client).place_bracket_orders("SHORT", 2.0, 90.0, 105.0)
+
+    batch = client.futures_place_batch_order.call_args.kwargs["batchOrders"]
+    assert [leg["positionSide"] for leg in batch] == ["SHORT"] * 3
+    client.futures_create_order.assert_not_called()
+    client.futures_cancel_orders.assert_not_called()
+
+
+def test_rejected_exit_leg_closes_the_position_and_cancels_the_other(client):
+    client.futures_place_batch_order.return_value = [
+        accepted(1),
+        accepted(2),
+        REJECTED,
+    ]
+
+    with pytest.raises(RuntimeError, match="stop-loss: -2021"):
+        AccountManager(client).place_bracket_orders("LONG", 1.0, 110.0, 95.0)
+
+    client.futures_create_order.assert_called_once_with(
+        symbol="BTCUSDT", quantity=1.0, type="MARKET", side="SELL", positionSide="LONG"
+    )
+    client.futures_cancel_orders.assert_called_once_with(
+        symbol="BTCUSDT", orderidlist=[2]
+    )
+
+
+def test_rejected_entry_only_cancels_the_exit_legs(client):
+    client.futures_place_batch_order.return_value = [REJECTED, accepted(2), accepted(3)]
+    client.futures_create_order.side_effect = AssertionError("nothing to close")
+
+    with pytest.raises(RuntimeError, match="entry: -2021"):
+        AccountManager(client).place_bracket_orders("SHORT", 1.0, 90.0, 105.0)
+
+    client.futures_cancel_orders.assert_called_once_with(
+        symbol="BTCUSDT", orderidlist=[2, 3]
+    )
+
+
+def test_exit_legs_are_cancelled_even_if_closing_fails(client):
+    client.futures_place_batch_order.return_value = [accepted(1), REJECTED, accepted(3)]
+    client.futures_create_order.side_effect = ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        AccountManager(client).place_bracket_orders("LONG", 1.0, 110.0, 95.0)
+
+    client.futures_cancel_orders.assert_called_once_with(
+        symbol="BTCUSDT", orderidlist=[3]
+    )
+
+
+def test_rejected_legs_reports_missing_results():
+    assert AccountManager.rejected_legs([accepted(1)]) == [
+        "take-profit: None None",
+        "stop-loss: None None",
+    ]
+
+
+def make_stream(fresh: bool):
+    stream = MagicMock()
+    stream.get_balance.return_value = 77.0 if fresh else None
+    stream.get_position.return_value = SimpleNamespace(amount=-0.5) if fresh else None
+    return stream
+
+
+def test_fresh_account_stream_serves_balance_and_position(client):
+    account_manager = AccountManager(client)
+    account_manager.account_stream = make_stream(fresh=True)
+
+    assert account_manager.get_account_balance() == 77.0
+    assert account_manager.get_position_amount("SHORT") == -0.5
+    account_manager.account_stream.get_position.assert_called_once_with(
+        "BTCUSDT", "SHORT"
+    )
+    client.futures_account_balance.assert_not_called()
+    client.futures_position_information.assert_not_called()
+
+
+def test_stale_account_stream_falls_back_to_rest(client):
+    client.futures_account_balance.return_value = [{"asset": "USDT", "balance": "12.5"}]
+    client.futures_position_information.return_value = [
+        {"positionSide": "LONG", "positionAmt": "0.3"},
+        {"positionSide": "SHORT", "positionAmt": "0"},
+    ]
+    account_manager = AccountManager(client)
+    account_manager.account_stream = make_stream(fresh=False)
+
+    assert account_manager.get_account_balance() == 12.5
+    assert account_manager.get_position_amount("LONG") == 0.3
+    client.futures_position_information.assert_called_once_with(symbol="BTCUSDT")
+
+
+def test_position_amount_is_zero_when_side_is_missing(client):
+    client.futures_position_information.return_value = []
+    assert AccountManager(client).get_position_amount("LONG") == 0.0
+
+
+def make_filters() -> SymbolFilters:
+    return SymbolFilters(Decimal("0.5"), Decimal("0.01"), Decimal("0.01"), Decimal("5"))
+
+
+def test_exchange_filters_round_target_prices_and_quantities(client):
+    symbol_settings = SymbolSettings("BTCUSDT", 4, 0.013, 0.007, 1, "btc.csv")
+    account_manager = AccountManager(client, symbol_settings)
+    cache = MagicMock()
+    cache.get.return_value = make_filters()
+
+    account_manager.use_exchange_filters(cache)
+
+    cache.get.assert_called_once_with("BTCUSDT")
+    assert account_manager.calculate_target_prices("LONG", 1000.0) == (
+        1013.0,
+        993.0,
+    )
+    assert account_manager.order_quantity(0.0789, 100.0) == 0.07
+    with pytest.raises(ValueError, match="below the exchange minimums"):
+        account_manager.order_quantity(0.0499, 100.0)
+
+
+def test_missing_exchange_filters_keep_coin_precision(client, monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        account_manager_module.Logger, "log_info", lambda m: logged.append(m)
+    )
+    symbol_settings = SymbolSettings("BTCUSDT", 1, 0.013, 0.007, 1, "btc.csv")
+    account_manager = AccountManager(client, symbol_settings)
+    cache = MagicMock()
+    cache.get.return_value = None
+
+    account_manager.use_exchange_filters(cache)
+
+    assert logged == ["No exchange filters for BTCUSDT, rounding with COIN_PRECISION"]
+    assert account_manager.calculate_target_prices("LONG", 1000.0) == (1013.0, 993.0)
+    assert account_manager.order_quantity(0.0789, 100.0) == 0.0789
+
+
+def make_tracking_stream(connections: int = 1, fresh: bool = True):
+    stream = MagicMock()
+    stream.connections = connections
+    stream.is_fresh.return_value = fresh
+    stream.get_order_update.return_value = None
+    return stream
+
+
+def test_placed_exit_orders_are_tracked_on_the_stream(client):
+    client.futures_create_order.side_effect = [
+        accepted(1),
+        accepted(2),
+        accepted(3),
+        accepted(4),
+    ]
+    account_manager = AccountManager(client)
+    account_manager.account_stream = make_tracking_stream()
+
+    account_manager.enter_position("LONG", 1.0)
+    account_manager.place_tp_order("LONG", 1.0, 110.0)
+    assert not account_manager.exits_tracked()
+    account_manager.place_sl_order("LONG", 1.0, 95.0)
+
+    assert account_manager.exit_order_ids == {"take-profit": 2, "stop-loss": 3}
+    assert account_manager.exits_tracked()
+    stream = account_manager.account_stream
+    assert [c.args for c in stream.track_order.call_args_list] == [(2,), (3,)]
+    stream.connections = 2
+    assert not account_manager.exits_tracked()
+
+    account_manager.enter_position("LONG", 1.0)
+    assert [c.args for c in stream.untrack_order.call_args_list] == [(2,), (3,)]
+
+
+def test_bracket_exit_orders_are_tracked(client):
+    client.futures_place_batch_order.return_value = [
+        accepted(1),
+        accepted(2),
+        accepted(3),
+    ]
+    account_manager = AccountManager(client)
+
+    account_manager.place_bracket_orders("SHORT", 2.0, 90.0, 105.0)
+
+    assert account_manager.exit_order_ids == {"take-profit": 2, "stop-loss": 3}
+    assert not account_manager.exits_tracked()
+
+
+def test_exit_fill_is_found_and_the_other_leg_cancelled(client):
+    account_manager = AccountManager(client)
+    assert account_manager.find_exit_fill() is None
+    stream = make_tracking_stream()
+    account_manager.account_stream = stream
+    account_manager.exit_order_ids = {"take-profit": 2, "stop-loss": 3}
+    updates = {2: {"X": "NEW"}, 3: {"X": "FILLED", "ap": "94.9"}}
+    stream.get_order_update.side_effect = updates.get
+
+    fill = account_manager.find_exit_fill()
+    assert fill == account_manager_module.ExitFill(False, 94.9)
+
+    account_manager.cancel_remaining_exit(fill)
+
+    client.futures_cancel_order.assert_called_once_with(symbol="BTCUSDT", orderId=2)
+    assert account_manager.exit_order_ids == {}
+    assert [c.args for c in stream.untrack_order.call_args_list] == [(2,), (3,)]
+    account_manager.cancel_remaining_exit(fill)
+    client.futures_cancel_order.assert_called_once()
+
+
+def test_failed_exit_cancel_is_logged(client, monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        account_manager_module.Logger, "log_exception", lambda m: logged.append(m)
+    )
+    client.futures_cancel_order.side_effect = RuntimeError("Unknown order")
+    account_manager = AccountManager(client)
+    account_manager.exit_order_ids = {"take-profit": 2, "stop-loss": 3}
+
+    account_manager.cancel_remaining_exit(account_manager_module.ExitFill(True, 1.0))
+
+    assert logged == ["Exit order 3 cancel failed: Unknown order"]
+
+
+def test_exit_fill_is_fetched_over_rest(client):
+    account_manager = AccountManager(client)
+    account_manager.exit_order_ids = {"take-profit": 2, "stop-loss": 3}
+    orders = {2: {"status": "FILLED", "avgPrice": "110.5"}, 3: {"status": "NEW"}}
+    client.futures_get_order.side_effect = lambda symbol, orderId: orders[orderId]
+
+    assert account_manager.fetch_exit_fill() == account_manager_module.ExitFill(
+        True, 110.5
+    )
+    orders[2] = {"status": "CANCELED"}
+    assert account_manager.fetch_exit_fill() is None
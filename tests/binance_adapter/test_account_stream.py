@@ -0,0 +1,193 @@
+import time
+from unittest.mock import MagicMock
+import pytest
+from binance_adapter.account_stream import AccountStream, PositionInfo
+import binance_adapter.account_stream as account_stream_module
+
+
+def wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def client():
+    rest_client = MagicMock()
+    rest_client.futures_stream_get_listen_key.return_value = "key1"
+    rest_client.futures_account_balance.return_value = [
+        {"asset": "USDT", "balance": "100.5"},
+        {"asset": "BNB", "balance": "1"},
+    ]
+    rest_client.futures_position_information.return_value = [
+        {
+            "symbol": "BTCUSDT",
+            "positionSide": "LONG",
+            "positionAmt": "0.2",
+            "entryPrice": "50000",
+        }
+    ]
+    return rest_client
+
+
+def account_update(wallet_balance: str, amount: str) -> dict:
+    return {
+        "e": "ACCOUNT_UPDATE",
+        "a": {
+            "B": [{"a": "USDT", "wb": wallet_balance, "cw": wallet_balance}],
+            "P": [{"s": "BTCUSDT", "ps": "LONG", "pa": amount, "ep": "51000"}],
+        },
+    }
+
+
+def connected_stream(client) -> AccountStream:
+    stream = AccountStream(client, base_url="wss://host/")
+    assert stream._get_url() == "wss://host/ws/key1"
+    stream._on_connect()
+    stream.is_connected = True
+    return stream
+
+
+def test_seeds_from_rest_and_serves_from_memory(client):
+    stream = connected_stream(client)
+
+    assert stream.is_fresh()
+    assert stream.get_balance() == 100.5
+    assert stream.get_balance("ETH") == 0.0
+    assert stream.get_position("BTCUSDT", "LONG") == PositionInfo(0.2, 50000.0)
+    assert stream.get_position("BTCUSDT", "SHORT") == PositionInfo(0.0, 0.0)
+
+
+def test_account_updates_replace_balances_and_positions(client):
+    stream = connected_stream(client)
+
+    stream._handle_message(account_update("90.25", "0"))
+
+    assert stream.get_balance() == 90.25
+    assert stream.get_position("BTCUSDT", "LONG") == PositionInfo(0.0, 51000.0)
+    assert stream.get_balance("BNB") == 1.0
+
+
+def test_order_updates_keep_the_latest_payload_per_order(client, monkeypatch):
+    stream = connected_stream(client)
+    monkeypatch.setattr(stream, "MAX_ORDER_UPDATES", 2)
+
+    for order_id, status in [(1, "NEW"), (2, "NEW"), (1, "FILLED"), (3, "NEW")]:
+        stream._handle_message(
+            {"e": "ORDER_TRADE_UPDATE", "o": {"i": order_id, "X": status}}
+        )
+    stream._handle_message({"e": "MARGIN_CALL"})
+
+    assert list(stream.order_updates) == [1, 3]
+    assert stream.get_order_update(1) == {"i": 1, "X": "FILLED"}
+    assert stream.get_order_update(2) is None
+    assert stream.connections == 1
+
+
+def test_updates_of_tracked_orders_are_never_dropped(client, monkeypatch):
+    stream = connected_stream(client)
+    monkeypatch.setattr(stream, "MAX_ORDER_UPDATES", 2)
+    stream.track_order(1)
+
+    for order_id in range(1, 6):
+        stream._handle_message(
+            {"e": "ORDER_TRADE_UPDATE", "o": {"i": order_id, "X": "FILLED"}}
+        )
+
+    assert list(stream.order_updates) == [1, 5]
+    stream.untrack_order(1)
+    stream._handle_message({"e": "ORDER_TRADE_UPDATE", "o": {"i": 6, "X": "NEW"}})
+    assert list(stream.order_updates) == [5, 6]
+    assert stream.tracked_orders == set()
+
+    stream.track_order(5)
+    stream.track_order(6)
+    stream._handle_message({"e": "ORDER_TRADE_UPDATE", "o": {"i": 7, "X": "NEW"}})
+    assert list(stream.order_updates) == [5, 6, 7]
+
+
+def test_cache_is_stale_when_disconnected_or_listen_key_lapsed(client, monkeypatch):
+    stream = AccountStream(client)
+    assert stream.get_balance() is None
+
+    stream = connected_stream(client)
+    stream.is_connected = False
+    assert stream.get_balance() is None
+    assert stream.get_position("BTCUSDT", "LONG") is None
+
+    stream.is_connected = True
+    now = account_stream_module.DateUtils.get_timestamp_ms()
+    monkeypatch.setattr(
+        account_stream_module.DateUtils,
+        "get_timestamp_ms",
+        lambda: now + AccountStream.LISTEN_KEY_TTL_MS,
+    )
+    assert not stream.is_fresh()
+
+
+def test_expired_listen_key_marks_the_cache_stale(client):
+    stream = connected_stream(client)
+    stream._handle_message({"e": "listenKeyExpired"})
+    assert not stream.is_fresh()
+
+
+def test_keepalive_extends_the_listen_key_and_logs_failures(client, monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        account_stream_module.Logger, "log_exception", lambda m: logged.append(m)
+    )
+    stream = AccountStream(client)
+    stream.listen_key = "key1"
+    waits = iter([False, False, True])
+    monkeypatch.setattr(stream._stopped, "wait", lambda _timeout: next(waits))
+    client.futures_stream_keepalive.side_effect = [None, RuntimeError("timeout")]
+
+    stream._keepalive_forever()
+
+    assert client.futures_stream_keepalive.call_count == 2
+    client.futures_stream_keepalive.assert_called_with(listenKey="key1")
+    assert stream._listen_key_ms is not None
+    assert logged == ["Listen key keepalive failed: timeout"]
+
+
+def test_streams_from_fake_server_and_closes_the_listen_key(fake_ws_server, client):
+    fake_ws_server.scripts = [[account_update("80", "0.1")]]
+    stream = AccountStream(client, base_url=fake_ws_server.url)
+    stream.start()
+    stream.start()
+    try:
+        assert wait_until(lambda: stream.get_balance() == 80.0)
+    finally:
+        stream.stop()
+
+    assert fake_ws_server.paths == ["/ws/key1"]
+    assert stream.get_position("BTCUSDT", "LONG") is None
+    client.futures_stream_close.assert_called_once_with(listenKey="key1")
+    assert stream.listen_key is None
+
+
+def test_listen_key_close_failure_is_logged(client, monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        account_stream_module.Logger, "log_exception", lambda m: logged.append(m)
+    )
+    client.futures_stream_close.side_effect = RuntimeError("gone")
+    stream = AccountStream(client)
+    stream.listen_key = "key1"
+
+    stream.stop()
+
+    assert logged == ["Listen key close failed: gone"]
+
+
+def test_create_builds_its_own_client(monkeypatch):
+    built = MagicMock()
+    monkeypatch.setattr(account_stream_module, "Client", built)
+
+    stream = AccountStream.create("pub", "sec")
+
+    built.assert_called_once_with("pub", "sec")
+    assert stream.client is built.return_value
@@ -0,0 +1,213 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from binance_adapter.async_account_manager import AsyncAccountManager
+import binance_adapter.account_manager as account_manager_module
+import binance_adapter.async_account_manager as async_account_manager_module
+from binance_adapter.account_manager import ExitFill
+from bot.symbol_settings import SymbolSettings
+
+
+@pytest.fixture(autouse=True)
+def patch_settings(monkeypatch):
+    fake_settings = SimpleNamespace(LEVERAGE="10", SYMBOL="BTCUSDT")
+    monkeypatch.setattr(
+        account_manager_module, "SETTINGS", fake_settings, raising=False
+    )
+
+
+@pytest.fixture
+def client():
+    async_client = MagicMock()
+    async_client.futures_account_balance = AsyncMock(return_value=[])
+    async_client.futures_create_order = AsyncMock()
+    async_client.futures_place_batch_order = AsyncMock()
+    async_client.futures_cancel_orders = AsyncMock()
+    return async_client
+
+
+def test_uses_given_symbol_settings(client):
+    symbol_settings = SymbolSettings("ETHUSDT", 1, 0.1, 0.05, 2, "eth.csv")
+    manager = AsyncAccountManager(client, symbol_settings)
+
+    asyncio.run(manager.async_enter_position("LONG", 3.0))
+
+    assert manager.get_coin_amount(100.0, 50.0) == pytest.approx(4.0)
+    assert manager.calculate_target_prices("LONG", 100.0) == (110.0, 95.0)
+    assert client.futures_create_order.await_args.kwargs["symbol"] == "ETHUSDT"
+
+
+def test_get_coin_amount_uses_leverage(client):
+    assert AsyncAccountManager(client).get_coin_amount(100.0, 200.0) == pytest.approx(
+        5.0
+    )
+
+
+def test_get_account_balance_awaits_balance_and_returns_usdt(client):
+    client.futures_account_balance.return_value = [
+        {"asset": "BTC", "balance": "0.01"},
+        {"asset": "USDT", "balance": "123.45"},
+    ]
+    balance = asyncio.run(AsyncAccountManager(client).async_get_account_balance())
+    assert balance == pytest.approx(123.45)
+    client.futures_account_balance.assert_awaited_once_with()
+
+
+def test_enter_position_awaits_market_order(client):
+    asyncio.run(AsyncAccountManager(client).async_enter_position("SHORT", 1.5))
+    client.futures_create_order.assert_awaited_once_with(
+        symbol="BTCUSDT",
+        quantity=1.5,
+        type="MARKET",
+        side="SELL",
+        positionSide="SHORT",
+    )
+
+
+def test_place_exit_orders_submits_tp_and_sl_together(client):
+    manager = AsyncAccountManager(client)
+    asyncio.run(manager.async_place_exit_orders("LONG", 2.0, 110, 95))
+
+    orders = [call.kwargs for call in client.futures_create_order.await_args_list]
+    assert [(o["type"], o["stopPrice"], o["side"]) for o in orders] == [
+        ("TAKE_PROFIT_MARKET", 110, "SELL"),
+        ("STOP_MARKET", 95, "SELL"),
+    ]
+    assert all(o["positionSide"] == "LONG" and o["quantity"] == 2.0 for o in orders)
+
+
+def test_place_bracket_orders_sends_one_batch_request(client):
+    client.futures_place_batch_order.return_value = [
+        {"orderId": 1},
+        {"orderId": 2},
+        {"orderId": 3},
+    ]
+
+    asyncio.run(
+        AsyncAccountManager(client).async_place_bracket_orders("LONG", 2.0, 110, 95)
+    )
+
+    batch = client.futures_place_batch_order.await_args.kwargs["batchOrders"]
+    assert [leg["type"] for leg in batch] == [
+        "MARKET",
+        "TAKE_PROFIT_MARKET",
+        "STOP_MARKET",
+    ]
+    client.futures_create_order.assert_not_awaited()
+    client.futures_cancel_orders.assert_not_awaited()
+
+
+def test_partial_bracket_is_rolled_back(client):
+    client.futures_place_batch_order.return_value = [
+        {"orderId": 1},
+        {"code": -4164, "msg": "Notional too small"},
+        {"orderId": 3},
+    ]
+    manager = AsyncAccountManager(client)
+
+    with pytest.raises(RuntimeError, match="take-profit: -4164"):
+        asyncio.run(manager.async_place_bracket_orders("SHORT", 2.0, 90, 105))
+
+    client.futures_create_order.assert_awaited_once_with(
+        symbol="BTCUSDT", quantity=2.0, type="MARKET", side="BUY", positionSide="SHORT"
+    )
+    client.futures_cancel_orders.assert_awaited_once_with(
+        symbol="BTCUSDT", orderidlist=[3]
+    )
+
+
+def test_fully_rejected_bracket_needs_no_rollback(client):
+    client.futures_place_batch_order.return_value = [
+        {"code": -2019, "msg": "Margin"}
+    ] * 3
+
+    with pytest.raises(RuntimeError, match="entry: -2019"):
+        asyncio.run(
+            AsyncAccountManager(client).async_place_bracket_orders("LONG", 1, 110, 95)
+        )
+
+    client.futures_create_order.assert_not_awaited()
+    client.futures_cancel_orders.assert_not_awaited()
+
+
+def test_fresh_account_stream_skips_rest_requests(client):
+    manager = AsyncAccountManager(client)
+    manager.account_stream = MagicMock()
+    manager.account_stream.get_balance.return_value = 55.0
+    manager.account_stream.get_position.return_value = SimpleNamespace(amount=1.5)
+
+    assert asyncio.run(manager.async_get_account_balance()) == 55.0
+    assert asyncio.run(manager.async_get_position_amount("LONG")) == 1.5
+    client.futures_account_balance.assert_not_awaited()
+
+
+def test_position_amount_falls_back_to_rest_without_stream(client):
+    client.futures_position_information = AsyncMock(
+        return_value=[{"positionSide": "SHORT", "positionAmt": "-2"}]
+    )
+    manager = AsyncAccountManager(client)
+
+    assert asyncio.run(manager.async_get_position_amount("SHORT")) == -2.0
+    client.futures_position_information.assert_awaited_once_with(symbol="BTCUSDT")
+
+
+def test_placed_exit_orders_are_tracked(client):
+    client.futures_create_order.side_effect = [
+        {"orderId": 1},
+        {"orderId": 2},
+        {"orderId": 3},
+    ]
+    manager = AsyncAccountManager(client)
+
+    asyncio.run(manager.async_enter_position("LONG", 1.0))
+    asyncio.run(manager.async_place_exit_orders("LONG", 1.0, 110.0, 95.0))
+
+    assert manager.exit_order_ids == {"take-profit": 2, "stop-loss": 3}
+
+    client.futures_place_batch_order.return_value = [
+        {"orderId": 4},
+        {"orderId": 5},
+        {"orderId": 6},
+    ]
+    asyncio.run(manager.async_place_bracket_orders("SHORT", 1.0, 90.0, 105.0))
+    assert manager.exit_order_ids == {"take-profit": 5, "stop-loss": 6}
+
+
+def test_remaining_exit_is_cancelled_and_failures_logged(client, monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        async_account_manager_module.Logger,
+        "log_exception",
+        lambda m: logged.append(m),
+    )
+    client.futures_cancel_order = AsyncMock()
+    manager = AsyncAccountManager(client)
+    fill = ExitFill(True, 110.5)
+
+    manager.exit_order_ids = {"take-profit": 2, "stop-loss": 3}
+    asyncio.run(manager.async_cancel_remaining_exit(fill))
+    client.futures_cancel_order.assert_awaited_once_with(symbol="BTCUSDT", orderId=3)
+
+    asyncio.run(manager.async_cancel_remaining_exit(fill))
+    client.futures_cancel_order.assert_awaited_once()
+
+    client.futures_cancel_order.side_effect = RuntimeError("Unknown order")
+    manager.exit_order_ids = {"take-profit": 2, "stop-loss": 3}
+    asyncio.run(manager.async_cancel_remaining_exit(fill))
+    assert logged == ["Exit order 3 cancel failed: Unknown order"]
+
+
+def test_exit_fill_is_fetched_over_rest(client):
+    manager = AsyncAccountManager(client)
+    manager.exit_order_ids = {"take-profit": 2, "stop-loss": 3}
+    orders = {2: {"status": "NEW"}, 3: {"status": "FILLED", "avgPrice": "95.5"}}
+
+    async def get_order(symbol, orderId):
+        return orders[orderId]
+
+    client.futures_get_order = AsyncMock(side_effect=get_order)
+
+    assert asyncio.run(manager.async_fetch_exit_fill()) == ExitFill(False, 95.5)
+    orders[3] = {"status": "CANCELED"}
+    assert asyncio.run(manager.async_fetch_exit_fill()) is None
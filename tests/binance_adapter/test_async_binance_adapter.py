@@ -0,0 +1,315 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from binance_adapter.async_binance_adapter import AsyncBinanceAdapter
+import binance_adapter.async_binance_adapter as async_adapter_module
+import binance_adapter.account_manager as account_manager_module
+from binance_adapter.account_manager import AccountManager
+from binance_adapter.rate_limiter import RateLimiter
+from binance_adapter.request_timings import RequestTimings
+from bot.symbol_settings import SymbolSettings
+
+
+class FakeAccountManager(AccountManager):
+    def __init__(self, client, symbol_settings=None):
+        super().__init__(client, symbol_settings)
+        self.calls = []
+
+    def get_coin_amount(self, balance, price):
+        return balance / price
+
+    async def async_get_account_balance(self):
+        return 1000.0
+
+    async def async_enter_position(self, order_type, quantity):
+        self.calls.append(("enter", order_type, quantity))
+
+    async def async_place_exit_orders(self, order_type, quantity, tp_price, sl_price):
+        self.calls.append(("exits", order_type, quantity, tp_price, sl_price))
+
+    async def async_place_bracket_orders(
+        self, order_type, quantity, tp_price, sl_price
+    ):
+        self.calls.append(("bracket", order_type, quantity, tp_price, sl_price))
+
+
+class FakeIndicatorManager:
+    def __init__(self, client, symbol_settings=None):
+        self.client = client
+        self.symbol_settings = symbol_settings
+
+
+@pytest.fixture
+def base_settings():
+    return SimpleNamespace(
+        API_PUBLIC_KEY="pub",
+        API_SECRET_KEY="sec",
+        SYMBOL="BTCUSDT",
+        LEVERAGE=20,
+        TP_RATIO=0.02,
+        SL_RATIO=0.01,
+        COIN_PRECISION=2,
+        TEST_MODE=False,
+        BATCH_ORDERS=False,
+        ACCOUNT_STREAM=False,
+        EXCHANGE_FILTERS=False,
+        RATE_LIMIT=False,
+        HTTP_TUNING=False,
+        HTTP_POOL_SIZE=10,
+        HTTP_CONNECT_TIMEOUT=3.0,
+        HTTP_READ_TIMEOUT=10.0,
+        CHECKPOINT=False,
+        BUFFERED_RESULTS=False,
+        RESULTS_FSYNC="batch",
+        TRADE_JOURNAL=False,
+        TICK_JOURNAL=False,
+        TICK_SEGMENT_MB=64,
+    )
+
+
+@pytest.fixture(autouse=True)
+def patch_module_symbols(monkeypatch, base_settings):
+    for module in (async_adapter_module, account_manager_module):
+        monkeypatch.setattr(module, "SETTINGS", base_settings, raising=False)
+    monkeypatch.setattr(async_adapter_module, "AsyncAccountManager", FakeAccountManager)
+    monkeypatch.setattr(
+        async_adapter_module, "AsyncIndicatorManager", FakeIndicatorManager
+    )
+
+
+@pytest.fixture
+def client():
+    async_client = MagicMock()
+    async_client.futures_change_leverage = AsyncMock()
+    async_client.close_connection = AsyncMock()
+    async_client.get_server_time = AsyncMock(return_value={"serverTime": 123})
+    return async_client
+
+
+def test_create_opens_client_and_sets_leverage(monkeypatch, client):
+    create = AsyncMock(return_value=client)
+    monkeypatch.setattr(async_adapter_module.AsyncClient, "create", create)
+
+    async def scenario():
+        adapter = await AsyncBinanceAdapter.create()
+        return adapter, asyncio.get_running_loop()
+
+    adapter, loop = asyncio.run(scenario())
+
+    create.assert_awaited_once_with("pub", "sec")
+    assert adapter.client is client and adapter.loop is loop
+    assert adapter.account_manager.client is client
+    assert adapter.indicator_manager.client is client
+    client.futures_change_leverage.assert_awaited_once_with(
+        symbol="BTCUSDT", leverage=20
+    )
+
+
+def test_create_traces_the_client_session_with_a_rate_limiter(
+    monkeypatch, base_settings, client
+):
+    base_settings.RATE_LIMIT = True
+    create = AsyncMock(return_value=client)
+    monkeypatch.setattr(async_adapter_module.AsyncClient, "create", create)
+
+    adapter = asyncio.run(AsyncBinanceAdapter.create())
+
+    assert isinstance(adapter.rate_limiter, RateLimiter)
+    session_params = create.await_args.kwargs["session_params"]
+    assert len(session_params["trace_configs"]) == 1
+    assert create.await_args.args == ("pub", "sec")
+
+
+def test_create_tunes_the_client_session_with_http_tuning(
+    monkeypatch, base_settings, client
+):
+    base_settings.HTTP_TUNING = True
+    base_settings.RATE_LIMIT = True
+    create = AsyncMock(return_value=client)
+    monkeypatch.setattr(async_adapter_module.AsyncClient, "create", create)
+
+    async def scenario():
+        adapter = await AsyncBinanceAdapter.create()
+        await create.await_args.kwargs["session_params"]["connector"].close()
+        return adapter
+
+    adapter = asyncio.run(scenario())
+
+    assert isinstance(adapter.request_timings, RequestTimings)
+    kwargs = create.await_args.kwargs
+    connector = kwargs["session_params"]["connector"]
+    assert connector.limit_per_host == 10 and connector.limit == 20
+    assert len(kwargs["session_params"]["trace_configs"]) == 2
+    timeout = kwargs["requests_params"]["timeout"]
+    assert (timeout.sock_connect, timeout.sock_read) == (3.0, 10.0)
+
+
+def test_create_binds_symbol_settings(monkeypatch, client):
+    monkeypatch.setattr(
+        async_adapter_module.AsyncClient, "create", AsyncMock(return_value=client)
+    )
+    symbol_settings = SymbolSettings("ETHUSDT", 1, 0.1, 0.05, 3, "eth.csv")
+
+    adapter = asyncio.run(AsyncBinanceAdapter.create(symbol_settings))
+
+    assert adapter.symbol_settings is symbol_settings
+    assert adapter.account_manager.symbol_settings is symbol_settings
+    assert adapter.indicator_manager.symbol_settings is symbol_settings
+    client.futures_change_leverage.assert_awaited_once_with(
+        symbol="ETHUSDT", leverage=3
+    )
+
+
+def test_create_skips_leverage_in_test_mode(monkeypatch, base_settings, client):
+    base_settings.TEST_MODE = True
+    monkeypatch.setattr(
+        async_adapter_module.AsyncClient, "create", AsyncMock(return_value=client)
+    )
+    asyncio.run(AsyncBinanceAdapter.create())
+    client.futures_change_leverage.assert_not_awaited()
+
+
+def test_create_starts_account_stream_and_close_stops_it(
+    monkeypatch, base_settings, client
+):
+    base_settings.ACCOUNT_STREAM = True
+    account_stream = MagicMock()
+    build = MagicMock(return_value=account_stream)
+    monkeypatch.setattr(
+        async_adapter_module.AsyncClient, "create", AsyncMock(return_value=client)
+    )
+    monkeypatch.setattr(async_adapter_module.AccountStream, "create", build)
+
+    async def scenario():
+        adapter = await AsyncBinanceAdapter.create()
+        account_stream.stop.assert_not_called()
+        await adapter.close()
+        return adapter
+
+    adapter = asyncio.run(scenario())
+
+    build.assert_called_once_with("pub", "sec")
+    assert adapter.account_manager.account_stream is account_stream
+    account_stream.start.assert_called_once_with()
+    account_stream.stop.assert_called_once_with()
+    client.close_connection.assert_awaited_once_with()
+
+
+def test_create_loads_exchange_filters_once_stale(
+    monkeypatch, base_settings, client, tmp_path
+):
+    base_settings.EXCHANGE_FILTERS = True
+    monkeypatch.setattr(
+        async_adapter_module.AsyncClient, "create", AsyncMock(return_value=client)
+    )
+    monkeypatch.setattr(
+        async_adapter_module.ExchangeFilterCache,
+        "DEFAULT_PATH",
+        tmp_path / "filters.json",
+    )
+    client.futures_exchange_info = AsyncMock(
+        return_value={
+            "symbols": [
+                {
+                    "symbol": "BTCUSDT",
+                    "filters": [
+                        {"filterType": "PRICE_FILTER", "tickSize": "0.5"},
+                        {"filterType": "LOT_SIZE", "stepSize": "1", "minQty": "1"},
+                    ],
+                }
+            ]
+        }
+    )
+
+    first = asyncio.run(AsyncBinanceAdapter.create())
+    second = asyncio.run(AsyncBinanceAdapter.create())
+
+    client.futures_exchange_info.assert_awaited_once_with()
+    for adapter in (first, second):
+        assert adapter.account_manager.calculate_target_prices("LONG", 100.2) == (
+            102.0,
+            99.0,
+        )
+
+
+def test_server_time_and_close_are_awaited(client):
+    adapter = AsyncBinanceAdapter(client)
+    assert asyncio.run(adapter.get_server_time()) == 123
+    asyncio.run(adapter.close())
+    client.close_connection.assert_awaited_once_with()
+
+
+def test_async_enter_position_places_entry_then_exit_orders(client):
+    adapter = AsyncBinanceAdapter(client)
+    tp_price, sl_price = asyncio.run(adapter.async_enter_position("SHORT", 100.0))
+
+    assert (tp_price, sl_price) == (98.0, 101.0)
+    assert adapter.account_manager.calls == [
+        ("enter", "SHORT", 9.5),
+        ("exits", "SHORT", 9.5, 98.0, 101.0),
+    ]
+
+
+def test_async_enter_position_sends_one_bracket_with_batch_orders(
+    client, base_settings
+):
+    base_settings.BATCH_ORDERS = True
+    adapter = AsyncBinanceAdapter(client)
+
+    asyncio.run(adapter.async_enter_position("LONG", 100.0))
+
+    assert adapter.account_manager.calls == [("bracket", "LONG", 9.5, 102.0, 99.0)]
+
+
+def test_async_enter_position_places_no_orders_when_blocked(client):
+    adapter = AsyncBinanceAdapter(client)
+    prices = asyncio.run(adapter.async_enter_position("LONG", 100.0, True))
+    assert prices == (102.0, 99.0)
+    assert adapter.account_manager.calls == []
+
+
+def test_blocking_facade_runs_orders_on_the_adapter_loop(client):
+    results = []
+
+    async def scenario():
+        adapter = AsyncBinanceAdapter(client, loop=asyncio.get_running_loop())
+        results.append(await asyncio.to_thread(adapter.enter_long, 100.0))
+        results.append(await asyncio.to_thread(adapter.enter_short, 100.0))
+        return adapter
+
+    adapter = asyncio.run(scenario())
+
+    assert results == [(102.0, 99.0), (98.0, 101.0)]
+    assert [call[:2] for call in adapter.account_manager.calls] == [
+        ("enter", "LONG"),
+        ("exits", "LONG"),
+        ("enter", "SHORT"),
+        ("exits", "SHORT"),
+    ]
+
+
+def test_blocking_facade_requires_an_event_loop(client):
+    with pytest.raises(RuntimeError, match="not bound to an event loop"):
+        AsyncBinanceAdapter(client).enter_long(100.0)
+
+
+def test_resolve_exit_fill_cancels_on_the_adapter_loop(client):
+    async def scenario():
+        adapter = AsyncBinanceAdapter(client, asyncio.get_running_loop())
+        account_manager = MagicMock()
+        account_manager.async_cancel_remaining_exit = AsyncMock()
+        adapter.account_manager = account_manager
+        account_manager.find_exit_fill.return_value = None
+        assert await asyncio.to_thread(adapter.resolve_exit_fill) is None
+
+        fill = async_adapter_module.ExitFill(False, 95.0)
+        account_manager.find_exit_fill.return_value = fill
+        assert await asyncio.to_thread(adapter.resolve_exit_fill) is fill
+        assert adapter.exits_tracked() is account_manager.exits_tracked.return_value
+        return account_manager
+
+    account_manager = asyncio.run(scenario())
+    account_manager.async_cancel_remaining_exit.assert_awaited_once_with(
+        async_adapter_module.ExitFill(False, 95.0)
+    )
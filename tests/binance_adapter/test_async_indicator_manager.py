@@ -0,0 +1,124 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from binance_adapter.async_indicator_manager import AsyncIndicatorManager
+import binance_adapter.async_indicator_manager as async_indicator_manager_module
+from binance_adapter.indicator_manager import IndicatorManager
+import binance_adapter.indicator_manager as indicator_manager_module
+from data.market_snapshot import MarketSnapshot
+
+
+@pytest.fixture(autouse=True)
+def patch_settings(monkeypatch):
+    fake_settings = SimpleNamespace(
+        SYMBOL="BTCUSDT",
+        INTERVAL="1m",
+        LOOKBACK_TOLERANCE=1e-6,
+    )
+    for module in (indicator_manager_module, async_indicator_manager_module):
+        monkeypatch.setattr(module, "SETTINGS", fake_settings, raising=False)
+
+
+def make_klines(closes, start=0, step=60_000):
+    return [
+        [start + i * step, "0", "0", "0", str(c), "0", start + (i + 1) * step - 1]
+        + ["0"] * 5
+        for i, c in enumerate(closes)
+    ]
+
+
+@pytest.fixture
+def client():
+    async_client = MagicMock()
+    async_client.get_klines = AsyncMock(return_value=[])
+    async_client.get_symbol_ticker = AsyncMock(return_value={"price": "42.5"})
+    async_client.futures_mark_price = AsyncMock(return_value={"markPrice": "41.0"})
+    return async_client
+
+
+def test_async_sync_klines_backfills_then_merges_since_last_open(client):
+    manager = AsyncIndicatorManager(client)
+    client.get_klines.return_value = make_klines([1, 2, 3])
+    asyncio.run(manager.async_sync_klines())
+    client.get_klines.assert_awaited_once_with(
+        symbol="BTCUSDT", interval="1m", limit=manager.lookback_bars
+    )
+
+    client.get_klines.reset_mock()
+    client.get_klines.return_value = make_klines([3.5, 4], start=120_000)
+    klines = asyncio.run(manager.async_sync_klines())
+
+    client.get_klines.assert_awaited_once_with(
+        symbol="BTCUSDT", interval="1m", startTime=120_000, limit=1000
+    )
+    assert [k[4] for k in klines] == ["2", "3.5", "4"]
+
+
+def test_async_fetch_latest_klines_pages_when_over_limit(monkeypatch, client):
+    monkeypatch.setattr(
+        async_indicator_manager_module.DateUtils, "get_timestamp_ms", lambda: 0
+    )
+    client.get_klines.side_effect = [make_klines([1] * 1000), make_klines([2] * 3)]
+    manager = AsyncIndicatorManager(client)
+
+    klines = asyncio.run(manager._async_fetch_latest_klines(1001))
+
+    assert len(klines) == 1001
+    assert client.get_klines.await_count == 2
+
+
+def test_async_fetch_indicators_matches_sync_evaluation(client):
+    closes = [100 + (i % 7) - i * 0.1 for i in range(300)]
+    client.get_klines.return_value = make_klines(closes)
+    manager = AsyncIndicatorManager(client)
+
+    snapshot = asyncio.run(manager.async_fetch_indicators())
+
+    expected = IndicatorManager(client)._evaluate_klines(make_klines(closes))
+    assert isinstance(snapshot, MarketSnapshot)
+    assert snapshot.price == 42.5
+    assert snapshot.ema_100 == pytest.approx(expected.ema_100)
+    assert snapshot.rsi_6 == pytest.approx(expected.rsi_6)
+    client.get_symbol_ticker.assert_awaited_once_with(symbol="BTCUSDT")
+
+
+def test_async_fetch_price_snapshot_skips_klines_while_bar_is_forming(
+    monkeypatch, client
+):
+    client.get_klines.return_value = make_klines([1, 2, 3])
+    manager = AsyncIndicatorManager(client)
+    asyncio.run(manager.async_fetch_indicators())
+    client.get_klines.reset_mock()
+    monkeypatch.setattr(
+        async_indicator_manager_module.DateUtils, "get_timestamp_ms", lambda: 0
+    )
+
+    snapshot = asyncio.run(manager.async_fetch_price_snapshot())
+
+    client.get_klines.assert_not_awaited()
+    assert snapshot.price == 42.5
+
+
+def test_async_fetch_price_snapshot_falls_back_when_bar_closed(client):
+    client.get_klines.return_value = make_klines([1, 2, 3])
+    manager = AsyncIndicatorManager(client)
+
+    asyncio.run(manager.async_fetch_price_snapshot())
+
+    client.get_klines.assert_awaited_once()
+
+
+def test_async_fetch_price_only_snapshot_uses_ticker_or_mark_price(client):
+    client.get_symbol_ticker.return_value = None
+    manager = AsyncIndicatorManager(client)
+    previous = MarketSnapshot("d", 1.0, 2.0, 3.0, 4.0, 5.0)
+
+    last = asyncio.run(manager.async_fetch_price_only_snapshot(previous))
+    mark = asyncio.run(
+        manager.async_fetch_price_only_snapshot(previous, mark_price=True)
+    )
+
+    assert last.price == 0.0
+    assert mark.price == 41.0
+    assert mark.ema_100 == previous.ema_100
@@ -1,9 +1,14 @@
 from types import SimpleNamespace
-from typing import cast
+from typing import Any, cast
 from unittest.mock import MagicMock
 import pytest
+import requests
+from binance_adapter.account_manager import AccountManager
 from binance_adapter.binance_adapter import BinanceAdapter
+from binance_adapter.rate_limited_http_adapter import RateLimitedHTTPAdapter
+from binance_adapter.tuned_http_adapter import TunedHTTPAdapter
 import binance_adapter.binance_adapter as adapter_module
+from bot.symbol_settings import SymbolSettings
 
 
 class FakeClient:
@@ -12,7 +17,12 @@ class FakeClient:
     def __init__(self, api_key, api_secret):
         self.api_key = api_key
         self.api_secret = api_secret
+        self.session = requests.Session()
         self.futures_change_leverage: MagicMock = MagicMock()
+        self.futures_exchange_info: MagicMock = MagicMock()
+        self.get_server_time: MagicMock = MagicMock(
+            return_value={"serverTime": 1_700_000_000_000}
+        )
 
 
 class FakeAccountManager:
@@ -23,19 +33,38 @@ class FakeAccountManager:
     enter_position: MagicMock
     place_tp_order: MagicMock
     place_sl_order: MagicMock
+    place_bracket_orders: MagicMock
+    order_quantity: MagicMock
+    use_exchange_filters: MagicMock
 
-    def __init__(self, client):
+    def __init__(self, client, symbol_settings=None):
         self.client = client
+        self.symbol_settings = symbol_settings or adapter_module.SETTINGS
         self.get_account_balance = MagicMock(return_value=0.0)
         self.get_coin_amount = MagicMock(return_value=0.0)
         self.enter_position = MagicMock()
         self.place_tp_order = MagicMock()
         self.place_sl_order = MagicMock()
+        self.place_bracket_orders = MagicMock()
+        self.order_quantity = MagicMock(side_effect=lambda quantity, _price: quantity)
+        self.use_exchange_filters = MagicMock()
+        self.exchange_filters = None
+
+    def calculate_target_prices(self, order_type, coin_price):
+        return AccountManager.calculate_target_prices(
+            cast(AccountManager, self), order_type, coin_price
+        )
 
 
 class FakeIndicatorManager:
-    def __init__(self, client):
+    def __init__(self, client, symbol_settings=None):
         self.client = client
+        self.symbol_settings = symbol_settings
+        self.kline_cache = object()
+        self.market_stream = None
+
+    def sync_klines(self):
+        return []
 
 
 @pytest.fixture
@@ -49,6 +78,22 @@ def base_settings():
         SL_RATIO=0.01,
         COIN_PRECISION=2,
         TEST_MODE=True,
+        STREAM_MODE=False,
+        INTERVAL="1m",
+        BATCH_ORDERS=False,
+        ACCOUNT_STREAM=False,
+        EXCHANGE_FILTERS=False,
+        RATE_LIMIT=False,
+        HTTP_TUNING=False,
+        HTTP_POOL_SIZE=10,
+        HTTP_CONNECT_TIMEOUT=3.0,
+        HTTP_READ_TIMEOUT=10.0,
+        CHECKPOINT=False,
+        BUFFERED_RESULTS=False,
+        RESULTS_FSYNC="batch",
+        TRADE_JOURNAL=False,
+        TICK_JOURNAL=False,
+        TICK_SEGMENT_MB=64,
     )
 
 
@@ -93,6 +138,71 @@ def test_init_skips_leverage_in_test_mode(base_settings):
     client.futures_change_leverage.assert_not_called()
 
 
+def test_init_attaches_market_stream_in_stream_mode(base_settings):
+    base_settings.STREAM_MODE = True
+    adapter = BinanceAdapter()
+    indicator_manager = cast(FakeIndicatorManager, adapter.indicator_manager)
+    market_stream = cast(adapter_module.MarketStream, indicator_manager.market_stream)
+
+    assert isinstance(market_stream, adapter_module.MarketStream)
+    assert market_stream.symbol == "BTCUSDT"
+    assert market_stream.interval == "1m"
+    assert market_stream.kline_cache is indicator_manager.kline_cache
+    assert not market_stream.is_connected
+
+
+def test_init_attaches_account_stream_on_the_shared_client(base_settings):
+    base_settings.ACCOUNT_STREAM = True
+    adapter = BinanceAdapter()
+    account_stream = adapter.account_manager.account_stream
+
+    assert isinstance(account_stream, adapter_module.AccountStream)
+    assert account_stream.client is adapter.client
+    assert not account_stream.is_connected
+
+
+def test_init_loads_exchange_filters(monkeypatch, base_settings):
+    base_settings.EXCHANGE_FILTERS = True
+    cache_class = MagicMock()
+    monkeypatch.setattr(adapter_module, "ExchangeFilterCache", cache_class)
+
+    adapter = BinanceAdapter()
+    account_manager = cast(FakeAccountManager, adapter.account_manager)
+
+    load = cache_class.return_value.load
+    load.assert_called_once_with(cast(FakeClient, adapter.client).futures_exchange_info)
+    account_manager.use_exchange_filters.assert_called_once_with(load.return_value)
+
+
+def test_init_installs_the_rate_limiter_on_the_client_session(base_settings):
+    adapter = BinanceAdapter()
+    assert adapter.http_adapter is None and adapter.rate_limiter is None
+
+    base_settings.RATE_LIMIT = True
+    adapter = BinanceAdapter()
+
+    mounted = cast(FakeClient, adapter.client).session.get_adapter("https://")
+    assert isinstance(mounted, RateLimitedHTTPAdapter)
+    assert mounted.rate_limiter is adapter.rate_limiter
+
+
+@pytest.mark.parametrize("rate_limit", [False, True])
+def test_init_installs_the_tuned_transport_with_http_tuning(base_settings, rate_limit):
+    base_settings.HTTP_TUNING = True
+    base_settings.RATE_LIMIT = rate_limit
+    base_settings.HTTP_POOL_SIZE = 4
+    adapter = BinanceAdapter()
+
+    mounted = cast(FakeClient, adapter.client).session.get_adapter("https://")
+    assert mounted is adapter.http_adapter
+    assert isinstance(mounted, TunedHTTPAdapter)
+    assert isinstance(mounted, RateLimitedHTTPAdapter) is rate_limit
+    assert mounted.timeout == (3.0, 10.0)
+    assert mounted.timings is not None
+    assert mounted.poolmanager.connection_pool_kw["maxsize"] == 4
+    assert (adapter.rate_limiter is not None) is rate_limit
+
+
 def test_enter_long_prices_no_orders_when_test_mode_true(base_settings):
     base_settings.TEST_MODE = True  # block order placement
     adapter = BinanceAdapter()
@@ -183,3 +293,68 @@ def test_enter_short_prices_no_orders_when_state_block_true(base_settings):
     account_manager.enter_position.assert_not_called()
     account_manager.place_tp_order.assert_not_called()
     account_manager.place_sl_order.assert_not_called()
+
+
+def test_get_server_time_returns_milliseconds():
+    adapter = BinanceAdapter()
+    assert adapter.get_server_time() == 1_700_000_000_000
+
+
+def test_init_shares_client_and_binds_symbol_settings(base_settings):
+    base_settings.TEST_MODE = False
+    shared_client = FakeClient("pub", "sec")
+    symbol_settings = SymbolSettings("ETHUSDT", 1, 0.1, 0.05, 3, "eth.csv")
+
+    adapter = BinanceAdapter(symbol_settings, client=cast(Any, shared_client))
+
+    assert adapter.client is shared_client
+    assert adapter.symbol_settings is symbol_settings
+    assert adapter.account_manager.symbol_settings is symbol_settings
+    shared_client.futures_change_leverage.assert_called_once_with(
+        symbol="ETHUSDT", leverage=3
+    )
+    assert adapter.enter_long(100.0) == (110.0, 95.0)
+
+
+@pytest.mark.parametrize("batch_orders", [False, True])
+def test_enter_places_sequential_orders_or_one_bracket(base_settings, batch_orders):
+    base_settings.TEST_MODE = False
+    base_settings.BATCH_ORDERS = batch_orders
+    adapter = BinanceAdapter()
+    account_manager = cast(FakeAccountManager, adapter.account_manager)
+    account_manager.get_coin_amount.return_value = 0.5
+
+    tp_price, sl_price = adapter.enter_short(100.0)
+
+    account_manager.order_quantity.assert_called_once_with(0.5, 100.0)
+    sequential = (
+        account_manager.enter_position,
+        account_manager.place_tp_order,
+        account_manager.place_sl_order,
+    )
+    if batch_orders:
+        account_manager.place_bracket_orders.assert_called_once_with(
+            "SHORT", 0.5, tp_price, sl_price
+        )
+        assert not any(method.called for method in sequential)
+    else:
+        account_manager.enter_position.assert_called_once_with("SHORT", 0.5)
+        account_manager.place_tp_order.assert_called_once_with("SHORT", 0.5, tp_price)
+        account_manager.place_sl_order.assert_called_once_with("SHORT", 0.5, sl_price)
+        account_manager.place_bracket_orders.assert_not_called()
+
+
+def test_resolve_exit_fill_cancels_the_remaining_exit():
+    adapter = BinanceAdapter()
+    account_manager = MagicMock()
+    adapter.account_manager = account_manager
+    account_manager.find_exit_fill.return_value = None
+
+    assert adapter.resolve_exit_fill() is None
+    account_manager.cancel_remaining_exit.assert_not_called()
+
+    fill = adapter_module.ExitFill(True, 101.0)
+    account_manager.find_exit_fill.return_value = fill
+    assert adapter.resolve_exit_fill() is fill
+    account_manager.cancel_remaining_exit.assert_called_once_with(fill)
+    assert adapter.exits_tracked() is account_manager.exits_tracked.return_value
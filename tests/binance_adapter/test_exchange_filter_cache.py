@@ -0,0 +1,100 @@
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock
+import pytest
+from binance_adapter.exchange_filter_cache import ExchangeFilterCache, SymbolFilters
+import binance_adapter.exchange_filter_cache as cache_module
+
+EXCHANGE_INFO = {
+    "symbols": [
+        {
+            "symbol": "BTCUSDT",
+            "filters": [
+                {"filterType": "PRICE_FILTER", "tickSize": "0.10"},
+                {"filterType": "LOT_SIZE", "stepSize": "0.001", "minQty": "0.001"},
+                {"filterType": "MIN_NOTIONAL", "notional": "100"},
+            ],
+        },
+        {
+            "symbol": "DOGEUSDT",
+            "filters": [
+                {"filterType": "PRICE_FILTER", "tickSize": "0.000010"},
+                {"filterType": "LOT_SIZE", "stepSize": "1", "minQty": "1"},
+            ],
+        },
+        {"symbol": "BROKENUSDT", "filters": []},
+    ]
+}
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = {"ms": 1_000_000}
+    monkeypatch.setattr(cache_module.DateUtils, "get_timestamp_ms", lambda: clock["ms"])
+    return clock
+
+
+def test_symbol_filters_round_to_tick_and_step():
+    filters = SymbolFilters(
+        Decimal("0.10"), Decimal("0.001"), Decimal("0.001"), Decimal("100")
+    )
+
+    assert filters.round_price(101.26) == 101.3
+    assert filters.round_price(101.24) == 101.2
+    assert filters.round_quantity(0.0129) == 0.012
+    assert filters.round_quantity(0.3) == 0.3
+    assert filters.meets_minimums(0.002, 50_000.0)
+    assert not filters.meets_minimums(0.001, 50_000.0)
+    assert not filters.meets_minimums(0.0, 50_000.0)
+
+
+def test_update_indexes_symbols_and_persists_them(tmp_path, now):
+    path = tmp_path / "cache" / "filters.json"
+    cache = ExchangeFilterCache(path)
+
+    cache.update(EXCHANGE_INFO)
+
+    btc = cache.get("BTCUSDT")
+    assert btc == SymbolFilters(
+        Decimal("0.10"), Decimal("0.001"), Decimal("0.001"), Decimal("100")
+    )
+    doge = cache.get("DOGEUSDT")
+    assert doge is not None and doge.min_notional == 0
+    assert cache.get("BROKENUSDT") is None
+    assert cache.get("ETHUSDT") is None
+    persisted = json.loads(path.read_text(encoding="utf-8"))
+    assert persisted["updated_ms"] == 1_000_000
+    assert persisted["symbols"]["BTCUSDT"]["minNotional"] == "100"
+    assert not path.with_name("filters.json.tmp").exists()
+
+
+def test_load_reads_fresh_files_and_downloads_stale_ones(tmp_path, now):
+    path = tmp_path / "filters.json"
+    fetch = MagicMock(return_value=EXCHANGE_INFO)
+
+    ExchangeFilterCache(path, ttl_seconds=60).load(fetch)
+    now["ms"] += 59_999
+    cache = ExchangeFilterCache(path, ttl_seconds=60).load(fetch)
+
+    assert fetch.call_count == 1
+    assert cache.get("BTCUSDT") is not None
+
+    now["ms"] += 1
+    ExchangeFilterCache(path, ttl_seconds=60).load(fetch)
+    assert fetch.call_count == 2
+
+
+def test_unreadable_file_is_logged_and_refetched(tmp_path, now, monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        cache_module.Logger, "log_exception", lambda m: logged.append(m)
+    )
+    path = tmp_path / "filters.json"
+    path.write_text("{not json", encoding="utf-8")
+    fetch = MagicMock(return_value=EXCHANGE_INFO)
+
+    cache = ExchangeFilterCache(path).load(fetch)
+
+    fetch.assert_called_once_with()
+    assert len(logged) == 1 and logged[0].startswith("Exchange filter cache")
+    assert cache.get("DOGEUSDT") is not None
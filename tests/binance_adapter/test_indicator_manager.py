@@ -1,9 +1,12 @@
 from types import SimpleNamespace
+from typing import Any, cast
 from unittest.mock import MagicMock
 from datetime import datetime, timedelta, timezone
 import numpy as np
 import pytest
+import talib
 from binance_adapter.indicator_manager import IndicatorManager
+from binance_adapter.kline_parser import KlineParser
 import binance_adapter.indicator_manager as indicator_manager_module
 
 
@@ -12,6 +15,7 @@ def patch_settings(monkeypatch):
     fake_settings = SimpleNamespace(
         SYMBOL="BTCUSDT",
         INTERVAL="1m",
+        LOOKBACK_TOLERANCE=1e-6,
     )
     monkeypatch.setattr(
         indicator_manager_module, "SETTINGS", fake_settings, raising=False
@@ -27,7 +31,7 @@ def binance_client_mock():
     return client
 
 
-def test_get_close_prices_returns_numpy_array(binance_client_mock):
+def test_refresh_klines_backfills_the_planned_lookback(binance_client_mock):
     # Binance returns raw klines; only "close" column is used.
     klines = [
         # open time, open, high, low, close, volume, close_time, quote_asset_volume, number_of_trades,
@@ -35,18 +39,92 @@ def test_get_close_prices_returns_numpy_array(binance_client_mock):
         [0, "100", "110", "90", "105.5", "1", 0, "0", "0", "0", "0", "0"],
         [0, "105", "115", "100", "111.7", "1", 0, "0", "0", "0", "0", "0"],
     ]
-    binance_client_mock.get_historical_klines.return_value = klines
+    binance_client_mock.get_klines.return_value = klines
 
     indicator_manager = IndicatorManager(binance_client_mock)
-    close_prices = indicator_manager._get_close_prices()
+    close_prices = KlineParser.parse_closes(indicator_manager._refresh_klines())
 
     assert isinstance(close_prices, np.ndarray)
     assert close_prices.tolist() == [105.5, 111.7]
-    binance_client_mock.get_historical_klines.assert_called_once_with(
+    binance_client_mock.get_klines.assert_called_once_with(
         symbol="BTCUSDT",
         interval="1m",
-        start_str="1 month ago UTC",
+        limit=indicator_manager.lookback_bars,
     )
+    binance_client_mock.get_historical_klines.assert_not_called()
+
+
+def test_lookback_bars_follow_tolerance_setting(monkeypatch, binance_client_mock):
+    strict = IndicatorManager(binance_client_mock).lookback_bars
+    monkeypatch.setattr(indicator_manager_module.SETTINGS, "LOOKBACK_TOLERANCE", 1e-3)
+    loose = IndicatorManager(binance_client_mock).lookback_bars
+    assert 100 < loose < strict < 1000
+
+
+def test_fetch_latest_klines_pages_from_start_time_when_over_limit(
+    monkeypatch, binance_client_mock
+):
+    monkeypatch.setattr(
+        indicator_manager_module.DateUtils, "get_timestamp_ms", lambda: 600_000
+    )
+    binance_client_mock.get_klines.side_effect = [
+        [[t, "1"] for t in range(0, 600_001, 60_000)][:1000],
+    ]
+    indicator_manager = IndicatorManager(binance_client_mock)
+
+    klines = indicator_manager._fetch_latest_klines(1001)
+
+    binance_client_mock.get_klines.assert_called_once_with(
+        symbol="BTCUSDT",
+        interval="1m",
+        startTime=600_000 - 1001 * 60_000,
+        limit=1000,
+    )
+    assert len(klines) == 11
+
+
+def test_refresh_klines_fetches_only_new_klines_after_backfill(binance_client_mock):
+    backfill = [
+        [0, "1", "1", "1", "10", "1", 59_999, "0", "0", "0", "0", "0"],
+        [60_000, "1", "1", "1", "11", "1", 119_999, "0", "0", "0", "0", "0"],
+    ]
+    update = [
+        [60_000, "1", "1", "1", "12", "1", 119_999, "0", "0", "0", "0", "0"],
+        [120_000, "1", "1", "1", "13", "1", 179_999, "0", "0", "0", "0", "0"],
+    ]
+    binance_client_mock.get_klines.side_effect = [backfill, update]
+
+    indicator_manager = IndicatorManager(binance_client_mock)
+    closes = [
+        KlineParser.parse_closes(indicator_manager._refresh_klines()).tolist()
+        for _ in range(2)
+    ]
+    assert closes == [[10.0, 11.0], [12.0, 13.0]]
+
+    assert binance_client_mock.get_klines.call_count == 2
+    binance_client_mock.get_klines.assert_called_with(
+        symbol="BTCUSDT", interval="1m", startTime=60_000, limit=1000
+    )
+
+
+def test_fetch_klines_since_paginates_until_short_page(
+    monkeypatch, binance_client_mock
+):
+    monkeypatch.setattr(IndicatorManager, "_KLINES_PAGE_LIMIT", 2)
+    pages = [
+        [[0, "1"], [60_000, "1"]],
+        [[120_000, "1"]],
+    ]
+    binance_client_mock.get_klines.side_effect = pages
+
+    indicator_manager = IndicatorManager(binance_client_mock)
+    klines = indicator_manager._fetch_klines_since(0)
+
+    assert [k[0] for k in klines] == [0, 60_000, 120_000]
+    start_times = [
+        c.kwargs["startTime"] for c in binance_client_mock.get_klines.call_args_list
+    ]
+    assert start_times == [0, 60_001]
 
 
 def test_fetch_price_returns_float(binance_client_mock):
@@ -62,179 +140,203 @@ def test_fetch_price_returns_zero_when_unavailable(binance_client_mock):
     assert indicator_manager._fetch_price() == 0.0
 
 
-def test_calculate_ema_with_provided_closes(monkeypatch, binance_client_mock):
-    # Stub talib.EMA to return an array whose last element is distinctive
-    def fake_ema(arr, timeperiod):
-        return np.array([0.0] * (len(arr) - 1) + [42.0])
+def make_klines(closes, start_open_time=0):
+    return [
+        [
+            start_open_time + i * 60_000,
+            "0",
+            "0",
+            "0",
+            str(c),
+            "0",
+            0,
+            "0",
+            "0",
+            "0",
+            "0",
+            "0",
+        ]
+        for i, c in enumerate(closes)
+    ]
 
-    monkeypatch.setattr(indicator_manager_module.talib, "EMA", fake_ema)
 
+def test_fetch_indicators_matches_talib_and_builds_snapshot(
+    monkeypatch, binance_client_mock
+):
+    rng = np.random.default_rng(7)
+    closes = 100 + np.cumsum(rng.normal(0, 1, 400))
     indicator_manager = IndicatorManager(binance_client_mock)
-    value = indicator_manager._calculate_EMA(
-        period=100, close_prices=np.array([1.0, 2.0, 3.0])
+    monkeypatch.setattr(
+        indicator_manager, "_refresh_klines", lambda: make_klines(closes)
+    )
+    monkeypatch.setattr(indicator_manager, "_fetch_price", lambda: 555.0)
+    monkeypatch.setattr(
+        indicator_manager_module.DateUtils, "get_date", lambda: "2025-08-27T00:00:00Z"
     )
-    assert value == pytest.approx(42.0)
-
-
-def test_calculate_ema_fetches_when_none(monkeypatch, binance_client_mock):
-    def fake_ema(arr, timeperiod):
-        return np.array([0.0] * (len(arr) - 1) + [99.0])
 
-    monkeypatch.setattr(indicator_manager_module.talib, "EMA", fake_ema)
+    class FakeSnapshot:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
 
-    indicator_manager = IndicatorManager(binance_client_mock)
-    # Ensure it fetches by patching _get_close_prices
     monkeypatch.setattr(
-        indicator_manager, "_get_close_prices", lambda: np.array([5.0, 6.0, 7.0])
+        indicator_manager_module, "MarketSnapshot", FakeSnapshot, raising=False
     )
-    value = indicator_manager._calculate_EMA(period=100, close_prices=None)
-    assert value == pytest.approx(99.0)
 
+    snapshot = indicator_manager.fetch_indicators()
+    assert isinstance(snapshot, FakeSnapshot)
 
-def test_calculate_macd_with_provided_closes(monkeypatch, binance_client_mock):
-    def fake_macd(arr, fastperiod, slowperiod, signalperiod):
-        length = len(arr)
-        return (
-            np.array([0.0] * (length - 1) + [1.1]),
-            np.array([0.0] * (length - 1) + [2.2]),
-            np.array([0.0] * (length - 1) + [3.3]),
-        )
+    macd, signal, _ = talib.MACD(closes, fastperiod=12, slowperiod=26, signalperiod=26)
+    assert snapshot.kwargs["date"] == "2025-08-27T00:00:00Z"
+    assert snapshot.kwargs["price"] == 555.0
+    assert snapshot.kwargs["macd_12"] == pytest.approx(macd[-1])
+    assert snapshot.kwargs["macd_26"] == pytest.approx(signal[-1])
+    assert snapshot.kwargs["ema_100"] == pytest.approx(
+        talib.EMA(closes, timeperiod=100)[-1]
+    )
+    assert snapshot.kwargs["rsi_6"] == pytest.approx(
+        talib.RSI(closes, timeperiod=6)[-1]
+    )
 
-    monkeypatch.setattr(indicator_manager_module.talib, "MACD", fake_macd)
 
+def test_evaluate_klines_commits_each_closed_bar_once(binance_client_mock):
     indicator_manager = IndicatorManager(binance_client_mock)
-    macd_value, signal_value = indicator_manager._calculate_MACD(
-        macd_period=12, signal_period=26, close_prices=np.array([1.0, 2.0, 3.0])
-    )
-    assert macd_value == pytest.approx(1.1)
-    assert signal_value == pytest.approx(2.2)
-
+    committed = []
+    indicator_manager.indicator_engine.update = committed.append
 
-def test_calculate_macd_fetches_when_none_and_params_are_passed(
-    monkeypatch, binance_client_mock
-):
-    captured = {}
+    indicator_manager._evaluate_klines(make_klines([1.0, 2.0, 3.0]))
+    indicator_manager._evaluate_klines(make_klines([2.0, 3.5, 4.0, 5.0], 60_000))
 
-    def spy_macd(arr, fastperiod, slowperiod, signalperiod):
-        captured["len"] = len(arr)
-        captured["fastperiod"] = fastperiod
-        captured["slowperiod"] = slowperiod
-        captured["signalperiod"] = signalperiod
-        return (
-            np.array([0.0, 9.9]),
-            np.array([0.0, 8.8]),
-            np.array([0.0, 7.7]),
-        )
+    assert committed == [1.0, 2.0, 3.5, 4.0]
+    assert indicator_manager._committed_open_time == 180_000
 
-    monkeypatch.setattr(indicator_manager_module.talib, "MACD", spy_macd)
 
+def test_evaluate_klines_raises_without_klines(binance_client_mock):
     indicator_manager = IndicatorManager(binance_client_mock)
-    monkeypatch.setattr(
-        indicator_manager, "_get_close_prices", lambda: np.array([10.0, 20.0])
-    )
+    with pytest.raises(ValueError, match="No klines available"):
+        indicator_manager._evaluate_klines([])
 
-    macd_value, signal_value = indicator_manager._calculate_MACD(
-        macd_period=12, signal_period=26, close_prices=None
-    )
 
-    assert macd_value == pytest.approx(9.9)
-    assert signal_value == pytest.approx(8.8)
-    assert captured["len"] == 2
-    assert captured["fastperiod"] == 12
-    assert captured["slowperiod"] == 26
-    assert captured["signalperiod"] == 26
+class ConnectedStream:
+    def __init__(self, last_price):
+        self.is_connected = True
+        self.last_price = last_price
 
 
-def test_calculate_rsi_with_and_without_fetch(monkeypatch, binance_client_mock):
-    def fake_rsi(arr, timeperiod):
-        return np.array([0.0] * (len(arr) - 1) + [55.5])
+def test_streaming_serves_klines_and_price_without_rest(binance_client_mock):
+    indicator_manager = IndicatorManager(binance_client_mock)
+    indicator_manager.kline_cache.replace("BTCUSDT", "1m", make_klines([1.0, 2.0]))
+    indicator_manager.market_stream = cast(Any, ConnectedStream(2.5))
+
+    assert len(indicator_manager._refresh_klines()) == 2
+    assert indicator_manager._fetch_price() == 2.5
+    binance_client_mock.get_klines.assert_not_called()
+    binance_client_mock.get_symbol_ticker.assert_not_called()
 
-    monkeypatch.setattr(indicator_manager_module.talib, "RSI", fake_rsi)
 
+def test_streaming_without_price_falls_back_to_ticker(binance_client_mock):
+    binance_client_mock.get_symbol_ticker.return_value = {"price": "3.5"}
     indicator_manager = IndicatorManager(binance_client_mock)
-    # with provided closes
-    provided_value = indicator_manager._calculate_RSI(
-        period=6, close_prices=np.array([1.0, 2.0, 3.0])
-    )
-    assert provided_value == pytest.approx(55.5)
+    indicator_manager.market_stream = cast(Any, ConnectedStream(None))
+    assert indicator_manager._fetch_price() == 3.5
 
-    # fetch branch
+
+def test_fetch_price_snapshot_peeks_engine_with_fresh_price(
+    monkeypatch, binance_client_mock
+):
+    closes = 100 + np.cumsum(np.random.default_rng(9).normal(0, 1, 300))
+    klines = make_klines(closes)
+    for kline in klines:
+        kline[6] = kline[0] + 59_999
+    binance_client_mock.get_klines.return_value = klines
+    binance_client_mock.get_symbol_ticker.return_value = {"price": "123.0"}
     monkeypatch.setattr(
-        indicator_manager, "_get_close_prices", lambda: np.array([4.0, 5.0, 6.0])
+        indicator_manager_module.DateUtils, "get_timestamp_ms", lambda: klines[-1][0]
     )
-    fetched_value = indicator_manager._calculate_RSI(period=6, close_prices=None)
-    assert fetched_value == pytest.approx(55.5)
+    indicator_manager = IndicatorManager(binance_client_mock)
+    indicator_manager.fetch_indicators()
+    binance_client_mock.get_klines.reset_mock()
 
+    snapshot = indicator_manager.fetch_price_snapshot()
 
-def test_fetch_indicators_integration_and_constructor_call(
+    binance_client_mock.get_klines.assert_not_called()
+    expected_closes = np.append(closes[:-1], 123.0)
+    assert snapshot.price == 123.0
+    assert snapshot.ema_100 == pytest.approx(
+        talib.EMA(expected_closes, timeperiod=100)[-1]
+    )
+    assert snapshot.rsi_6 == pytest.approx(talib.RSI(expected_closes, timeperiod=6)[-1])
+
+
+def test_fetch_price_snapshot_falls_back_to_full_refresh(
     monkeypatch, binance_client_mock
 ):
-    # Spy on the internal calls and verify parameters used in fetch_indicators
     indicator_manager = IndicatorManager(binance_client_mock)
+    monkeypatch.setattr(indicator_manager, "fetch_indicators", lambda: "full")
+
+    assert indicator_manager.fetch_price_snapshot() == "full"
 
+    indicator_manager.kline_cache.replace("BTCUSDT", "1m", make_klines([1.0]))
     monkeypatch.setattr(
-        indicator_manager, "_get_close_prices", lambda: np.array([1.0, 2.0, 3.0])
+        indicator_manager_module.DateUtils, "get_timestamp_ms", lambda: 60_000
     )
+    assert indicator_manager.fetch_price_snapshot() == "full"
 
-    captured_params = {}
 
-    def spy_macd(macd_period, signal_period, close_prices):
-        captured_params["macd_period"] = macd_period
-        captured_params["signal_period"] = signal_period
-        captured_params["macd_close_len"] = len(close_prices)
-        return 1.1, 2.2
+def test_fetch_mark_price_uses_rest_or_stream(binance_client_mock):
+    binance_client_mock.futures_mark_price.return_value = {"markPrice": "10.5"}
+    indicator_manager = IndicatorManager(binance_client_mock)
+    assert indicator_manager._fetch_mark_price() == 10.5
+    binance_client_mock.futures_mark_price.assert_called_once_with(symbol="BTCUSDT")
 
-    def spy_ema(period, close_prices):
-        captured_params["ema_period"] = period
-        captured_params["ema_close_len"] = len(close_prices)
-        return 100.5
+    stream = ConnectedStream(None)
+    stream.mark_price = 11.5
+    indicator_manager.market_stream = cast(Any, stream)
+    assert indicator_manager._fetch_mark_price() == 11.5
 
-    def spy_rsi(period, close_prices):
-        captured_params["rsi_period"] = period
-        captured_params["rsi_close_len"] = len(close_prices)
-        return 55.5
 
-    def spy_price():
-        return 555.0
+def test_fetch_price_only_snapshot_keeps_indicators(monkeypatch, binance_client_mock):
+    from data.market_snapshot import MarketSnapshot
 
-    monkeypatch.setattr(indicator_manager, "_calculate_MACD", spy_macd)
-    monkeypatch.setattr(indicator_manager, "_calculate_EMA", spy_ema)
-    monkeypatch.setattr(indicator_manager, "_calculate_RSI", spy_rsi)
-    monkeypatch.setattr(indicator_manager, "_fetch_price", lambda: spy_price())
+    binance_client_mock.get_symbol_ticker.return_value = {"price": "12.0"}
+    binance_client_mock.futures_mark_price.return_value = {"markPrice": "12.5"}
+    monkeypatch.setattr(indicator_manager_module.DateUtils, "get_date", lambda: "now")
+    indicator_manager = IndicatorManager(binance_client_mock)
+    previous = MarketSnapshot("before", 10.0, 1.0, 2.0, 3.0, 4.0)
 
-    # Fix date
-    monkeypatch.setattr(
-        indicator_manager_module.DateUtils, "get_date", lambda: "2025-08-27T00:00:00Z"
+    snapshot = indicator_manager.fetch_price_only_snapshot(previous)
+    mark_snapshot = indicator_manager.fetch_price_only_snapshot(
+        previous, mark_price=True
     )
 
-    # Replace MarketSnapshot to capture constructor kwargs
-    class FakeSnapshot:
-        def __init__(self, **kwargs):
-            self.kwargs = kwargs
-
-    monkeypatch.setattr(
-        indicator_manager_module, "MarketSnapshot", FakeSnapshot, raising=False
+    assert (snapshot.date, snapshot.price) == ("now", 12.0)
+    assert mark_snapshot.price == 12.5
+    assert (snapshot.macd_12, snapshot.macd_26, snapshot.ema_100, snapshot.rsi_6) == (
+        1.0,
+        2.0,
+        3.0,
+        4.0,
     )
+    binance_client_mock.get_klines.assert_not_called()
 
-    snapshot = indicator_manager.fetch_indicators()
-    assert isinstance(snapshot, FakeSnapshot)
 
-    # Verify internal call parameters
-    assert captured_params["macd_period"] == 12
-    assert captured_params["signal_period"] == 26
-    assert captured_params["ema_period"] == 100
-    assert captured_params["rsi_period"] == 6
-    assert captured_params["macd_close_len"] == 3
-    assert captured_params["ema_close_len"] == 3
-    assert captured_params["rsi_close_len"] == 3
-
-    # Verify fields passed to MarketSnapshot
-    expected = {
-        "date": "2025-08-27T00:00:00Z",
-        "price": 555.0,
-        "macd_12": 1.1,
-        "macd_26": 2.2,
-        "ema_100": 100.5,
-        "rsi_6": 55.5,
-    }
-    assert snapshot.kwargs == expected
+def test_exported_state_restores_without_fetching_history(binance_client_mock):
+    indicator_manager = IndicatorManager(binance_client_mock)
+    klines = make_klines([float(c) for c in range(1, 41)])
+    indicator_manager.kline_cache.replace("BTCUSDT", "1m", klines)
+    indicator_manager._evaluate_klines(klines)
+    state = indicator_manager.export_state()
+
+    restored = IndicatorManager(binance_client_mock)
+    restored.restore_state(state)
+
+    assert restored.committed_open_time == indicator_manager.committed_open_time
+    assert restored.indicator_engine.state() == state["engine"]
+    assert restored.kline_cache.get("BTCUSDT", "1m") == [klines[-1]]
+
+
+def test_restore_state_requires_a_committed_kline(binance_client_mock):
+    indicator_manager = IndicatorManager(binance_client_mock)
+    state = indicator_manager.export_state()
+    assert state["committed_open_time"] is None
+    with pytest.raises(ValueError, match="no committed kline"):
+        indicator_manager.restore_state(state)
@@ -0,0 +1,64 @@
+from binance_adapter.kline_cache import KlineCache
+
+
+def make_kline(open_time: int, close: str = "1"):
+    return [
+        open_time,
+        "1",
+        "1",
+        "1",
+        close,
+        "1",
+        open_time + 59_999,
+        "0",
+        0,
+        "0",
+        "0",
+        "0",
+    ]
+
+
+def test_get_and_last_open_time_when_empty():
+    cache = KlineCache()
+    assert cache.get("BTCUSDT", "1m") == []
+    assert cache.last_open_time("BTCUSDT", "1m") is None
+
+
+def test_replace_stores_copy_and_last_open_time():
+    klines = [make_kline(0), make_kline(60_000)]
+    cache = KlineCache()
+    cache.replace("BTCUSDT", "1m", klines)
+    klines.append(make_kline(120_000))
+
+    assert len(cache.get("BTCUSDT", "1m")) == 2
+    assert cache.last_open_time("BTCUSDT", "1m") == 60_000
+
+
+def test_merge_replaces_forming_bar_and_keeps_window_size():
+    cache = KlineCache()
+    cache.replace(
+        "BTCUSDT", "1m", [make_kline(0), make_kline(60_000), make_kline(120_000, "5")]
+    )
+
+    cache.merge("BTCUSDT", "1m", [make_kline(120_000, "6"), make_kline(180_000, "7")])
+
+    cached = cache.get("BTCUSDT", "1m")
+    assert [k[0] for k in cached] == [60_000, 120_000, 180_000]
+    assert [k[4] for k in cached] == ["1", "6", "7"]
+
+
+def test_merge_ignores_empty_payload():
+    cache = KlineCache()
+    cache.replace("BTCUSDT", "1m", [make_kline(0)])
+    cache.merge("BTCUSDT", "1m", [])
+    assert cache.last_open_time("BTCUSDT", "1m") == 0
+
+
+def test_merge_into_empty_key_and_keys_are_independent():
+    cache = KlineCache()
+    cache.replace("BTCUSDT", "1m", [make_kline(0)])
+    cache.merge("ETHUSDT", "1m", [make_kline(0), make_kline(60_000)])
+
+    assert len(cache.get("ETHUSDT", "1m")) == 2
+    assert len(cache.get("BTCUSDT", "1m")) == 1
+    assert cache.get("BTCUSDT", "15m") == []
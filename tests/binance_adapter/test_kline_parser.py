@@ -0,0 +1,29 @@
+import numpy as np
+from binance_adapter.kline_parser import KlineParser
+
+KLINES = [
+    [0, "100", "110", "90", "105.5", "1.5", 59_999, "0", 3, "0", "0", "0"],
+    [60_000, "105", "115", "100", "111.7", "2", 119_999, "0", 4, "0", "0", "0"],
+]
+
+
+def test_parse_closes_returns_float64_array():
+    closes = KlineParser.parse_closes(KLINES)
+    assert closes.dtype == np.float64
+    assert closes.tolist() == [105.5, 111.7]
+
+
+def test_parse_ohlcv_returns_all_columns():
+    ohlcv = KlineParser.parse_ohlcv(KLINES)
+    assert ohlcv.open_time.dtype == np.int64
+    assert ohlcv.open_time.tolist() == [0, 60_000]
+    assert ohlcv.open.tolist() == [100.0, 105.0]
+    assert ohlcv.high.tolist() == [110.0, 115.0]
+    assert ohlcv.low.tolist() == [90.0, 100.0]
+    assert ohlcv.close.tolist() == [105.5, 111.7]
+    assert ohlcv.volume.tolist() == [1.5, 2.0]
+
+
+def test_parse_empty_payload():
+    assert KlineParser.parse_closes([]).shape == (0,)
+    assert KlineParser.parse_ohlcv([]).open_time.shape == (0,)
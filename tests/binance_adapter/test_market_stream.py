@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import List
+from binance_adapter.kline_cache import KlineCache
+from binance_adapter.market_stream import MarketStream
+
+
+def wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_url_subscribes_to_kline_and_mark_price_streams():
+    stream = MarketStream("BTCUSDT", "15m", KlineCache(), base_url="wss://host/")
+    assert stream._get_url() == (
+        "wss://host/stream?streams=btcusdt@kline_15m/btcusdt@markPrice@1s"
+    )
+
+
+def test_kline_event_is_merged_in_rest_layout(kline_event):
+    cache = KlineCache()
+    cache.replace("BTCUSDT", "1m", [[0, "1", "1", "1", "5", "1", 59_999]])
+    stream = MarketStream("BTCUSDT", "1m", cache)
+
+    stream._handle_message(kline_event(0, "6", closed=True))
+    stream._handle_message(kline_event(60_000, "7"))
+
+    klines = cache.get("BTCUSDT", "1m")
+    assert [k[4] for k in klines] == ["6", "7"][-len(klines) :]
+    assert klines[-1] == [
+        60_000,
+        "1",
+        "2",
+        "0.5",
+        "7",
+        "10",
+        119_999,
+        "20",
+        3,
+        "4",
+        "8",
+        "0",
+    ]
+    assert stream.last_price == 7.0
+    assert stream.wait_for_update(0) is True
+    assert stream.wait_for_update(0) is False
+
+
+def test_mark_price_and_unknown_events():
+    stream = MarketStream("BTCUSDT", "1m", KlineCache())
+    stream._handle_message({"data": {"e": "markPriceUpdate", "p": "101.5"}})
+    assert stream.mark_price == 101.5
+    assert stream.wait_for_update(0) is True
+
+    stream._handle_message({"e": "somethingElse"})
+    assert stream.wait_for_update(0) is False
+
+
+def test_events_arriving_between_waits_are_not_lost():
+    stream = MarketStream("BTCUSDT", "1m", KlineCache())
+    mark_price = {"data": {"e": "markPriceUpdate", "p": "101.5"}}
+    woken = threading.Event()
+    results: List[bool] = []
+
+    def consume() -> None:
+        results.append(stream.wait_for_update(5.0))
+        woken.set()
+        results.append(stream.wait_for_update(5.0))
+
+    consumer = threading.Thread(target=consume)
+    consumer.start()
+    stream._handle_message(mark_price)
+    assert woken.wait(5.0)
+    stream._handle_message(mark_price)
+    consumer.join(5.0)
+
+    assert results == [True, True]
+    assert stream.wait_for_update(0) is False
+
+
+def test_streams_from_fake_server_and_backfills_on_each_connect(
+    fake_ws_server, kline_event
+):
+    fake_ws_server.scripts = [
+        [kline_event(0, "10")],
+        [kline_event(60_000, "11"), {"data": {"e": "markPriceUpdate", "p": "11.2"}}],
+    ]
+    backfills: List[int] = []
+    cache = KlineCache()
+    cache.replace(
+        "BTCUSDT", "1m", [[-60_000, "1", "1", "1", "9"], [0, "1", "1", "1", "9"]]
+    )
+    stream = MarketStream(
+        "BTCUSDT",
+        "1m",
+        cache,
+        on_connect=lambda: backfills.append(1),
+        base_url=fake_ws_server.url,
+    )
+    stream._INITIAL_RECONNECT_DELAY = 0.01
+    stream.start()
+    try:
+        assert wait_until(lambda: stream.mark_price == 11.2)
+    finally:
+        stream.stop()
+
+    assert len(backfills) == 2
+    assert fake_ws_server.paths[0] == (
+        "/stream?streams=btcusdt@kline_1m/btcusdt@markPrice@1s"
+    )
+    assert [k[0] for k in cache.get("BTCUSDT", "1m")] == [0, 60_000]
+    assert [k[4] for k in cache.get("BTCUSDT", "1m")] == ["10", "11"]
+    assert stream.last_price == 11.0
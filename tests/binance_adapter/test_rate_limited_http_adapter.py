@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+import requests
+from binance import AsyncClient
+from binance.client import Client
+from binance.exceptions import BinanceAPIException
+from binance_adapter.rate_limited_http_adapter import RateLimitedHTTPAdapter
+from binance_adapter.rate_limiter import RateLimiter
+from fake_exchange.fake_binance_server import FakeBinanceServer
+import binance_adapter.rate_limiter as rate_limiter_module
+
+
+@pytest.fixture
+def server():
+    fake_server = FakeBinanceServer.synthetic(bars=300, interval="1m", seed=3)
+    with fake_server:
+        yield fake_server
+
+
+def test_install_mounts_once_and_syncs_from_response_headers(server):
+    client = server.configure_client(Client("key", "secret", ping=False))
+    adapter = RateLimitedHTTPAdapter.install(client.session)
+    limiter = adapter.rate_limiter
+
+    assert RateLimitedHTTPAdapter.install(client.session) is adapter
+    client.futures_klines(symbol="ETHUSDT", interval="1m", limit=100)
+    client.futures_mark_price(symbol="ETHUSDT")
+
+    bucket = limiter.weight_buckets["fapi"]
+    assert bucket.capacity - bucket.tokens == pytest.approx(6, abs=0.5)
+
+
+def test_install_uses_the_given_limiter():
+    limiter = RateLimiter()
+    adapter = RateLimitedHTTPAdapter.install(requests.Session(), rate_limiter=limiter)
+    assert adapter.rate_limiter is limiter
+
+
+def test_rate_limit_response_blocks_the_family(monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        rate_limiter_module.Logger, "log_exception", lambda m: logged.append(m)
+    )
+    with FakeBinanceServer.synthetic(bars=300, weight_limit=0) as server:
+        client = server.configure_client(Client("key", "secret", ping=False))
+        limiter = RateLimitedHTTPAdapter.install(client.session).rate_limiter
+        with pytest.raises(BinanceAPIException):
+            client.futures_ping()
+
+    assert limiter.weight_buckets["fapi"].wait_time(1) > 50
+    assert logged == ["Rate limited (HTTP 429), pausing fapi requests for 60 s"]
+
+
+def test_session_params_trace_the_async_client(server):
+    limiter = RateLimiter()
+
+    async def scenario():
+        client = AsyncClient("key", "secret", session_params=limiter.session_params())
+        server.configure_client(client)
+        try:
+            await client.futures_klines(symbol="ETHUSDT", interval="1m", limit=100)
+        finally:
+            await client.close_connection()
+
+    asyncio.run(scenario())
+
+    bucket = limiter.weight_buckets["fapi"]
+    assert bucket.capacity - bucket.tokens == pytest.approx(5, abs=0.5)
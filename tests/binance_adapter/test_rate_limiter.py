@@ -0,0 +1,146 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+import binance_adapter.rate_limiter as rate_limiter_module
+import binance_adapter.token_bucket as token_bucket_module
+from binance_adapter.rate_limiter import RateLimiter, RequestCost
+
+FAPI = "https://fapi.binance.com/fapi/v1"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"t": 100.0}
+
+    def sleep(seconds):
+        now["t"] += seconds
+
+    fake_time = SimpleNamespace(monotonic=lambda: now["t"], sleep=sleep)
+    monkeypatch.setattr(token_bucket_module, "time", fake_time)
+    monkeypatch.setattr(rate_limiter_module, "time", fake_time)
+    return now
+
+
+@pytest.mark.parametrize(
+    "method,url,expected",
+    [
+        ("GET", "https://api.binance.com/api/v3/klines?limit=50", ("api", 1, 0, False)),
+        ("GET", f"{FAPI}/klines?symbol=X&limit=100", ("fapi", 2, 0, False)),
+        ("GET", f"{FAPI}/klines?symbol=X", ("fapi", 5, 0, False)),
+        ("GET", f"{FAPI}/klines?limit=1500", ("fapi", 10, 0, False)),
+        ("GET", "https://api.binance.com/api/v3/ticker/price", ("api", 2, 0, False)),
+        ("GET", "https://fapi.binance.com/fapi/v3/balance", ("fapi", 5, 0, False)),
+        ("POST", f"{FAPI}/order?symbol=X", ("fapi", 1, 1, True)),
+        ("DELETE", f"{FAPI}/order?orderId=1", ("fapi", 1, 0, True)),
+        (
+            "POST",
+            f"{FAPI}/batchOrders?batchOrders=%5B%7B%22a%22%3A1%7D%2C%7B%7D%5D",
+            ("fapi", 5, 2, True),
+        ),
+        ("POST", f"{FAPI}/batchOrders?batchOrders=oops", ("fapi", 5, 1, True)),
+        ("GET", "http://127.0.0.1:1/ping", ("api", 1, 0, False)),
+    ],
+)
+def test_request_cost(method, url, expected):
+    assert RateLimiter.request_cost(method, url) == RequestCost(*expected)
+
+
+def test_market_data_cannot_use_the_order_reserve(clock):
+    limiter = RateLimiter()
+    market = RequestCost("fapi", 480, 0, False)
+    order = RequestCost("fapi", 1, 1, True)
+
+    assert limiter.try_acquire(market) == 0.0
+    assert limiter.try_acquire(market) == 0.0
+    assert limiter.try_acquire(market) == 0.0
+    assert limiter.try_acquire(market) == 0.0
+    assert limiter.try_acquire(market) == pytest.approx(12.0)
+    assert limiter.try_acquire(order) == 0.0
+
+    assert limiter.acquire(market) == pytest.approx(12.025)
+    assert limiter.waited == pytest.approx(12.025)
+
+
+def test_order_counts_are_limited_per_ten_seconds(clock):
+    limiter = RateLimiter()
+    batch = RequestCost("fapi", 1, 100, True)
+    for _ in range(3):
+        assert limiter.try_acquire(batch) == 0.0
+
+    assert limiter.try_acquire(batch) == pytest.approx(100 / 30)
+    limiter.update(f"{FAPI}/order", 200, {"X-MBX-ORDER-COUNT-10S": "0"})
+    assert limiter.try_acquire(batch) == 0.0
+    limiter.update(f"{FAPI}/order", 200, {"X-MBX-ORDER-COUNT-1M": "1200"})
+    assert limiter.try_acquire(batch) == pytest.approx(5.0)
+
+
+def test_headers_resync_weight_and_rate_limits_block_the_family(clock, monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        rate_limiter_module.Logger, "log_exception", lambda m: logged.append(m)
+    )
+    limiter = RateLimiter()
+    ticker = RequestCost("fapi", 1, 0, False)
+
+    limiter.update(f"{FAPI}/time", 200, {"X-MBX-USED-WEIGHT-1M": "1920"})
+    assert limiter.try_acquire(ticker) == pytest.approx(1 / 40)
+    assert limiter.try_acquire(RequestCost("api", 1, 0, False)) == 0.0
+
+    limiter.update(f"{FAPI}/time", 429, {"Retry-After": "7"})
+    limiter.update(f"{FAPI}/time", 418, {})
+    assert limiter.try_acquire(RequestCost("fapi", 1, 0, True)) == pytest.approx(60.0)
+    assert logged == [
+        "Rate limited (HTTP 429), pausing fapi requests for 7 s",
+        "Rate limited (HTTP 418), pausing fapi requests for 60 s",
+    ]
+
+
+def test_poll_interval_stretches_as_the_budget_drains(clock):
+    limiter = RateLimiter()
+    poll = RequestCost("fapi", 2, 0, False)
+
+    limiter.try_acquire(poll)
+    assert limiter.poll_interval(0.5) == 0.5
+    assert limiter.poll_interval(0.5) == 0.5
+
+    limiter.update(f"{FAPI}/time", 200, {"X-MBX-USED-WEIGHT-1M": "1440"})
+    limiter.try_acquire(RequestCost("fapi", 20, 0, False))
+    assert limiter.poll_interval(0.01) == pytest.approx(20 / (32 * 460 / 1920))
+
+    limiter.update(f"{FAPI}/time", 200, {"X-MBX-USED-WEIGHT-1M": "2400"})
+    limiter.try_acquire(RequestCost("fapi", 1, 0, True))
+    assert limiter.poll_interval(0.01) == pytest.approx(0.01)
+    limiter.try_acquire(RequestCost("api", 10, 0, False))
+    assert limiter.poll_interval(0.01) == pytest.approx(10 / (80 * 4790 / 4800))
+
+    limiter.update(f"{FAPI}/time", 429, {"Retry-After": "30"})
+    assert limiter.poll_interval(0.01) == pytest.approx(30.0)
+
+
+def test_async_acquire_waits_on_the_event_loop(clock, monkeypatch):
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        clock["t"] += seconds
+
+    monkeypatch.setattr(
+        rate_limiter_module, "asyncio", SimpleNamespace(sleep=fake_sleep)
+    )
+    limiter = RateLimiter()
+    limiter.update(f"{FAPI}/time", 200, {"X-MBX-USED-WEIGHT-1M": "2400"})
+
+    waited = asyncio.run(limiter.async_acquire(RequestCost("fapi", 4, 0, True)))
+
+    assert waited == pytest.approx(0.1) and slept == [pytest.approx(0.1)]
+
+
+def test_session_params_append_a_trace_config():
+    limiter = RateLimiter()
+    existing = object()
+
+    params = limiter.session_params({"trace_configs": [existing], "timeout": 5})
+
+    assert params["timeout"] == 5 and params["trace_configs"][0] is existing
+    assert len(params["trace_configs"]) == 2
+    assert len(limiter.session_params()["trace_configs"]) == 1
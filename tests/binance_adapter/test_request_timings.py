@@ -0,0 +1,62 @@
+import asyncio
+import aiohttp
+import pytest
+from binance_adapter.request_timings import PhaseStats, RequestTimings
+from fake_exchange.fake_binance_server import FakeBinanceServer
+import binance_adapter.request_timings as request_timings_module
+
+
+def test_summary_reports_percentiles_per_phase_in_milliseconds():
+    timings = RequestTimings()
+    for index in range(100):
+        phases = {"ttfb": (index + 1) / 1000}
+        if index == 0:
+            phases.update(dns=0.002, connect=0.004)
+        timings.record(phases)
+
+    summary = timings.summary()
+
+    assert set(summary) == {"dns", "connect", "ttfb"}
+    assert summary["ttfb"] == PhaseStats(100, 51.0, 100.0, 100.0)
+    assert summary["dns"] == PhaseStats(1, 2.0, 2.0, 2.0)
+    assert timings.format_summary().startswith(
+        "HTTP timings over 100 requests: dns n=1 p50 2.0 ms p99 2.0 ms max 2.0 ms"
+    )
+
+
+def test_summary_is_logged_every_log_every_requests(monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        request_timings_module.Logger, "log_info", lambda m: logged.append(m)
+    )
+    timings = RequestTimings()
+    assert timings.format_summary() == "HTTP timings over 0 requests: none"
+    monkeypatch.setattr(timings, "LOG_EVERY", 2)
+
+    for _ in range(5):
+        timings.record({})
+
+    assert logged == [
+        "HTTP timings over 2 requests: none",
+        "HTTP timings over 4 requests: none",
+    ]
+
+
+def test_trace_config_times_new_and_reused_connections():
+    timings = RequestTimings()
+
+    async def scenario(url):
+        async with aiohttp.ClientSession(**timings.session_params()) as session:
+            for _ in range(2):
+                async with session.get(f"{url}/fapi/v1/ping") as response:
+                    await response.read()
+
+    with FakeBinanceServer.synthetic(bars=300) as server:
+        asyncio.run(scenario(server.url.replace("127.0.0.1", "localhost")))
+
+    summary = timings.summary()
+    assert timings.requests == 2
+    assert summary["dns"].count == 1 and summary["connect"].count == 1
+    assert summary["ttfb"].count == 2
+    assert "tls" not in summary
+    assert all(stats.max >= 0 for stats in summary.values())
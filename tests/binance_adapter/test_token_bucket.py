@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+import pytest
+import binance_adapter.token_bucket as token_bucket_module
+from binance_adapter.token_bucket import TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"t": 100.0}
+    monkeypatch.setattr(
+        token_bucket_module, "time", SimpleNamespace(monotonic=lambda: now["t"])
+    )
+    return now
+
+
+def test_tokens_are_taken_and_refilled_up_to_capacity(clock):
+    bucket = TokenBucket(60, 60.0)
+
+    assert bucket.wait_time(60) == 0.0
+    bucket.take(50)
+    assert bucket.wait_time(20) == pytest.approx(10.0)
+    assert bucket.wait_time(5, floor=10) == pytest.approx(5.0)
+
+    clock["t"] += 10.0
+    assert bucket.wait_time(20) == 0.0
+    clock["t"] += 1_000.0
+    assert bucket.tokens == 20 and bucket.headroom() == 1.0
+
+
+def test_server_usage_and_blocks_override_the_local_estimate(clock):
+    bucket = TokenBucket(100, 60.0)
+
+    bucket.sync_used(90)
+    assert bucket.headroom() == pytest.approx(0.1)
+    assert bucket.headroom(floor=20) == 0.0
+
+    bucket.block(30.0)
+    bucket.block(5.0)
+    assert bucket.wait_time(1) == pytest.approx(30.0)
+    assert bucket.headroom() == 0.0
+    clock["t"] += 30.0
+    assert bucket.wait_time(1) == 0.0
@@ -0,0 +1,126 @@
+import socket
+from types import SimpleNamespace
+import pytest
+import requests
+from binance.client import Client
+from binance_adapter.rate_limited_http_adapter import RateLimitedHTTPAdapter
+from binance_adapter.request_timings import RequestTimings
+from binance_adapter.timed_connection import TimedHTTPConnection
+from binance_adapter.tuned_http_adapter import TunedHTTPAdapter
+from fake_exchange.fake_binance_server import FakeBinanceServer
+import binance_adapter.timed_connection as timed_connection_module
+
+
+@pytest.fixture
+def server():
+    fake_server = FakeBinanceServer.synthetic(bars=300, interval="1m", seed=5)
+    with fake_server:
+        yield fake_server
+
+
+def local_client(server) -> Client:
+    client = server.configure_client(Client("key", "secret", ping=False))
+    client.FUTURES_URL = client.FUTURES_URL.replace("127.0.0.1", "localhost")
+    return client
+
+
+def test_pooled_connections_are_timed_once_and_reused(server):
+    client = local_client(server)
+    timings = RequestTimings()
+    adapter = TunedHTTPAdapter.install(client.session, pool_size=4, timings=timings)
+
+    assert TunedHTTPAdapter.install(client.session) is adapter
+    for _ in range(3):
+        client.futures_ping()
+
+    summary = timings.summary()
+    assert timings.requests == 3
+    assert summary["dns"].count == summary["connect"].count == 1
+    assert summary["ttfb"].count == 3
+    pool = adapter.poolmanager.connection_from_url(client.FUTURES_URL)
+    assert pool.ConnectionCls is TimedHTTPConnection
+    assert pool.conn_kw["socket_options"] == TunedHTTPAdapter.SOCKET_OPTIONS
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in pool.conn_kw["socket_options"]
+
+
+def test_configured_timeouts_replace_the_client_timeout(monkeypatch):
+    sent = []
+    monkeypatch.setattr(
+        requests.adapters.HTTPAdapter,
+        "send",
+        lambda _self, _request, **kwargs: sent.append(kwargs["timeout"]),
+    )
+    request = requests.Request("GET", "http://localhost/fapi/v1/ping").prepare()
+
+    TunedHTTPAdapter(timeout=(1.5, 4.0)).send(request, timeout=10)
+    TunedHTTPAdapter().send(request, timeout=10)
+
+    assert sent == [(1.5, 4.0), 10]
+
+
+def test_rate_limited_adapter_keeps_the_tuned_transport(server):
+    client = local_client(server)
+    timings = RequestTimings()
+    adapter = RateLimitedHTTPAdapter.install(client.session, timings=timings)
+
+    client.futures_ping()
+
+    assert timings.summary()["ttfb"].count == 1
+    assert adapter.rate_limiter.weight_buckets["fapi"].tokens < 2_400
+
+
+def test_unreachable_addresses_fall_back_to_the_next_one(monkeypatch, server):
+    resolved = [
+        (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.2", server.port)),
+        (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", server.port)),
+    ]
+    monkeypatch.setattr(
+        timed_connection_module,
+        "socket",
+        SimpleNamespace(
+            getaddrinfo=lambda *_args: resolved, SOCK_STREAM=socket.SOCK_STREAM
+        ),
+    )
+    timings = RequestTimings()
+    session = requests.Session()
+    TunedHTTPAdapter.install(session, timings=timings)
+
+    assert session.get(f"{server.url}/fapi/v1/ping").status_code == 200
+    assert set(timings.summary()) == {"dns", "connect", "ttfb"}
+
+
+def test_name_resolution_errors_stay_urllib3_errors(monkeypatch):
+    def fail(*_args):
+        raise socket.gaierror("no such host")
+
+    monkeypatch.setattr(
+        timed_connection_module,
+        "socket",
+        SimpleNamespace(getaddrinfo=fail, SOCK_STREAM=socket.SOCK_STREAM),
+    )
+    session = requests.Session()
+    TunedHTTPAdapter.install(session, timings=RequestTimings())
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get("http://host.invalid/fapi/v1/ping")
+
+
+def test_tls_phase_is_the_rest_of_the_https_connect(monkeypatch):
+    connection = timed_connection_module.TimedHTTPSConnection("localhost", 443)
+    clock = iter([10.0, 10.5])
+    monkeypatch.setattr(
+        timed_connection_module,
+        "time",
+        SimpleNamespace(perf_counter=lambda: next(clock)),
+    )
+    monkeypatch.setattr(
+        timed_connection_module.HTTPSConnection, "connect", lambda _self: None
+    )
+    phases = {"dns": 0.1, "connect": 0.15}
+    token = TimedHTTPConnection.PHASES.set(phases)
+    try:
+        connection.connect()
+    finally:
+        TimedHTTPConnection.PHASES.reset(token)
+
+    assert phases["tls"] == pytest.approx(0.25)
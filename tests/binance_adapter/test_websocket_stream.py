@@ -0,0 +1,83 @@
+import time
+from typing import Any, Dict, List
+from binance_adapter.websocket_stream import WebSocketStream
+import binance_adapter.websocket_stream as websocket_stream_module
+
+
+class RecordingStream(WebSocketStream):
+    _INITIAL_RECONNECT_DELAY = 0.01
+
+    def __init__(self, url: str) -> None:
+        super().__init__()
+        self.url = url
+        self.messages: List[Dict[str, Any]] = []
+        self.connects = 0
+
+    def _get_url(self) -> str:
+        return self.url
+
+    def _on_connect(self) -> None:
+        self.connects += 1
+
+    def _handle_message(self, message: Dict[str, Any]) -> None:
+        if message.get("boom"):
+            raise ValueError("bad message")
+        self.messages.append(message)
+
+
+def wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_reconnects_and_runs_on_connect_each_time(fake_ws_server, monkeypatch):
+    monkeypatch.setattr(websocket_stream_module.Logger, "log_exception", print)
+    fake_ws_server.scripts = [[{"n": 1}], [{"n": 2}]]
+    stream = RecordingStream(fake_ws_server.url)
+    stream.start()
+    stream.start()  # second call is a no-op while running
+    try:
+        assert wait_until(lambda: len(stream.messages) == 2)
+        assert wait_until(lambda: stream.is_connected)
+        assert stream.connects == 2
+        assert stream.messages == [{"n": 1}, {"n": 2}]
+    finally:
+        stream.stop()
+    assert not stream.is_connected
+
+
+def test_bad_messages_are_logged_and_skipped(fake_ws_server, monkeypatch):
+    logged: List[str] = []
+    monkeypatch.setattr(websocket_stream_module.Logger, "log_exception", logged.append)
+    fake_ws_server.scripts = [["not json", {"boom": True}, {"ok": True}]]
+    stream = RecordingStream(fake_ws_server.url)
+    stream.start()
+    try:
+        assert wait_until(lambda: stream.messages == [{"ok": True}])
+    finally:
+        stream.stop()
+    assert len(logged) == 2
+    assert all("RecordingStream message error" in entry for entry in logged)
+
+
+def test_connection_errors_are_logged_and_retried(monkeypatch):
+    logged: List[str] = []
+    monkeypatch.setattr(websocket_stream_module.Logger, "log_exception", logged.append)
+    stream = RecordingStream("ws://127.0.0.1:1")
+    stream.start()
+    try:
+        assert wait_until(lambda: len(logged) >= 2)
+    finally:
+        stream.stop()
+    assert stream.connects == 0
+    assert all(entry.startswith("RecordingStream:") for entry in logged)
+
+
+def test_default_on_connect_hook_is_noop():
+    stream = RecordingStream("ws://unused")
+    assert WebSocketStream._on_connect(stream) is None
+    stream.stop()
@@ -1,4 +1,5 @@
 import pytest
+from types import SimpleNamespace
 from typing import Any, Literal, cast
 from bot.states.active.active_position_state import ActivePositionState
 import bot.states.active.active_position_state as open_pos_module
@@ -22,6 +23,9 @@ class Parent:
     def __init__(self) -> None:
         self.data_manager = DataManager()
         self.performance_tracker = PerformanceTracker()
+        self.symbol_settings = SimpleNamespace(
+            SYMBOL="BTCUSDT", OUTPUT_CSV_PATH="results_BTCUSDT.csv"
+        )
         self.state = None
 
 
@@ -70,8 +74,9 @@ def test_handle_tp_increases_win_and_saves(monkeypatch):
     saved: dict[str, Any] = {}
 
     def fake_save_result(
-        *, file_path: str, result: str, position: str, snapshot: Any
+        *, file_path: str, result: str, position: str, snapshot: Any, exit_price
     ) -> None:
+        saved["exit_price"] = exit_price
         saved["file_path"] = file_path
         saved["result"] = result
         saved["position"] = position
@@ -84,13 +89,16 @@ def test_handle_tp_increases_win_and_saves(monkeypatch):
         position=cast(PositionSide, "LONG"),
         snapshot=cast(Any, snapshot),
         performance_tracker=tracker,
+        exit_price=101.5,
     )
 
     assert tracker.win_count == 1
     assert success_logs == ["Position is closed with TP"]
+    assert saved["file_path"] == "results_BTCUSDT.csv"
     assert saved["position"] == "LONG"
     assert saved["result"] == "LONG"
     assert saved["snapshot"] is snapshot
+    assert saved["exit_price"] == 101.5
 
 
 def test_handle_sl_increases_loss_and_saves(monkeypatch):
@@ -106,8 +114,9 @@ def test_handle_sl_increases_loss_and_saves(monkeypatch):
     saved: dict[str, Any] = {}
 
     def fake_save_result(
-        *, file_path: str, result: str, position: str, snapshot: Any
+        *, file_path: str, result: str, position: str, snapshot: Any, exit_price
     ) -> None:
+        saved["exit_price"] = exit_price
         saved["file_path"] = file_path
         saved["result"] = result
         saved["position"] = position
@@ -120,6 +129,7 @@ def test_handle_sl_increases_loss_and_saves(monkeypatch):
         position=cast(PositionSide, "SHORT"),
         snapshot=cast(Any, snapshot),
         performance_tracker=tracker,
+        exit_price=101.5,
     )
 
     assert tracker.loss_count == 1
@@ -127,6 +137,7 @@ def test_handle_sl_increases_loss_and_saves(monkeypatch):
     assert saved["position"] == "SHORT"
     assert saved["result"] == "LONG"
     assert saved["snapshot"] is snapshot
+    assert saved["exit_price"] == 101.5
 
 
 def test_close_position_calls_handler_logs_and_transitions(monkeypatch):
@@ -139,8 +150,12 @@ def test_close_position_calls_handler_logs_and_transitions(monkeypatch):
     calls: dict[str, Any] = {}
 
     def handler(
-        position: PositionSide, snapshot: Any, tracker: PerformanceTracker
+        position: PositionSide,
+        snapshot: Any,
+        tracker: PerformanceTracker,
+        exit_price: float,
     ) -> None:
+        calls["exit_price"] = exit_price
         calls["position"] = position
         calls["snapshot"] = snapshot
         calls["tracker"] = tracker
@@ -152,12 +167,13 @@ def test_close_position_calls_handler_logs_and_transitions(monkeypatch):
     )
 
     instance._close_position(
-        position=cast(PositionSide, "LONG"), result_function=handler
+        position=cast(PositionSide, "LONG"), result_function=handler, exit_price=98.5
     )
 
     assert calls["position"] == "LONG"
     assert calls["snapshot"] is entry_snapshot
     assert calls["tracker"] is parent.performance_tracker
+    assert calls["exit_price"] == 98.5
 
     assert parent.state is not None
     assert parent.state.__class__.__name__ == "FlatPositionState"
@@ -168,3 +184,101 @@ def test_close_position_calls_handler_logs_and_transitions(monkeypatch):
         and "SL:" in info_logs[0]
         and "Win-Rate:" in info_logs[0]
     )
+
+
+def test_active_states_only_require_the_mark_price():
+    assert (
+        ActivePositionState.DATA_REQUIREMENT
+        is open_pos_module.DataRequirement.MARK_PRICE
+    )
+
+
+class PricedOpen(ConcreteOpen):
+    def _is_tp_price(self) -> bool:
+        return self.parent.data_manager.market_snapshot.price > self.tp_price
+
+
+def make_exit_parent(fill, tracked: bool = False) -> Parent:
+    parent = Parent()
+    parent.data_manager.market_snapshot = FakeMarketSnapshot(price=105.0)
+    parent.binance_adapter = SimpleNamespace(
+        resolve_exit_fill=lambda: fill, exits_tracked=lambda: tracked
+    )
+    return parent
+
+
+def test_exit_fill_closes_at_the_fill_price(monkeypatch):
+    parent = make_exit_parent(SimpleNamespace(is_tp=False, price=89.5))
+    instance = PricedOpen(parent=parent, target_prices=[100.0, 90.0])
+    closed = []
+    monkeypatch.setattr(instance, "_close_position", lambda *args: closed.append(args))
+
+    instance._apply_exit("LONG")
+
+    assert closed == [("LONG", instance._handle_sl, 89.5)]
+
+
+def test_price_exit_records_the_market_price(monkeypatch):
+    parent = make_exit_parent(None)
+    instance = PricedOpen(parent=parent, target_prices=[100.0, 90.0])
+    closed = []
+    monkeypatch.setattr(instance, "_close_position", lambda *args: closed.append(args))
+
+    instance._apply_exit("LONG")
+
+    assert closed == [("LONG", instance._handle_tp, 105.0)]
+
+
+@pytest.mark.parametrize(
+    "tracked,expected",
+    [
+        (True, open_pos_module.DataRequirement.NONE),
+        (False, open_pos_module.DataRequirement.MARK_PRICE),
+    ],
+)
+def test_price_is_not_polled_while_exits_are_tracked(tracked, expected):
+    instance = ConcreteOpen(
+        parent=make_exit_parent(None, tracked), target_prices=[100.0, 90.0]
+    )
+    assert instance.data_requirement() is expected
+
+
+def test_close_from_fill_closes_the_side_of_the_state(monkeypatch):
+    instance = ConcreteOpen(parent=make_exit_parent(None), target_prices=[100.0, 90.0])
+    instance.SIDE = "SHORT"
+    closed = []
+    monkeypatch.setattr(instance, "_close_position", lambda *args: closed.append(args))
+
+    instance.close_from_fill(SimpleNamespace(is_tp=True, price=99.5))
+
+    assert closed == [("SHORT", instance._handle_tp, 99.5)]
+
+
+def test_closed_trades_are_journaled_with_their_fill_price(monkeypatch):
+    parent = make_exit_parent(SimpleNamespace(is_tp=True, price=100.4))
+    instance = PricedOpen(parent=parent, target_prices=[100.0, 90.0])
+    parent.data_manager.position_snapshot = FakeMarketSnapshot(price=95.0)
+    monkeypatch.setattr(open_pos_module.Logger, "log_success", lambda _m: None)
+    monkeypatch.setattr(open_pos_module.Logger, "log_info", lambda _m: None)
+    monkeypatch.setattr(
+        open_pos_module.FileUtils, "save_result", lambda **_kwargs: None
+    )
+    recorded = []
+    monkeypatch.setattr(
+        open_pos_module.FileUtils, "record_trade", lambda **kw: recorded.append(kw)
+    )
+
+    instance._apply_exit("LONG")
+
+    assert recorded == [
+        dict(
+            symbol="BTCUSDT",
+            result="LONG",
+            position="LONG",
+            snapshot=parent.data_manager.position_snapshot,
+            exit_price=100.4,
+            tp_price=100.0,
+            sl_price=90.0,
+            fill_price=100.4,
+        )
+    ]
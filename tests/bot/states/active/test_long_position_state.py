@@ -1,3 +1,4 @@
+from types import SimpleNamespace
 from bot.states.active.long_position_state import LongPositionState
 
 
@@ -14,6 +15,7 @@ class DataManager:
 class Parent:
     def __init__(self, price: float) -> None:
         self.data_manager = DataManager(Snapshot(price))
+        self.binance_adapter = SimpleNamespace(resolve_exit_fill=lambda: None)
 
 
 def test_is_tp_price_true_and_boundary():
@@ -40,9 +42,10 @@ def test_apply_triggers_tp_branch(monkeypatch):
 
     calls = {}
 
-    def fake_close(side, handler):
+    def fake_close(side, handler, exit_price):
         calls["side"] = side
         calls["handler"] = handler
+        calls["exit_price"] = exit_price
 
     monkeypatch.setattr(lps, "_close_position", fake_close)
     lps.apply()
@@ -58,9 +61,10 @@ def test_apply_triggers_sl_branch_when_no_tp(monkeypatch):
 
     calls = {}
 
-    def fake_close(side, handler):
+    def fake_close(side, handler, exit_price):
         calls["side"] = side
         calls["handler"] = handler
+        calls["exit_price"] = exit_price
 
     monkeypatch.setattr(lps, "_close_position", fake_close)
     lps.apply()
@@ -91,9 +95,10 @@ def test_apply_prefers_tp_when_both_true(monkeypatch):
 
     calls = {}
 
-    def fake_close(side, handler):
+    def fake_close(side, handler, exit_price):
         calls["side"] = side
         calls["handler"] = handler
+        calls["exit_price"] = exit_price
 
     monkeypatch.setattr(lps, "_close_position", fake_close)
     lps.apply()
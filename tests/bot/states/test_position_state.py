@@ -1,3 +1,5 @@
+import asyncio
+import threading
 from bot.states.position_state import PositionState
 import bot.states.position_state as position_state_module
 
@@ -17,6 +19,28 @@ class DummyIndicatorManager:
         self.calls.append("fetch")
         return self._snapshot
 
+    def fetch_price_snapshot(self) -> Snapshot:
+        self.calls.append("price")
+        return self._snapshot
+
+    def fetch_price_only_snapshot(self, previous, mark_price=False) -> Snapshot:
+        self.calls.append(("price_only", previous, mark_price))
+        return self._snapshot
+
+    async def async_fetch_indicators(self) -> Snapshot:
+        self.calls.append("async_fetch")
+        return self._snapshot
+
+    async def async_fetch_price_snapshot(self) -> Snapshot:
+        self.calls.append("async_price")
+        return self._snapshot
+
+    async def async_fetch_price_only_snapshot(
+        self, previous, mark_price=False
+    ) -> Snapshot:
+        self.calls.append(("async_price_only", previous, mark_price))
+        return self._snapshot
+
 
 class DummyBinanceAdapter:
     def __init__(self, snapshot: Snapshot) -> None:
@@ -117,3 +141,112 @@ def test_refresh_indicators_sets_parent_snapshot():
     assert parent.data_manager.market_snapshot is None
     state._refresh_indicators()
     assert parent.data_manager.market_snapshot is snapshot
+
+
+def test_step_without_full_refresh_only_refreshes_price(monkeypatch):
+    snapshot = Snapshot(price=5.0, ema_100=6.0)
+    parent = make_parent(snapshot)
+    state = ConcreteState(parent)
+
+    state.step(full_refresh=False)
+
+    assert parent.data_manager.market_snapshot is snapshot
+    assert parent.binance_adapter.indicator_manager.calls == ["price"]
+    assert state.calls == ["apply"]
+
+
+class PriceOnlyState(ConcreteState):
+    DATA_REQUIREMENT = position_state_module.DataRequirement.PRICE
+
+
+class MarkPriceOnlyState(ConcreteState):
+    DATA_REQUIREMENT = position_state_module.DataRequirement.MARK_PRICE
+
+
+class NoDataState(ConcreteState):
+    DATA_REQUIREMENT = position_state_module.DataRequirement.NONE
+
+
+def test_state_without_data_requirement_skips_every_refresh():
+    parent = make_parent(Snapshot(price=7.0))
+    state = NoDataState(parent)
+
+    state.step()
+    asyncio.run(state.async_step())
+
+    assert parent.binance_adapter.indicator_manager.calls == []
+    assert parent.data_manager.market_snapshot is None
+    assert state.calls == ["apply", "apply"]
+
+
+def test_price_only_state_skips_indicators_even_on_full_refresh():
+    snapshot = Snapshot(price=7.0)
+    parent = make_parent(snapshot)
+    previous = Snapshot(price=6.0)
+    parent.data_manager.market_snapshot = previous
+    state = PriceOnlyState(parent)
+
+    state.step()
+
+    assert parent.binance_adapter.indicator_manager.calls == [
+        ("price_only", previous, False)
+    ]
+    assert parent.data_manager.market_snapshot is snapshot
+    assert state.calls == ["apply"]
+
+
+def test_mark_price_state_requests_mark_price():
+    parent = make_parent(Snapshot(price=7.0))
+    previous = Snapshot(price=6.0)
+    parent.data_manager.market_snapshot = previous
+    MarkPriceOnlyState(parent).step(full_refresh=False)
+
+    assert parent.binance_adapter.indicator_manager.calls == [
+        ("price_only", previous, True)
+    ]
+
+
+def test_async_step_refreshes_then_applies_in_worker_thread():
+    snapshot = Snapshot(price=1.0)
+    parent = make_parent(snapshot)
+    threads = []
+
+    class ThreadRecordingState(ConcreteState):
+        def apply(self) -> None:
+            threads.append(threading.current_thread())
+
+    state = ThreadRecordingState(parent)
+    asyncio.run(state.async_step())
+    asyncio.run(state.async_step(full_refresh=False))
+
+    assert parent.data_manager.market_snapshot is snapshot
+    assert parent.binance_adapter.indicator_manager.calls == [
+        "async_fetch",
+        "async_price",
+    ]
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+def test_async_step_uses_declared_price_requirement():
+    parent = make_parent(Snapshot(price=7.0))
+    previous = Snapshot(price=6.0)
+    parent.data_manager.market_snapshot = previous
+
+    asyncio.run(MarkPriceOnlyState(parent).async_step())
+
+    assert parent.binance_adapter.indicator_manager.calls == [
+        ("async_price_only", previous, True)
+    ]
+
+
+def test_async_step_logs_when_apply_raises(monkeypatch):
+    parent = make_parent(Snapshot())
+    logged = []
+    monkeypatch.setattr(
+        position_state_module.Logger, "log_exception", lambda msg: logged.append(msg)
+    )
+
+    asyncio.run(RaisingApplyState(parent).async_step())
+
+    assert logged == ["boom"]
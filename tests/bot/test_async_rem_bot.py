@@ -0,0 +1,345 @@
+import dataclasses
+import asyncio
+from types import SimpleNamespace
+import pytest
+from bot.async_rem_bot import AsyncRemBot
+import bot.async_rem_bot as async_rem_bot_module
+from data.market_snapshot import MarketSnapshot
+
+
+class Snapshot(MarketSnapshot):
+    def __init__(self, price: float, ema_100: float) -> None:
+        super().__init__("[2025-08-29 00:00:00]", price, 0.0, 0.0, ema_100, 50.0)
+
+
+class FakeIndicatorManager:
+    def __init__(self, snapshot: Snapshot) -> None:
+        self._snapshot = snapshot
+
+    async def async_fetch_indicators(self) -> Snapshot:
+        return self._snapshot
+
+
+class FakeAsyncBinanceAdapter:
+    def __init__(self, snapshot: Snapshot, server_time: int = 0) -> None:
+        self.indicator_manager = FakeIndicatorManager(snapshot)
+        self.server_time = server_time
+        self.symbol_settings = object()
+        self.rate_limiter = None
+        self.closed = False
+
+    async def get_server_time(self) -> int:
+        return self.server_time
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class RecordingState(async_rem_bot_module.PositionState):
+    steps: list = []
+
+    def apply(self) -> None:
+        RecordingState.steps.append("apply")
+
+
+class StopLoop(Exception):
+    pass
+
+
+def scripted_ticks(*ticks):
+    remaining = iter(ticks)
+
+    def next_tick():
+        try:
+            return next(remaining)
+        except StopIteration:
+            raise StopLoop
+
+    return next_tick
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    fake_adapter = FakeAsyncBinanceAdapter(Snapshot(price=100.0, ema_100=150.0))
+
+    async def create():
+        return fake_adapter
+
+    monkeypatch.setattr(async_rem_bot_module.AsyncBinanceAdapter, "create", create)
+    monkeypatch.setattr(async_rem_bot_module, "FlatPositionState", RecordingState)
+    monkeypatch.setattr(async_rem_bot_module.Logger, "log_start", lambda _m: None)
+    RecordingState.steps = []
+    return fake_adapter
+
+
+def test_run_blocks_by_trend_and_steps_on_scheduled_ticks(monkeypatch, adapter):
+    adapter.server_time = 10_000
+    monkeypatch.setattr(
+        async_rem_bot_module.DateUtils, "get_timestamp_ms", lambda: 4_000
+    )
+    bot = AsyncRemBot()
+    monkeypatch.setattr(
+        bot.scheduler, "next_tick", scripted_ticks((0, False), (0, True))
+    )
+    refreshes = []
+
+    async def fake_step(self, full_refresh=True):
+        refreshes.append(full_refresh)
+        adapter.server_time += 1
+
+    monkeypatch.setattr(RecordingState, "async_step", fake_step)
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    assert bot.data_manager.is_long_blocked is True
+    assert isinstance(bot.state, RecordingState) and bot.state.parent is bot
+    assert refreshes == [False, True]
+    assert bot.scheduler.offset_ms == 6_002
+    assert adapter.closed is True
+
+
+def test_run_drives_real_async_step(monkeypatch, adapter):
+    adapter.indicator_manager = FakeIndicatorManager(Snapshot(200.0, 150.0))
+    bot = AsyncRemBot()
+    monkeypatch.setattr(bot.scheduler, "next_tick", scripted_ticks((0, True)))
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    assert bot.data_manager.is_short_blocked is True
+    assert bot.symbol_settings is adapter.symbol_settings
+    assert RecordingState.steps == ["apply"]
+
+
+def test_given_adapter_is_used_and_left_open(monkeypatch, adapter):
+    shared = FakeAsyncBinanceAdapter(Snapshot(200.0, 150.0))
+    bot = AsyncRemBot(shared)  # type: ignore[arg-type]
+    monkeypatch.setattr(bot.scheduler, "next_tick", scripted_ticks())
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    assert bot.binance_adapter is shared
+    assert bot.symbol_settings is shared.symbol_settings
+    assert shared.closed is False and adapter.closed is False
+
+
+def test_server_time_sync_failure_is_logged(monkeypatch, adapter):
+    async def fail():
+        raise RuntimeError("timeout")
+
+    adapter.get_server_time = fail
+    logged = []
+    monkeypatch.setattr(
+        async_rem_bot_module.Logger, "log_exception", lambda m: logged.append(m)
+    )
+    bot = AsyncRemBot()
+    bot.binance_adapter = adapter
+
+    asyncio.run(bot._sync_server_time())
+
+    assert logged == ["Server time sync failed: timeout"]
+    assert bot.scheduler.offset_ms == 0
+
+
+def test_run_paces_ticks_with_the_adapter_rate_limiter(monkeypatch, adapter):
+    adapter.rate_limiter = SimpleNamespace(poll_interval=lambda base: base * 2)
+    bot = AsyncRemBot()
+    monkeypatch.setattr(bot.scheduler, "next_tick", scripted_ticks())
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    assert bot.scheduler.pace_fn is adapter.rate_limiter.poll_interval
+
+
+class FakeTickRecorder:
+    def __init__(self) -> None:
+        self.recorded = []
+        self.closed = False
+
+    def record(self, snapshot) -> None:
+        self.recorded.append(snapshot)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_run_records_every_step_in_the_tick_journal(monkeypatch, adapter):
+    adapter.symbol_settings = SimpleNamespace(SYMBOL="ETHUSDT")
+    recorder = FakeTickRecorder()
+    opened = []
+
+    def for_symbol(symbol, max_segment_bytes):
+        opened.append((symbol, max_segment_bytes))
+        return recorder
+
+    monkeypatch.setattr(
+        async_rem_bot_module,
+        "SETTINGS",
+        dataclasses.replace(async_rem_bot_module.SETTINGS, TICK_JOURNAL=True),
+    )
+    monkeypatch.setattr(
+        async_rem_bot_module, "TickRecorder", SimpleNamespace(for_symbol=for_symbol)
+    )
+    bot = AsyncRemBot()
+    monkeypatch.setattr(
+        bot.scheduler, "next_tick", scripted_ticks((0, False), (0, False))
+    )
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    assert opened == [
+        ("ETHUSDT", async_rem_bot_module.SETTINGS.TICK_SEGMENT_MB * 1024 * 1024)
+    ]
+    assert recorder.recorded == [bot.data_manager.market_snapshot] * 2
+    assert recorder.closed is True
+
+
+class FakeCheckpoint:
+    def __init__(self, restored_state=None) -> None:
+        self.restored_state = restored_state
+        self.symbols = []
+        self.saves = []
+        self.candle_closes = 0
+
+    def for_symbol(self, symbol: str) -> "FakeCheckpoint":
+        self.symbols.append(symbol)
+        return self
+
+    def restore(self, bot: AsyncRemBot) -> bool:
+        if self.restored_state is None:
+            return False
+        bot.state = self.restored_state(bot)
+        return True
+
+    def save(self, bot: AsyncRemBot) -> None:
+        self.saves.append(type(bot.state).__name__)
+
+    def save_on_candle_close(self, _bot: AsyncRemBot) -> None:
+        self.candle_closes += 1
+
+
+class RestoredLong(async_rem_bot_module.ActivePositionState):
+    SIDE = "LONG"
+
+    def __init__(self, parent: AsyncRemBot) -> None:
+        super().__init__(parent=parent, target_prices=[110.0, 95.0])
+        self.fills = []
+
+    def apply(self) -> None:
+        return None
+
+    def _is_tp_price(self) -> bool:
+        return False
+
+    def _is_sl_price(self) -> bool:
+        return False
+
+    def close_from_fill(self, fill) -> None:
+        self.fills.append(fill)
+
+
+class FakeAccountManager:
+    def __init__(self, amounts, fill=None) -> None:
+        self.amounts = amounts
+        self.fill = fill
+        self.cancelled = []
+
+    async def async_get_position_amount(self, side: str) -> float:
+        return self.amounts.get(side, 0.0)
+
+    async def async_fetch_exit_fill(self):
+        return self.fill
+
+    async def async_cancel_remaining_exit(self, fill) -> None:
+        self.cancelled.append(fill)
+
+
+def start_checkpointed_bot(
+    monkeypatch, checkpoint, account_manager=None, test_mode=False
+) -> AsyncRemBot:
+    monkeypatch.setattr(
+        async_rem_bot_module,
+        "SETTINGS",
+        dataclasses.replace(
+            async_rem_bot_module.SETTINGS, CHECKPOINT=True, TEST_MODE=test_mode
+        ),
+    )
+    monkeypatch.setattr(async_rem_bot_module, "BotCheckpoint", checkpoint)
+    adapter = FakeAsyncBinanceAdapter(Snapshot(price=100.0, ema_100=150.0))
+    adapter.symbol_settings = SimpleNamespace(SYMBOL="ETHUSDT")
+    adapter.account_manager = account_manager
+    bot = AsyncRemBot(adapter)  # type: ignore[arg-type]
+    monkeypatch.setattr(bot.scheduler, "next_tick", scripted_ticks((0, False)))
+
+    async def fake_step(self, full_refresh=True):
+        return None
+
+    monkeypatch.setattr(async_rem_bot_module.PositionState, "async_step", fake_step)
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+    return bot
+
+
+def test_run_checkpoints_state_changes_and_candle_closes(monkeypatch, adapter):
+    checkpoint = FakeCheckpoint()
+    bot = start_checkpointed_bot(monkeypatch, checkpoint, test_mode=True)
+
+    assert checkpoint.symbols == ["ETHUSDT"]
+    assert bot.checkpoint is checkpoint
+    assert bot.data_manager.is_long_blocked is True
+    assert checkpoint.saves == ["RecordingState"]
+    assert checkpoint.candle_closes == 1
+
+
+def test_restored_open_position_is_kept(monkeypatch, adapter):
+    bot = start_checkpointed_bot(
+        monkeypatch, FakeCheckpoint(RestoredLong), FakeAccountManager({"LONG": 0.5})
+    )
+
+    assert isinstance(bot.state, RestoredLong)
+    assert bot.state.fills == []
+    assert bot.data_manager.is_long_blocked is False
+
+
+def test_restored_position_closed_by_an_exit_fill_is_closed_with_it(
+    monkeypatch, adapter
+):
+    fill = SimpleNamespace(is_tp=False, price=94.8)
+    account_manager = FakeAccountManager({}, fill)
+    bot = start_checkpointed_bot(
+        monkeypatch, FakeCheckpoint(RestoredLong), account_manager
+    )
+
+    assert account_manager.cancelled == [fill]
+    assert bot.state.fills == [fill]
+
+
+def test_restored_position_closed_elsewhere_returns_to_flat(monkeypatch, adapter):
+    logs = []
+    monkeypatch.setattr(async_rem_bot_module.Logger, "log_info", logs.append)
+    checkpoint = FakeCheckpoint(RestoredLong)
+    bot = start_checkpointed_bot(monkeypatch, checkpoint, FakeAccountManager({}))
+
+    assert isinstance(bot.state, RecordingState)
+    assert checkpoint.saves == ["RestoredLong", "RecordingState"]
+    assert "Restored LONG position is no longer open." in logs
+
+
+def test_untracked_exchange_position_is_reported(monkeypatch, adapter):
+    logs = []
+    monkeypatch.setattr(async_rem_bot_module.Logger, "log_info", logs.append)
+
+    class RestoredFlat(RecordingState):
+        pass
+
+    start_checkpointed_bot(
+        monkeypatch,
+        FakeCheckpoint(RestoredFlat),
+        FakeAccountManager({"SHORT": -1.0}),
+    )
+
+    assert logs[-1] == "Untracked SHORT position is open."
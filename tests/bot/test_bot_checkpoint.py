@@ -0,0 +1,205 @@
+import json
+from types import SimpleNamespace
+import pytest
+from bot.bot_checkpoint import BotCheckpoint
+import bot.bot_checkpoint as bot_checkpoint_module
+from bot.data_manager import DataManager
+from bot.performance_tracker import PerformanceTracker
+from bot.states.active.long_position_state import LongPositionState
+from bot.states.active.short_position_state import ShortPositionState
+from bot.states.flat.flat_position_state import FlatPositionState
+from data.market_snapshot import MarketSnapshot
+
+
+@pytest.fixture(autouse=True)
+def patch_settings(monkeypatch):
+    monkeypatch.setattr(
+        bot_checkpoint_module, "SETTINGS", SimpleNamespace(INTERVAL="15m")
+    )
+
+
+class FakeIndicatorManager:
+    def __init__(self, committed_open_time=None) -> None:
+        self.committed_open_time = committed_open_time
+        self.restored = None
+
+    def export_state(self):
+        return {
+            "engine": {"ema": {"value": 1.5}},
+            "committed_open_time": self.committed_open_time,
+            "last_kline": [self.committed_open_time, "1.5"],
+        }
+
+    def restore_state(self, state):
+        self.restored = state
+        self.committed_open_time = state["committed_open_time"]
+
+
+def make_snapshot(price: float) -> MarketSnapshot:
+    return MarketSnapshot(
+        date="2025-08-29 00:00",
+        price=price,
+        macd_12=0.1,
+        macd_26=0.2,
+        ema_100=price - 1,
+        rsi_6=50.0,
+    )
+
+
+def make_bot(symbol: str = "ETHUSDT", committed_open_time=None) -> SimpleNamespace:
+    return SimpleNamespace(
+        symbol_settings=SimpleNamespace(SYMBOL=symbol),
+        data_manager=DataManager(),
+        performance_tracker=PerformanceTracker(),
+        binance_adapter=SimpleNamespace(
+            indicator_manager=FakeIndicatorManager(committed_open_time),
+            account_manager=SimpleNamespace(exit_order_ids={}),
+        ),
+        state=None,
+    )
+
+
+def make_long_bot() -> SimpleNamespace:
+    bot = make_bot(committed_open_time=900_000)
+    bot.data_manager.market_snapshot = make_snapshot(101.0)
+    bot.data_manager.position_snapshot = make_snapshot(100.0)
+    bot.data_manager.is_long_blocked = True
+    bot.performance_tracker.win_count = 3
+    bot.performance_tracker.loss_count = 1
+    bot.binance_adapter.account_manager.exit_order_ids = {
+        "take-profit": 2,
+        "stop-loss": 3,
+    }
+    bot.state = LongPositionState(parent=bot, target_prices=[110.0, 95.0])
+    return bot
+
+
+def test_for_symbol_stores_the_checkpoint_in_the_base_dir():
+    checkpoint = BotCheckpoint.for_symbol("ETHUSDT")
+    assert checkpoint.path == bot_checkpoint_module.BASE_DIR / "checkpoint_ETHUSDT.json"
+
+
+def test_saved_position_is_restored(tmp_path):
+    checkpoint = BotCheckpoint(tmp_path / "checkpoint.json")
+    checkpoint.save(make_long_bot())
+
+    assert checkpoint.saved_open_time == 900_000
+    assert not (tmp_path / "checkpoint.json.tmp").exists()
+
+    bot = make_bot()
+    restored = BotCheckpoint(tmp_path / "checkpoint.json")
+    assert restored.restore(bot) is True
+
+    assert isinstance(bot.state, LongPositionState)
+    assert bot.state.parent is bot
+    assert (bot.state.tp_price, bot.state.sl_price) == (110.0, 95.0)
+    assert bot.binance_adapter.account_manager.exit_order_ids == {
+        "take-profit": 2,
+        "stop-loss": 3,
+    }
+    assert bot.data_manager.position_snapshot.price == 100.0
+    assert bot.data_manager.market_snapshot.price == 101.0
+    assert bot.data_manager.is_long_blocked is True
+    assert bot.data_manager.is_short_blocked is False
+    assert bot.performance_tracker.win_count == 3
+    assert bot.performance_tracker.loss_count == 1
+    assert bot.binance_adapter.indicator_manager.restored["committed_open_time"] == (
+        900_000
+    )
+    assert restored.saved_open_time == 900_000
+
+
+def test_short_and_flat_states_are_restored(tmp_path):
+    checkpoint = BotCheckpoint(tmp_path / "checkpoint.json")
+    bot = make_long_bot()
+    bot.state = ShortPositionState(parent=bot, target_prices=[90.0, 105.0])
+    checkpoint.save(bot)
+    restored_bot = make_bot()
+    assert checkpoint.restore(restored_bot)
+    assert isinstance(restored_bot.state, ShortPositionState)
+
+    bot.state = FlatPositionState(parent=bot)
+    checkpoint.save(bot)
+    data = json.loads(checkpoint.path.read_text())
+    assert (data["state"], data["tp_price"], data["exit_order_ids"]) == (
+        "FLAT",
+        None,
+        {},
+    )
+    assert data["position_snapshot"] is None
+    restored_bot = make_bot()
+    assert checkpoint.restore(restored_bot)
+    assert isinstance(restored_bot.state, FlatPositionState)
+
+
+def test_missing_or_foreign_checkpoints_are_not_restored(tmp_path, monkeypatch):
+    checkpoint = BotCheckpoint(tmp_path / "checkpoint.json")
+    assert checkpoint.restore(make_bot()) is False
+
+    checkpoint.save(make_long_bot())
+    assert checkpoint.restore(make_bot(symbol="BTCUSDT")) is False
+    monkeypatch.setattr(
+        bot_checkpoint_module, "SETTINGS", SimpleNamespace(INTERVAL="1h")
+    )
+    assert checkpoint.restore(make_bot()) is False
+
+
+def test_unreadable_checkpoints_are_logged_and_ignored(tmp_path, monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        bot_checkpoint_module.Logger, "log_exception", lambda m: logged.append(m)
+    )
+    checkpoint = BotCheckpoint(tmp_path / "checkpoint.json")
+    checkpoint.path.write_text("{truncated")
+    assert checkpoint.restore(make_bot()) is False
+
+    checkpoint.path.write_text(
+        json.dumps(
+            {"version": 1, "symbol": "ETHUSDT", "interval": "15m", "indicators": {}}
+        )
+    )
+    assert checkpoint.restore(make_bot()) is False
+    assert checkpoint.saved_open_time is None
+
+    assert logged[0].startswith("Checkpoint unreadable: ")
+    assert logged[1].startswith("Checkpoint restore failed: ")
+
+
+def test_failed_save_is_logged_and_keeps_the_previous_checkpoint(tmp_path, monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        bot_checkpoint_module.Logger, "log_exception", lambda m: logged.append(m)
+    )
+    checkpoint = BotCheckpoint(tmp_path / "checkpoint.json")
+    checkpoint.save(make_long_bot())
+    previous = checkpoint.path.read_text()
+
+    def fail_replace(*_args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(
+        bot_checkpoint_module,
+        "os",
+        SimpleNamespace(fsync=lambda _fd: None, replace=fail_replace),
+    )
+    checkpoint.save(make_long_bot())
+
+    assert logged == ["Checkpoint save failed: disk full"]
+    assert checkpoint.path.read_text() == previous
+
+
+def test_candle_close_saves_only_when_a_new_kline_was_committed(tmp_path):
+    checkpoint = BotCheckpoint(tmp_path / "checkpoint.json")
+    bot = make_long_bot()
+    checkpoint.save_on_candle_close(bot)
+    saved_ms = json.loads(checkpoint.path.read_text())["saved_ms"]
+
+    checkpoint.path.unlink()
+    checkpoint.save_on_candle_close(bot)
+    assert not checkpoint.path.exists()
+
+    bot.binance_adapter.indicator_manager.committed_open_time = 1_800_000
+    checkpoint.save_on_candle_close(bot)
+    data = json.loads(checkpoint.path.read_text())
+    assert data["indicators"]["committed_open_time"] == 1_800_000
+    assert data["saved_ms"] >= saved_ms
@@ -134,3 +134,18 @@
 # def test_test_mode_false_requires_api_keys():
 #     with pytest.raises(ValueError, match="API keys must not be empty"):
 #         BotSettings(API_PUBLIC_KEY="", API_SECRET_KEY="", SYMBOL="X", TEST_MODE=False)
+
+
+def test_read_portfolio_falls_back_to_position_settings():
+    from bot.bot_settings import BASE_DIR, _read_portfolio
+    from bot.symbol_settings import SymbolSettings
+
+    position = {"COIN_PRECISION": 2, "TP_RATIO": 0.01, "SL_RATIO": 0.02, "LEVERAGE": 1}
+    portfolio = _read_portfolio(
+        position, [{"SYMBOL": "BTCUSDT", "LEVERAGE": 5}, {"SYMBOL": "ETHUSDT"}]
+    )
+
+    assert portfolio == (
+        SymbolSettings("BTCUSDT", 2, 0.01, 0.02, 5, BASE_DIR / "results_BTCUSDT.csv"),
+        SymbolSettings("ETHUSDT", 2, 0.01, 0.02, 1, BASE_DIR / "results_ETHUSDT.csv"),
+    )
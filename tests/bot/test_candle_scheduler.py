@@ -0,0 +1,91 @@
+import pytest
+from bot.candle_scheduler import CandleScheduler
+import bot.candle_scheduler as scheduler_module
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = {"ms": 0}
+    monkeypatch.setattr(
+        scheduler_module.DateUtils, "get_timestamp_ms", lambda: now["ms"]
+    )
+    return now
+
+
+def test_price_ticks_are_aligned_to_candle_open(clock):
+    scheduler = CandleScheduler("1m", tick_seconds=15)
+    clock["ms"] = 120_000 + 3_200
+
+    delay, is_close = scheduler.next_tick()
+
+    assert delay == pytest.approx(11.8)
+    assert is_close is False
+
+
+def test_candle_close_wins_when_no_tick_fits_before_it(clock):
+    scheduler = CandleScheduler("1m", tick_seconds=15)
+    clock["ms"] = 120_000 + 46_000
+
+    delay, is_close = scheduler.next_tick()
+
+    assert delay == pytest.approx(14.0 + CandleScheduler.CLOSE_GRACE_MS / 1000)
+    assert is_close is True
+
+
+def test_slow_steps_do_not_accumulate_drift(clock):
+    scheduler = CandleScheduler("1m", tick_seconds=15)
+    clock["ms"] = 15_000 + 4_000  # step took 4 s after the 15 s tick
+
+    delay, _ = scheduler.next_tick()
+
+    assert clock["ms"] + delay * 1000 == 30_000
+
+
+def test_tick_longer_than_interval_only_yields_candle_closes(clock):
+    scheduler = CandleScheduler("1m", tick_seconds=300)
+    clock["ms"] = 10_000
+    assert scheduler.next_tick() == (pytest.approx(50.25), True)
+
+
+def test_server_offset_is_applied_and_resynced_hourly(clock):
+    server_times = iter([1_000, 3_600_000 + 5_000])
+    scheduler = CandleScheduler(
+        "1m", tick_seconds=15, server_time_fn=lambda: next(server_times)
+    )
+
+    clock["ms"] = 0
+    assert scheduler.now_ms() == 1_000
+    clock["ms"] = 10_000
+    assert scheduler.now_ms() == 11_000
+    clock["ms"] = 3_600_000
+    assert scheduler.now_ms() == 3_605_000
+    assert scheduler.offset_ms == 5_000
+
+
+def test_failed_sync_keeps_previous_offset(clock, monkeypatch):
+    logged = []
+    monkeypatch.setattr(scheduler_module.Logger, "log_exception", logged.append)
+
+    def failing_server_time() -> int:
+        raise RuntimeError("timeout")
+
+    scheduler = CandleScheduler("1m", 15, server_time_fn=failing_server_time)
+    scheduler.offset_ms = 42
+    assert scheduler.now_ms() == 42
+    assert logged == ["Server time sync failed: timeout"]
+
+
+def test_pace_fn_spreads_price_ticks_but_not_candle_closes(clock):
+    paced = []
+
+    def pace(base_seconds):
+        paced.append(base_seconds)
+        return 60.0
+
+    scheduler = CandleScheduler("1m", tick_seconds=15, pace_fn=pace)
+    clock["ms"] = 120_000 + 3_200
+    assert scheduler.next_tick() == (pytest.approx(56.8 + 0.25), True)
+    assert paced == [15.0]
+
+    scheduler.pace_fn = lambda _base: 20.0
+    assert scheduler.next_tick() == (pytest.approx(20.0), False)
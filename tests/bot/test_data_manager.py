@@ -1,4 +1,5 @@
 from bot.data_manager import DataManager
+from data.market_snapshot import MarketSnapshot
 import bot.data_manager as data_manager_module
 
 
@@ -46,3 +47,18 @@ def test_block_long_sets_flags_and_logs_in_order(monkeypatch):
         "Long trading is BLOCKED.",
         "Short trading is UNBLOCKED.",
     ]
+
+
+def test_new_market_snapshots_are_appended_to_the_history():
+    manager = DataManager()
+    first = MarketSnapshot("[2024-10-04 00:00:00]", 100, 1, 2, 99, 40)
+    second = first.with_price("[2024-10-04 00:01:00]", 101)
+
+    manager.market_snapshot = first
+    manager.market_snapshot = first
+    manager.market_snapshot = second
+
+    assert manager.market_snapshot is second
+    assert len(manager.history) == 2
+    assert manager.history.window()["price"].tolist() == [100.0, 101.0]
+    assert manager.history.capacity == DataManager.HISTORY_SIZE
@@ -0,0 +1,317 @@
+import asyncio
+import dataclasses
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from bot.portfolio_bot import PortfolioBot
+import bot.portfolio_bot as portfolio_bot_module
+from bot.symbol_settings import SymbolSettings
+from data.market_snapshot import MarketSnapshot
+
+
+class StopLoop(Exception):
+    pass
+
+
+class Snapshot(MarketSnapshot):
+    def __init__(self, price: float, ema_100: float) -> None:
+        super().__init__("[2025-08-29 00:00:00]", price, 0.0, 0.0, ema_100, 50.0)
+
+
+class FakeIndicatorManager:
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.calls = []
+
+    async def async_fetch_indicators(self) -> Snapshot:
+        self.calls.append("fetch")
+        return Snapshot(price=100.0, ema_100=150.0 if self.symbol == "AUSDT" else 50.0)
+
+    async def async_fetch_price_snapshot(self) -> Snapshot:
+        self.calls.append("price")
+        return Snapshot(price=100.0, ema_100=100.0)
+
+
+class FakeAsyncBinanceAdapter:
+    instances: list = []
+    account_stream = None
+    exchange_filter_cache = None
+    exchange_filter_loads: list = []
+    client_limiters: list = []
+    client_timings: list = []
+
+    def __init__(self, client, loop, symbol_settings) -> None:
+        self.client = client
+        self.loop = loop
+        self.symbol_settings = symbol_settings
+        self.indicator_manager = FakeIndicatorManager(symbol_settings.SYMBOL)
+        self.account_manager = SimpleNamespace(
+            account_stream=None, use_exchange_filters=MagicMock()
+        )
+        self.leverage_configured = False
+        FakeAsyncBinanceAdapter.instances.append(self)
+
+    @staticmethod
+    async def create_client(rate_limiter=None, request_timings=None):
+        FakeAsyncBinanceAdapter.client_limiters.append(rate_limiter)
+        FakeAsyncBinanceAdapter.client_timings.append(request_timings)
+        return await portfolio_bot_module.AsyncClient.create("key", "secret")
+
+    @staticmethod
+    async def start_account_stream():
+        return FakeAsyncBinanceAdapter.account_stream
+
+    @staticmethod
+    async def load_exchange_filters(client):
+        FakeAsyncBinanceAdapter.exchange_filter_loads.append(client)
+        return FakeAsyncBinanceAdapter.exchange_filter_cache
+
+    async def configure_leverage(self) -> None:
+        self.leverage_configured = True
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async_client = MagicMock()
+    async_client.get_server_time = AsyncMock(return_value={"serverTime": 5_000})
+    async_client.close_connection = AsyncMock()
+    monkeypatch.setattr(
+        portfolio_bot_module.AsyncClient, "create", AsyncMock(return_value=async_client)
+    )
+    monkeypatch.setattr(
+        portfolio_bot_module, "AsyncBinanceAdapter", FakeAsyncBinanceAdapter
+    )
+    monkeypatch.setattr(portfolio_bot_module.Logger, "log_start", lambda _m: None)
+    monkeypatch.setattr(
+        portfolio_bot_module.DateUtils, "get_timestamp_ms", lambda: 2_000
+    )
+    FakeAsyncBinanceAdapter.instances = []
+    FakeAsyncBinanceAdapter.account_stream = MagicMock()
+    FakeAsyncBinanceAdapter.exchange_filter_loads = []
+    FakeAsyncBinanceAdapter.client_limiters = []
+    FakeAsyncBinanceAdapter.client_timings = []
+    return async_client
+
+
+def make_settings(symbol: str) -> SymbolSettings:
+    return SymbolSettings(symbol, 2, 0.01, 0.01, 1, f"results_{symbol}.csv")
+
+
+def test_run_shares_one_client_and_steps_every_symbol(monkeypatch, client):
+    bot = PortfolioBot([make_settings("AUSDT"), make_settings("BUSDT")])
+    ticks = iter([(0, False), (0, True)])
+
+    def next_tick():
+        try:
+            return next(ticks)
+        except StopIteration:
+            raise StopLoop
+
+    monkeypatch.setattr(bot.scheduler, "next_tick", next_tick)
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    adapters = FakeAsyncBinanceAdapter.instances
+    assert [a.symbol_settings.SYMBOL for a in adapters] == ["AUSDT", "BUSDT"]
+    assert all(a.client is client and a.leverage_configured for a in adapters)
+    assert [b.binance_adapter for b in bot.bots] == adapters
+    assert bot.bots[0].data_manager.is_long_blocked is True
+    assert bot.bots[1].data_manager.is_short_blocked is True
+    assert [a.indicator_manager.calls for a in adapters] == [
+        ["fetch", "price", "fetch"],
+        ["fetch", "price", "fetch"],
+    ]
+    assert bot.scheduler.offset_ms == 3_000
+    assert client.get_server_time.await_count == 2
+    client.close_connection.assert_awaited_once_with()
+
+
+def test_run_shares_one_account_stream_and_stops_it(monkeypatch, client):
+    monkeypatch.setattr(
+        portfolio_bot_module,
+        "SETTINGS",
+        dataclasses.replace(portfolio_bot_module.SETTINGS, ACCOUNT_STREAM=True),
+    )
+    bot = PortfolioBot([make_settings("AUSDT"), make_settings("BUSDT")])
+    monkeypatch.setattr(bot.scheduler, "next_tick", MagicMock(side_effect=StopLoop))
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    account_stream = FakeAsyncBinanceAdapter.account_stream
+    assert all(
+        a.account_manager.account_stream is account_stream
+        for a in FakeAsyncBinanceAdapter.instances
+    )
+    account_stream.stop.assert_called_once_with()
+    client.close_connection.assert_awaited_once_with()
+
+
+def test_run_loads_exchange_filters_once_for_every_symbol(monkeypatch, client):
+    monkeypatch.setattr(
+        portfolio_bot_module,
+        "SETTINGS",
+        dataclasses.replace(portfolio_bot_module.SETTINGS, EXCHANGE_FILTERS=True),
+    )
+    cache = object()
+    FakeAsyncBinanceAdapter.exchange_filter_cache = cache
+    bot = PortfolioBot([make_settings("AUSDT"), make_settings("BUSDT")])
+    monkeypatch.setattr(bot.scheduler, "next_tick", MagicMock(side_effect=StopLoop))
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    assert FakeAsyncBinanceAdapter.exchange_filter_loads == [client]
+    for adapter in FakeAsyncBinanceAdapter.instances:
+        adapter.account_manager.use_exchange_filters.assert_called_once_with(cache)
+
+
+def test_run_shares_one_rate_limiter_and_paces_the_ticks(monkeypatch, client):
+    monkeypatch.setattr(
+        portfolio_bot_module,
+        "SETTINGS",
+        dataclasses.replace(portfolio_bot_module.SETTINGS, RATE_LIMIT=True),
+    )
+    bot = PortfolioBot([make_settings("AUSDT"), make_settings("BUSDT")])
+    monkeypatch.setattr(bot.scheduler, "next_tick", MagicMock(side_effect=StopLoop))
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    (rate_limiter,) = FakeAsyncBinanceAdapter.client_limiters
+    assert isinstance(rate_limiter, portfolio_bot_module.RateLimiter)
+    assert all(
+        a.rate_limiter is rate_limiter for a in FakeAsyncBinanceAdapter.instances
+    )
+    assert bot.scheduler.pace_fn == rate_limiter.poll_interval
+
+
+def test_run_shares_one_request_timings_with_http_tuning(monkeypatch, client):
+    monkeypatch.setattr(
+        portfolio_bot_module,
+        "SETTINGS",
+        dataclasses.replace(portfolio_bot_module.SETTINGS, HTTP_TUNING=True),
+    )
+    bot = PortfolioBot([make_settings("AUSDT"), make_settings("BUSDT")])
+    monkeypatch.setattr(bot.scheduler, "next_tick", MagicMock(side_effect=StopLoop))
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    (request_timings,) = FakeAsyncBinanceAdapter.client_timings
+    assert isinstance(request_timings, portfolio_bot_module.RequestTimings)
+    assert all(
+        a.request_timings is request_timings for a in FakeAsyncBinanceAdapter.instances
+    )
+
+
+class FakeTickRecorder:
+    def __init__(self, symbol: str, max_segment_bytes: int) -> None:
+        self.symbol = symbol
+        self.max_segment_bytes = max_segment_bytes
+        self.recorded = []
+        self.closed = False
+
+    def record(self, snapshot) -> None:
+        self.recorded.append(snapshot.ema_100)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_run_records_every_symbol_in_its_tick_journal(monkeypatch, client):
+    monkeypatch.setattr(
+        portfolio_bot_module,
+        "SETTINGS",
+        dataclasses.replace(portfolio_bot_module.SETTINGS, TICK_JOURNAL=True),
+    )
+    monkeypatch.setattr(
+        portfolio_bot_module,
+        "TickRecorder",
+        SimpleNamespace(for_symbol=FakeTickRecorder),
+    )
+    bot = PortfolioBot([make_settings("AUSDT"), make_settings("BUSDT")])
+    ticks = iter([(0, False), (0, True)])
+
+    def next_tick():
+        try:
+            return next(ticks)
+        except StopIteration:
+            raise StopLoop
+
+    monkeypatch.setattr(bot.scheduler, "next_tick", next_tick)
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    recorders = [b.tick_recorder for b in bot.bots]
+    assert [r.symbol for r in recorders] == ["AUSDT", "BUSDT"]
+    assert all(
+        r.max_segment_bytes
+        == portfolio_bot_module.SETTINGS.TICK_SEGMENT_MB * 1024 * 1024
+        for r in recorders
+    )
+    assert [r.recorded for r in recorders] == [[100.0, 150.0], [100.0, 50.0]]
+    assert all(r.closed for r in recorders)
+
+
+def test_server_time_sync_failure_is_logged(monkeypatch, client):
+    client.get_server_time.side_effect = RuntimeError("timeout")
+    logged = []
+    monkeypatch.setattr(
+        portfolio_bot_module.Logger, "log_exception", lambda m: logged.append(m)
+    )
+    bot = PortfolioBot([])
+
+    asyncio.run(bot._sync_server_time(client))
+
+    assert logged == ["Server time sync failed: timeout"]
+    assert bot.scheduler.offset_ms == 0
+
+
+class FakeCheckpoint:
+    def __init__(self, symbol: str) -> None:
+        self.symbol = symbol
+        self.saves = []
+        self.candle_closes = 0
+
+    def restore(self, _bot) -> bool:
+        return False
+
+    def save(self, bot) -> None:
+        self.saves.append(type(bot.state).__name__)
+
+    def save_on_candle_close(self, _bot) -> None:
+        self.candle_closes += 1
+
+
+def test_run_checkpoints_every_symbol_in_its_own_file(monkeypatch, client):
+    monkeypatch.setattr(
+        portfolio_bot_module,
+        "SETTINGS",
+        dataclasses.replace(portfolio_bot_module.SETTINGS, CHECKPOINT=True),
+    )
+    monkeypatch.setattr(
+        portfolio_bot_module,
+        "BotCheckpoint",
+        SimpleNamespace(for_symbol=FakeCheckpoint),
+    )
+    bot = PortfolioBot([make_settings("AUSDT"), make_settings("BUSDT")])
+    ticks = iter([(0, False)])
+
+    def next_tick():
+        try:
+            return next(ticks)
+        except StopIteration:
+            raise StopLoop
+
+    monkeypatch.setattr(bot.scheduler, "next_tick", next_tick)
+
+    with pytest.raises(StopLoop):
+        asyncio.run(bot.run())
+
+    checkpoints = [b.checkpoint for b in bot.bots]
+    assert [c.symbol for c in checkpoints] == ["AUSDT", "BUSDT"]
+    assert all(c.saves == ["FlatPositionState"] for c in checkpoints)
+    assert all(c.candle_closes == 1 for c in checkpoints)
@@ -1,17 +1,20 @@
+import dataclasses
+from types import SimpleNamespace
 import pytest
 from bot.rem_bot import RemBot
 import bot.rem_bot as rem_bot_module
+from data.market_snapshot import MarketSnapshot
 
 
-class Snapshot:
+class Snapshot(MarketSnapshot):
     def __init__(self, price: float, ema_100: float) -> None:
-        self.price = price
-        self.ema_100 = ema_100
+        super().__init__("[2025-08-29 00:00:00]", price, 0.0, 0.0, ema_100, 50.0)
 
 
 class FakeIndicatorManager:
     def __init__(self, snapshot: Snapshot) -> None:
         self._snapshot = snapshot
+        self.market_stream = None
 
     def fetch_indicators(self) -> Snapshot:
         return self._snapshot
@@ -20,6 +23,11 @@ class FakeIndicatorManager:
 class FakeBinanceAdapter:
     def __init__(self, snapshot: Snapshot) -> None:
         self.indicator_manager = FakeIndicatorManager(snapshot)
+        self.account_manager = SimpleNamespace(account_stream=None)
+        self.rate_limiter = None
+
+    def get_server_time(self) -> int:
+        return 0
 
 
 class FakeState(rem_bot_module.PositionState):
@@ -75,6 +83,23 @@ def test_init_blocks_short_when_price_at_or_above_ema(monkeypatch):
     assert bot.state.parent is bot
 
 
+def test_init_uses_injected_adapter_and_its_symbol_settings(monkeypatch):
+    monkeypatch.setattr(rem_bot_module, "FlatPositionState", FakeState)
+
+    def fail_factory(*_args, **_kwargs):
+        raise AssertionError("no adapter must be created")
+
+    monkeypatch.setattr(rem_bot_module, "BinanceAdapter", fail_factory)
+    adapter = FakeBinanceAdapter(Snapshot(price=100.0, ema_100=150.0))
+    adapter.symbol_settings = object()
+
+    bot = RemBot(binance_adapter=adapter)
+
+    assert bot.binance_adapter is adapter
+    assert bot.symbol_settings is adapter.symbol_settings
+    assert bot.data_manager.is_long_blocked is True
+
+
 def test_run_exits_when_sleep_raises_and_sleep_called_once(monkeypatch):
     # Force the loop to exit deterministically by raising from sleep.
     calls = []
@@ -103,3 +128,299 @@ def test_run_exits_when_sleep_raises_and_sleep_called_once(monkeypatch):
 
     assert len(calls) == 1
     assert isinstance(calls[0], (int, float))
+
+
+def test_run_in_stream_mode_starts_streams_and_waits_for_events(monkeypatch):
+    class StopLoop(Exception):
+        pass
+
+    class FakeStream:
+        def __init__(self) -> None:
+            self.calls = []
+
+        def start(self) -> None:
+            self.calls.append("start")
+
+        def wait_for_update(self, timeout: float) -> bool:
+            self.calls.append(("wait", timeout))
+            raise StopLoop
+
+    def fail_sleep(_seconds: float) -> None:
+        raise AssertionError("sleep must not be used in stream mode")
+
+    monkeypatch.setattr(rem_bot_module, "sleep", fail_sleep)
+    monkeypatch.setattr(rem_bot_module, "FlatPositionState", FakeState)
+
+    adapter = FakeBinanceAdapter(Snapshot(price=100.0, ema_100=50.0))
+    stream = FakeStream()
+    account_stream = FakeStream()
+    adapter.indicator_manager.market_stream = stream
+    adapter.account_manager.account_stream = account_stream
+    monkeypatch.setattr(rem_bot_module, "BinanceAdapter", lambda: adapter)
+
+    bot = RemBot()
+    with pytest.raises(StopLoop):
+        bot.run()
+
+    assert account_stream.calls == ["start"]
+    assert stream.calls == [
+        "start",
+        ("wait", rem_bot_module.SETTINGS.SLEEP_DURATION),
+    ]
+
+
+def test_run_sleeps_until_next_tick_and_passes_refresh_kind(monkeypatch):
+    class StopLoop(Exception):
+        pass
+
+    steps = []
+
+    class RecordingState(FakeState):
+        def apply(self) -> None:
+            steps.append("apply")
+
+    sleeps = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        if len(sleeps) == 3:
+            raise StopLoop
+
+    monkeypatch.setattr(rem_bot_module, "sleep", fake_sleep)
+    monkeypatch.setattr(rem_bot_module, "FlatPositionState", RecordingState)
+    monkeypatch.setattr(
+        rem_bot_module,
+        "BinanceAdapter",
+        lambda: FakeBinanceAdapter(Snapshot(price=100.0, ema_100=50.0)),
+    )
+
+    bot = RemBot()
+    ticks = iter([(1.5, False), (0.5, True), (2.0, False)])
+    monkeypatch.setattr(bot.scheduler, "next_tick", lambda: next(ticks))
+    refreshes = []
+    monkeypatch.setattr(
+        bot.state, "_refresh_indicators", lambda: refreshes.append("full")
+    )
+    monkeypatch.setattr(bot.state, "_refresh_price", lambda: refreshes.append("price"))
+
+    with pytest.raises(StopLoop):
+        bot.run()
+
+    assert sleeps == [1.5, 0.5, 2.0]
+    assert refreshes == ["price", "full"]
+    assert steps == ["apply", "apply"]
+
+
+def test_init_paces_ticks_with_the_adapter_rate_limiter(monkeypatch):
+    monkeypatch.setattr(rem_bot_module.Logger, "log_start", lambda _message: None)
+    monkeypatch.setattr(rem_bot_module, "FlatPositionState", FakeState)
+    adapter = FakeBinanceAdapter(Snapshot(price=100.0, ema_100=50.0))
+    adapter.rate_limiter = SimpleNamespace(poll_interval=lambda base: base * 2)
+    monkeypatch.setattr(rem_bot_module, "BinanceAdapter", lambda *_a, **_k: adapter)
+
+    bot = RemBot()
+
+    assert bot.scheduler.pace_fn is adapter.rate_limiter.poll_interval
+
+
+class FakeCheckpoint:
+    def __init__(self, restored_state=None) -> None:
+        self.restored_state = restored_state
+        self.saves = []
+        self.candle_closes = 0
+
+    def restore(self, bot: RemBot) -> bool:
+        if self.restored_state is None:
+            return False
+        bot.state = self.restored_state(bot)
+        return True
+
+    def save(self, bot: RemBot) -> None:
+        self.saves.append(type(bot.state).__name__)
+
+    def save_on_candle_close(self, _bot: RemBot) -> None:
+        self.candle_closes += 1
+
+
+class RestoredLong(rem_bot_module.ActivePositionState):
+    SIDE = "LONG"
+
+    def __init__(self, parent: RemBot) -> None:
+        super().__init__(parent=parent, target_prices=[110.0, 95.0])
+        self.fills = []
+
+    def apply(self) -> None:
+        return None
+
+    def _is_tp_price(self) -> bool:
+        return False
+
+    def _is_sl_price(self) -> bool:
+        return False
+
+    def close_from_fill(self, fill) -> None:
+        self.fills.append(fill)
+
+
+class FakeAccountManager:
+    def __init__(self, amounts, fill=None) -> None:
+        self.account_stream = None
+        self.amounts = amounts
+        self.fill = fill
+        self.cancelled = []
+
+    def get_position_amount(self, side: str) -> float:
+        return self.amounts.get(side, 0.0)
+
+    def fetch_exit_fill(self):
+        return self.fill
+
+    def cancel_remaining_exit(self, fill) -> None:
+        self.cancelled.append(fill)
+
+
+def make_checkpointed_bot(
+    monkeypatch, checkpoint, account_manager=None, test_mode=False
+) -> RemBot:
+    monkeypatch.setattr(
+        rem_bot_module,
+        "SETTINGS",
+        dataclasses.replace(
+            rem_bot_module.SETTINGS, CHECKPOINT=True, TEST_MODE=test_mode
+        ),
+    )
+    monkeypatch.setattr(
+        rem_bot_module,
+        "BotCheckpoint",
+        SimpleNamespace(for_symbol=lambda _symbol: checkpoint),
+    )
+    monkeypatch.setattr(rem_bot_module, "FlatPositionState", FakeState)
+    adapter = FakeBinanceAdapter(Snapshot(price=100.0, ema_100=150.0))
+    if account_manager is not None:
+        adapter.account_manager = account_manager
+    monkeypatch.setattr(rem_bot_module, "BinanceAdapter", lambda: adapter)
+    return RemBot()
+
+
+def test_state_changes_are_checkpointed_and_replays_are_not(monkeypatch):
+    checkpoint = FakeCheckpoint()
+    bot = make_checkpointed_bot(monkeypatch, checkpoint, test_mode=True)
+
+    assert bot.checkpoint is checkpoint
+    assert bot.data_manager.is_long_blocked is True
+    bot.state = RestoredLong(bot)
+    assert checkpoint.saves == ["FakeState", "RestoredLong"]
+
+    replay_adapter = FakeBinanceAdapter(Snapshot(1.0, 2.0))
+    replay_adapter.symbol_settings = SimpleNamespace(SYMBOL="ETHUSDT")
+    replay = RemBot(binance_adapter=replay_adapter)
+    assert replay.checkpoint is None
+
+
+def test_restored_open_position_is_kept(monkeypatch):
+    account_manager = FakeAccountManager({"LONG": 0.5})
+    bot = make_checkpointed_bot(
+        monkeypatch, FakeCheckpoint(RestoredLong), account_manager
+    )
+
+    assert isinstance(bot.state, RestoredLong)
+    assert bot.state.fills == []
+    assert bot.data_manager.is_long_blocked is False
+
+
+def test_restored_position_closed_by_an_exit_fill_is_closed_with_it(monkeypatch):
+    fill = SimpleNamespace(is_tp=True, price=110.2)
+    account_manager = FakeAccountManager({}, fill)
+    bot = make_checkpointed_bot(
+        monkeypatch, FakeCheckpoint(RestoredLong), account_manager
+    )
+
+    assert account_manager.cancelled == [fill]
+    assert bot.state.fills == [fill]
+
+
+def test_restored_position_closed_elsewhere_returns_to_flat(monkeypatch):
+    logs = []
+    monkeypatch.setattr(rem_bot_module.Logger, "log_info", logs.append)
+    checkpoint = FakeCheckpoint(RestoredLong)
+    bot = make_checkpointed_bot(monkeypatch, checkpoint, FakeAccountManager({}))
+
+    assert isinstance(bot.state, FakeState)
+    assert checkpoint.saves == ["RestoredLong", "FakeState"]
+    assert "Restored LONG position is no longer open." in logs
+
+
+def test_untracked_exchange_position_is_reported(monkeypatch):
+    logs = []
+    monkeypatch.setattr(rem_bot_module.Logger, "log_info", logs.append)
+    make_checkpointed_bot(
+        monkeypatch, FakeCheckpoint(FakeState), FakeAccountManager({"SHORT": -1.0})
+    )
+
+    assert logs[-1] == "Untracked SHORT position is open."
+
+
+def test_run_checkpoints_after_each_step(monkeypatch):
+    class StopLoop(Exception):
+        pass
+
+    sleeps = []
+
+    def fake_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        if len(sleeps) == 2:
+            raise StopLoop
+
+    monkeypatch.setattr(rem_bot_module, "sleep", fake_sleep)
+    checkpoint = FakeCheckpoint()
+    bot = make_checkpointed_bot(monkeypatch, checkpoint, test_mode=True)
+    monkeypatch.setattr(bot.scheduler, "next_tick", lambda: (0.0, False))
+    monkeypatch.setattr(bot.state, "_refresh_price", lambda: None)
+
+    with pytest.raises(StopLoop):
+        bot.run()
+
+    assert checkpoint.candle_closes == 1
+
+
+def test_run_records_every_step_in_the_tick_journal(monkeypatch):
+    class StopLoop(Exception):
+        pass
+
+    recorded = []
+    closed = []
+
+    def fake_sleep(_seconds: float) -> None:
+        if len(recorded) == 2:
+            raise StopLoop
+
+    monkeypatch.setattr(rem_bot_module, "sleep", fake_sleep)
+    monkeypatch.setattr(
+        rem_bot_module,
+        "SETTINGS",
+        dataclasses.replace(rem_bot_module.SETTINGS, TICK_JOURNAL=True),
+    )
+    monkeypatch.setattr(
+        rem_bot_module,
+        "TickRecorder",
+        SimpleNamespace(
+            for_symbol=lambda symbol, max_segment_bytes: SimpleNamespace(
+                record=recorded.append, close=lambda: closed.append(symbol)
+            )
+        ),
+    )
+    monkeypatch.setattr(rem_bot_module, "FlatPositionState", FakeState)
+    monkeypatch.setattr(
+        rem_bot_module,
+        "BinanceAdapter",
+        lambda: FakeBinanceAdapter(Snapshot(price=100.0, ema_100=50.0)),
+    )
+    bot = RemBot()
+    monkeypatch.setattr(bot.scheduler, "next_tick", lambda: (0.0, False))
+    monkeypatch.setattr(bot.state, "_refresh_price", lambda: None)
+
+    with pytest.raises(StopLoop):
+        bot.run()
+
+    assert recorded == [bot.data_manager.market_snapshot] * 2
+    assert closed == [rem_bot_module.SETTINGS.SYMBOL]
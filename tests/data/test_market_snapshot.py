@@ -1,3 +1,5 @@
+import numpy as np
+import pytest
 from data.market_snapshot import MarketSnapshot
 
 
@@ -51,3 +53,55 @@ def test_clone_returns_deep_copy_and_is_independent():
     assert cloned.macd_26 == original.macd_26
     assert cloned.ema_100 == original.ema_100
     assert cloned.rsi_6 == original.rsi_6
+
+
+def test_with_price_replaces_date_and_price_only():
+    original = MarketSnapshot(
+        date="2025-08-29 00:00",
+        price=10.0,
+        macd_12=0.1,
+        macd_26=0.2,
+        ema_100=9.0,
+        rsi_6=55.0,
+    )
+    updated = original.with_price(date="2025-08-29 00:01", price=11)
+
+    assert updated is not original
+    assert updated.date == "2025-08-29 00:01"
+    assert isinstance(updated.price, float) and updated.price == 11.0
+    assert (updated.macd_12, updated.macd_26, updated.ema_100, updated.rsi_6) == (
+        0.1,
+        0.2,
+        9.0,
+        55.0,
+    )
+    assert original.price == 10.0
+
+
+def test_as_dict_round_trips_through_from_dict():
+    original = MarketSnapshot(
+        date="2025-08-29 00:00",
+        price=10.0,
+        macd_12=0.1,
+        macd_26=0.2,
+        ema_100=9.5,
+        rsi_6=55.0,
+    )
+    restored = MarketSnapshot.from_dict(original.as_dict())
+
+    assert restored is not original
+    assert restored.as_dict() == original.as_dict()
+
+
+def test_fields_are_slotted():
+    snap = MarketSnapshot("[2024-10-04 00:00:00]", 1, 2, 3, 4, 5)
+    assert not hasattr(snap, "__dict__")
+    with pytest.raises(AttributeError):
+        snap.extra = 1
+
+
+def test_as_record_matches_the_record_layout():
+    snap = MarketSnapshot("[2024-10-04 00:00:00]", 1, 2, 3, 4, 5)
+    record = np.array([snap.as_record(7)], dtype=MarketSnapshot.DTYPE)
+    assert MarketSnapshot.DTYPE.itemsize == 48
+    assert record.tolist() == [(7, 1.0, 2.0, 3.0, 4.0, 5.0)]
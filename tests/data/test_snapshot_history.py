@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from data.market_snapshot import MarketSnapshot
+from data.snapshot_history import SnapshotHistory
+import data.snapshot_history as snapshot_history_module
+
+
+def make_snapshot(price: float) -> MarketSnapshot:
+    return MarketSnapshot("[2024-10-04 00:00:00]", price, 0.5, 0.25, price - 1, 40.0)
+
+
+def test_rows_use_the_tick_journal_layout():
+    history = SnapshotHistory(4)
+    history.append(make_snapshot(100.0), 7)
+
+    window = history.window()
+
+    assert window.dtype == SnapshotHistory.DTYPE
+    assert window.tolist() == [(7, 100.0, 0.5, 0.25, 99.0, 40.0)]
+
+
+def test_window_is_oldest_first_before_and_after_wrapping():
+    history = SnapshotHistory(3)
+    assert len(history) == 0 and len(history.window()) == 0
+
+    for i in range(2):
+        history.append(make_snapshot(100.0 + i), i)
+    assert history.window()["timestamp_ms"].tolist() == [0, 1]
+
+    for i in range(2, 8):
+        history.append(make_snapshot(100.0 + i), i)
+        assert len(history) == min(i + 1, 3)
+        assert history.window()["timestamp_ms"].tolist() == list(
+            range(max(0, i - 2), i + 1)
+        )
+    assert history.window()["price"].tolist() == [105.0, 106.0, 107.0]
+
+
+def test_window_size_is_clamped():
+    history = SnapshotHistory(4)
+    for i in range(6):
+        history.append(make_snapshot(100.0 + i), i)
+
+    assert history.window(2)["timestamp_ms"].tolist() == [4, 5]
+    assert history.window(10)["timestamp_ms"].tolist() == [2, 3, 4, 5]
+    assert len(history.window(0)) == 0 and len(history.window(-1)) == 0
+
+
+def test_windows_are_copies_unless_a_view_is_requested():
+    history = SnapshotHistory(4)
+    for i in range(5):
+        history.append(make_snapshot(100.0 + i), i)
+    window = history.window()
+    view = history.window(copy=False)
+    assert not np.shares_memory(window, history._buffer)
+    assert np.shares_memory(view, history._buffer)
+
+    history.append(make_snapshot(105.0), 5)
+
+    assert window["timestamp_ms"].tolist() == [1, 2, 3, 4]
+    assert view["timestamp_ms"].tolist() == [5, 2, 3, 4]
+
+
+def test_append_defaults_to_the_current_time(monkeypatch):
+    monkeypatch.setattr(
+        snapshot_history_module.DateUtils, "get_timestamp_ms", staticmethod(lambda: 42)
+    )
+    history = SnapshotHistory(2)
+    history.append(make_snapshot(100.0))
+    assert history.window()["timestamp_ms"].tolist() == [42]
+
+
+def test_invalid_capacity_is_rejected():
+    with pytest.raises(ValueError):
+        SnapshotHistory(0)
@@ -0,0 +1,55 @@
+from pathlib import Path
+import numpy as np
+from data.market_snapshot import MarketSnapshot
+from data.tick_reader import TickReader
+from data.tick_recorder import TickRecorder
+
+DAY_MS = TickRecorder.DAY_MS
+START_MS = 20_000 * DAY_MS
+
+
+def record_days(directory: Path, days: int, per_day: int) -> None:
+    recorder = TickRecorder(directory, max_segment_bytes=48 * 4)
+    for day in range(days):
+        for i in range(per_day):
+            price = float(day * per_day + i)
+            recorder.record(
+                MarketSnapshot("", price, 0.0, 0.0, price, 50.0),
+                START_MS + day * DAY_MS + i * 1_000,
+            )
+    recorder.close()
+
+
+def test_segments_are_mapped_without_copies(tmp_path: Path):
+    record_days(tmp_path, days=2, per_day=6)
+    reader = TickReader(tmp_path)
+
+    assert [p.name for p in reader.segments()] == [
+        "20241004-0000.ticks",
+        "20241004-0001.ticks",
+        "20241005-0000.ticks",
+        "20241005-0001.ticks",
+    ]
+    arrays = reader.read()
+    assert all(isinstance(a, np.memmap) for a in arrays)
+    assert not arrays[0].flags.writeable
+    assert np.concatenate(arrays)["price"].tolist() == [float(i) for i in range(12)]
+    assert arrays[0].dtype == TickRecorder.DTYPE
+
+
+def test_read_limits_segments_and_records_to_the_range(tmp_path: Path):
+    record_days(tmp_path, days=3, per_day=3)
+    reader = TickReader(tmp_path)
+
+    day_two = reader.read(START_MS + DAY_MS, START_MS + 2 * DAY_MS)
+    assert np.concatenate(day_two)["price"].tolist() == [3.0, 4.0, 5.0]
+
+    middle = reader.read(START_MS + 1_000, START_MS + DAY_MS + 2_000)
+    assert np.concatenate(middle)["price"].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert reader.read(START_MS + 3 * DAY_MS) == []
+
+
+def test_empty_and_torn_segments(tmp_path: Path):
+    (tmp_path / "20241004-0000.ticks").write_bytes(b"\x00" * 20)
+    assert len(TickReader.map_segment(tmp_path / "20241004-0000.ticks")) == 0
+    assert TickReader(tmp_path).read() == []
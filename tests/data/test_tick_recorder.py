@@ -0,0 +1,86 @@
+from pathlib import Path
+import numpy as np
+from data.market_snapshot import MarketSnapshot
+from data.tick_recorder import TickRecorder
+import data.tick_recorder as tick_recorder_module
+
+DAY_MS = TickRecorder.DAY_MS
+START_MS = 20_000 * DAY_MS  # 2024-10-04 00:00 UTC
+
+
+def make_snapshot(price: float) -> MarketSnapshot:
+    return MarketSnapshot("[2024-10-04 00:00:00]", price, 0.5, 0.25, price - 1, 40.0)
+
+
+def read_records(path: Path) -> np.ndarray:
+    return np.fromfile(path, dtype=TickRecorder.DTYPE)
+
+
+def test_records_are_fixed_width_snapshots(tmp_path: Path):
+    assert TickRecorder.RECORD.size == TickRecorder.DTYPE.itemsize == 48
+    recorder = TickRecorder(tmp_path / "ETHUSDT")
+    snapshot = make_snapshot(100.0)
+    recorder.record(snapshot, START_MS + 1)
+    recorder.record(snapshot, START_MS + 2)
+    recorder.record(make_snapshot(101.0), START_MS + 3)
+    recorder.close()
+
+    (segment,) = sorted((tmp_path / "ETHUSDT").iterdir())
+    assert segment.name == "20241004-0000.ticks"
+    records = read_records(segment)
+    assert records["timestamp_ms"].tolist() == [START_MS + 1, START_MS + 3]
+    assert records["price"].tolist() == [100.0, 101.0]
+    assert records[0].tolist() == (START_MS + 1, 100.0, 0.5, 0.25, 99.0, 40.0)
+
+
+def test_segments_rotate_by_day_and_size(tmp_path: Path):
+    recorder = TickRecorder(tmp_path, max_segment_bytes=100)
+    assert recorder.max_segment_bytes == 96
+    for i in range(5):
+        recorder.record(make_snapshot(float(i)), START_MS + i)
+    recorder.record(make_snapshot(9.0), START_MS + DAY_MS)
+    recorder.close()
+
+    segments = sorted(p.name for p in tmp_path.iterdir())
+    assert segments == [
+        "20241004-0000.ticks",
+        "20241004-0001.ticks",
+        "20241004-0002.ticks",
+        "20241005-0000.ticks",
+    ]
+    assert [len(read_records(tmp_path / name)) for name in segments] == [2, 2, 1, 1]
+
+
+def test_restart_appends_to_the_day_and_drops_a_torn_record(tmp_path: Path):
+    recorder = TickRecorder(tmp_path, max_segment_bytes=480)
+    recorder.record(make_snapshot(1.0), START_MS)
+    recorder.close()
+    segment = tmp_path / "20241004-0000.ticks"
+    with segment.open("ab") as f:
+        f.write(b"\x00" * 20)
+
+    recorder = TickRecorder(tmp_path, max_segment_bytes=480)
+    recorder.record(make_snapshot(2.0), START_MS + 1)
+    recorder.close()
+
+    assert read_records(segment)["price"].tolist() == [1.0, 2.0]
+
+
+def test_record_defaults_to_the_current_time(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(
+        tick_recorder_module.DateUtils, "get_timestamp_ms", lambda: START_MS + 7
+    )
+    recorder = TickRecorder(tmp_path)
+    recorder.record(make_snapshot(1.0))
+    recorder.close()
+
+    assert read_records(tmp_path / "20241004-0000.ticks")["timestamp_ms"][0] == (
+        START_MS + 7
+    )
+
+
+def test_for_symbol_records_under_the_base_dir():
+    recorder = TickRecorder.for_symbol("ETHUSDT", 1024)
+    recorder.close()
+    assert recorder.directory == tick_recorder_module.BASE_DIR / "ticks" / "ETHUSDT"
+    assert recorder.max_segment_bytes == 1008
@@ -0,0 +1,211 @@
+import asyncio
+import time
+import pytest
+from binance import AsyncClient
+from binance.client import Client
+from binance.exceptions import BinanceAPIException
+from backtest.kline_loader import KlineLoader
+from binance_adapter.account_manager import AccountManager
+from binance_adapter.account_stream import AccountStream
+from binance_adapter.kline_cache import KlineCache
+from binance_adapter.market_stream import MarketStream
+from bot.symbol_settings import SymbolSettings
+from fake_exchange.fake_binance_server import FakeBinanceServer
+
+
+def wait_until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def server():
+    fake_server = FakeBinanceServer.synthetic(bars=600, interval="1m", seed=7)
+    with fake_server:
+        yield fake_server
+
+
+@pytest.fixture
+def client(server):
+    return server.configure_client(Client("key", "secret", ping=False))
+
+
+def bracket_legs(price: float):
+    legs = [
+        {"type": "MARKET", "side": "BUY"},
+        {"type": "TAKE_PROFIT_MARKET", "side": "SELL", "stopPrice": price * 1.01},
+        {"type": "STOP_MARKET", "side": "SELL", "stopPrice": price * 0.99},
+    ]
+    for leg in legs:
+        leg.update(symbol="ETHUSDT", quantity="1.0", positionSide="LONG")
+    return [{key: str(value) for key, value in leg.items()} for leg in legs]
+
+
+def test_market_data_endpoints_serve_the_forming_bar(server, client):
+    client.ping()
+    klines = client.get_klines(symbol="ETHUSDT", interval="1m", limit=100)
+
+    assert len(klines) == 100
+    assert klines[-1][0] == server.open_time[server.cursor]
+    assert float(klines[-1][4]) == server.price
+    assert float(client.get_symbol_ticker(symbol="ETHUSDT")["price"]) == server.price
+    mark = client.futures_mark_price(symbol="ETHUSDT")
+    assert float(mark["markPrice"]) == server.price
+    server_time = client.get_server_time()["serverTime"]
+    assert 0 <= server_time - klines[-1][0] < 60_000
+
+    page = client.get_klines(
+        symbol="ETHUSDT", interval="1m", startTime=server.open_time[0], limit=10
+    )
+    assert [kline[0] for kline in page] == server.open_time[:10]
+    info = client.futures_exchange_info()
+    assert info["symbols"][0]["symbol"] == "ETHUSDT"
+    assert client.response.headers["X-MBX-USED-WEIGHT-1M"] == "15"
+
+
+def test_orders_fill_and_resting_exits_trigger(server, client):
+    assert client.futures_change_leverage(symbol="ETHUSDT", leverage=5)["leverage"] == 5
+    price = server.price
+    results = client.futures_place_batch_order(batchOrders=bracket_legs(price))
+
+    assert [order["status"] for order in results] == ["FILLED", "NEW", "NEW"]
+    amount = AccountManager.parse_position_amount(
+        client.futures_position_information(symbol="ETHUSDT"), "LONG"
+    )
+    assert amount == 1.0
+
+    server.set_price(price * 0.98)
+
+    assert server.orders[3]["status"] == "FILLED"
+    assert server.positions["LONG"] == [0.0, 0.0]
+    assert float(client.futures_account_balance()[0]["balance"]) == pytest.approx(
+        10_000.0 - price * 0.02
+    )
+    cancelled = client.futures_cancel_orders(symbol="ETHUSDT", orderidlist=[2, 3])
+    assert cancelled[0]["status"] == "CANCELED" and cancelled[1]["code"] == -2011
+    with pytest.raises(BinanceAPIException) as error:
+        client.futures_cancel_order(symbol="ETHUSDT", orderId=2)
+    assert error.value.code == -2011
+    with pytest.raises(BinanceAPIException):
+        client.futures_create_order(
+            symbol="BTCUSDT", type="MARKET", side="BUY", quantity=1
+        )
+
+
+def test_short_positions_realize_pnl_on_close(server, client):
+    price = server.price
+    for side in ("SELL", "BUY"):
+        client.futures_create_order(
+            symbol="ETHUSDT",
+            type="MARKET",
+            side=side,
+            positionSide="SHORT",
+            quantity="2",
+        )
+        assert server.positions["SHORT"][0] == (-2.0 if side == "SELL" else 0.0)
+        server.set_price(price - 1.0)
+
+    assert server.balance == pytest.approx(10_002.0)
+
+
+def test_injected_errors_latency_and_rate_limits(server, client):
+    server.fail_next(status=502, code=-1007, message="Timeout")
+    with pytest.raises(BinanceAPIException) as error:
+        client.futures_account_balance()
+    assert (error.value.status_code, error.value.code) == (502, -1007)
+
+    server.error_rate = 1.0
+    with pytest.raises(BinanceAPIException) as error:
+        client.get_server_time()
+    assert error.value.code == -1001
+
+    server.error_rate, server.latency = 0.0, 0.05
+    started = time.monotonic()
+    client.get_server_time()
+    assert time.monotonic() - started >= 0.05
+    server.weight_limit = 0
+    with pytest.raises(BinanceAPIException) as error:
+        client.get_server_time()
+    assert error.value.status_code == 429
+    assert client.response.headers["Retry-After"] == "60"
+
+    with pytest.raises(BinanceAPIException) as error:
+        client.futures_create_order(symbol="ETHUSDT")
+    assert error.value.status_code == 429
+    server.weight_limit = 10_000
+    with pytest.raises(BinanceAPIException) as error:
+        client.futures_create_order(symbol="ETHUSDT")
+    assert error.value.code == -1102
+    with pytest.raises(BinanceAPIException) as error:
+        client._request_futures_api("get", "unknownEndpoint")
+    assert error.value.status_code == 404
+
+
+def test_streams_carry_klines_mark_prices_and_fills(server, client):
+    kline_cache = KlineCache()
+    market_stream = MarketStream("ETHUSDT", "1m", kline_cache, base_url=server.ws_url)
+    account_stream = AccountStream(client, base_url=server.ws_url)
+    market_stream.start()
+    account_stream.start()
+    try:
+        assert wait_until(lambda: market_stream.is_connected)
+        assert wait_until(account_stream.is_fresh)
+        results = client.futures_place_batch_order(
+            batchOrders=bracket_legs(server.price)
+        )
+        assert wait_until(
+            lambda: account_stream.get_position("ETHUSDT", "LONG").amount == 1.0
+        )
+
+        server.set_price(server.price * 1.02)
+        server.advance()
+
+        assert wait_until(lambda: market_stream.mark_price == server.price)
+        update = account_stream.get_order_update(results[1]["orderId"])
+        assert update["X"] == "FILLED"
+        assert update["ap"] == server.orders[2]["avgPrice"]
+        assert wait_until(
+            lambda: account_stream.get_position("ETHUSDT", "LONG").amount == 0.0
+        )
+    finally:
+        market_stream.stop()
+        account_stream.stop()
+
+    assert "DELETE /fapi/v1/listenKey" in server.requests
+
+
+def test_async_client_and_recorded_klines(tmp_path):
+    path = tmp_path / "klines.csv"
+    KlineLoader.write_csv(
+        path, [[i * 60_000, 10 + i, 11 + i, 9 + i, 10 + i, 1] for i in range(5)]
+    )
+    server = FakeBinanceServer.from_csv(path, interval="1m", start_index=3)
+    server.advance()
+    with pytest.raises(IndexError):
+        server.advance()
+
+    async def scenario():
+        client = server.configure_client(AsyncClient("key", "secret"))
+        try:
+            return await client.get_klines(symbol="ETHUSDT", interval="1m")
+        finally:
+            await client.close_connection()
+
+    with server:
+        klines = asyncio.run(scenario())
+
+    assert [kline[0] for kline in klines] == [0, 60_000, 120_000, 180_000, 240_000]
+    assert float(klines[3][4]) == 13.0 and float(klines[3][2]) == 14.0
+    assert float(klines[4][4]) == 14.0
+    server.stop()
+
+
+def test_symbol_settings_still_round_on_the_served_tick(server, client):
+    symbol_settings = SymbolSettings("ETHUSDT", 3, 0.01, 0.01, 1, "results.csv")
+    account_manager = AccountManager(client, symbol_settings)
+    assert account_manager.get_account_balance() == 10_000.0
+    assert account_manager.get_position_amount("LONG") == 0.0
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+import talib
+from indicators.lookback_planner import LookbackPlanner
+
+
+def test_required_bars_for_default_indicators():
+    planner = LookbackPlanner()
+    assert planner.ema_bars(100, 1e-6) == 100 + 691
+    assert planner.rsi_bars(1e-6) == 7 + 76
+    assert planner.required_bars(1e-6) == 1 + planner.ema_bars(100, 1e-6)
+
+
+def test_tighter_tolerance_needs_more_bars():
+    planner = LookbackPlanner()
+    assert planner.required_bars(1e-3) < planner.required_bars(1e-6)
+
+
+def test_macd_dominates_when_ema_is_short():
+    planner = LookbackPlanner(ema_period=5, rsi_period=2)
+    assert planner.required_bars(1e-6) == 1 + planner.macd_bars(1e-6)
+
+
+def test_period_one_rsi_needs_no_decay():
+    assert LookbackPlanner(rsi_period=1).rsi_bars(1e-6) == 2
+
+
+@pytest.mark.parametrize("tolerance", [0.0, 1.0, -1e-6])
+def test_rejects_invalid_tolerance(tolerance):
+    with pytest.raises(ValueError, match="LOOKBACK_TOLERANCE"):
+        LookbackPlanner().required_bars(tolerance)
+
+
+def test_planned_lookback_reproduces_long_history_values():
+    closes = 2000 + np.cumsum(np.random.default_rng(3).normal(0, 5, 20_000))
+    bars = LookbackPlanner().required_bars(1e-6)
+    tail = closes[-bars:]
+
+    assert talib.EMA(tail, 100)[-1] == pytest.approx(
+        talib.EMA(closes, 100)[-1], rel=1e-6
+    )
+    full_macd, full_signal, _ = talib.MACD(closes, 12, 26, 26)
+    tail_macd, tail_signal, _ = talib.MACD(tail, 12, 26, 26)
+    assert tail_macd[-1] == pytest.approx(full_macd[-1], abs=1e-3)
+    assert tail_signal[-1] == pytest.approx(full_signal[-1], abs=1e-3)
+    assert talib.RSI(tail, 6)[-1] == pytest.approx(talib.RSI(closes, 6)[-1], abs=1e-4)
@@ -0,0 +1,20 @@
+import pytest
+from indicators.streaming_ema import StreamingEMA
+
+
+def test_seeds_with_simple_mean_then_smooths():
+    ema = StreamingEMA(period=3)
+    assert ema.update(1.0) is None
+    assert ema.peek(2.0) is None
+    assert ema.update(2.0) is None
+    assert ema.update(3.0) == pytest.approx(2.0)
+    assert ema.update(6.0) == pytest.approx(4.0)
+    assert ema.value == pytest.approx(4.0)
+
+
+def test_peek_matches_update_without_committing():
+    ema = StreamingEMA(period=2)
+    ema.update(1.0)
+    assert ema.peek(3.0) == pytest.approx(2.0)
+    assert ema.value is None
+    assert ema.update(3.0) == pytest.approx(2.0)
@@ -0,0 +1,79 @@
+import json
+import math
+import numpy as np
+import pytest
+import talib
+from indicators.streaming_indicator_engine import StreamingIndicatorEngine
+
+
+def random_walk(length: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100 + np.cumsum(rng.normal(0, 1, length))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_peek_matches_talib_on_every_bar(seed):
+    closes = random_walk(600, seed)
+    ema = talib.EMA(closes, timeperiod=100)
+    macd, signal, _ = talib.MACD(closes, fastperiod=12, slowperiod=26, signalperiod=26)
+    rsi = talib.RSI(closes, timeperiod=6)
+
+    engine = StreamingIndicatorEngine()
+    for i, close in enumerate(closes):
+        values = engine.peek(float(close))
+        expected = (macd[i], signal[i], ema[i], rsi[i])
+        for actual, reference in zip(values, expected):
+            if math.isnan(reference):
+                assert math.isnan(actual)
+            else:
+                assert actual == pytest.approx(reference, rel=1e-9, abs=1e-9)
+        engine.update(float(close))
+
+
+def test_peek_does_not_change_committed_state():
+    closes = random_walk(300, 4)
+    engine = StreamingIndicatorEngine()
+    engine.seed(closes[:-1])
+
+    first = engine.peek(1000.0)
+    second = engine.peek(float(closes[-1]))
+    again = engine.peek(1000.0)
+
+    assert first == again
+    assert first != second
+
+
+def test_custom_periods_match_talib():
+    closes = random_walk(200, 5)
+    engine = StreamingIndicatorEngine(
+        ema_period=20, macd_fast_period=26, macd_slow_period=12, macd_signal_period=9
+    )
+    engine.seed(closes[:-1])
+    values = engine.peek(float(closes[-1]))
+
+    macd, signal, _ = talib.MACD(closes, fastperiod=12, slowperiod=26, signalperiod=9)
+    assert values.ema_100 == pytest.approx(talib.EMA(closes, timeperiod=20)[-1])
+    assert values.macd_12 == pytest.approx(macd[-1])
+    assert values.macd_26 == pytest.approx(signal[-1])
+
+
+def test_rsi_is_zero_for_flat_prices():
+    engine = StreamingIndicatorEngine()
+    engine.seed([10.0] * 10)
+    assert engine.peek(10.0).rsi_6 == 0.0
+    assert engine.rsi.value == 0.0
+
+
+def test_restored_state_continues_like_the_original():
+    closes = random_walk(400, 9)
+    engine = StreamingIndicatorEngine()
+    engine.seed(closes[:300])
+
+    restored = StreamingIndicatorEngine()
+    restored.restore(json.loads(json.dumps(engine.state())))
+
+    for close in closes[300:]:
+        assert restored.peek(float(close)) == engine.peek(float(close))
+        engine.update(float(close))
+        restored.update(float(close))
+    assert restored.state() == engine.state()
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+import talib
+from indicators.streaming_macd import StreamingMACD
+
+
+def test_value_is_none_until_signal_is_warm():
+    macd = StreamingMACD(fast_period=2, slow_period=3, signal_period=2)
+    for close in [1.0, 2.0, 3.0]:
+        assert macd.update(close) is None
+    assert macd.peek(4.0) is not None
+    assert macd.value is None
+    assert macd.update(4.0) is not None
+
+
+def test_matches_talib_macd_and_signal():
+    closes = np.linspace(1.0, 50.0, 60) + np.sin(np.arange(60))
+    reference_macd, reference_signal, _ = talib.MACD(
+        closes, fastperiod=12, slowperiod=26, signalperiod=26
+    )
+    macd = StreamingMACD(fast_period=12, slow_period=26, signal_period=26)
+    for close in closes:
+        value = macd.update(float(close))
+
+    assert value is not None
+    assert value[0] == pytest.approx(reference_macd[-1])
+    assert value[1] == pytest.approx(reference_signal[-1])
@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+import talib
+from indicators.streaming_rsi import StreamingRSI
+
+
+def test_warm_up_requires_period_changes():
+    rsi = StreamingRSI(period=2)
+    assert rsi.update(1.0) is None
+    assert rsi.update(2.0) is None
+    assert rsi.peek(1.0) == pytest.approx(50.0)
+    assert rsi.value is None
+    assert rsi.update(1.0) == pytest.approx(50.0)
+
+
+def test_matches_talib_rsi():
+    closes = 100 + np.cumsum(np.random.default_rng(11).normal(0, 1, 100))
+    rsi = StreamingRSI(period=6)
+    for close in closes:
+        rsi.update(float(close))
+    assert rsi.value == pytest.approx(talib.RSI(closes, timeperiod=6)[-1])
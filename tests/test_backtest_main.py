@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+import numpy as np
+import backtest_main
+from backtest.backtest_result import BacktestResult
+from backtest.kline_loader import KlineLoader
+
+
+def test_main_prints_backtest_statistics(tmp_path, capsys):
+    rng = np.random.default_rng(3)
+    closes = 2000 + np.cumsum(rng.normal(0, 2, 3_000))
+    path = tmp_path / "klines.csv"
+    KlineLoader.write_csv(
+        path, [[i * 60_000, c, c, c, c, 1] for i, c in enumerate(closes)]
+    )
+
+    backtest_main.main([str(path), "--tp-ratio", "0.004", "--sl-ratio", "0.003"])
+
+    output = capsys.readouterr().out
+    assert "Bars: 3000" in output
+    assert "Win-Rate: " in output and "Max drawdown: " in output
+
+
+def test_main_downloads_klines_first(monkeypatch, tmp_path, capsys):
+    fetched = {}
+
+    def fake_fetch(client, symbol, interval, start_time, end_time):
+        fetched.update(symbol=symbol, span=end_time - start_time)
+        return [[i * 60_000, 1, 1, 1, 1, 1] for i in range(10)]
+
+    monkeypatch.setattr(backtest_main.KlineLoader, "fetch_klines", fake_fetch)
+    monkeypatch.setattr(backtest_main.DateUtils, "get_timestamp_ms", lambda: 10**12)
+    monkeypatch.setattr(
+        "binance.client.Client", lambda *_args: SimpleNamespace(), raising=True
+    )
+    path = tmp_path / "klines.csv"
+
+    backtest_main.main([str(path), "--download-days", "0.5"])
+
+    assert fetched == {"symbol": backtest_main.SETTINGS.SYMBOL, "span": 43_200_000}
+    assert "Trades: 0" in capsys.readouterr().out
+
+
+def test_main_resolves_exits_intrabar_with_lower_timeframe(monkeypatch, tmp_path):
+    path, lower_path = tmp_path / "klines.csv", tmp_path / "lower.csv"
+    KlineLoader.write_csv(path, [[i * 120_000, 1, 2, 0, 1, 1] for i in range(5)])
+    KlineLoader.write_csv(lower_path, [[i * 60_000, 1, 2, 0, 1, 1] for i in range(10)])
+    resolvers = []
+    monkeypatch.setattr(
+        backtest_main.VectorizedBacktester,
+        "run",
+        lambda self, ohlcv, exit_resolver=None: resolvers.append(exit_resolver)
+        or BacktestResult([]),
+    )
+
+    backtest_main.main([str(path), "--intrabar"])
+    backtest_main.main(
+        [str(path), "--lower-csv", str(lower_path), "--assume-stop-loss"]
+    )
+
+    assert resolvers[0].lower_timeframe is None
+    assert len(resolvers[1].lower_timeframe.open_time) == 10
+    assert resolvers[1].assume_stop_loss is True
@@ -0,0 +1,64 @@
+import fake_exchange_main
+
+
+class FakeServer:
+    built = []
+
+    def __init__(self, source, options):
+        self.source, self.options, self.advanced, self.stopped = (
+            source,
+            options,
+            0,
+            False,
+        )
+        self.url, self.ws_url = "http://host:1", "ws://host:1"
+        FakeServer.built.append(self)
+
+    @classmethod
+    def from_csv(cls, path, **options):
+        return cls(path, options)
+
+    @classmethod
+    def synthetic(cls, bars, **options):
+        return cls(bars, options)
+
+    def start(self):
+        return self
+
+    def advance(self):
+        self.advanced += 1
+        if self.advanced == 2:
+            raise IndexError("exhausted")
+
+    def stop(self):
+        self.stopped = True
+
+
+def test_main_serves_and_closes_bars_until_exhausted(monkeypatch, capsys):
+    monkeypatch.setattr(fake_exchange_main, "FakeBinanceServer", FakeServer)
+    sleeps = []
+    monkeypatch.setattr(fake_exchange_main.time, "sleep", sleeps.append)
+
+    fake_exchange_main.main(
+        ["--csv", "k.csv", "--bar-seconds", "0.5", "--latency", "0.1"]
+    )
+
+    server = FakeServer.built[-1]
+    assert (server.source, server.advanced, server.stopped) == ("k.csv", 2, True)
+    assert server.options["latency"] == 0.1 and sleeps == [0.5, 0.5]
+    assert "ws://host:1" in capsys.readouterr().out
+
+
+def test_main_serves_synthetic_klines_until_interrupted(monkeypatch):
+    monkeypatch.setattr(fake_exchange_main, "FakeBinanceServer", FakeServer)
+
+    def interrupt(_seconds):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(fake_exchange_main.time, "sleep", interrupt)
+
+    fake_exchange_main.main(["--bars", "300", "--port", "0"])
+
+    server = FakeServer.built[-1]
+    assert (server.source, server.advanced, server.stopped) == (300, 0, True)
+    assert server.options["port"] == 0
@@ -0,0 +1,45 @@
+import journal_main
+from data.market_snapshot import MarketSnapshot
+from utils.file_utils import FileUtils
+from utils.trade_journal import TradeJournal
+
+
+def test_main_imports_results_and_reports_the_win_rate(tmp_path, capsys):
+    results = tmp_path / "results.csv"
+    for i, result in enumerate(("SHORT", "SHORT", "LONG")):
+        FileUtils.save_result(
+            results,
+            result,
+            "SHORT",
+            MarketSnapshot(
+                TradeJournal.date_of(1_700_000_000_000 + i * 60_000),
+                1.0,
+                0.0,
+                0.0,
+                1.0,
+                50.0,
+            ),
+            2.0,
+        )
+    journal = tmp_path / "trades.sqlite3"
+
+    journal_main.main(
+        [
+            "--import-csv",
+            str(results),
+            "--symbol",
+            "ETHUSDT",
+            "--journal",
+            str(journal),
+        ]
+    )
+    journal_main.main(
+        ["--symbol", "ETHUSDT", "--position", "LONG", "--journal", str(journal)]
+    )
+    journal_main.main(["--symbol", "ETHUSDT", "--days", "7", "--journal", str(journal)])
+
+    output = capsys.readouterr().out.splitlines()
+    assert output[0] == f"Imported 3 trades from {results}"
+    assert output[1].startswith("ETHUSDT ALL: 3 trades, Win-Rate: 66.67% (")
+    assert output[2].startswith("ETHUSDT LONG: 0 trades, Win-Rate: 0.00% (")
+    assert output[3].startswith("ETHUSDT ALL: 0 trades, Win-Rate: 0.00% (")
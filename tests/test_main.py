@@ -6,12 +6,15 @@ import types
 from typing import Any, cast
 
 
-def _install_dummy_rembot(monkeypatch, calls):
+def _install_dummy_rembot(monkeypatch, calls, async_mode=False, portfolio=()):
     bot_pkg = types.ModuleType("bot")
     bot_pkg.__path__ = []  # type: ignore[attr-defined]
     monkeypatch.setitem(sys.modules, "bot", bot_pkg)
 
     rem_bot_mod = types.ModuleType("bot.rem_bot")
+    async_rem_bot_mod = types.ModuleType("bot.async_rem_bot")
+    portfolio_bot_mod = types.ModuleType("bot.portfolio_bot")
+    bot_settings_mod = types.ModuleType("bot.bot_settings")
 
     class DummyRemBot:
         def __init__(self):
@@ -20,8 +23,34 @@ def _install_dummy_rembot(monkeypatch, calls):
         def run(self):
             calls.append("run")
 
+    class DummyAsyncRemBot:
+        def __init__(self):
+            calls.append("async_init")
+
+        async def run(self):
+            calls.append("async_run")
+
+    class DummyPortfolioBot:
+        def __init__(self, symbol_settings):
+            calls.append(("portfolio_init", tuple(symbol_settings)))
+
+        async def run(self):
+            calls.append("portfolio_run")
+
     cast(Any, rem_bot_mod).RemBot = DummyRemBot  # type: ignore[attr-defined]
+    cast(Any, async_rem_bot_mod).AsyncRemBot = DummyAsyncRemBot
+    cast(Any, portfolio_bot_mod).PortfolioBot = DummyPortfolioBot
+    cast(Any, bot_settings_mod).SETTINGS = types.SimpleNamespace(
+        ASYNC_MODE=async_mode,
+        PORTFOLIO=portfolio,
+        BUFFERED_RESULTS=False,
+        RESULTS_FSYNC="batch",
+        TRADE_JOURNAL=False,
+    )
     monkeypatch.setitem(sys.modules, "bot.rem_bot", rem_bot_mod)
+    monkeypatch.setitem(sys.modules, "bot.async_rem_bot", async_rem_bot_mod)
+    monkeypatch.setitem(sys.modules, "bot.portfolio_bot", portfolio_bot_mod)
+    monkeypatch.setitem(sys.modules, "bot.bot_settings", bot_settings_mod)
 
 
 def test_main_function_calls_rembot_run(monkeypatch):
@@ -33,8 +62,48 @@ def test_main_function_calls_rembot_run(monkeypatch):
     assert calls == ["init", "run"]
 
 
+def test_main_runs_async_rembot_in_async_mode(monkeypatch):
+    calls = []
+    _install_dummy_rembot(monkeypatch, calls, async_mode=True)
+    mod = importlib.import_module("main")
+    importlib.reload(mod)
+    mod.main()
+    assert calls == ["async_init", "async_run"]
+
+
+def test_main_runs_portfolio_when_symbols_are_configured(monkeypatch):
+    calls = []
+    _install_dummy_rembot(monkeypatch, calls, async_mode=True, portfolio=("A", "B"))
+    mod = importlib.import_module("main")
+    importlib.reload(mod)
+    mod.main()
+    assert calls == [("portfolio_init", ("A", "B")), "portfolio_run"]
+
+
 def test_module_runs_when_invoked_as_script(monkeypatch):
     calls = []
     _install_dummy_rembot(monkeypatch, calls)
     runpy.run_module("main", run_name="__main__")
     assert calls == ["init", "run"]
+
+
+def test_main_writes_results_in_the_background_and_flushes_on_exit(monkeypatch):
+    calls = []
+    _install_dummy_rembot(monkeypatch, calls)
+    settings = sys.modules["bot.bot_settings"].SETTINGS  # type: ignore[attr-defined]
+    settings.BUFFERED_RESULTS = True
+    settings.RESULTS_FSYNC = "close"
+    settings.TRADE_JOURNAL = True
+    mod = importlib.import_module("main")
+    importlib.reload(mod)
+    monkeypatch.setattr(
+        mod,
+        "FileUtils",
+        types.SimpleNamespace(
+            use_buffered_writers=lambda fsync: calls.append(("buffered", fsync)),
+            use_trade_journal=lambda: calls.append("journal"),
+            close_writers=lambda: calls.append("closed"),
+        ),
+    )
+    mod.main()
+    assert calls == [("buffered", "close"), "journal", "init", "run", "closed"]
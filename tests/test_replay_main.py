@@ -0,0 +1,77 @@
+import numpy as np
+import replay_main
+from backtest.backtest_result import BacktestResult, Trade
+from backtest.kline_loader import KlineLoader
+from backtest.replay_engine import ReplayReport
+
+
+def make_trade(entry_index: int, is_tp: bool = True) -> Trade:
+    return Trade("LONG", entry_index, entry_index + 1, 0, 0, 1.0, 2.0, 0.5, is_tp)
+
+
+def test_first_divergence():
+    same = BacktestResult([make_trade(1), make_trade(5)])
+    assert replay_main.first_divergence(same, same) is None
+    assert (
+        replay_main.first_divergence(
+            same, BacktestResult([make_trade(1), make_trade(5, is_tp=False)])
+        )
+        == 1
+    )
+    assert replay_main.first_divergence(same, BacktestResult([make_trade(1)])) == 1
+
+
+def test_main_reports_throughput_and_backtest_agreement(tmp_path, capsys):
+    rng = np.random.default_rng(3)
+    closes = 2000 + np.cumsum(rng.normal(0, 2, 3_000))
+    path = tmp_path / "klines.csv"
+    KlineLoader.write_csv(
+        path, [[i * 60_000, c, c, c, c, 1] for i, c in enumerate(closes)]
+    )
+
+    replay_main.main(
+        [str(path), "--tp-ratio", "0.004", "--output", str(tmp_path / "out.csv")]
+    )
+
+    output = capsys.readouterr().out
+    assert "steps/s" in output
+    assert "Backtest agreement: OK" in output
+
+
+def test_main_prints_the_diverging_trades(monkeypatch, tmp_path, capsys):
+    path = tmp_path / "klines.csv"
+    KlineLoader.write_csv(path, [[i * 60_000, 1, 1, 1, 1, 1] for i in range(10)])
+    monkeypatch.setattr(
+        replay_main.VectorizedBacktester,
+        "run",
+        lambda self, ohlcv: BacktestResult([make_trade(3)]),
+    )
+
+    replay_main.main([str(path), "--output", str(tmp_path / "out.csv")])
+
+    output = capsys.readouterr().out
+    assert "Backtest divergence at trade #1" in output
+    assert "replay: None" in output and "backtest: Trade(" in output
+
+
+def test_main_reports_step_errors_and_saves_only_on_request(
+    monkeypatch, tmp_path, capsys
+):
+    path = tmp_path / "klines.csv"
+    KlineLoader.write_csv(path, [[i * 60_000, 1, 1, 1, 1, 1] for i in range(10)])
+    engines = []
+
+    class FakeEngine:
+        def __init__(self, symbol_settings, quiet, save_results):
+            engines.append(save_results)
+
+        def run(self, ohlcv):
+            return ReplayReport(5, 1.0, BacktestResult([]), 5, "boom")
+
+    monkeypatch.setattr(replay_main, "ReplayEngine", FakeEngine)
+
+    replay_main.main([str(path)])
+    replay_main.main([str(path), "--output", str(tmp_path / "out.csv")])
+
+    assert engines == [False, True]
+    assert "Step errors: 5 (first: boom)" in capsys.readouterr().out
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+import sweep_main
+from backtest.kline_loader import KlineLoader
+
+
+def test_parse_grid_accepts_lists_and_inclusive_ranges():
+    assert sweep_main.parse_grid("0.002,0.004", float) == [0.002, 0.004]
+    assert sweep_main.parse_grid("0.002:0.008:0.002", float) == [
+        0.002,
+        0.004,
+        0.006,
+        0.008,
+    ]
+    assert sweep_main.parse_grid("10:30:10", int) == [10, 20, 30]
+
+
+def test_parse_grid_rejects_non_positive_step():
+    with pytest.raises(ValueError):
+        sweep_main.parse_grid("1:5:0", int)
+
+
+def test_main_prints_ranked_table(tmp_path, capsys):
+    rng = np.random.default_rng(5)
+    closes = 2000 + np.cumsum(rng.normal(0, 2, 2_000))
+    path = tmp_path / "klines.csv"
+    KlineLoader.write_csv(
+        path, [[i * 60_000, c, c, c, c, 1] for i, c in enumerate(closes)]
+    )
+
+    sweep_main.main(
+        [
+            str(path),
+            "--tp-ratios",
+            "0.002,0.004",
+            "--sl-ratios",
+            "0.003",
+            "--workers",
+            "2",
+            "--top",
+            "1",
+        ]
+    )
+
+    output = capsys.readouterr().out.splitlines()
+    assert output[0] == "Combinations: 2 on 2 workers"
+    assert len(output) == 4
+
+
+def test_main_shares_klines_for_intrabar_sweeps(monkeypatch, tmp_path):
+    path, lower_path = tmp_path / "klines.csv", tmp_path / "lower.csv"
+    KlineLoader.write_csv(path, [[i * 120_000, 1, 2, 0, 1, 1] for i in range(5)])
+    KlineLoader.write_csv(lower_path, [[i * 60_000, 1, 2, 0, 1, 1] for i in range(10)])
+    sweeps = []
+    monkeypatch.setattr(
+        sweep_main.ParameterSweep,
+        "run",
+        lambda self, combinations: sweeps.append(self) or [],
+    )
+
+    sweep_main.main([str(path), "--workers", "1"])
+    sweep_main.main([str(path), "--lower-csv", str(lower_path), "--workers", "1"])
+
+    assert sweeps[0].ohlcv is None and sweeps[0].lower_timeframe is None
+    assert len(sweeps[1].ohlcv.high) == 5
+    assert len(sweeps[1].lower_timeframe.high) == 10
@@ -0,0 +1,79 @@
+import threading
+import time
+from typing import Any, List
+import pytest
+from utils.background_writer import BackgroundWriter
+import utils.background_writer as background_writer_module
+
+
+class ListWriter(BackgroundWriter):
+    def __init__(self, max_queue: int = 10_000, fail_on: Any = None) -> None:
+        super().__init__("list-writer", max_queue)
+        self.batches: List[List[Any]] = []
+        self.closed_targets = 0
+        self.fail_on = fail_on
+        self.release = threading.Event()
+        self.release.set()
+        self._start()
+
+    def _write_batch(self, records: List[Any]) -> None:
+        self.release.wait(5)
+        if self.fail_on in records:
+            raise ValueError(f"cannot write {self.fail_on}")
+        self.batches.append(records)
+
+    def _close_target(self) -> None:
+        self.closed_targets += 1
+
+
+def test_records_are_batched_in_order_and_written_before_close():
+    writer = ListWriter()
+    writer.release.clear()
+    writer.write(0)
+    for i in range(1, 50):
+        writer.write(i)
+    writer.release.set()
+    writer.close()
+    writer.close()
+
+    assert [r for batch in writer.batches for r in batch] == list(range(50))
+    assert len(writer.batches) < 50
+    assert writer.closed_targets == 1
+    assert writer._thread.name == "list-writer"
+    with pytest.raises(RuntimeError, match="list-writer is closed"):
+        writer.write(50)
+
+
+def test_write_failures_are_logged_and_the_thread_goes_on(monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        background_writer_module.Logger, "log_exception", lambda m: logged.append(m)
+    )
+    writer = ListWriter(fail_on="bad")
+    writer.write("bad")
+    writer.flush()
+    writer.write("good")
+    writer.close()
+
+    assert logged == ["list-writer write failed: cannot write bad"]
+    assert writer.batches == [["good"]]
+
+
+def test_close_waits_for_a_write_blocked_on_a_full_queue():
+    writer = ListWriter(max_queue=1)
+    writer.release.clear()
+    writer.write(0)
+    writer.write(1)
+    blocked = threading.Thread(target=writer.write, args=(2,))
+    blocked.start()
+    deadline = time.monotonic() + 5
+    while not writer._lock.locked() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    closing = threading.Thread(target=writer.close)
+    closing.start()
+    writer.release.set()
+    blocked.join(5)
+    closing.join(5)
+
+    assert not closing.is_alive()
+    assert [r for batch in writer.batches for r in batch] == [0, 1, 2]
@@ -0,0 +1,103 @@
+import csv
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+import pytest
+from utils.buffered_csv_writer import BufferedCsvWriter
+import utils.buffered_csv_writer as writer_module
+
+
+def read_csv(path: Path):
+    with path.open("r", newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def record_fsyncs(monkeypatch):
+    fsyncs = []
+    monkeypatch.setattr(
+        writer_module, "os", SimpleNamespace(fsync=lambda fd: fsyncs.append(fd))
+    )
+    return fsyncs
+
+
+def test_rows_are_written_after_the_header_in_order(tmp_path: Path):
+    path = tmp_path / "out" / "journal.csv"
+    writer = BufferedCsvWriter(path, ["a", "b"])
+    for i in range(500):
+        writer.write([i, float(i) / 2])
+    writer.flush()
+
+    rows = read_csv(path)
+    assert rows[0] == ["a", "b"]
+    assert rows[1:] == [[str(i), str(float(i) / 2)] for i in range(500)]
+    writer.close()
+
+
+def test_existing_file_keeps_its_header(tmp_path: Path):
+    path = tmp_path / "journal.csv"
+    path.write_text("a,b\r\n1,2\r\n", encoding="utf-8")
+
+    writer = BufferedCsvWriter(path, ["a", "b"])
+    writer.write([3, 4])
+    writer.close()
+
+    assert read_csv(path) == [["a", "b"], ["1", "2"], ["3", "4"]]
+
+
+@pytest.mark.parametrize(
+    "fsync,expected", [("batch", True), ("close", True), ("never", False)]
+)
+def test_fsync_policy(tmp_path: Path, monkeypatch, fsync, expected):
+    fsyncs = record_fsyncs(monkeypatch)
+    writer = BufferedCsvWriter(tmp_path / "journal.csv", ["a"], fsync=fsync)
+    writer.write([1])
+    writer.flush()
+    assert bool(fsyncs) is (fsync == "batch")
+
+    writer.close()
+    assert bool(fsyncs) is expected
+
+
+def test_unknown_fsync_policy_is_rejected(tmp_path: Path):
+    with pytest.raises(ValueError, match="Unknown fsync policy: sometimes"):
+        BufferedCsvWriter(tmp_path / "journal.csv", ["a"], fsync="sometimes")
+
+
+def test_close_writes_queued_rows_and_rejects_new_ones(tmp_path: Path):
+    path = tmp_path / "journal.csv"
+    writer = BufferedCsvWriter(path, ["a"], fsync="never", max_queue=2)
+    for i in range(20):
+        writer.write([i])
+    writer.close()
+    writer.close()
+
+    assert len(read_csv(path)) == 21
+    with pytest.raises(RuntimeError, match="csv-writer-journal.csv is closed"):
+        writer.write([21])
+
+
+def test_writes_are_off_the_calling_thread(tmp_path: Path, monkeypatch):
+    threads = []
+
+    class RecordingFile:
+        def __init__(self, f) -> None:
+            self._f = f
+
+        def write(self, text: str) -> int:
+            threads.append(threading.current_thread().name)
+            return self._f.write(text)
+
+        def __getattr__(self, name):
+            return getattr(self._f, name)
+
+    opened = BufferedCsvWriter._open
+    monkeypatch.setattr(
+        BufferedCsvWriter,
+        "_open",
+        lambda self, header: RecordingFile(opened(self, header)),
+    )
+    writer = BufferedCsvWriter(tmp_path / "journal.csv", ["a"], fsync="never")
+    writer.write([1])
+    writer.close()
+
+    assert threads == ["csv-writer-journal.csv"]
@@ -1,3 +1,4 @@
+import pytest
 import types
 from datetime import datetime as RealDateTime
 from utils.date_utils import DateUtils
@@ -19,3 +20,29 @@ def test_get_date_returns_expected_format(monkeypatch):
     result = DateUtils.get_date()
     assert isinstance(result, str)
     assert result == "[2023-01-02 03:04:05]"
+
+
+def test_get_timestamp_ms_uses_unix_time(monkeypatch):
+    monkeypatch.setattr(date_utils_module.time, "time", lambda: 1_700_000_000.1234)
+    assert DateUtils.get_timestamp_ms() == 1_700_000_000_123
+
+
+@pytest.mark.parametrize(
+    "interval,expected",
+    [
+        ("30s", 30_000),
+        ("1m", 60_000),
+        ("15m", 900_000),
+        ("4h", 14_400_000),
+        ("1d", 86_400_000),
+        ("2w", 1_209_600_000),
+    ],
+)
+def test_interval_to_milliseconds(interval, expected):
+    assert DateUtils.interval_to_milliseconds(interval) == expected
+
+
+@pytest.mark.parametrize("interval", ["", "m", "1M", "h1", "1.5h"])
+def test_interval_to_milliseconds_rejects_invalid(interval):
+    with pytest.raises(ValueError, match="Invalid INTERVAL"):
+        DateUtils.interval_to_milliseconds(interval)
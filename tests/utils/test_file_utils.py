@@ -1,5 +1,6 @@
 import csv
 from pathlib import Path
+from types import SimpleNamespace
 import pytest
 
 from utils.file_utils import FileUtils
@@ -87,7 +88,9 @@ def test_save_result_appends_snapshot_rows_and_header_once(tmp_path: Path):
         rsi_6=48.0,
     )
 
-    FileUtils.save_result(out, result="WIN", position="LONG", snapshot=s1)
+    FileUtils.save_result(
+        out, result="WIN", position="LONG", snapshot=s1, exit_price=102.5
+    )
     FileUtils.save_result(out, result="LOSS", position="SHORT", snapshot=s2)
 
     rows = read_csv(out)
@@ -101,6 +104,7 @@ def test_save_result_appends_snapshot_rows_and_header_once(tmp_path: Path):
         "-2.0",
         "200.0",
         "55.0",
+        "102.5",
     ]
     assert rows[2] == [
         "2025-08-29 01:00",
@@ -111,6 +115,7 @@ def test_save_result_appends_snapshot_rows_and_header_once(tmp_path: Path):
         "0.8",
         "198.0",
         "48.0",
+        "",
     ]
     assert len(rows) == 3
 
@@ -162,3 +167,165 @@ def test_read_toml_file_non_dict_top_level_raises_valueerror(
     with pytest.raises(ValueError) as ei:
         FileUtils.read_toml_file(toml_file)
     assert "Top-level TOML content must be a table/object." in str(ei.value)
+
+
+def test_buffered_writers_keep_the_csv_format(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(FileUtils, "_writers", {})
+    monkeypatch.setattr(FileUtils, "_buffered_fsync", None)
+    monkeypatch.setattr(FileUtils, "_close_registered", False)
+    registered = []
+    monkeypatch.setattr(
+        file_utils_module, "atexit", SimpleNamespace(register=registered.append)
+    )
+    direct = tmp_path / "direct.csv"
+    buffered = tmp_path / "buffered.csv"
+    row = ["2025-08-29 00:00", "WIN", "LONG", 100.0, 1.0, -2.0, 200.0, 55.0, ""]
+    FileUtils._append_csv(direct, row)
+
+    FileUtils.use_buffered_writers("never")
+    FileUtils.use_buffered_writers("close")
+    FileUtils._append_csv(buffered, row)
+    FileUtils._append_csv(buffered, row)
+    assert list(FileUtils._writers) == [buffered]
+    FileUtils.close_writers()
+
+    assert registered == [FileUtils.close_writers]
+    assert FileUtils._writers == {}
+    assert read_csv(buffered) == read_csv(direct) + read_csv(direct)[1:]
+
+
+@pytest.mark.parametrize("buffered", [False, True])
+def test_results_of_older_versions_are_upgraded_on_first_write(
+    tmp_path: Path, monkeypatch, buffered: bool
+):
+    monkeypatch.setattr(FileUtils, "_writers", {})
+    monkeypatch.setattr(FileUtils, "_buffered_fsync", "never" if buffered else None)
+    out = tmp_path / "results.csv"
+    old_row = [
+        "2025-08-29 00:00",
+        "WIN",
+        "LONG",
+        "100.0",
+        "1.0",
+        "-2.0",
+        "200.0",
+        "55.0",
+    ]
+    with out.open("w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows([FileUtils._LEGACY_HEADER, old_row])
+    snapshot = MarketSnapshot("2025-08-29 01:00", 90.0, -0.5, 0.8, 198.0, 48.0)
+
+    FileUtils.save_result(out, "LOSS", "SHORT", snapshot, exit_price=91.0)
+    FileUtils.save_result(out, "WIN", "SHORT", snapshot)
+    FileUtils.close_writers()
+
+    new_row = [
+        "2025-08-29 01:00",
+        "LOSS",
+        "SHORT",
+        "90.0",
+        "-0.5",
+        "0.8",
+        "198.0",
+        "48.0",
+    ]
+    assert read_csv(out) == [
+        FileUtils._HEADER,
+        old_row + [""],
+        new_row + ["91.0"],
+        new_row[:1] + ["WIN"] + new_row[2:] + [""],
+    ]
+    assert not (tmp_path / "results.csv.tmp").exists()
+
+
+def test_results_with_the_current_header_are_left_as_they_are(tmp_path: Path):
+    out = tmp_path / "results.csv"
+    snapshot = MarketSnapshot("2025-08-29 01:00", 90.0, -0.5, 0.8, 198.0, 48.0)
+    FileUtils.save_result(out, "LOSS", "SHORT", snapshot)
+    FileUtils._checked_headers.discard(out)
+    before = out.read_bytes()
+
+    FileUtils._upgrade_header(out)
+
+    assert out.read_bytes() == before
+
+
+def test_unknown_buffered_fsync_policy_is_rejected(monkeypatch):
+    monkeypatch.setattr(FileUtils, "_buffered_fsync", None)
+    with pytest.raises(ValueError, match="Unknown fsync policy"):
+        FileUtils.use_buffered_writers("sometimes")
+    assert FileUtils._buffered_fsync is None
+
+
+def test_trades_are_recorded_in_the_journal_when_in_use(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(FileUtils, "_journal", None)
+    monkeypatch.setattr(FileUtils, "_close_registered", True)
+    monkeypatch.setattr(file_utils_module.DateUtils, "get_timestamp_ms", lambda: 42)
+    snapshot = MarketSnapshot(
+        date="[2025-08-29 00:00:00]",
+        price=100.0,
+        macd_12=1.0,
+        macd_26=-2.0,
+        ema_100=200.0,
+        rsi_6=55.0,
+    )
+    trade = dict(
+        symbol="BTCUSDT",
+        result="LONG",
+        position="LONG",
+        snapshot=snapshot,
+        exit_price=101.0,
+        tp_price=101.0,
+        sl_price=99.0,
+        fill_price=101.2,
+    )
+    FileUtils.record_trade(**trade)
+
+    FileUtils.use_trade_journal(tmp_path / "trades.sqlite3")
+    journal = FileUtils._journal
+    assert journal is not None
+    FileUtils.record_trade(**trade)
+    journal.flush()
+    row = journal._query("SELECT * FROM trades", ())
+    FileUtils.close_writers()
+
+    assert FileUtils._journal is None
+    assert row == [
+        (
+            1,
+            "BTCUSDT",
+            "[2025-08-29 00:00:00]",
+            "LONG",
+            "LONG",
+            100.0,
+            1.0,
+            -2.0,
+            200.0,
+            55.0,
+            101.0,
+            101.0,
+            99.0,
+            101.2,
+            file_utils_module.TradeJournal.timestamp_of("[2025-08-29 00:00:00]"),
+            42,
+        )
+    ]
+
+
+def test_results_and_trades_are_discarded_within_the_block(tmp_path: Path, monkeypatch):
+    journal = SimpleNamespace(records=[])
+    journal.write = journal.records.append
+    monkeypatch.setattr(FileUtils, "_journal", journal)
+    out = tmp_path / "results.csv"
+    snapshot = MarketSnapshot("[2025-08-29 00:00:00]", 100.0, 1.0, -2.0, 200.0, 55.0)
+
+    with FileUtils.discarding_results():
+        with FileUtils.discarding_results():
+            pass
+        FileUtils.save_result(out, "LONG", "LONG", snapshot, exit_price=101.0)
+        FileUtils.record_trade("BTCUSDT", "LONG", "LONG", snapshot, 101.0, 101.0, 99.0)
+    assert not out.exists() and journal.records == []
+
+    FileUtils.save_result(out, "LONG", "LONG", snapshot, exit_price=101.0)
+    FileUtils.record_trade("BTCUSDT", "LONG", "LONG", snapshot, 101.0, 101.0, 99.0)
+    assert len(read_csv(out)) == 2 and len(journal.records) == 1
@@ -0,0 +1,131 @@
+import sqlite3
+from pathlib import Path
+import pytest
+from data.market_snapshot import MarketSnapshot
+from utils.file_utils import FileUtils
+from utils.trade_journal import TradeJournal, TradeRecord
+
+
+def make_trade(date: str, position: str, won: bool, symbol: str = "BTCUSDT"):
+    result = position if won else ("SHORT" if position == "LONG" else "LONG")
+    return TradeRecord(symbol, date, result, position, 100.0, 1.0, 2.0, 99.0, 50.0)
+
+
+@pytest.fixture
+def journal(tmp_path: Path):
+    journal = TradeJournal(tmp_path / "db" / "trades.sqlite3")
+    yield journal
+    journal.close()
+
+
+def test_database_uses_wal_and_indexes(journal: TradeJournal):
+    assert journal._query("PRAGMA journal_mode", ()) == [("wal",)]
+    indexes = journal._query(
+        "SELECT name FROM sqlite_master WHERE type = 'index' ORDER BY name", ()
+    )
+    assert indexes == [("trades_result",), ("trades_trade",)]
+    plan = journal._query(
+        "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM trades"
+        " WHERE symbol = ? AND date >= ?",
+        ("BTCUSDT", "[2025"),
+    )
+    assert "trades_trade" in str(plan)
+
+
+def test_win_rate_filters_by_side_and_period(journal: TradeJournal):
+    since = TradeJournal.timestamp_of("[2025-08-20 00:00:00]")
+    assert since is not None
+    for trade in [
+        make_trade("[2025-08-01 10:00:00]", "SHORT", won=True),
+        make_trade("[2025-08-21 10:00:00]", "SHORT", won=True),
+        make_trade("[2025-08-22 10:00:00]", "SHORT", won=False),
+        make_trade("[2025-08-23 10:00:00]", "LONG", won=True),
+        make_trade("[2025-08-23 10:00:00]", "SHORT", won=True, symbol="ETHUSDT"),
+    ]:
+        journal.write(trade)
+    journal.flush()
+
+    assert journal.win_rate("BTCUSDT") == (4, 3)
+    assert journal.win_rate("BTCUSDT", position="SHORT") == (3, 2)
+    assert journal.win_rate("BTCUSDT", position="SHORT", since_ms=since) == (2, 1)
+    assert journal.win_rate("SOLUSDT") == (0, 0)
+
+
+def test_dates_and_timestamps_convert_both_ways():
+    timestamp = TradeJournal.timestamp_of("[2025-08-29 12:34:56]")
+    assert timestamp is not None
+    assert TradeJournal.date_of(timestamp) == "[2025-08-29 12:34:56]"
+    assert TradeJournal.timestamp_of("1234") is None
+
+
+def test_results_csv_is_imported(tmp_path: Path, journal: TradeJournal):
+    results = tmp_path / "results.csv"
+    for date, exit_price in (
+        ("[2025-08-29 00:00:00]", 101.5),
+        ("[2025-08-29 01:00:00]", None),
+    ):
+        FileUtils.save_result(
+            results,
+            "SHORT",
+            "LONG",
+            MarketSnapshot(date, 100.0, 1.0, -2.0, 99.0, 40.0),
+            exit_price,
+        )
+
+    assert journal.import_csv(results, "ETHUSDT") == 2
+    rows = journal._query(
+        "SELECT symbol, result, position, price, exit_price, entry_ms FROM trades",
+        (),
+    )
+    entry_ms = TradeJournal.timestamp_of("[2025-08-29 00:00:00]")
+    assert entry_ms is not None
+    assert rows == [
+        ("ETHUSDT", "SHORT", "LONG", 100.0, 101.5, entry_ms),
+        ("ETHUSDT", "SHORT", "LONG", 100.0, None, entry_ms + 3_600_000),
+    ]
+    assert journal.win_rate("ETHUSDT") == (2, 0)
+
+    FileUtils.save_result(
+        results,
+        "LONG",
+        "LONG",
+        MarketSnapshot("[2025-08-29 02:00:00]", 100.0, 1.0, -2.0, 99.0, 40.0),
+        110.0,
+    )
+    assert journal.import_csv(results, "ETHUSDT") == 1
+    assert journal.import_csv(results, "ETHUSDT") == 0
+    assert journal.win_rate("ETHUSDT") == (3, 1)
+
+
+def test_a_trade_is_recorded_once(journal: TradeJournal):
+    trade = make_trade("[2025-08-01 10:00:00]", "SHORT", won=True)
+    journal.write(trade)
+    journal.write(trade)
+    journal.write(trade._replace(price=101.0))
+    journal.flush()
+
+    assert journal.win_rate("BTCUSDT") == (2, 2)
+
+
+def test_duplicates_of_an_older_journal_are_dropped(tmp_path: Path):
+    path = tmp_path / "trades.sqlite3"
+    connection = sqlite3.connect(path)
+    with connection:
+        connection.execute(TradeJournal._SCHEMA[0])
+        connection.execute("CREATE INDEX trades_symbol_date ON trades (symbol, date)")
+        for _ in range(2):
+            connection.execute(
+                "INSERT INTO trades (symbol, date, result, position, price)"
+                " VALUES ('BTCUSDT', '[2025-08-01 10:00:00]', 'LONG', 'LONG', 1.0)"
+            )
+    connection.close()
+
+    journal = TradeJournal(path)
+    assert journal.win_rate("BTCUSDT") == (1, 1)
+    assert (
+        journal._query(
+            "SELECT name FROM sqlite_master WHERE name = 'trades_symbol_date'", ()
+        )
+        == []
+    )
+    journal.close()